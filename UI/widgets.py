@@ -42,7 +42,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 ###############################################################################
 
 
-from configparser import ConfigParser
 from math import pi
 import os
 import sys
@@ -51,7 +50,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-from lib.config import conf_dir, IMAGE_PATH
+from lib.config import getPreferences, IMAGE_PATH
 from lib.corriente import Corriente
 from lib.utilities import representacion
 from tools.UI_unitConverter import UI_conversorUnidades, moneda
@@ -180,8 +179,7 @@ class Entrada_con_unidades(QtWidgets.QWidget):
         self.resaltado = resaltado
         self.showNull = showNull
 
-        Config = ConfigParser()
-        Config.read(conf_dir+"pychemqtrc")
+        Config = getPreferences()
         if colorReadOnly:
             self.colorReadOnly = colorReadOnly
         else:
@@ -347,13 +345,10 @@ class Entrada_con_unidades(QtWidgets.QWidget):
 
     def setToolTip(self):
         """Define the tooltip with the values in confguration"""
-        Preferences = ConfigParser()
-        Preferences.read(conf_dir+"pychemqtrc")
+        Preferences = getPreferences()
         if Preferences.getboolean("Tooltip", "Show"):
-            Config = ConfigParser()
-            Config.read(conf_dir+"pychemqtrc")
             try:
-                lista = eval(Config.get('Tooltip', self.magnitud))
+                lista = eval(Preferences.get('Tooltip', self.magnitud))
             except:
                 lista = []
             if len(lista) > 0:
@@ -519,8 +514,7 @@ class Tabla(QtWidgets.QTableWidget):
             delegate = self.delegateforRow(self.parent())
             self.setItemDelegateForRow(row, delegate)
 
-        Config = ConfigParser()
-        Config.read(conf_dir+"pychemqtrc")
+        Config = getPreferences()
         inactivo = QtGui.QColor(Config.get("General", 'Color_ReadOnly'))
         for j in range(self.columnCount()):
             self.setItem(row, j, QtWidgets.QTableWidgetItem(data[j]))
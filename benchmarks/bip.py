@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the binary interaction parameters matrix of a 20 components
+mixture, with a query for each pair of components, the load of bip tables
+and the cached matrix
+'''
+
+
+from common import timeit, report
+
+from lib import bip
+from lib.sql import databank_name, getConnection
+
+
+ids = list(range(2, 22))
+
+
+def pairs(ids, EOS):
+    """Interaction matrix with a query for each pair of components"""
+    db = getConnection(databank_name).cursor()
+    query = "SELECT kij FROM %sbip WHERE i=? AND j=?" % EOS
+    kij = []
+    for i in ids:
+        kiji = []
+        for j in ids:
+            db.execute(query, (min(i, j), max(i, j)))
+            k = db.fetchone()
+            kiji.append(float(k[0]) if k else 0)
+        kij.append(kiji)
+    return kij
+
+
+def cold(ids, EOS):
+    """Interaction matrix without cached data"""
+    bip._tables.clear()
+    bip._cache.clear()
+    return bip.Kij(ids, EOS)
+
+
+rows = []
+for EOS in ("PR", "SRK"):
+    t = timeit(pairs, ids, EOS, number=10)
+    rows.append(("%s query per pair" % EOS, t*1e6))
+    t = timeit(cold, ids, EOS, number=10)
+    rows.append(("%s table load" % EOS, t*1e6))
+    t = timeit(bip.Kij, ids, EOS, number=1000)
+    rows.append(("%s cached" % EOS, t*1e6))
+
+report("Kij, %i components" % len(ids), rows, ("Case", "time [µs]"))
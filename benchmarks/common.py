@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Common setup for benchmark scripts, they must be run from pychemqt root
+folder, for example::
+
+    python3 benchmarks/meos_helmholtz.py
+'''
+
+
+import os
+import sys
+import time
+
+
+# Define pychemqt environment like in the test suite
+sys.path.insert(0, os.path.abspath('.'))
+os.environ["pychemqt"] = os.path.abspath('.')
+for module in ["freesteam", "pybel", "CoolProp", "refprop", "ezodf",
+               "openpyxl", "xlwt", "icu", "reportlab", "PyQt5.Qsci"]:
+    os.environ.setdefault(module, "False")
+
+# Don't print the numpy RuntimeWarning
+from numpy import seterr  # noqa
+seterr("ignore")
+
+import warnings  # noqa
+warnings.simplefilter("ignore")
+
+
+def timeit(func, *args, repeat=5, number=1, **kwargs):
+    """Return the best wall time per call of func in several repetition
+
+    Parameters
+    ----------
+    func : callable
+        Function to benchmark
+    repeat : int
+        Number of repetitions, the minimum time is returned
+    number : int
+        Number of calls in each repetition
+    """
+    best = float("inf")
+    for i in range(repeat):
+        start = time.perf_counter()
+        for j in range(number):
+            func(*args, **kwargs)
+        best = min(best, (time.perf_counter()-start)/number)
+    return best
+
+
+def report(title, rows, header=("Case", "Time")):
+    """Print a simple table with the benchmark results"""
+    print(title)
+    print("-"*len(title))
+    width = max([len(header[0])]+[len(str(row[0])) for row in rows])
+    print("%-*s  %s" % (width, header[0], "  ".join(header[1:])))
+    for row in rows:
+        txt = []
+        for value in row[1:]:
+            if isinstance(value, float):
+                txt.append("%12.4g" % value)
+            else:
+                txt.append("%12s" % value)
+        print("%-*s  %s" % (width, row[0], "  ".join(txt)))
+    print()
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the component database access, time of creation of compounds
+and mixtures with the registry of parsed records of lib.compuestos and with
+the database read in each instance
+'''
+
+
+from common import timeit, report
+
+from lib import compuestos, sql
+from lib.compuestos import Componente
+from lib.mezcla import Mezcla
+
+
+ids = [1, 2, 3, 4, 5, 6, 8, 10, 46, 62]
+
+
+def components(n=10):
+    """Create the compounds several times"""
+    for i in range(n):
+        [Componente(id) for id in ids]
+
+
+def mixture(n=10):
+    """Create a mixture several times"""
+    for i in range(n):
+        Mezcla(2, ids=ids, caudalUnitarioMolar=[1]*len(ids))
+
+
+def uncached(func):
+    """Run func clearing the registry before each instance"""
+    size = compuestos._recordsSize
+    compuestos._recordsSize = 0
+    sql.invalidate()
+    func()
+    compuestos._recordsSize = size
+
+
+rows = []
+for name, func in (("Componente x10", components), ("Mezcla x10", mixture)):
+    old = timeit(uncached, func, repeat=3)
+    new = timeit(func, repeat=3)
+    rows.append((name, old*1e3, new*1e3, old/new))
+
+report("Component database access", rows,
+       ("Case", "parsed [ms]", "registry [ms]", "speedup"))
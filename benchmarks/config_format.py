@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the formatting of values with the configuration of units and
+numeric format, string representation of magnitudes, report of stream
+properties and rendering of a table of properties like TablaMEoS
+'''
+
+
+from common import timeit, report
+
+from lib import config
+from lib.corriente import Corriente
+from lib.mEoS import H2O
+from lib.unidades import Temperature, Pressure, Enthalpy
+
+
+N = 10**4
+props = ("T", "P", "rho", "v", "h", "s", "cp", "cv", "w", "mu", "k")
+
+
+def strings(cls, n=N):
+    """String representation of n values"""
+    for i in range(n):
+        cls(i+1).str
+
+
+def streamReport(stream):
+    """Text of the properties of stream, like the stream report"""
+    txt = []
+    for title, attr, unit in stream.propertiesNames():
+        try:
+            value = stream._prop(attr)
+        except (AttributeError, KeyError, IndexError, TypeError):
+            continue
+        if not isinstance(value, list):
+            value = [value]
+        for x in value:
+            if hasattr(x, "str"):
+                txt.append("%s %s" % (title, x.str))
+    return txt
+
+
+def table(states):
+    """Text of a table with the properties of states in configured units"""
+    return [[st.__getattribute__(prop).str for prop in props]
+            for st in states]
+
+
+config.getMainWindowConfig().set("Thermo", "MEoS", "True")
+config.setMainWindowConfig(config.getMainWindowConfig())
+stream = Corriente(T=400, P=101325, caudalMasico=1, ids=[62],
+                   fraccionMolar=[1])
+states = [H2O(T=T, P=1e6) for T in range(300, 800, 10)]
+
+rows = []
+for cls in (Temperature, Pressure, Enthalpy):
+    t = timeit(strings, cls, repeat=3)
+    rows.append(("%s.str" % cls.__name__, t/N*1e6, N/t))
+n = len(streamReport(stream))
+t = timeit(streamReport, stream, repeat=5)
+rows.append(("Stream report %i values" % n, t/n*1e6, n/t))
+t = timeit(table, states, repeat=5)
+n = len(states)*len(props)
+rows.append(("Table %ix%i" % (len(states), len(props)), t/n*1e6, n/t))
+
+report("Formatting of values", rows,
+       ("Case", "time [µs]", "throughput [1/s]"))
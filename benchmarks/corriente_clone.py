@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of Corriente.clone with a change of thermodynamic state, reusing
+the mixture and thermodynamic method of the original stream, compared with
+the build of a new stream, and the rating of the hairpin heat exchanger of
+Samples/hairpin.pcq, where clone is called in the iteration of output
+temperatures
+'''
+
+
+import json
+
+from common import timeit, report
+
+from lib.corriente import Corriente
+from lib.project import Project
+
+
+def rebuild(self, **kwargs):
+    """Clone building the stream from its kwargs"""
+    kw = self.kwargs.copy()
+    if "x" in kwargs:
+        kw["T"] = 0.0
+    kw.update(kwargs)
+    return Corriente(**kw)
+
+
+with open("Samples/hairpin.pcq", "r") as file:
+    data = json.load(file)
+prj = Project()
+prj.readFromJSON(data, temporal=False)
+hairpin = prj.getObject("e1")
+stream = hairpin.kwargs["entradaTubo"]
+
+reflash = Corriente.clone
+rows = []
+for name, func in (("new stream", rebuild), ("reflash", reflash)):
+    Corriente.clone = func
+    t1 = timeit(stream.clone, T=stream.T+10, number=20)
+    t2 = timeit(stream.clone, x=0.5, number=20)
+    t3 = timeit(hairpin, **hairpin.kwargs, number=3)
+    rows.append((name, t1*1e3, t2*1e3, t3*1e3))
+Corriente.clone = reflash
+
+report("Corriente.clone, %s with %s" % (stream.componente[0].name,
+                                      stream._thermo), rows,
+       ("Case", "clone T [ms]", "clone x [ms]", "hairpin rating [ms]"))
@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the outlet stream of a heat duty, the temperature iterated
+with fsolve over clones of stream at each temperature, compared with the
+stream defined directly with pressure and enthalpy, for the meos and the
+tabulated backends in liquid, two phases and vapor outlet states
+'''
+
+
+from common import timeit, report
+
+from scipy.optimize import fsolve
+
+from lib.corriente import Corriente
+
+
+def iterated(stream, Q):
+    """Outlet temperature iterated with clones at each temperature"""
+    def f(T):
+        return stream.clone(T=T).h-stream.h-Q
+    T = fsolve(f, stream.T)[0]
+    return stream.clone(T=T)
+
+
+def specified(stream, Q):
+    """Outlet defined with pressure and enthalpy"""
+    h = (stream.h+Q)/stream.caudalmasico
+    return stream.clone(P=stream.P, h=h)
+
+
+for tabulated in (False, True):
+    stream = Corriente(T=300, P=101325, caudalMasico=1, ids=[62],
+                       fraccionMolar=[1], MEoS=True, tabulated=tabulated)
+    rows = []
+    for name, Q in (("liquid", 1e5), ("two phases", 1e6), ("vapor", 3e6)):
+        t1 = timeit(iterated, stream, Q, number=3)
+        t2 = timeit(specified, stream, Q, number=3)
+        rows.append((name, t1*1e3, t2*1e3))
+
+    report("Outlet stream of water, %s" % stream._thermo, rows,
+           ("Outlet", "fsolve of T [ms]", "P-h stream [ms]"))
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the cubic equation of state core with a 20 components mixture,
+the solution of compressibility factor, mixing rules, fugacity coefficients
+and the calculation of states of a isotherm in a single call
+'''
+
+
+from common import timeit, report
+
+from numpy import linspace, roots
+from scipy.constants import R
+
+from lib.bip import Mix_vdW1f
+from lib.EoS.cubic import CubicRoots, CubicZ
+from lib.EoS.Cubic import PR
+from lib.mezcla import Mezcla
+
+
+N = 1000
+ids = list(range(2, 22))
+mix = Mezcla(5, ids=ids, caudalMolar=1, fraccionMolar=[1/len(ids)]*len(ids))
+eq = PR(400, 2e6, mix)
+P = linspace(1e5, 5e6, N)
+
+
+def numpyRoots(eq, P):
+    """Compressibility factor of states with numpy.roots"""
+    for p in P:
+        B = eq.b*p/R/eq.T
+        A = eq.tita*p/(R*eq.T)**2
+        Z = roots([1, B-1, A-3*B**2-2*B, B**3+B**2-A*B])
+        min(Z).real, max(Z).real
+
+
+def analyticRoots(eq, P):
+    """Compressibility factor of states with the analytic solution"""
+    for p in P:
+        B = eq.b*p/R/eq.T
+        A = eq.tita*p/(R*eq.T)**2
+        CubicRoots(B-1, A-3*B**2-2*B, B**3+B**2-A*B)
+
+
+rows = []
+t = timeit(numpyRoots, eq, P, repeat=3)
+rows.append(("Z numpy.roots", t/N*1e6))
+t = timeit(analyticRoots, eq, P, repeat=3)
+rows.append(("Z analytic", t/N*1e6))
+t = timeit(CubicZ, eq.T, P, eq.tita, eq.b, eq.delta, eq.epsilon, number=10)
+rows.append(("Z analytic isotherm %i states" % N, t/N*1e6))
+t = timeit(Mix_vdW1f, mix.fraccion, [eq.ai, eq.bi], eq.kij, number=100)
+rows.append(("Mixing rules", t*1e6))
+t = timeit(eq._lnphi, mix.fraccion, eq.Zg, number=100)
+rows.append(("ln φ gas", t*1e6))
+t = timeit(PR, 400, 2e6, mix, number=10)
+rows.append(("PR state", t*1e6))
+
+report("Cubic EoS, %i components" % len(ids), rows, ("Case", "time [µs]"))
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the flash engine with a natural gas liquid mixture and the
+Peng-Robinson equation of state, time and iterations of the Rachford-Rice
+solution, the stability test, the two-phase flash and the saturation points,
+and the flash of a grid of states with flash_batch
+'''
+
+
+from common import timeit, report
+
+from numpy import linspace, meshgrid
+
+from lib.EoS.Cubic import PR
+from lib.flash import (RachfordRice, Wilson, stability, flash, bubbleP,
+                       bubbleT, dewP, dewT, flash_batch)
+from lib.mezcla import Mezcla
+
+
+ids = [2, 3, 4, 6, 8, 10, 11, 12]
+z = [.45, .15, .1, .1, .05, .05, .05, .05]
+mix = Mezcla(5, ids=ids, caudalMolar=1, fraccionMolar=z)
+cmp = mix.componente
+
+rows = []
+eq = PR(300, 2e6, mix)
+K = Wilson(300, 2e6, [c.Tc for c in cmp], [c.Pc for c in cmp],
+           [c.f_acent for c in cmp])
+t = timeit(RachfordRice, z, K, number=1000)
+rows.append(("Rachford-Rice", t*1e3, "", ""))
+t = timeit(stability, eq, z, K, number=10)
+rows.append(("Stability 300K 20bar", t*1e3, stability(eq, z, K)[2], ""))
+
+for T, P in ((300, 2e6), (250, 5e5), (350, 5e6), (400, 1e5)):
+    eq = PR(T, P, mix)
+    res = flash(eq, z)
+    t = timeit(flash, eq, z, number=10)
+    it = res["iterations"]
+    rows.append(("Flash %iK %gbar" % (T, P/1e5), t*1e3, "%i/%i/%i" % (
+        it["stability"], it["ss"], it["newton"]), "%0.4f" % res["beta"]))
+
+eq = PR(300, 2e6, mix)
+res = flash(eq, z)
+t = timeit(flash, eq, z, res["K"], number=10)
+rows.append(("Flash 300K 20bar, initial K", t*1e3, "%i/%i/%i" % tuple(
+    flash(eq, z, res["K"])["iterations"].values()), ""))
+
+for func in (bubbleP, dewP, bubbleT, dewT):
+    res = func(eq, z)
+    t = timeit(func, eq, z, repeat=3)
+    value = "%0.5g" % (res["P"] if func.__name__[-1] == "P" else res["T"])
+    rows.append((func.__name__, t*1e3, res["iterations"], value))
+
+report("Flash, %i components" % len(ids), rows,
+       ("Case", "time [ms]", "iterations", "result"))
+
+
+def loop(T, P):
+    """Flash of states building the mixture and model in each state"""
+    for t in T:
+        for p in P:
+            m = Mezcla(5, ids=ids, caudalMolar=1, fraccionMolar=z)
+            flash(PR(t, p, m), z)
+
+
+T = linspace(250, 400, 10)
+P = linspace(1e5, 5e6, 20)
+TT, PP = meshgrid(T, P, indexing="ij")
+rows = []
+t = timeit(loop, T, P, repeat=1)
+rows.append(("Mezcla and PR in each state", t*1e3, 200/t))
+for workers in (1, 2, 4):
+    t = timeit(flash_batch, mix, TT, PP, workers=workers, repeat=1)
+    rows.append(("flash_batch, %i workers" % workers, t*1e3, 200/t))
+
+report("Flash of a grid of %ix%i states" % TT.shape, rows,
+       ("Case", "time [ms]", "throughput [1/s]"))
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the flowsheet solver of lib.flowsheet, a water loop with a
+recycle and a chain of valves downstream, time of the full calculation, of
+the incremental calculation after a change in the last valve and iterations
+of recycle with each acceleration method.
+
+Several parallel trains of valves, time of serial calculation and with the
+independent equipments calculated in a process pool.
+'''
+
+
+import os
+
+from common import timeit, report
+
+from lib.corriente import Corriente
+from lib.project import Project
+from equipment.flux import Divider, Mixer, Valve
+
+
+def project(method, n=5):
+    """Recycle loop with a chain of n valves in the product stream"""
+    feed = Corriente(T=300, P=10e5, caudalMasico=1, ids=[62],
+                     fraccionMolar=[1], MEoS=True)
+    items = {"i1": feed, "e1": Mixer(), "o1": Corriente(),
+             "e2": Divider(salidas=2, split=[0.2, 0.8])}
+    streams = {1: ("i1", "e1", 0, 0, feed),
+               2: ("e1", "e2", 0, 0, Corriente()),
+               3: ("e2", "e1", 1, 1, feed.clone(caudalMasico=0.1))}
+    up = "e2"
+    for i in range(n):
+        items["e%i" % (i+3)] = Valve(off=1, Pout=9e5-i*1e5)
+        streams[i+4] = (up, "e%i" % (i+3), 0, 0, Corriente())
+        up = "e%i" % (i+3)
+    streams[n+4] = (up, "o1", 0, 0, Corriente())
+    prj = Project(items=items, streams=streams)
+    prj.scheduler.method = method
+    return prj
+
+
+def trains(workers, n=4, m=4):
+    """n parallel trains of m valves fed from a divider"""
+    feed = Corriente(T=400, P=20e5, caudalMasico=1, ids=[62],
+                     fraccionMolar=[1], MEoS=True)
+    items = {"i1": feed, "e1": Divider(salidas=n, split=[1/n]*n)}
+    streams = {1: ("i1", "e1", 0, 0, feed)}
+    for i in range(n):
+        up, ind_up = "e1", i
+        for j in range(m):
+            name = "e%i" % (2+i*m+j)
+            items[name] = Valve(off=1, Pout=(19-j*4-i)*1e5)
+            streams[len(streams)+1] = (up, name, ind_up, 0, Corriente())
+            up, ind_up = name, 0
+        items["o%i" % (i+1)] = Corriente()
+        streams[len(streams)+1] = (up, "o%i" % (i+1), 0, 0, Corriente())
+    prj = Project(items=items, streams=streams)
+    prj.scheduler.workers = workers
+    return prj
+
+
+def outputs(prj):
+    """Values of output streams"""
+    return [(prj.items[key].T, prj.items[key].P, prj.items[key].h)
+            for key in sorted(prj.items) if key[0] == "o"]
+
+
+def change(prj, P):
+    """Change the output pressure of last valve"""
+    last = max(prj.items, key=lambda x: (x[0] == "e", int(x[1:])))
+    prj.items[last](Pout=P)
+    prj.setItem(int(last[1:]), prj.items[last])
+
+
+rows = []
+for method in ("wegstein", "broyden"):
+    prj = project(method)
+    full = timeit(prj.run, repeat=1)
+    iterations = prj.scheduler.recycles[0]["iterations"]
+    calls = sum([stat["calls"] for stat in prj.scheduler.stats.values()])
+    inc = timeit(change, prj, 4e5, repeat=1)
+    rows.append((method, full*1e3, inc*1e3, iterations, calls))
+
+report("Flowsheet calculation", rows,
+       ("Method", "full [ms]", "incremental [ms]", "iterations",
+        "calculations"))
+
+rows = []
+serial = trains(0)
+ref = timeit(serial.run, repeat=1)
+for workers in (2, os.cpu_count() or 1):
+    prj = trains(workers)
+    t = timeit(prj.run, repeat=1)
+    rows.append(("%i workers" % workers, ref*1e3, t*1e3, ref/t,
+                 str(outputs(prj) == outputs(serial))))
+
+report("Parallel trains", rows,
+       ("Case", "serial [ms]", "parallel [ms]", "speedup", "identical"))
@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the friction factor correlations with the data of a Moody
+chart, 50 Reynolds numbers for 19 relative roughness, with a loop over the
+points and with the arrays in a call, and the old fsolve procedure of
+Colebrook equation as reference
+'''
+
+
+from math import log10
+
+from common import timeit, report
+
+from numpy import array, logspace
+from scipy.optimize import fsolve
+
+from lib.friction import f_list, f_chen, f_friccion
+
+
+Re = logspace(3.4, 8, 50)
+eD = array([0, 1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 2e-4, 4e-4, 6e-4, 8e-4, 1e-3,
+            2e-3, 4e-3, 6e-3, 8e-3, 1e-2, 2e-2, 4e-2, 5e-2])[:, None]
+
+
+def loop(func, Re, eD):
+    """Call func for each point of chart"""
+    return [[func(r, e) for r in Re] for e in eD[:, 0]]
+
+
+def colebrook(Re, eD):
+    """Colebrook equation solved with fsolve"""
+    fo = f_chen(Re, eD)
+    if eD:
+        f = fsolve(lambda x: 1/x**0.5+2.0*log10(eD/3.7+2.51/Re/x**0.5), fo)
+    else:
+        f = fsolve(lambda x: 1/x**0.5-2.0*log10(Re*x**0.5)+0.8, fo)
+    return f[0]
+
+
+rows = []
+t = timeit(loop, colebrook, Re, eD, repeat=1, number=1)
+rows.append(("Colebrook fsolve", t*1e3, "-"))
+for func in f_list:
+    tl = timeit(loop, func, Re, eD, repeat=1, number=1)
+    tv = timeit(func, Re, eD, number=10)
+    rows.append((func.__name__, tl*1e3, tv*1e3))
+tl = timeit(loop, f_friccion, Re, eD, repeat=1, number=1)
+tv = timeit(f_friccion, Re, eD, number=10)
+rows.append(("f_friccion", tl*1e3, tv*1e3))
+
+report("Friction factor, %i points" % (Re.size*eD.size), rows,
+       ("Correlation", "loop [ms]", "array [ms]"))
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the GERG-2008 kernel with the natural gas of AGA8 reference
+code of 21 components and a 4 components gas, the build of kernel, the
+residual Helmholtz energy, density, properties and fugacity coefficients,
+and the calculation of a state with the GERG class
+'''
+
+
+from common import timeit, report
+
+from lib import gerg
+from lib.gerg import GERG, Kernel
+
+
+cases = (
+    ("AGA8", [0, 1, 2, 3, 4, 6, 5, 8, 7, 9, 10, 11, 19, 20, 12, 13, 14, 15,
+              18, 16, 17],
+     [.77824, .02, .06, .08, .03, .0015, .003, .0005, .00165, .00215, .00088,
+      .00024, .00015, .00009, .004, .005, .002, .0001, .0025, .007, .001]),
+    ("Natural gas", [0, 1, 2, 3], [.9, .05, .03, .02]))
+
+
+def cold(ids):
+    """Kernel without cached coefficients"""
+    gerg._coefficients.clear()
+    return Kernel(ids)
+
+
+for name, ids, x in cases:
+    kernel = Kernel(ids)
+    rho = kernel.density(x, 400, 5e7)
+    Tr, vr = kernel.reducing(x)[:2]
+
+    rows = []
+    t = timeit(cold, ids, number=3)
+    rows.append(("Kernel, coefficients load", t*1e6))
+    t = timeit(Kernel, ids, number=100)
+    rows.append(("Kernel", t*1e6))
+    t = timeit(kernel.reducing, x, number=1000)
+    rows.append(("Reducing functions", t*1e6))
+    t = timeit(kernel.residual, x, rho*vr, Tr/400, number=1000)
+    rows.append(("αr and derivatives", t*1e6))
+    t = timeit(kernel.density, x, 400, 5e7, number=100)
+    rows.append(("Density 400K 500bar", t*1e6))
+    t = timeit(kernel.properties, x, 400, rho, number=1000)
+    rows.append(("Properties", t*1e6))
+    t = timeit(kernel.lnphi, x, 400, rho, number=1000)
+    rows.append(("ln φ", t*1e6))
+    t = timeit(GERG, componente=ids, fraccion=x, T=400, P=5e7, number=3)
+    rows.append(("GERG T-P state with flash", t*1e6))
+
+    report("GERG-2008 %s, %i components, %i terms" % (
+        name, len(ids), len(kernel.n)), rows, ("Case", "time [µs]"))
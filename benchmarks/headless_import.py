@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the headless import of the calculation core, import time and
+resident memory of a fresh interpreter, like a worker process, and the check
+of Qt loaded. The bytecode of modules must be compiled previously to measure
+only the import time, ``python3 -m compileall lib equipment tools``.
+'''
+
+
+import json
+import os
+import subprocess
+import sys
+
+from common import report
+
+
+setup = """
+import json, os, resource, sys, time
+sys.path.insert(0, %r)
+os.environ["pychemqt"] = %r
+for module in ["freesteam", "pybel", "CoolProp", "refprop", "ezodf",
+               "openpyxl", "xlwt", "icu", "reportlab", "PyQt5.Qsci"]:
+    os.environ.setdefault(module, "False")
+import numpy, scipy
+start = time.perf_counter()
+""" % (os.path.abspath('.'), os.path.abspath('.') + os.sep)
+
+end = """
+t = time.perf_counter()-start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([t, rss, "PyQt5.QtWidgets" in sys.modules]))
+"""
+
+cases = (
+    ("lib.mEoS", "from lib.mEoS import H2O\nH2O(T=300, P=1e5)"),
+    ("lib.EoS", "import lib.EoS"),
+    ("lib.mezcla", "import lib.mezcla"),
+    ("lib.corriente", "import lib.corriente"),
+    ("equipment.flux", "import equipment.flux"),
+    ("worker", "import lib.project\nimport equipment.pipe"),
+)
+
+
+def run(code, repeat=3):
+    """Best import time in ms and memory in MiB of code in a fresh
+    interpreter"""
+    times = []
+    for i in range(repeat):
+        # Run outside root folder to avoid the import of all lib modules
+        # in lib/__init__.py
+        out = subprocess.run(
+            [sys.executable, "-c", setup + code + end],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True).stdout
+        t, rss, qt = json.loads(out.splitlines()[-1])
+        times.append(t)
+    return min(times)*1e3, rss/1024, "yes" if qt else "no"
+
+
+rows = []
+for title, code in cases:
+    rows.append((title, ) + run(code))
+
+report("Headless import", rows,
+       ("Case", "time [ms]", "memory [MiB]", "Qt loaded"))
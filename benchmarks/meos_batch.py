@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+Benchmark of state calculation of a set of points in lib.meos, comparing
+the loop of instances with the batch calculation
+'''
+
+
+from common import timeit, report
+
+from numpy import linspace
+
+from lib.mEoS import H2O, CO2, R134a
+
+
+def loop(fluid, T, P):
+    """Calculate the state point by point with the normal instances"""
+    return [fluid(T=t, P=P) for t in T]
+
+
+rows = []
+for fluid in (H2O, CO2, R134a):
+    T = linspace(fluid.Tc*1.05, fluid.Tc*1.5, 50)
+    P = 1e6
+
+    single = timeit(loop, fluid, T, P, repeat=3)
+    batch = timeit(fluid.batch, T=T, P=P, repeat=3)
+    rows.append((fluid.__name__, single/T.size*1e3, batch/T.size*1e3,
+                 single/batch))
+
+report("T-P state, 50 points", rows,
+       ("Fluid", "loop [ms/pt]", "batch [ms/pt]", "speedup"))
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of residual Helmholtz free energy evaluation in lib.meos, single
+point, grid evaluation and complete state calculation for H2O, CO2 and R134a
+'''
+
+
+from common import timeit, report
+
+from numpy import linspace, meshgrid
+
+from lib.meos import _Helmholtz_derivatives, _Helmholtz_phird
+from lib.mEoS import H2O, CO2, R134a
+
+
+rows = []
+for fluid in (H2O, CO2, R134a):
+    coef = fluid.eq[0]
+    tau, delta = 1.2, 0.8
+
+    # Compile coefficient once, not included in timing
+    _Helmholtz_derivatives(tau, delta, coef)
+
+    full = timeit(_Helmholtz_derivatives, tau, delta, coef, number=200)
+    fird = timeit(_Helmholtz_phird, tau, delta, coef, number=200)
+
+    taus, deltas = meshgrid(linspace(0.5, 3, 100), linspace(0.01, 3, 100))
+    grid = timeit(_Helmholtz_derivatives, taus, deltas, coef, number=5)
+
+    state = timeit(fluid, T=300, P=1e6, number=5)
+    rows.append((fluid.__name__, full*1e6, fird*1e6, grid/taus.size*1e6,
+                 state*1e3))
+
+report("Residual Helmholtz evaluation", rows,
+       ("Fluid", "all [µs]", "fird [µs]", "grid/pt [µs]", "T-P state [ms]"))
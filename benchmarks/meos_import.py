@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the lazy fluid registry of lib.mEoS, import time reported by
+``python -X importtime`` in a fresh interpreter for each case. The eager case
+load all fluids after import, like the import of lib.mEoS before the lazy
+registry. The bytecode of modules must be compiled previously to measure only
+the import time, ``python3 -m compileall lib``.
+'''
+
+
+import os
+import re
+import subprocess
+import sys
+
+from common import report
+
+
+setup = """
+import os, sys
+os.environ["pychemqt"] = %r
+for module in ["freesteam", "pybel", "CoolProp", "refprop", "ezodf",
+               "openpyxl", "xlwt", "icu", "reportlab", "PyQt5.Qsci"]:
+    os.environ.setdefault(module, "False")
+import numpy, scipy.optimize, PyQt5.QtWidgets
+""" % (os.path.abspath('.') + os.sep)
+
+cases = (
+    ("import lib.mEoS", "import lib.mEoS"),
+    ("lib.mEoS eager", "import lib.mEoS\nfor f in lib.mEoS.__all__: pass"),
+    ("import lib.corriente", "import lib.corriente"),
+    ("import lib.gerg", "import lib.gerg"),
+)
+
+
+def importTime(code, repeat=5):
+    """Best time in ms of the imports done by code, the sum of cumulative
+    time of the top level imports after the common setup"""
+    times = []
+    for i in range(repeat):
+        # Run outside root folder to avoid the import of all lib modules
+        # in lib/__init__.py
+        out = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", setup+code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=dict(os.environ, PYTHONPATH=os.path.abspath('.')),
+            stderr=subprocess.PIPE, universal_newlines=True).stderr
+        total = 0
+        started = False
+        for line in out.splitlines():
+            match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| (\S.*)",
+                             line)
+            if not match:
+                continue
+            if started:
+                total += int(match.group(2))
+            elif match.group(3) == "PyQt5.QtWidgets":
+                started = True
+        times.append(total/1e3)
+    return min(times)
+
+
+rows = []
+for title, code in cases:
+    rows.append((title, importTime(code)))
+
+report("Import time", rows, ("Case", "time [ms]"))
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the reference state offset registry of lib.meos, time of state
+calculation with the offsets read from file in each state, like before the
+registry, and with the offsets in memory, and time of precalculation of
+offsets of all lib.mEoS fluids
+'''
+
+
+from common import timeit, report
+
+from lib import meos
+from lib.mEoS import CO2, R134a, nC4
+
+
+def states(fluid, ref, reload=False):
+    """Calculate a list of states"""
+    for T in range(300, 320):
+        if reload:
+            meos._refOffsetsLoaded = False
+        fluid(T=T, P=1e5, ref=ref)
+
+
+rows = []
+for fluid in (CO2, R134a, nC4):
+    for ref in ("OTO", "NBP", "IIR"):
+        old = timeit(states, fluid, ref, reload=True, repeat=3)
+        new = timeit(states, fluid, ref, repeat=3)
+        rows.append(("%s %s" % (fluid.__name__, ref), old/20*1e3,
+                     new/20*1e3, old/new))
+
+report("State calculation", rows,
+       ("Case", "file [ms]", "registry [ms]", "speedup"))
+
+meos.refOffsets.clear()
+meos._refOffsetsLoaded = True
+t = timeit(meos.precomputeRefOffsets, repeat=1)
+report("Precalculation of offsets", [("All fluids", len(meos.refOffsets), t)],
+       ("Case", "offsets", "time [s]"))
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the saturation table of lib.meos, time of state calculation in
+the subcritical region with and without the table, and error bound of
+interpolation against the rigorous phase equilibrium solution
+'''
+
+
+from common import timeit, report
+
+from numpy import linspace
+
+from lib import meos
+from lib.mEoS import H2O, CO2, R134a, nC10
+
+
+def states(fluid, inputs):
+    """Calculate the list of states"""
+    return [fluid(**kw) for kw in inputs]
+
+
+def inputs(fluid):
+    """Subcritical input values for several modes"""
+    ref = [fluid(T=T, x=0.5) for T in linspace(
+        fluid.Tt*0.2+fluid.Tc*0.8, fluid.Tc*0.95, 5)]
+    data = {}
+    data["T-P liquid"] = [{"T": st.T, "P": st.P*1.5} for st in ref]
+    data["T-P vapor"] = [{"T": st.T, "P": st.P*0.5} for st in ref]
+    data["T-rho"] = [{"T": st.T, "rho": st.rho} for st in ref]
+    data["P-x"] = [{"P": st.P, "x": 0.5} for st in ref]
+    data["P-h"] = [{"P": st.P, "h": st.h} for st in ref]
+    return data
+
+
+rows = []
+error = []
+for fluid in (H2O, CO2, R134a, nC10):
+    data = inputs(fluid)
+    for mode, kw in data.items():
+        meos.MEoS._useSatTable = False
+        old = timeit(states, fluid, kw, repeat=3)
+        meos.MEoS._useSatTable = True
+        new = timeit(states, fluid, kw, repeat=3)
+        rows.append(("%s %s" % (fluid.__name__, mode), old/len(kw)*1e3,
+                     new/len(kw)*1e3, old/new))
+
+    table = fluid(T=300, P=1e5)._satTable()
+    error.append((fluid.__name__, len(table["T"]), table["error"]["P"],
+                  table["error"]["rhoL"], table["error"]["rhoG"]))
+
+report("Subcritical states", rows,
+       ("Case", "ancillary [ms]", "table [ms]", "speedup"))
+report("Error bound of saturation table", error,
+       ("Fluid", "nodes", "P", "rhoL", "rhoG"))
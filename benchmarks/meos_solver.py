@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+Benchmark of the iterative procedure to solve the input pair of MEoS states,
+comparing the Newton-Raphson solver with analytic jacobian and the multi-start
+scipy fsolve procedure, using the statistics saved in lib.meos.solverStats
+'''
+
+
+from common import report
+
+from lib import meos
+from lib.mEoS import H2O, CO2, R134a
+
+
+MODES = ("T-P", "P-h", "P-s", "P-u", "rho-h", "rho-s", "rho-u", "h-s", "h-u",
+         "s-u", "P-rho")
+
+
+def states():
+    """Reference states, single phase and two phases"""
+    sts = []
+    for fluid in (H2O, CO2, R134a):
+        for Tr in (0.6, 0.9, 1.1, 1.5):
+            for P in (1e5, 5e6):
+                sts.append(fluid(T=Tr*fluid.Tc, P=P))
+        for x in (0.2, 0.8):
+            sts.append(fluid(T=0.8*fluid.Tc, x=x))
+    return [st for st in sts if st.status == 1]
+
+
+def run(sts, newton):
+    """Calculate all states with each input pair, return the solver
+    statistics and the number of wrong states"""
+    meos.MEoS._useNewton = newton
+    meos.solverStats.clear()
+    wrong = dict.fromkeys(MODES, 0)
+    for ref in sts:
+        for mode in MODES:
+            kw = {key: ref.__getattribute__(key)._data
+                  for key in mode.split("-")}
+            try:
+                st = ref.__class__(**kw)
+                if st.status != 1 or abs(st.T-ref.T) > 1e-3:
+                    wrong[mode] += 1
+            except Exception:
+                wrong[mode] += 1
+    meos.MEoS._useNewton = True
+    return {mode: dict(meos.solverStats[mode]) for mode in MODES}, wrong
+
+
+sts = states()
+old, oldWrong = run(sts, False)
+new, newWrong = run(sts, True)
+
+rows = []
+for mode in MODES:
+    n = new[mode]
+    o = old[mode]
+    its = n["iterations"]/n["newton"] if n["newton"] else 0
+    rows.append((mode, n["calls"], n["newton"], its, n["fallback"],
+                 o["time"]/o["calls"]*1e3, n["time"]/n["calls"]*1e3,
+                 o["time"]/n["time"], oldWrong[mode], newWrong[mode]))
+
+report("Input pair solver, %i states" % len(sts), rows,
+       ("Mode", "calls", "newton", "it/call", "fallback", "fsolve [ms]",
+        "newton [ms]", "speedup", "wrong fsolve", "wrong newton"))
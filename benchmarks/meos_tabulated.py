@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the tabulated interpolation of lib.tabulated against the
+rigorous MEoS calculation, time of state calculation, fraction of states
+solved with the table and max relative error of interpolated properties.
+The first run calculate the tables and save them in the config folder.
+'''
+
+
+from common import timeit, report
+
+from numpy import exp, isfinite, random
+
+from lib.tabulated import Tabulated, getTable
+from lib.mEoS import H2O, R134a
+
+
+def states(cls, inputs, **kwargs):
+    """Calculate the list of states"""
+    return [cls(**kw, **kwargs) for kw in inputs]
+
+
+def inputs(fluid, table, n=100):
+    """Random input values in the domain of table for several modes"""
+    rng = random.RandomState(42)
+    T = rng.uniform(table.T[0], table.T[-1], n)
+    P = exp(rng.uniform(table.lnP[0], table.lnP[-1], n))
+    Ts = rng.uniform(table.Tt, table.Tc*0.95, n)
+    ref = fluid.batch(T=T, P=P)
+    data = {}
+    data["T-P"] = [{"T": t, "P": p} for t, p in zip(T, P)]
+    data["P-h"] = [{"P": p, "h": h} for p, h in zip(P, ref["h"])
+                   if isfinite(h)]
+    data["T-x"] = [{"T": t, "x": 0.5} for t in Ts]
+    return data
+
+
+rows = []
+error = []
+for fluid in (H2O, R134a):
+    table = getTable(fluid)
+    data = inputs(fluid, table)
+    for mode, kw in data.items():
+        old = timeit(states, fluid, kw, repeat=1)
+        new = timeit(states, Tabulated, kw, repeat=3, fluid=fluid,
+                     table=table)
+        tab = states(Tabulated, kw, fluid=fluid, table=table)
+        used = sum([not st.fallback for st in tab])/len(kw)
+        rows.append(("%s %s" % (fluid.__name__, mode), old/len(kw)*1e3,
+                     new/len(kw)*1e3, old/new, used))
+
+        # Error of states solved with table
+        ref = states(fluid, kw)
+        err = {}
+        for st, st0 in zip(tab, ref):
+            if st.fallback:
+                continue
+            for prop in ("rho", "h", "s", "cp", "cv", "w", "mu", "k"):
+                value = st.__getattribute__(prop)
+                value0 = st0.__getattribute__(prop)
+                if not isinstance(value0, float) or not value0:
+                    continue
+                e = abs(value/value0-1)
+                err[prop] = max(err.get(prop, 0), e)
+        error.append(["%s %s" % (fluid.__name__, mode)] + [
+            err.get(prop, 0.) for prop in ("rho", "cp", "w", "mu", "k")])
+
+report("State calculation", rows,
+       ("Case", "MEoS [ms]", "table [ms]", "speedup", "table use"))
+report("Max relative error of tabulated states", error,
+       ("Case", "rho", "cp", "w", "mu", "k"))
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the mixing rules of transport properties in lib.mezcla with
+mixtures of 2, 10 and 50 components, a single temperature and a vector of
+100 temperatures in a call, compared with a loop over the temperatures
+'''
+
+
+from common import timeit, report
+
+from numpy import linspace, ones
+
+from lib.compuestos import Componente
+from lib.mezcla import (RhoL_RackettMix, RhoL_CostaldMix, RhoL_TaitCostaldMix,
+                        MuG_Reichenberg, MuG_Wilke, MuG_Chung, MuG_TRAPP,
+                        ThG_LindsayBromley, ThG_MasonSaxena, ThG_Chung,
+                        ThG_StielThodosYorizane, ThG_TRAPP)
+
+
+compounds = [Componente(i) for i in range(2, 52)]
+T = linspace(300, 400, 100)
+
+
+def loop(func, T, *args):
+    """Call func for each temperature"""
+    return [func(t, *args) for t in T]
+
+
+for n in (2, 10, 50):
+    cmp = compounds[:n]
+    x = ones(n)/n
+    Tc = [c.Tc for c in cmp]
+    Pc = [c.Pc for c in cmp]
+    Vc = [c.Vc for c in cmp]
+    Zc = [c.Zc for c in cmp]
+    Zra = [c.rackett for c in cmp]
+    M = [c.M for c in cmp]
+    w = [c.f_acent for c in cmp]
+    D = [c.dipole.Debye for c in cmp]
+    Tb = [c.Tb for c in cmp]
+    k = [0]*n
+    mu = [1e-5]*n
+    kg = [0.02]*n
+    Cv = [1500]*n
+
+    cases = (
+        ("RhoL Rackett", RhoL_RackettMix, (x, Tc, Pc, Vc, Zra, M)),
+        ("RhoL Costald", RhoL_CostaldMix, (x, Tc, w, Vc, M)),
+        ("RhoL Tait-Costald", RhoL_TaitCostaldMix,
+         (2e7, x, Tc, Vc, w, M, 600)),
+        ("MuG Reichenberg", MuG_Reichenberg, (x, Tc, Pc, M, mu, D)),
+        ("MuG Chung", MuG_Chung, (x, Tc, Vc, M, w, D, k)),
+        ("MuG TRAPP", MuG_TRAPP, (5e6, x, Tc, Vc, Zc, M, w, 50, 1e-5)),
+        ("ThG Lindsay-Bromley", ThG_LindsayBromley, (x, M, Tb, mu, kg)),
+        ("ThG Chung", ThG_Chung, (x, Tc, Vc, M, w, Cv, 1e-5)),
+        ("ThG Stiel-Thodos-Yorizane", ThG_StielThodosYorizane,
+         (x, Tc, Pc, Vc, w, M, 0.02, 0.02)),
+        ("ThG TRAPP", ThG_TRAPP, (x, Tc, Vc, Zc, w, M, 50, 0.02)))
+
+    rows = []
+    for name, func, args in cases:
+        t1 = timeit(func, 350, *args, number=10)
+        tl = timeit(loop, func, T, *args, repeat=3)
+        tv = timeit(func, T, *args, number=10)
+        rows.append((name, t1*1e6, tl*1e6, tv*1e6))
+
+    # Temperature independent rules with component properties by state
+    for name, func, args in (("MuG Wilke", MuG_Wilke, (mu, )),
+                             ("ThG Mason-Saxena", ThG_MasonSaxena, (mu, kg))):
+        states = [[arg]*len(T) for arg in args]
+        t1 = timeit(func, x, M, *args, number=10)
+        tl = timeit(lambda: [func(x, M, *a) for a in zip(*states)], repeat=3)
+        tv = timeit(func, x, M, *states, number=10)
+        rows.append((name, t1*1e6, tl*1e6, tv*1e6))
+
+    report("Mixing rules, %i components" % n, rows,
+           ("Case", "1 state [µs]", "loop 100 [µs]", "vector 100 [µs]"))
@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of the pipe network solver in square grids of pipes, a cooling
+water distribution fed from a corner at 6 bar and a fuel gas distribution
+fed from a corner at 4 bar, with the same demand in each node
+'''
+
+
+from common import report
+
+from numpy.random import default_rng
+
+from lib.corriente import Corriente
+from lib.pipeNetwork import Network
+
+
+mat = ["Steel (ANSI)", "Sch.  40", 0.046, '4"', 102.26, 6.02, 114.3, 16.07,
+       0.821, 35.91, 0, 0]
+elbow = [[0, 0, 0.3, 2, "", 102.26, '4"', "elbow"]]
+
+
+def grid(n, demand):
+    """Square grid of n×n nodes with pipes of random length, the total
+    demand is distributed in nodes"""
+    rng = default_rng(1)
+    pipes = []
+    for i in range(n):
+        for j in range(n):
+            if i < n-1:
+                pipes.append(((i, j), (i+1, j), {
+                    "material": mat, "l": rng.uniform(50, 150),
+                    "accesorios": elbow}))
+            if j < n-1:
+                pipes.append(((i, j), (i, j+1), {
+                    "material": mat, "l": rng.uniform(50, 150),
+                    "h": rng.uniform(-1, 1)}))
+    demands = {(i, j): demand/(n**2-1) for i in range(n) for j in range(n)}
+    del demands[(0, 0)]
+    return pipes, demands
+
+
+agua = Corriente(T=300, P=6e5, caudalMasico=1, ids=[62], fraccionMolar=[1],
+                 MEoS=True)
+gas = Corriente(T=300, P=4e5, caudalMasico=1, ids=[2], fraccionMolar=[1],
+                MEoS=True)
+
+for fluido, name, demand in ((agua, "Water", 50), (gas, "Methane", 0.5)):
+    rows = []
+    for n in (10, 20, 32, 45):
+        pipes, demands = grid(n, demand)
+        red = Network(fluido, pipes, P={(0, 0): fluido.P}, demand=demands)
+        red.solve()
+        stats = red.stats
+        rows.append(("%i×%i" % (n, n), len(red.pipes), stats["iterations"],
+                     stats["evaluations"], stats["time"]*1e3,
+                     red.P.min()/1e5))
+
+    report("%s network" % name, rows, ("Grid", "Pipes", "Iterations",
+                                       "Evaluations", "Time [ms]",
+                                       "Pmin [bar]"))
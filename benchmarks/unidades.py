@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Benchmark of lib.unidades magnitudes, time to build 10⁶ instances of
+Pressure and Enthalpy, memory of each instance alive and time of access to
+unit attributes. Each magnitude is compared with the previous layout, an
+instance attribute for each unit set in the constructor
+'''
+
+
+import logging
+import tracemalloc
+
+from common import timeit, report
+
+from lib.unidades import Pressure, Enthalpy
+
+
+N = 10**6
+
+
+def eager(cls):
+    """Magnitude with the previous layout of lib.unidades, without slots and
+    with the value in every unit calculated and saved in the constructor"""
+    class Eager(float):
+        def __new__(kls, data, unit=""):
+            return float.__new__(kls, cls._getBaseValue(data, unit, ""))
+
+        def __init__(self, data, unit=""):
+            self.magnitud = cls.__name__
+            self.code = ""
+            self._data = cls._getBaseValue(data, unit, "")
+            for key in cls.rates:
+                self.__setattr__(key, self._data/cls.rates[key])
+            # Non proportional units, i.e. gauge pressure
+            for key in cls.__units__:
+                if key not in cls.rates:
+                    self.__setattr__(key, cls._fromBase(self, key))
+            logging.debug("%s, %f" % (cls.__name__, self._data))
+
+    Eager.__name__ = cls.__name__
+    Eager.__units__ = cls.__units__
+    return Eager
+
+
+def build(cls, unit, n=N):
+    """Build n instances of cls"""
+    for i in range(n):
+        cls(i, unit)
+
+
+def memory(cls, unit, n=10**5):
+    """Memory in bytes of each instance alive"""
+    tracemalloc.start()
+    values = [cls(i, unit) for i in range(n)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del values
+    return size/n
+
+
+def access(value, units, n=N//10):
+    """Access n times to the unit attributes"""
+    for i in range(n//len(units)):
+        for unit in units:
+            getattr(value, unit)
+
+
+rows = []
+for cls, unit in ((Pressure, "bar"), (Enthalpy, "kJkg")):
+    for layout, kls in (("eager", eager(cls)), ("lazy", cls)):
+        t = timeit(build, kls, unit, repeat=1)
+        units = cls.__units__
+        ta = timeit(access, kls(1, unit), units, repeat=1)
+        rows.append(("%s %s" % (cls.__name__, layout), t, t/N*1e6,
+                     memory(kls, unit), ta/(N//10)*1e6))
+
+report("Magnitude instances", rows,
+       ("Case", "10⁶ build [s]", "build [µs]", "memory [B]", "access [µs]"))
@@ -31,7 +31,7 @@ from numpy import any
 
 from lib.unidades import Time, Pressure, Length, Area, Speed
 from equipment.gas_solid import Baghouse
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from UI.widgets import Entrada_con_unidades, Tabla
 
 
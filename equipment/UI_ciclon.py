@@ -32,7 +32,7 @@ from PyQt5 import QtGui, QtWidgets
 from lib.unidades import Length, Pressure, DeltaP, Speed, VolFlow, Currency
 from tools.costIndex import CostData
 from equipment.gas_solid import Ciclon
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from UI.widgets import Entrada_con_unidades
 
 
@@ -30,7 +30,7 @@ from PyQt5 import QtWidgets
 
 from lib.unidades import Length, Mass, Volume, Density, Currency
 from tools.costIndex import CostData
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from equipment.distillation import Flash
 from UI.widgets import Entrada_con_unidades
 
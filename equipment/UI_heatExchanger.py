@@ -31,7 +31,7 @@ from lib.unidades import (Temperature, DeltaT, DeltaP, Power, Area,
                           HeatTransfCoef)
 from UI.widgets import Entrada_con_unidades
 from equipment.heatExchanger import Heat_Exchanger
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 
 
 class UI_equipment(UI_equip):
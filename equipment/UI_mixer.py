@@ -28,7 +28,7 @@ from functools import partial
 from PyQt5 import QtWidgets
 
 from lib.unidades import Pressure
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from equipment.flux import Mixer
 from UI import UI_corriente
 from UI.widgets import Entrada_con_unidades
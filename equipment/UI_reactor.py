@@ -35,7 +35,7 @@ from lib import unidades, reaction, plot
 from lib.thread import Evaluate
 from lib.config import getComponents
 from UI.widgets import Status
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from equipment.reactor import Reactor
 from UI import UI_corriente, inputTable
 from UI.widgets import Entrada_con_unidades, Tabla, QLabelMath
@@ -32,7 +32,7 @@ from PyQt5 import QtWidgets
 
 from lib import unidades
 from tools.costIndex import CostData
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from UI.widgets import Entrada_con_unidades
 from UI import UI_corriente
 from equipment.solids import Screen
@@ -30,7 +30,7 @@ from PyQt5 import QtWidgets
 
 from lib.unidades import Length, ThermalConductivity, Pressure, Currency
 from UI.widgets import Entrada_con_unidades
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from equipment.widget import FoulingWidget, Dialog_Finned
 from equipment.UI_pipe import Catalogo_Materiales_Dialog
 from equipment.heatExchanger import Shell_Tube
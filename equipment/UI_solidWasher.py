@@ -29,12 +29,12 @@ from PyQt5 import QtCore, QtWidgets
 from equipment.gas_solid_liquid import Dryer
 from lib import unidades, config
 from UI import UI_corriente
-from equipment import parents
+from equipment import UI_parents
 from UI.widgets import Entrada_con_unidades
 from tools import costIndex
 
 
-class UI_equipment(parents.UI_equip):
+class UI_equipment(UI_parents.UI_equip):
     """Dialogo de definición de unidades de secado de sólidos"""
     def __init__(self, entradaSolido=None, entradaAire=None,  parent=None):
         """entrada: Parametro opcional de clase corriente que indica la corriente de entrada"""
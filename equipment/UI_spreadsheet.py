@@ -33,7 +33,7 @@ except:
     pass
 
 from UI.widgets import PathConfig, Tabla
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from equipment.spreadsheet import Spreadsheet
 
 
@@ -30,12 +30,12 @@ from .gas_solid import Baghouse
 from lib import unidades
 from lib.utilities import representacion
 from UI import UI_corriente
-from equipment import parents
+from equipment import UI_parents
 from UI.delegate import CellEditor
 from UI.widgets import Entrada_con_unidades
 
 
-class UI_equipment(parents.UI_equip):
+class UI_equipment(UI_parents.UI_equip):
     """Diálogo de definición de filtros de mangas"""
     def __init__(self, entrada=None, parent=None):
         """entrada: Parametro opcional de clase corriente que indica la corriente de entrada"""
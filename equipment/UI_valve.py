@@ -28,7 +28,7 @@ from functools import partial
 from PyQt5 import QtWidgets
 
 from lib.unidades import Temperature, Pressure
-from equipment.parents import UI_equip
+from equipment.UI_parents import UI_equip
 from equipment.flux import Valve
 from UI.widgets import Entrada_con_unidades
 
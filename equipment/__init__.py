@@ -18,63 +18,65 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 
 
-
 ###Modulo de equipos
 
-#Inicializa importando las interfaces gráficas de los equipos
+# Initialize importing the calculation classes of equipments, the graphical
+# interfaces are imported only when they are used, so the calculation
+# library can be used without PyQt5
+
+import importlib
 
 # flow
-from . import UI_divider
-from . import UI_valve
-from . import UI_mixer
-from . import UI_compressor
-from . import UI_turbine
-from . import UI_pump
-from . import UI_pipe
+from .flux import Divider, Valve, Mixer
+from .compressor import Compressor, Turbine
+from .pump import Pump
+from .pipe import Pipe
 
 # Operaciones
-from . import UI_flash
-from . import UI_columnFUG
-from . import UI_heatExchanger
-from . import UI_hairpin
-from . import UI_shellTube
-from . import UI_fireHeater
+from .distillation import Flash, ColumnFUG
+from .heatExchanger import Heat_Exchanger, Shell_Tube, Hairpin, Fired_Heater
 
 # solids
-from . import UI_ciclon
-from . import UI_gravityChamber
-from . import UI_baghouse
-from . import UI_electricPrecipitator
-from . import UI_dryer
-from . import UI_scrubber
+from .gas_solid import Ciclon, GravityChamber, Baghouse, ElectricPrecipitator
+from .gas_solid_liquid import Dryer, Scrubber
 
 # Tools
-from . import UI_spreadsheet
-
-# No funcionales
-from . import UI_centrifuge
-from . import UI_crystallizer
-from . import UI_filter
-from . import UI_grinder
-from . import UI_screen
-from . import UI_solidWasher
-from . import UI_vacuum
-from . import UI_tank
-from . import UI_tower
-from . import UI_reactor
-
-
-UI_equipments = [UI_divider, UI_valve, UI_mixer, UI_pump, UI_compressor,
-                 UI_turbine, UI_pipe, UI_flash, UI_columnFUG, UI_heatExchanger,
-                 UI_shellTube, UI_hairpin, UI_fireHeater, UI_ciclon,
-                 UI_gravityChamber, UI_baghouse, UI_electricPrecipitator,
-                 UI_dryer, UI_scrubber, UI_spreadsheet, UI_reactor]
+from .spreadsheet import Spreadsheet
+from .reactor import Reactor
+
+
+# The index of equipment in list is saved in project files, don't change the
+# order, only add new equipment at end
+equipments = [Divider, Valve, Mixer, Pump, Compressor, Turbine, Pipe, Flash,
+              ColumnFUG, Heat_Exchanger, Shell_Tube, Hairpin, Fired_Heater,
+              Ciclon, GravityChamber, Baghouse, ElectricPrecipitator, Dryer,
+              Scrubber, Spreadsheet, Reactor]
+
+# Graphical interface of equipments with the same order
+_UI_equipments = [
+    "UI_divider", "UI_valve", "UI_mixer", "UI_pump", "UI_compressor",
+    "UI_turbine", "UI_pipe", "UI_flash", "UI_columnFUG", "UI_heatExchanger",
+    "UI_shellTube", "UI_hairpin", "UI_fireHeater", "UI_ciclon",
+    "UI_gravityChamber", "UI_baghouse", "UI_electricPrecipitator",
+    "UI_dryer", "UI_scrubber", "UI_spreadsheet", "UI_reactor"]
 # UI_tower, UI_reactor, UI_centrifuge, UI_grinder, UI_solidWasher, UI_vacuum, ]
 
-equipments=[ui.UI_equipment.Equipment.__class__ for ui in UI_equipments]
 
-#__all__ = [equip.__name__ for equip in UI_equipments]
-#print(__all__)
+def __getattr__(name):
+    """Import the graphical interface of equipments in the first use"""
+    if name == "UI_equipments":
+        UI_equipments = [importlib.import_module("." + module, __name__)
+                         for module in _UI_equipments]
+        globals()["UI_equipments"] = UI_equipments
+        return UI_equipments
+    if name.startswith("UI_"):
+        try:
+            return importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as error:
+            if error.name != "%s.%s" % (__name__, name):
+                raise
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
 
 # To get a list of equipment available to add to lib/firstrun.py file:
 # equipos=[equipment.__name__ for equipment in equipments]
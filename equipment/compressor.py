@@ -27,13 +27,13 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 import os
 
-from PyQt5.QtWidgets import QApplication
 from scipy import log, exp
 from scipy.constants import R
 from scipy.optimize import fsolve
 
 from lib.unidades import (DeltaT, DeltaP, Temperature, Pressure, MassFlow,
                           Power, Currency, Dimensionless)
+from lib.qt import QApplication
 from equipment.parents import equipment
 
 
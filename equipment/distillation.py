@@ -30,11 +30,10 @@ import os
 
 from scipy import log, exp, pi, log10, linspace
 from scipy.optimize import fsolve
-from PyQt5.QtWidgets import QApplication
 
 from lib import unidades
 from lib.corriente import Corriente
-from lib.plot import Plot
+from lib.qt import QApplication
 from equipment.parents import equipment
 from equipment.heatExchanger import Heat_Exchanger
 
@@ -401,6 +400,7 @@ class Tower(equipment):
 
 
     def McCabe(self, LK=0, HK=1):
+        from lib.plot import Plot
         A = self.kwargs["entrada"].componente[LK].nombre
         B = self.kwargs["entrada"].componente[HK].nombre
         P = self.kwargs["entrada"].P
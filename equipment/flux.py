@@ -28,11 +28,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 import os
 
-from PyQt5.QtWidgets import QApplication
 from scipy.optimize import fsolve
 
 from lib.corriente import Corriente
 from lib import unidades
+from lib.qt import QApplication
 from equipment.parents import equipment
 
 
@@ -342,9 +342,11 @@ class Mixer(equipment):
                     massUnitFlow[i] += caudal
         To /= sum(massUnitFlow)
 
+        # Output stream with the components and thermodynamic options of
+        # input streams
         def f(T):
-            output = Corriente(T=T, P=self.Pout,
-                               caudalUnitarioMasico=massUnitFlow)
+            output = self.entrada[0].clone(
+                T=T, P=self.Pout, x=None, caudalUnitarioMasico=massUnitFlow)
             return output.h-h_in
         T = fsolve(f, To)[0]
 
@@ -352,7 +354,8 @@ class Mixer(equipment):
         if self.entrada[0].solido:
             pass
 
-        salida = Corriente(T=T, P=self.Pout, caudalUnitarioMasico=massUnitFlow)
+        salida = self.entrada[0].clone(
+            T=T, P=self.Pout, x=None, caudalUnitarioMasico=massUnitFlow)
         self.salida = [salida]
 
         # Calculate other properties
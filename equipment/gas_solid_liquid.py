@@ -27,7 +27,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 import os
 
-from PyQt5.QtWidgets import QApplication
 from scipy import pi, exp, sqrt, log
 
 from lib.unidades import (Pressure, DeltaP, Area, Speed, Dimensionless,
@@ -35,6 +34,7 @@ from lib.unidades import (Pressure, DeltaP, Area, Speed, Dimensionless,
 from lib.physics import Cunningham
 from lib.corriente import Corriente
 from lib.psycrometry import PsychroState
+from lib.qt import QApplication
 from equipment.parents import equipment
 from equipment.gas_solid import Separador_SolidGas
 
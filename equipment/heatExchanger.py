@@ -29,15 +29,14 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 import os
 
-from PyQt5.QtWidgets import QApplication
 from scipy import sqrt, exp, log, pi, arccos, sin, cos, tanh
 from scipy.constants import g
-from scipy.optimize import fsolve
 
 from lib import unidades
 from lib.adimensional import Re, Pr, Gr, Gz
 from lib.friction import f_friccion
 from lib.heatTransfer import *  # noqa
+from lib.qt import QApplication
 from equipment.parents import equipment
 
 
@@ -146,18 +145,18 @@ class Heat_Exchanger(equipment):
             self.salida = [entrada.clone(T=Tout, P=entrada.P-self.deltaP)]
             self.HeatCalc = unidades.Power(self.salida[0].h-entrada.h)
         else:
-            if self.modo == 2:
-                self.HeatCalc = unidades.Power(0)
-            else:
+            if self.modo == 3:
                 self.HeatCalc = unidades.Power(A*U*(Text-entrada.T))
 
-            def f():
-                output = entrada.clone(T=T, P=entrada.P-self.deltaP)
-                return output.h-entrada.h-self.HeatCalc
-            T = fsolve(f, entrada.T)[0]
-            if T > max(Text, entrada.T) or T < min(Text, entrada.T):
-                T = self.Text
-            self.salida = [entrada.clone(T=T, P=entrada.P-self.deltaP)]
+            h = (entrada.h+self.HeatCalc)/entrada.caudalmasico
+            salida = entrada.clone(h=h, P=entrada.P-self.deltaP)
+
+            # The output temperature is bounded by the input and the external
+            # temperature, when it's defined
+            if Text and (salida.T > max(Text, entrada.T) or
+                         salida.T < min(Text, entrada.T)):
+                salida = entrada.clone(T=Text, P=entrada.P-self.deltaP)
+            self.salida = [salida]
 
         self.Tin = entrada.T
         self.ToutCalc = self.salida[0].T
@@ -346,10 +345,8 @@ class Fired_Heater(equipment):
 
         if self.Hmax and Heat > self.Hmax:
             self.Heat = unidades.Power(self.Hmax)
-            To = (entrada.T+self.Tout)/2
-            T = fsolve(lambda T: entrada.clone(
-                T=T, P=entrada.P-self.deltaP).h-Ho-self.Hmax, To)[0]
-            self.salida = [entrada.clone(T=T, P=entrada.P-self.deltaP)]
+            h = (Ho+self.Hmax)/entrada.caudalmasico
+            self.salida = [entrada.clone(h=h, P=entrada.P-self.deltaP)]
         else:
             self.Heat = Heat
             self.salida = [salida]
@@ -847,15 +844,10 @@ class Hairpin(equipment):
                 QTube = -self.Q
                 QAnnulli = self.Q
 
-            def f(T):
-                return inTube.clone(T=T).h-inTube.h+QTube
-            T = fsolve(f, inTube.T)[0]
-            self.outTube = inTube.clone(T=T)
-
-            def f(T):
-                return inAnnulli.clone(T=T).h-inAnnulli.h+QAnnulli
-            T = fsolve(f, inAnnulli.T)[0]
-            self.outAnnulli = inAnnulli.clone(T=T)
+            h = (inTube.h-QTube)/inTube.caudalmasico
+            self.outTube = inTube.clone(P=inTube.P, h=h)
+            h = (inAnnulli.h-QAnnulli)/inAnnulli.caudalmasico
+            self.outAnnulli = inAnnulli.clone(P=inAnnulli.P, h=h)
 
     def design(self):
         """Design a pipe to meet the specified heat transfer requeriments"""
@@ -893,10 +885,8 @@ class Hairpin(equipment):
                 Qi = abs(self.outTube.h-inTube.h)
                 self.Q = unidades.Power(Qi)
 
-                def f(T):
-                    return inAnnulli.clone(T=T).h-inAnnulli.h-Qi
-                T = fsolve(f, inAnnulli.T)[0]
-                self.outAnnulli = inAnnulli.clone(T=T)
+                h = (inAnnulli.h+Qi)/inAnnulli.caudalmasico
+                self.outAnnulli = inAnnulli.clone(P=inAnnulli.P, h=h)
 
             elif self.statusOut == 3:
                 if self.kwargs["annulliTout"]:
@@ -909,10 +899,8 @@ class Hairpin(equipment):
                 Qo = abs(self.outAnnulli.h-inAnnulli.h)
                 self.Q = unidades.Power(Qo)
 
-                def f(T):
-                    return inTube.clone(T=T).h-inTube.h-Qi
-                T = fsolve(f, inTube.T)[0]
-                self.outTube = inTube.clone(T=T)
+                h = (inTube.h+Qo)/inTube.caudalmasico
+                self.outTube = inTube.clone(P=inTube.P, h=h)
 
             self.phaseTube = self.ThermalPhase(inTube, self.outTube)
             self.phaseAnnulli = self.ThermalPhase(inAnnulli, self.outAnnulli)
@@ -25,12 +25,13 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 import os
 
-from PyQt5.QtWidgets import QApplication
+from numpy import abs as np_abs, array, full, insert, linspace
 from scipy.constants import g, pi
 
 from lib import unidades
 from lib.friction import f_friccion
 from lib.adimensional import Re
+from lib.qt import QApplication
 from equipment.parents import equipment
 from equipment.heatExchanger import Heat_Exchanger
 
@@ -81,6 +82,11 @@ class Pipe(equipment):
         T_ext: External temperatura of pipe for heat exchanger calculation
         U: Global heat transfer coeficient for pipe wall
         Q: Heat transfered by pipe wall
+        segmentos: Number of initial segments for the marching calculation
+            along the pipe, only for single phase flow method, the segments
+            are refined to keep the pressure and temperature change of each
+            segment in the step limits. 0 to calculate the pipe with the input
+            stream properties
 
     Coste:
         Only available for steal pipes, Ref Darby pag 217
@@ -92,6 +98,36 @@ class Pipe(equipment):
     >>> pipe=Pipe(entrada=agua, metodo=0, l=5, material=material)
     >>> print("%0.4f %6g %6g %6g" % (pipe.Di, pipe.V, pipe.Re, pipe.DeltaP))
     0.1524 0.0626815 9427.99 1.83620
+
+    The segmented calculation of an almost isothermal liquid flow give the
+    pressure drop of calculation with the input properties
+
+    >>> from numpy import diff
+    >>> mat = ["Steel (ANSI)", "Sch.  40", 0.046, '4"', 102.26, 6.02, 114.3,
+    ...        16.07, 0.821, 35.91, 0, 0]
+    >>> agua = Corriente(T=300, P=3e5, caudalMasico=5, ids=[62],
+    ...                  fraccionMolar=[1], MEoS=True)
+    >>> pipe = Pipe(entrada=agua, material=mat, l=500)
+    >>> seg = Pipe(entrada=agua, material=mat, l=500, segmentos=10)
+    >>> print("%0.0f %0.0f" % (pipe.DeltaP, seg.DeltaP))
+    19149 19149
+
+    In a long gas pipe the segments are refined along the pipe, with the
+    pressure decreasing and the velocity increasing in the profiles
+
+    >>> gas = Corriente(T=300, P=5e6, caudalMasico=1.5, ids=[2],
+    ...                 fraccionMolar=[1], MEoS=True)
+    >>> seg = Pipe(entrada=gas, material=mat, l=10000, segmentos=10)
+    >>> len(seg.L_profile) > 11, len(seg.P_profile) == len(seg.L_profile)
+    (True, True)
+    >>> print("%0.1f %0.1f" % (seg.L_profile[0], seg.L_profile[-1]))
+    0.0 10000.0
+    >>> bool((diff(seg.P_profile) < 0).all())
+    True
+    >>> bool((diff(seg.V_profile) > 0).all())
+    True
+    >>> print("%0.0f" % (seg.P_profile[0]-seg.P_profile[-1]-seg.DeltaP))
+    0
     """
     title = QApplication.translate("pychemqt", "Pipe")
     help = ""
@@ -108,6 +144,7 @@ class Pipe(equipment):
         "T_ext": 0.0,
         "U": 0.0,
         "Q": 0.0,
+        "segmentos": 0,
 
         "f_install": 2.8,
         "Base_index": 0.0,
@@ -121,6 +158,23 @@ class Pipe(equipment):
     indiceCostos = 5
     salida = [None]
 
+    # Profiles along the pipe of segmented calculation
+    profiles = {"L_profile": unidades.Length,
+                "P_profile": unidades.Pressure,
+                "T_profile": unidades.Temperature,
+                "V_profile": unidades.Speed,
+                "Re_profile": unidades.Dimensionless,
+                "f_profile": unidades.Dimensionless}
+
+    # Step control of segmented calculation, maximum relative pressure drop
+    # and temperature change in a segment, maximum number of segments, and
+    # the relative tolerance and maximum iterations of profile
+    dPmax = 0.02
+    dTmax = 2.
+    maxSegments = 1000
+    tol = 1e-7
+    maxiter = 50
+
     TEXT_METODO = (
         QApplication.translate("pychemqt", "Single Phase flow"),
         QApplication.translate("pychemqt", "Water (Hazen-Williams)"),
@@ -185,13 +239,7 @@ class Pipe(equipment):
 
     def calculo(self):
         self.L = unidades.Length(self.kwargs["l"])
-
-        if self.kwargs["entrada"].x == 0:
-            self.rho = self.kwargs["entrada"].Liquido.rho
-            self.mu = self.kwargs["entrada"].Liquido.mu
-        else:
-            self.rho = self.kwargs["entrada"].Gas.rho
-            self.mu = self.kwargs["entrada"].Gas.mu
+        self.rho, self.mu = self._fluid(self.kwargs["entrada"])
 
         self.material = self.kwargs["material"][0] + " " + \
             self.kwargs["material"][1]
@@ -213,6 +261,10 @@ class Pipe(equipment):
         self.DeltaP_ac = unidades.Pressure(self.K*self.V**2/2*self.rho)
 
         self.f = f_friccion(self.Re, self.eD)
+        if self.kwargs["segmentos"] and self.kwargs["metodo"] == 0:
+            self.__march()
+            return
+
         self.DeltaP_f = self.__DeltaP_friccion()
         # TODO:
         self.DeltaP_v = unidades.Pressure(0)
@@ -237,6 +289,122 @@ class Pipe(equipment):
         self.Pin = self.kwargs["entrada"].P
         self.Pout = self.salida[0].P
 
+    @staticmethod
+    def _fluid(stream):
+        """Density and viscosity of the flowing phase of stream"""
+        if stream.x == 0:
+            return stream.Liquido.rho, stream.Liquido.mu
+        else:
+            return stream.Gas.rho, stream.Gas.mu
+
+    def __march(self):
+        """Segmented calculation of pipe, marching along the pipe with the
+        update of pressure, temperature and fluid properties in each segment
+
+        The pressure drop of each segment use the mean values of its ends,
+        so the profile is iterated to convergence, with the friction factor
+        of all nodes calculated in a call. The segments with a pressure drop
+        or temperature change over the step limits are halved. The profiles
+        along the pipe are saved in the attributes with _profile suffix"""
+        entrada = self.kwargs["entrada"]
+        m = entrada.caudalmasico
+        G = m/self.seccion
+        h = self.kwargs["h"]/self.L
+        K = self.K/self.L
+        thermal = self.kwargs["thermal"]
+
+        # Initial profile with the input properties
+        x = linspace(0, self.L, self.kwargs["segmentos"]+1)
+        P = full(len(x), float(entrada.P))
+        T = full(len(x), float(entrada.T))
+        rho = full(len(x), float(self.rho))
+        mu = full(len(x), float(self.mu))
+        streams = [entrada]*len(x)
+
+        converge = False
+        for it in range(self.maxiter):
+            # The mass flux is constant along the pipe, so Re only depend of
+            # viscosity
+            Re_ = G*self.Di/mu
+            f = f_friccion(Re_, self.eD)
+
+            Pn = P.copy()
+            Tn = T.copy()
+            rhon = rho.copy()
+            mun = mu.copy()
+            hn = entrada.h/m
+            dPf = dPac = dPh = dPv = Heat = 0
+            for i in range(len(x)-1):
+                dl = x[i+1]-x[i]
+                v = (1/rhon[i]+1/rho[i+1])/2
+                dPf += (f[i]+f[i+1])/2*dl/self.Di*G**2*v/2
+                dPac += K*dl*G**2*v/2
+                dPh += g*h*dl/v
+                dPv += G**2*(1/rho[i+1]-1/rhon[i])
+                Pn[i+1] = entrada.P-dPf-dPac-dPh-dPv
+                if Pn[i+1] <= 0:
+                    self.msg = QApplication.translate(
+                        "pychemqt", "pressure drop over input pressure")
+                    self.status = 5
+                    return
+
+                if thermal == 1:
+                    dQ = self.kwargs["Q"]*dl/self.L
+                elif thermal == 2:
+                    dQ = self.kwargs["U"]*pi*self.De*dl * \
+                        (self.kwargs["T_ext"]-(Tn[i]+T[i+1])/2)
+                else:
+                    dQ = 0
+                Heat += dQ
+                hn += dQ/m
+
+                streams[i+1] = entrada.clone(P=Pn[i+1], h=hn)
+                Tn[i+1] = streams[i+1].T
+                rhon[i+1], mun[i+1] = self._fluid(streams[i+1])
+
+            change = max(np_abs(Pn-P)/Pn)
+            P, T, rho, mu = Pn, Tn, rhon, mun
+            if change > self.tol:
+                continue
+
+            # Step control, the segments out of limits are halved with the
+            # profile interpolated as new initial values
+            split = [i+1 for i in range(len(x)-1)
+                     if abs(P[i]-P[i+1]) > self.dPmax*P[i] or
+                     abs(T[i]-T[i+1]) > self.dTmax]
+            if not split or len(x)+len(split) > self.maxSegments:
+                converge = True
+                break
+            x = insert(x, split, (x[split]+x[array(split)-1])/2)
+            P = insert(P, split, (P[split]+P[array(split)-1])/2)
+            T = insert(T, split, (T[split]+T[array(split)-1])/2)
+            rho = insert(rho, split, (rho[split]+rho[array(split)-1])/2)
+            mu = insert(mu, split, (mu[split]+mu[array(split)-1])/2)
+            for i in split[-1::-1]:
+                streams.insert(i, streams[i-1])
+
+        if not converge:
+            self.msg = QApplication.translate(
+                "pychemqt", "segmented calculation not converged")
+            self.status = 3
+
+        Re_ = G*self.Di/mu
+        values = (x, P, T, G/rho, Re_, f_friccion(Re_, self.eD))
+        for (key, unit), value in zip(self.profiles.items(), values):
+            self.__setattr__(key, unit.array(value))
+
+        self.DeltaP_f = unidades.DeltaP(dPf)
+        self.DeltaP_ac = unidades.DeltaP(dPac)
+        self.DeltaP_h = unidades.DeltaP(dPh)
+        self.DeltaP_v = unidades.DeltaP(dPv)
+        self.DeltaP = unidades.DeltaP(entrada.P-P[-1])
+        self.DeltaP_100ft = self.DeltaP*100/self.L.ft
+        self.Tout = unidades.Temperature(T[-1])
+        self.Heat = unidades.Power(Heat)
+        self.salida = [streams[-1]]
+        self.Pin = entrada.P
+        self.Pout = self.salida[0].P
+
     def __DeltaP_friccion(self):
         """Método para el calculo de la perdida de presión"""
         if self.kwargs["metodo"] == 0:
@@ -381,6 +549,9 @@ class Pipe(equipment):
         if self.statusCoste:
             state["C_adq"] = self.C_adq
             state["C_inst"] = self.C_inst
+        if self.kwargs["segmentos"] and self.kwargs["metodo"] == 0:
+            for key in self.profiles:
+                state[key] = list(self.__getattribute__(key))
 
     def readStatefromJSON(self, state):
         """Load instance parameter from saved file"""
@@ -414,6 +585,9 @@ class Pipe(equipment):
         if self.statusCoste:
             self.C_adq = unidades.Currency(state["C_adq"])
             self.C_inst = unidades.Currency(state["C_inst"])
+        for key, unit in self.profiles.items():
+            if key in state:
+                self.__setattr__(key, unit.array(state[key]))
         self.salida = [None]
 
     def propTxt(self):
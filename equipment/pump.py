@@ -25,13 +25,13 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 import os
 
-from PyQt5.QtWidgets import QApplication
 from scipy import log, exp, optimize, polyval, roots, r_
 from scipy.constants import g
 
 from lib.unidades import (Pressure, Length, Power, VolFlow, Currency,
                           Dimensionless, DeltaP)
 from lib.datasheet import pdf
+from lib.qt import QApplication
 from equipment.parents import equipment
 
 
@@ -23,12 +23,10 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 ###  librería de definición de reactores   ###
 ############################
 
-from scipy.optimize import fsolve
-from PyQt5.QtWidgets import  QApplication
-
 from lib import unidades
 from lib.corriente import Corriente
 from lib.reaction import Reaction
+from lib.qt import QApplication
 from .parents import equipment
 
 
@@ -97,12 +95,19 @@ class Reactor(equipment):
 
         if self.thermal in [0, 2]:
 
-            def f(T):
+            # Output stream defined by its enthalpy, the successive
+            # substitution is only necessary when the reaction depend of T
+            T=self.entrada.T
+            for it in range(50):
                 fracciones, h=self.reaccion.conversion(self.entrada, T)
-                corriente=Corriente(T, self.entrada.P.atm, self.entrada.caudalmasico.kgh, Mezcla(self.entrada.ids, fracciones), self.entrada.solido)
-                return corriente.h-self.Q-self.entrada.h-h
-            T=fsolve(f, self.entrada.T)
-            fracciones, h=self.reaccion.conversion(self.entrada, T)
+                Ho=(self.entrada.h+self.Q+h)/self.entrada.caudalmasico
+                corriente=Corriente(P=self.entrada.P, h=Ho, caudalMasico=self.entrada.caudalmasico, ids=self.entrada.ids, fraccionMolar=fracciones, solido=self.entrada.solido)
+                dT=corriente.T-T
+                T=corriente.T
+                if abs(dT)<1e-6:
+                    break
+            else:
+                raise ValueError("Iteration not converge")
 
         elif self.thermal==1:
             T=self.T
@@ -112,7 +117,7 @@ class Reactor(equipment):
             pass
 
         print(fracciones)
-        self.Salida=Corriente(T=T, P=self.entrada.P, caudalMasico=self.entrada.caudalmasico, fraccionMolar=fracciones, solido=self.entrada.solido)
+        self.Salida=Corriente(T=T, P=self.entrada.P, caudalMasico=self.entrada.caudalmasico, ids=self.entrada.ids, fraccionMolar=fracciones, solido=self.entrada.solido)
         self.Heat=unidades.Power(self.Salida.h-self.entrada.h-h)
 
 
@@ -96,11 +96,13 @@ class ALS1983(Cubic):
         self.bi = b1i
         self.b = b1m
         self.tita = am
-        self.delta = b3m-b2m
-        self.epsilon = -b2m*b3m
+        self.delta, self.epsilon = self._volume(b1m, b2m, b3m)
 
         super(ALS1983, self).__init__(T, P, mezcla)
 
+    def _volume(self, b1, b2, b3):
+        return b3-b2, -b2*b3
+
 
 if __name__ == "__main__":
     from lib.mezcla import Mezcla
@@ -115,8 +115,7 @@ class PR(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = 2*bm
-        self.epsilon = -bm**2
+        self.delta, self.epsilon = self._volume(bm)
         # print("tita", am)
         # print("kij", self.kij)
         # print("ai", ai)
@@ -135,6 +134,9 @@ class PR(Cubic):
 
         # self._phir(mezcla, tau, delta, T, rho, ao, ai, C1, C2, C3)
 
+    def _volume(self, b):
+        return 2*b, -b**2
+
     def _phir(self, mezcla, tau, delta, T, rho, ao, ai, C1, C2, C3):
 
         Tr = mezcla.Tc
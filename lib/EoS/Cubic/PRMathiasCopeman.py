@@ -139,8 +139,7 @@ class PRMathiasCopeman(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = 2*bm
-        self.epsilon = -bm**2
+        self.delta, self.epsilon = self._volume(bm)
 
         super(PRMathiasCopeman, self).__init__(T, P, mezcla)
         print(1/self.Vl, 1/self.Vg)
@@ -157,6 +156,9 @@ class PRMathiasCopeman(Cubic):
         H_exc = excess["H"]*R*T/mezcla.M
         print(self.mezcla._Ho(T), H_exc)
 
+    def _volume(self, b):
+        return 2*b, -b**2
+
     def _phir(self, tau, delta, ao, ai, C1, C2, C3):
 
         # Tr = self.mezcla.Tc
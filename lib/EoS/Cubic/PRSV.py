@@ -294,11 +294,13 @@ class PRSV(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = 2*bm
-        self.epsilon = -bm**2
+        self.delta, self.epsilon = self._volume(bm)
 
         super(PRSV, self).__init__(T, P, mezcla)
 
+    def _volume(self, b):
+        return 2*b, -b**2
+
     def _k(self, cmp, Tr):
         # Eq 11
         ko = 0.378893 + 1.4897153*cmp.f_acent - \
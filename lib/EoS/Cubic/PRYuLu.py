@@ -97,11 +97,13 @@ class PRYuLu(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = 3*bm + cm
-        self.epsilon = bm*cm
+        self.delta, self.epsilon = self._volume(bm, cm)
 
         super(PRYuLu, self).__init__(T, P, mezcla)
 
+    def _volume(self, b, c):
+        return 3*b + c, b*c
+
     def _lib(self, cmp, T):
         Tr = T/cmp.Tc
 
@@ -18,10 +18,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 
 
-from scipy import roots
 from scipy.constants import R
 
-from lib.EoS.cubic import Cubic
+from lib.EoS.cubic import Cubic, CubicRoots
 
 
 # Table I in [1]_ and Table III, IV in [3]_
@@ -219,11 +218,13 @@ class PT(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = bm+cm
-        self.epsilon = -bm*cm
+        self.delta, self.epsilon = self._volume(bm, cm)
 
         super(PT, self).__init__(T, P, mezcla)
 
+    def _volume(self, b, c):
+        return b+c, -b*c
+
     def _lib(self, cmp, T):
         if cmp.id in dat:
             # Use the compound specific parameters values
@@ -236,13 +237,8 @@ class PT(Cubic):
         # Eq 8
         c = (1-3*xic)*R*cmp.Tc/cmp.Pc
 
-        # Eq 10
-        b = roots([1, 2-3*xic, 3*xic**2, -xic**3])
-        Bpositivos = []
-        for i in b:
-            if i > 0:
-                Bpositivos.append(i)
-        Omegab = min(Bpositivos)
+        # Eq 10, the only positive root is the largest one
+        Omegab = CubicRoots(2-3*xic, 3*xic**2, -xic**3)[1]
         b = Omegab*R*cmp.Tc/cmp.Pc
 
         # Eq 9
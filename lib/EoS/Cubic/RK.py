@@ -20,7 +20,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 from scipy.constants import R
 
-from lib.bip import Kij, Mixing_Rule
 from lib.EoS.cubic import Cubic
 
 
@@ -58,6 +57,8 @@ class RK(Cubic):
         "doi": "10.1021/cr60137a013"},
 
     def __init__(self, T, P, mezcla):
+        self.mezcla = mezcla
+
         ai = []
         bi = []
         for componente in mezcla.componente:
@@ -65,18 +66,19 @@ class RK(Cubic):
             ai.append(a)
             bi.append(b)
 
-        self.kij = Kij(mezcla.ids)
-        a, b = Mixing_Rule(mezcla.fraccion, [ai, bi], self.kij)
+        a, b = self._mixture(None, mezcla.ids, [ai, bi])
 
         self.ai = ai
         self.bi = bi
         self.b = b
         self.tita = a
-        self.delta = b
-        self.epsilon = 0
+        self.delta, self.epsilon = self._volume(b)
 
         super(RK, self).__init__(T, P, mezcla)
 
+    def _volume(self, b):
+        return b, 0
+
     def _lib(self, cmp, T):
         a = 0.42747*R**2*cmp.Tc**2/cmp.Pc
         alfa = (T/cmp.Tc)**-0.5
@@ -82,11 +82,13 @@ class SRK(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = bm
-        self.epsilon = 0
+        self.delta, self.epsilon = self._volume(bm)
 
         super(SRK, self).__init__(T, P, mezcla)
 
+    def _volume(self, b):
+        return b, 0
+
     def _lib(self, cmp, T):
         ao = 0.42747*R**2*cmp.Tc**2/cmp.Pc                              # Eq 5
         b = 0.08664*R*cmp.Tc/cmp.Pc                                     # Eq 6
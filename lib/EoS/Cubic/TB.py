@@ -20,10 +20,9 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 from math import exp, log
 
-from scipy import roots
 from scipy.constants import R
 
-from lib.EoS.cubic import Cubic
+from lib.EoS.cubic import Cubic, CubicRoots
 
 
 # Table 2 from [2]_
@@ -198,11 +197,13 @@ class TB(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = bm+cm
-        self.epsilon = -bm*cm - dm**2
+        self.delta, self.epsilon = self._volume(bm, cm, dm)
 
         super(TB, self).__init__(T, P, mezcla)
 
+    def _volume(self, b, c, d):
+        return b+c, -b*c - d**2
+
     def __lib(self, cmp, T):
         Tr = T/cmp.Tc
 
@@ -231,13 +232,8 @@ class TB(Cubic):
         Dc = d*cmp.Pc/R/cmp.Tc                                      # Eq 12
         Cc = 1-3*Xc                                                 # Eq 6
 
-        # Bc calculated ad the smallest positive root of Eq 8
-        B = roots([1, 2-3*Xc, 3*Xc**2, -Dc**2-Xc**3])
-        Bpositivos = []
-        for Bi in B:
-            if Bi > 0:
-                Bpositivos.append(Bi)
-        Bc = min(Bpositivos)
+        # Bc calculated as the only positive root of Eq 8, the largest one
+        Bc = CubicRoots(2-3*Xc, 3*Xc**2, -Dc**2-Xc**3)[1]
 
         Ac = 3*Xc**2 + 2*Bc*Cc + Bc + Cc + Bc**2 + Dc**2            # Eq 7
 
@@ -18,10 +18,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 
-from scipy import roots
 from scipy.constants import R
 
-from lib.EoS.cubic import Cubic
+from lib.EoS.cubic import Cubic, CubicRoots
 
 
 # Table 1
@@ -177,11 +176,13 @@ class TBS(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = bm+cm
-        self.epsilon = -bm*cm - dm**2
+        self.delta, self.epsilon = self._volume(bm, cm, dm)
 
         super(TBS, self).__init__(T, P, mezcla)
 
+    def _volume(self, b, c, d):
+        return b+c, -b*c - d**2
+
     def __lib(self, cmp, T):
         Tr = T/cmp.Tc
 
@@ -210,13 +211,8 @@ class TBS(Cubic):
         Cc = 1-3*Xc                                                    # Eq 6
         Dc = d*cmp.Pc/R/cmp.Tc                                         # Eq 12
 
-        # Bc calculated ad the smallest positive root of Eq 8
-        B = roots([1, 2-3*Xc, 3*Xc**2, -Dc**2-Xc**3])
-        Bpositivos = []
-        for Bi in B:
-            if Bi > 0:
-                Bpositivos.append(Bi)
-        Bc = min(Bpositivos)
+        # Bc calculated as the only positive root of Eq 8, the largest one
+        Bc = CubicRoots(2-3*Xc, 3*Xc**2, -Dc**2-Xc**3)[1]
 
         Ac = 3*Xc**2 + 2*Bc*Cc + Bc + Cc + Bc**2 + Dc**2                # Eq 7
         ac = Ac*R**2*cmp.Tc**2/cmp.Pc
@@ -76,11 +76,13 @@ class vdW(Cubic):
         self.bi = bi
         self.b = bm
         self.tita = am
-        self.delta = 0
-        self.epsilon = 0
+        self.delta, self.epsilon = self._volume(bm)
 
         super(vdW, self).__init__(T, P, mezcla)
 
+    def _volume(self, b):
+        return 0, 0
+
     def __lib(self, cmp):
         a = 0.421875*R**2*cmp.Tc**2/cmp.Pc
         b = 0.125*R*cmp.Tc/cmp.Pc
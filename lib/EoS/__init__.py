@@ -18,10 +18,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 
-from PyQt5.QtWidgets import QApplication
-
 from lib.EoS import cubic
 from lib.EoS.cubic import alfa
+from lib.qt import QApplication
 from . import BWRS
 from . import Cubic
 from . import Grayson_Streed
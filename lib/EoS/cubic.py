@@ -46,17 +46,20 @@ expression changing the values of δ, ε and the expresion of α(T)
 """
 
 
-from scipy import roots, r_, log, exp, sqrt
-from scipy.constants import R
+import copy
+import math
 
-from PyQt5.QtWidgets import QApplication
+from numpy import (arccos, arctan, array, asarray, cbrt, clip, cos, errstate,
+                   exp, log, pi, r_, sqrt, where)
+from scipy.constants import R
 
 from lib import unidades
 # from lib.corriente import Mezcla
 from lib.eos import EoS
 from lib.physics import R_atml
-from lib.bip import Kij, Mixing_Rule
+from lib.bip import Aij, Kij, Mixing_Rule
 from lib.utilities import refDoc
+from lib.qt import QApplication
 
 
 # TODO: Add parameters, file
@@ -88,9 +91,10 @@ __doi__ = {
          "doi": "10.6028/jres.121.011"},
 
     4:
-        {"autor": "",
-         "title": "",
-         "ref": "",
+        {"autor": "Michelsen, M.L., Mollerup, J.M.",
+         "title": "Thermodynamic Models: Fundamentals & Computational "
+                  "Aspects, 2nd Edition",
+         "ref": "Tie-Line Publications, Holte, 2007",
          "doi": ""},
         }
 
@@ -202,6 +206,250 @@ def CubicHelmholtz(tau, delta, **kw):
     return prop
 
 
+def CubicRoots(c2, c1, c0):
+    r"""Smallest and largest real roots of a cubic polynomial in the form
+
+    .. math::
+        Z^3 + c_2Z^2 + c_1Z + c_0 = 0
+
+    using the analytic solution, the trigonometric method when there are three
+    real roots and the Cardano formula when there are only one real root,
+    improved with a Newton step. The coefficients can be arrays, so the roots
+    of several states are calculated in a single call
+
+    Parameters
+    ----------
+    c2 : float or array
+        Coefficient of second degree term
+    c1 : float or array
+        Coefficient of first degree term
+    c0 : float or array
+        Independent coefficient
+
+    Returns
+    -------
+    Zmin : float or array
+        Smallest real root
+    Zmax : float or array
+        Largest real root, equal to Zmin with only one real root
+
+    Examples
+    --------
+    >>> "%0.6f %0.6f" % CubicRoots(-6, 11, -6)
+    '1.000000 3.000000'
+    >>> "%0.6f %0.6f" % CubicRoots(0, 1, -2)
+    '1.000000 1.000000'
+    >>> Zmin, Zmax = CubicRoots([-6, -7], [11, 14], [-6, -8])
+    >>> " ".join("%0.6f" % z for z in r_[Zmin, Zmax])
+    '1.000000 1.000000 3.000000 4.000000'
+    """
+    if all(isinstance(c, (int, float)) for c in (c2, c1, c0)):
+        # Single state, avoid the overhead of numpy arrays
+        p = c1 - c2**2/3
+        q = 2*c2**3/27 - c2*c1/3 + c0
+        disc = q**2/4 + p**3/27
+
+        if disc > 0:
+            # One real root, Cardano formula avoiding the cancellation of terms
+            u = math.copysign((abs(q)/2+disc**0.5)**(1/3), -q)
+            t = u-p/3/u
+            t = (t, t)
+        elif p < 0:
+            # Three real roots, trigonometric method
+            r = (-p/3)**0.5
+            phi = math.acos(min(max(-q/2/r**3, -1), 1))/3
+            t = (2*r*math.cos(phi+2*math.pi/3), 2*r*math.cos(phi))
+        else:
+            t = (0, 0)
+
+        roots = []
+        for z in t:
+            # Newton step to refine the analytic solution
+            z -= c2/3
+            df = (3*z+2*c2)*z+c1
+            if df:
+                z -= (((z+c2)*z+c1)*z+c0)/df
+            roots.append(z)
+        return tuple(roots)
+
+    c2 = asarray(c2, dtype=float)
+    c1 = asarray(c1, dtype=float)
+    c0 = asarray(c0, dtype=float)
+
+    p = c1 - c2**2/3
+    q = 2*c2**3/27 - c2*c1/3 + c0
+    disc = q**2/4 + p**3/27
+
+    with errstate(invalid="ignore", divide="ignore"):
+        u = where(q < 0, 1., -1.)*cbrt(abs(q)/2+sqrt(where(disc > 0, disc, 0)))
+        t = where(u != 0, u-p/3/u, 0)
+
+        r = sqrt(where(p < 0, -p/3, 0))
+        phi = arccos(clip(where(r > 0, -q/2/r**3, 0), -1, 1))/3
+        tmax = 2*r*cos(phi)
+        tmin = 2*r*cos(phi+2*pi/3)
+
+        three = disc <= 0
+        roots = []
+        for z in (where(three, tmin, t)-c2/3, where(three, tmax, t)-c2/3):
+            f = ((z+c2)*z+c1)*z+c0
+            df = (3*z+2*c2)*z+c1
+            roots.append(where(df != 0, z-f/where(df != 0, df, 1), z))
+
+    return tuple(roots)
+
+
+def CubicZ(T, P, a, b, delta, epsilon):
+    r"""Liquid and gas compressibility factor of a generic cubic equation of
+    state
+
+    .. math::
+        P = \frac{RT}{V-b}-\frac{a}{V^2+\delta V+\epsilon}
+
+    The parameters can be arrays for the calculation of several states of
+    the same composition in a single call, the mixture parameters must be
+    evaluated at each temperature
+
+    Parameters
+    ----------
+    T : float or array
+        Temperature, [K]
+    P : float or array
+        Pressure, [Pa]
+    a : float or array
+        Attractive parameter of mixture, [Pa·m⁶/mol²]
+    b : float or array
+        Covolume of mixture, [m³/mol]
+    delta : float or array
+        δ parameter of mixture, [m³/mol]
+    epsilon : float or array
+        ε parameter of mixture, [m⁶/mol²]
+
+    Returns
+    -------
+    Zl : float or array
+        Liquid compressibility factor, smallest root with volume greater
+        than covolume, [-]
+    Zg : float or array
+        Gas compressibility factor, largest root, [-]
+    """
+    B = b*P/R/T
+    A = a*P/(R*T)**2
+    d = delta*P/R/T
+    e = epsilon*(P/R/T)**2
+
+    # Eq 4-6.3 in [1]_
+    Zl, Zg = CubicRoots(d-B-1, A+e-d*(B+1), -e*(B+1)-A*B)
+
+    # The roots with volume lower than covolume have no physical meaning
+    if isinstance(Zl, float):
+        if Zl <= B:
+            Zl = Zg
+    else:
+        Zl = where(Zl > B, Zl, Zg)
+    return Zl, Zg
+
+
+def CubicLnPhi(T, P, Z, a, b, delta, epsilon, dai, bi, deltai, epsiloni):
+    r"""Logarithm of fugacity coefficient of components of mixture in a
+    generic cubic equation of state
+
+    .. math::
+        P = \frac{RT}{V-b}-\frac{a}{V^2+\delta V+\epsilon}
+
+    The residual Helmholtz free energy is:
+
+    .. math::
+        \frac{A^r}{RT} = -n\ln\left(1-\frac{b}{V}\right) -
+        \frac{na}{RT}g\left(V, \delta, \epsilon\right)
+
+    .. math::
+        g = \int_V^\infty\frac{dv}{v^2+\delta v+\epsilon}
+
+    and the fugacity coefficients are calculated analitically with its
+    derivatives with respect to the moles of components, Chapter 3 in [4]_
+
+    .. math::
+        \ln\phi_i = \frac{b_i}{V-b} - \ln\left(Z-B\right) -
+        \frac{1}{RT}\left(a_ig - a\delta_i\frac{\partial g}{\partial\delta} -
+        a\epsilon_i\frac{\partial g}{\partial\epsilon}\right)
+
+    The parameters of mixture can be arrays with the states in a single call,
+    the parameters of components must be arrays with the component in last
+    dimension
+
+    Parameters
+    ----------
+    T : float or array
+        Temperature, [K]
+    P : float or array
+        Pressure, [Pa]
+    Z : float or array
+        Compressibility factor of phase, [-]
+    a : float or array
+        Attractive parameter of mixture, [Pa·m⁶/mol²]
+    b : float or array
+        Covolume of mixture, [m³/mol]
+    delta : float or array
+        δ parameter of mixture, [m³/mol]
+    epsilon : float or array
+        ε parameter of mixture, [m⁶/mol²]
+    dai : array
+        Derivative of attractive parameter, ∂n²a/∂nᵢ/n, [Pa·m⁶/mol²]
+    bi : array
+        Derivative of covolume, ∂nb/∂nᵢ, [m³/mol]
+    deltai : array
+        Derivative of δ, ∂nδ/∂nᵢ, [m³/mol]
+    epsiloni : array
+        Derivative of ε, ∂n²ε/∂nᵢ/n, [m⁶/mol²]
+
+    Returns
+    -------
+    lnphi : array
+        Logarithm of fugacity coefficient of components, [-]
+    """
+    if all(isinstance(x, (int, float)) for x in (T, P, Z, delta, epsilon)):
+        # Single state, avoid the overhead of numpy arrays
+        V = Z*R*T/P
+        D = delta**2 - 4*epsilon
+        Q = V**2 + delta*V + epsilon
+        x = 2*V + delta
+
+        # g and the integrals of its derivatives with respect to δ and ε,
+        # with the special case of two equals roots when D is zero
+        if D > 0:
+            s = D**0.5
+            g = math.log((x+s)/(x-s))/s
+        elif D < 0:
+            s = (-D)**0.5
+            g = (math.pi-2*math.atan(x/s))/s
+        else:
+            g = 2/x
+        if D:
+            I2 = (x/Q-2*g)/D
+        else:
+            I2 = 8/3/x**3
+
+    else:
+        T, P, Z, a, b, delta, epsilon = [
+            asarray(x, dtype=float)[..., None]
+            for x in (T, P, Z, a, b, delta, epsilon)]
+
+        V = Z*R*T/P
+        D = delta**2 - 4*epsilon
+        Q = V**2 + delta*V + epsilon
+        x = 2*V + delta
+
+        with errstate(invalid="ignore", divide="ignore"):
+            s = sqrt(abs(D))
+            g = where(D > 0, log((x+s)/(x-s))/s, (pi-2*arctan(x/s))/s)
+            g = where(D == 0, 2/x, g)
+            I2 = where(D == 0, 8/3/x**3, (x/Q-2*g)/D)
+
+    I1 = 1/2/Q - delta/2*I2
+    return bi/(V-b) - log(Z-b*P/R/T) - (dai*g-a*(deltai*I1+epsiloni*I2))/R/T
+
+
 @refDoc(__doi__, [1, 2])
 class Cubic(EoS):
     r"""Class to implement the common functionality of cubic equation of state
@@ -220,6 +468,30 @@ class Cubic(EoS):
 
     .. math::
         \delta_2 = -\frac{\sqrt{\delta^2-4\epsilon}+\delta}{2b}
+
+    The fugacity coefficients of components are calculated analitically for
+    any equation with the van der Waals one-fluid mixing rules, defining the
+    δ and ε parameters from the linear parameters of mixture in method
+    _volume
+
+    Examples
+    --------
+    Fugacity coefficients of propane saturated at 300K, equal in both phases
+
+    >>> from lib.mezcla import Mezcla
+    >>> from lib.EoS.Cubic import PR
+    >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
+    >>> eq = PR(300, 9.9742e5, mix)
+    >>> "%0.3f %0.3f" % (eq._fug(eq.Zl, [1])[0], eq._fug(eq.Zg, [1])[0])
+    '0.843 0.843'
+
+    The vapor fraction and phase compositions of a mixture are calculated
+    with the flash engine
+
+    >>> mix = Mezcla(5, ids=[4, 6], caudalMolar=1, fraccionMolar=[0.5, 0.5])
+    >>> eq = PR(280, 3e5, mix)
+    >>> "%0.4f %0.4f %0.4f" % (eq.x, eq.xi[0], eq.yi[0])
+    '0.3534 0.3853 0.7099'
     """
 
     def __init__(self, T, P, mezcla):
@@ -233,47 +505,150 @@ class Cubic(EoS):
         self.B = self.b*P/R/T
         self.Tita = self.tita*P/(R*T)**2
 
-        delta = self.delta*P/R/T
-        epsilon = self.epsilon*(P/R/T)**2
-
         # δ1, δ2 calculated from polynomial factorization
         self.delta1 = ((self.delta**2-4*self.epsilon)**0.5-self.delta)/2/self.b
         self.delta2 = ((self.delta**2-4*self.epsilon)**0.5+self.delta)/2/self.b
 
-        # Eq 4-6.3 in [1]_
-        coeff = [1, delta-self.B-1, self.Tita+epsilon-delta*(self.B+1),
-                 -epsilon*(self.B+1)-self.Tita*self.B]
-        Z = roots(coeff)
-        # print("Z", Z)
-        # TODO: use the anallycal solution, Span, pag 50
-
         # Set the minimum and maximum root values as liquid and gas Z values
-        self.Z = r_[Z[0].real, Z[2].real]
-        self.Zl = min(Z).real
-        self.Zg = max(Z).real
+        self.Zl, self.Zg = CubicZ(T, P, self.tita, self.b, self.delta,
+                                  self.epsilon)
+        self.Z = r_[self.Zg, self.Zl]
 
         self.V = self.Z*R_atml*T/P_atm  # l/mol
         self.rho = 1/self.V
         self.Vl = unidades.MolarVolume(self.Zl*R*T/P, "m3mol")   # l/mol
         self.Vg = unidades.MolarVolume(self.Zg*R*T/P, "m3mol")  # l/mol
 
-        # tau = mezcla.Tc/T
-        # delta = self.V[0]*mezcla.Vc
-        # kw = {}
-        # print(CubicHelmholtz(tau, delta, **kw))
-
-
-        # print(coeff, Z)
-        # self.x, self.xi, self.yi, self.Ki = self._Flash()
-
-        # dep_v = self._departure(self.tita, self.b, self.delta, self.epsilon, self.dTitadT, self.V[0], T)
-        # dep_l = self._departure(self.tita, self.b, self.delta, self.epsilon, self.dTitadT, self.V[1], T)
+        # The flash of mixture is done only when the phase state is
+        # requested, the clones used in saturation and enthalpy calculation
+        # don't need it
+        self.flashInfo = None
+        self._H_exc = None
+
+    def _flashState(self):
+        """Return the result of flash engine, calculated in first use"""
+        if self.flashInfo is None:
+            self._Flash()
+        return self.flashInfo
+
+    @property
+    def x(self):
+        """Vapor fraction of mixture"""
+        return unidades.Dimensionless(self._flashState()["beta"])
+
+    @property
+    def xi(self):
+        """Molar fraction of components in liquid phase"""
+        return list(self._flashState()["x"])
+
+    @property
+    def yi(self):
+        """Molar fraction of components in vapor phase"""
+        return list(self._flashState()["y"])
+
+    @property
+    def Ki(self):
+        """Equilibrium ratios of components"""
+        return list(self._flashState()["K"])
+
+    @property
+    def H_exc(self):
+        """Enthalpy departure of vapor and liquid phases, (H°-H)/RT"""
+        if self._H_exc is None:
+            res = self._flashState()
+            self._H_exc = r_[self._Hexc(res["y"], res["Zg"]),
+                             self._Hexc(res["x"], res["Zl"])]
+        return self._H_exc
 
     def _mixture(self, eq, ids, par):
-        self.kij = Kij(ids, eq)
+        """Calculate the parameters of mixture, saving the matrix of
+        attractive parameters and the linear parameters of components for the
+        calculation of fugacities. The interaction parameters are reused if
+        already defined by clone"""
+        if getattr(self, "kij", None) is None:
+            self.kij = array(Kij(ids, eq), dtype=float)
+        self._aij = Aij(par[0], self.kij)
+        self._pari = array(par[1:], dtype=float)
         mixpar = Mixing_Rule(self.mezcla.fraccion, par, self.kij)
         return mixpar
 
+    def _volume(self, b, *par):
+        """Return the δ and ε parameters of equation from the linear
+        parameters of mixture, b and the aditional parameters, must be
+        defined in each equation"""
+        raise NotImplementedError
+
+    def _composition(self, xi):
+        """Calculate the parameters of mixture with composition xi and its
+        derivatives with respect to the moles of components, with the van der
+        Waals one-fluid mixing rules. The last result is saved because the
+        compressibility factor and the fugacities of a phase are calculated
+        with the same composition"""
+        xi = asarray(xi, dtype=float)
+        key = xi.tobytes()
+        cache = getattr(self, "_compositionCache", None)
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        dai = 2*self._aij.dot(xi)
+        a = xi.dot(dai)/2
+        parm = self._pari.dot(xi)
+        delta, epsilon = self._volume(*parm)
+
+        # δ is linear and ε quadratic in the linear parameters so its
+        # derivatives are exact with the polarization of the expressions
+        deltai, epsilonii = self._volume(*self._pari)
+        epsiloni = self._volume(*(parm[:, None]+self._pari))[1] - \
+            epsilon - epsilonii
+        par = (a, parm[0], delta, epsilon, dai, self._pari[0], deltai,
+               epsiloni)
+        self._compositionCache = key, par
+        return par
+
+    def _Z(self, xi):
+        """Liquid and gas compressibility factor of a phase with composition
+        xi at the temperature and pressure of state"""
+        a, b, delta, epsilon = self._composition(xi)[:4]
+        return CubicZ(self.T, self.P, a, b, delta, epsilon)
+
+    def _lnphi(self, xi, Z):
+        """Logarithm of fugacity coefficient of components in a phase with
+        composition xi and compressibility factor Z"""
+        return CubicLnPhi(self.T, self.P, Z, *self._composition(xi))
+
+    def _fug(self, Z, xi):
+        """Fugacity coefficient of components in a phase with composition xi
+        and compressibility factor Z"""
+        return exp(self._lnphi(xi, Z))
+
+    def clone(self, T=None, P=None):
+        """Return the equation of state at other temperature or pressure, in
+        Pa, at the same temperature only the compressibility factor must be
+        recalculated"""
+        if P is None:
+            P = self.P
+        if T is None or T == self.T:
+            eq = copy.copy(self)
+            Cubic.__init__(eq, self.T, P, self.mezcla)
+            return eq
+        eq = self.__class__.__new__(self.__class__)
+        eq.kij = self.kij
+        eq.__init__(T, P, self.mezcla)
+        return eq
+
+    def _Hexc(self, xi, Z):
+        """Enthalpy departure of a phase with composition xi and
+        compressibility factor Z, (H°-H)/RT, the temperature derivative of
+        attractive parameter is calculated numerically"""
+        a, b, delta, epsilon = self._composition(xi)[:4]
+        dT = self.T*1e-6
+        if getattr(self, "_eqdT", None) is None:
+            self._eqdT = self.clone(T=self.T+dT)
+        dadT = (self._eqdT._composition(xi)[0]-a)/dT
+        V = Z*R*self.T/self.P
+        return self._departure(a, b, delta, epsilon, -self.T*dadT, V,
+                               self.T)["H"]
+
     # def _PHIO(self, cp, Tc):
         # """Convert cp dict in phi0 dict when the cp expression isn't in
         # Helmholtz free energy terms"""
@@ -405,7 +780,7 @@ class Cubic(EoS):
 
     def _departure(self, a, b, d, e, TdadT, V, T):
         """Calculate departure function, Table 6-3 from [1]"""
-        Z = 1 + b/(V-b) - a*V/R_atml/T/(V**2+d*V+e)
+        Z = 1 + b/(V-b) - a*V/R/T/(V**2+d*V+e)
 
         # Numerador and denominator used in several expression
         K = (d**2-4*e)**0.5
@@ -414,56 +789,18 @@ class Cubic(EoS):
         kw = {}
         kw["Z"] = Z
         if K:
-            kw["H"] = 1 - (a+TdadT)/R_atml/T/K*log(num/den) - Z
-            kw["S"] = TdadT/R_atml/K*log(num/den) - log(Z*(1-b/V))
-            kw["A"] = -a/R_atml/T/K*log(num/den) + log(Z*(1-b/V))
-            kw["f"] = a/R_atml/T/K*log(num/den) - log(Z*(1-b/V)) - (1-Z)
+            kw["H"] = 1 - (a+TdadT)/R/T/K*log(num/den) - Z
+            kw["S"] = TdadT/R/K*log(num/den) - log(Z*(1-b/V))
+            kw["A"] = -a/R/T/K*log(num/den) + log(Z*(1-b/V))
+            kw["f"] = a/R/T/K*log(num/den) - log(Z*(1-b/V)) - (1-Z)
         else:
-            kw["H"] = 1 - Z
-            kw["S"] = -log(Z*(1-b/V))
-            kw["A"] = log(Z*(1-b/V))
-            kw["f"] = -log(Z*(1-b/V)) - (1-Z)
+            g = 2/(2*V+d)
+            kw["H"] = 1 + (a+TdadT)*g/R/T - Z
+            kw["S"] = -TdadT*g/R - log(Z*(1-b/V))
+            kw["A"] = a*g/R/T + log(Z*(1-b/V))
+            kw["f"] = -a*g/R/T - log(Z*(1-b/V)) - (1-Z)
         return kw
 
-    def _fug(self, Z, xi):
-        """Calculate partial fugacities coefficieint of components
-
-        References
-        ----------
-        mollerup, Chap 2, pag 64 and so
-        """
-        V = Z*R_atml*self.T/self.P
-
-        g = log(V-self.b) - log(V)                                     # Eq 61
-        f = 1/R_atml/self.b/(self.delta1-self.delta2) * \
-            log((V+self.delta1*self.b)/(V+self.delta2*self.b))         # Eq 62
-
-        gB = -1/(V-self.b)                                             # Eq 80
-        
-        An = -g                                                        # Eq 75
-        AB = -n*gB-D/self.T*fB                                         # Eq 78
-        AD = -f/self.T                                                 # Eq 79
-
-        # Ch.3, Eq 66
-        dAni = An+AB*Bi+AD*Di
-
-        # Ch.2, Eq 13
-        fi = dAni - log(Z)
-        return
-
-        
-
-    def _fug(self, Z, xi):
-        Ai=[]
-        for i in range(len(self.componente)):
-            suma=0
-            for j in range(len(self.componente)):
-                suma+=self.zi[j]*self.ai[j]**0.5*(1-self.kij[i][j])
-            Ai.append(1/self.tita*2*self.ai[i]**0.5*suma)
-        tita=[]
-        for i in range(len(self.componente)):
-            tita.append(exp(self.bi[i]/self.b*(Z-1)-log(Z-self.B)-self.Tita/self.B/sqrt(self.u**2-4*self.w)*(Ai[i]-self.bi[i]/self.b)*log((Z+self.B/2*(self.u+sqrt(self.u**2-4*self.w)))/(Z+self.B/2*(self.u-sqrt(self.u**2-4*self.w))))).real)
-        return tita
 
 # if __name__ == "__main__":
     # # from lib.mezcla import Mezcla
@@ -21,14 +21,17 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 ###############################################################################
 # lib module
 # module with general library functionality of pychemqt
+# The modules are imported in the first use, so the calculation modules can
+# be used without import the graphical ones
 ###############################################################################
 
 
 import glob
+import importlib
 import os
 
 
-files = sorted(glob.glob(os.path.join("lib", "*.py")))
+files = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py")))
 __all__ = ["EoS", "mEoS"]
 
 for file in files:
@@ -36,6 +39,9 @@ for file in files:
     if fname != "__init__":
         __all__.append(fname)
 
-for module in __all__:
-    child_module = "lib." + module
-    __import__(child_module)
+
+def __getattr__(name):
+    """Import the lib modules in the first use"""
+    if name in __all__:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
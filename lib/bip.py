@@ -18,113 +18,139 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 
 
-from numpy import zeros
+from numpy import arange, asarray, clip, outer, sqrt, zeros
 
 from lib import config
-from lib.sql import databank
+from lib.sql import databank_name, getConnection
 
 
 EoSBIP = ["SRK", "PR", "APISRK", "BWRS", "NRTL", "UNIQUAC", "WILSON"]
 
+# Columns of parameters in the bip tables of databank
+_columns = {
+    "SRK": ("kij", ),
+    "PR": ("kij", ),
+    "APISRK": ("kij", ),
+    "BWRS": ("kij", ),
+    "NRTL": ("Gij", "Gji", "alpha"),
+    "UNIQUAC": ("DUij", "DUji"),
+    "WILSON": ("Aij", "Aji")}
+
+# In-memory bip tables, loaded in the first use, and cache of interaction
+# matrix of mixtures, keyed by model and the sorted tuple of ids
+_tables = {}
+_cache = {}
+
+
+def _table(EOS):
+    """Load the bip table of model from databank in a single query, return
+    a dict with the position of each component in matrix and the array of
+    parameters with shape (parameters, components, components)"""
+    if EOS not in _tables:
+        db = getConnection(databank_name).cursor()
+        db.execute("SELECT i, j, %s FROM %sbip" % (
+            ", ".join(_columns[EOS]), EOS))
+        rows = db.fetchall()
+        db.close()
+
+        index = {}
+        for row in rows:
+            for id in row[:2]:
+                index.setdefault(id, len(index))
+        par = zeros((len(_columns[EOS]), len(index), len(index)))
+        for row in rows:
+            i, j = index[row[0]], index[row[1]]
+            if len(_columns[EOS]) == 1:
+                # Simple case with only a symetric parameter
+                par[0, i, j] = par[0, j, i] = row[2]
+            else:
+                # Asymetric bip, saved in order of ids in database
+                par[0, j, i] = row[3]
+                par[0, i, j] = row[2]
+                if EOS == "NRTL":
+                    par[1, i, j] = par[1, j, i] = row[4]
+        _tables[EOS] = index, par
+    return _tables[EOS]
+
 
 def Kij(ids, EOS=None):
     """Calculate binary interaction matrix for component of mixture,
     use bip data from database
 
+    The bip tables are loaded from database in the first use and the
+    matrix of each mixture is cached, so the repeated calculations with the
+    same components don't access to database
+
     Parameters
     ----------
     ids : list
         Index of components in database, [-]
     EOS : string
         Code of equation of state: SRK, APISRK, PR, BWRS, NRTL, UNIQUAC, WILSON
+
+    Returns
+    -------
+    kij : array
+        Read-only binary interaction matrix, for NRTL it's returned too the
+        matrix of α parameters
+
+    Examples
+    --------
+    >>> "%0.4f" % Kij([2, 5], "PR")[0][1]
+    '0.0256'
+    >>> Kij([2, 5], "PR")[1][0] == Kij([5, 2], "PR")[0][1]
+    True
     """
     # Return null bip if EOS is not specified
     if EOS is None or EOS not in EoSBIP:
         kij = zeros((len(ids), len(ids)))
         return kij
 
-    # Continue with real procedure
-    # Simple case with only a symetric parameter
-    if EOS in ["SRK", "APISRK", "PR", "BWRS"]:
-        kij = []
-        query = "SELECT kij FROM %sbip WHERE i=? AND j=?" % EOS
-        for i in ids:
-            kiji = []
-            for j in ids:
-                i_ = min(i, j)
-                j_ = max(i, j)
-                databank.execute(query, (i_, j_))
-                k = databank.fetchone()
-                if k:
-                    kiji.append(float(k[0]))
-                else:
-                    kiji.append(0)
-
-            kij.append(kiji)
-        return kij
-
-    # Asymetric BIP
+    key = tuple(sorted(set(ids)))
+    if (EOS, key) not in _cache:
+        index, par = _table(EOS)
+        pos = asarray([index.get(id, -1) for id in key], dtype=int)
+        found = pos >= 0
+        kij = zeros((len(par), len(key), len(key)))
+        kij[:, found[:, None] & found] = par[:, pos[found]][:, :, pos[found]]\
+            .reshape(len(par), -1)
+        kij.flags.writeable = False
+        _cache[EOS, key] = kij
+
+    # Reorder the matrix of sorted ids to the order of components
+    kij = _cache[EOS, key]
+    order = [key.index(id) for id in ids]
+    if order != list(arange(len(key))):
+        kij = kij[:, order][:, :, order]
+        kij.flags.writeable = False
+
+    if EOS == "NRTL":
+        return kij[0], kij[1]
     else:
-        kij = []
-        query = "SELECT * FROM %sbip WHERE i=? AND j=?" % EOS
-        for i in ids:
-            kiji = []
-            for j in ids:
-                i_ = min(i, j)
-                j_ = max(i, j)
-                databank.execute(query, (i_, j_))
-                k = databank.fetchone()
-                if i == i_ and k:
-                    kiji.append(float(k[3]))
-                elif k:
-                    kiji.append(float(k[4]))
-                else:
-                    kiji.append(0)
-            kij.append(kiji)
-
-        # Get second parameter for NRTL
-        if EOS == "NRTL":
-            alpha = []
-            query = "SELECT alpha FROM NRTLbip WHERE i=? AND j=?"
-            for i in ids:
-                alphai = []
-                for j in ids:
-                    i_ = min(i, j)
-                    j_ = max(i, j)
-                    databank.execute(query, (i_, j_))
-                    a = databank.fetchone()
-                    if a:
-                        alphai.append(float(a[0]))
-                    else:
-                        alphai.append(0)
-                alpha.append(alphai)
-
-            return kij, alpha
-        else:
-            return kij
+        return kij[0]
 
 
 # Mixing Rules
+def Aij(ai, kij):
+    """Matrix of croos-energy parameters with the geometric mean rule, the
+    negative products of temperature functions out of its range of validity
+    don't contribute"""
+    ai = asarray(ai, dtype=float)
+    return sqrt(clip(outer(ai, ai), 0, None))*(1-asarray(kij, dtype=float))
+
+
 def Mix_vdW1f(xi, parameters, kij):
     """Mixing rules of van der Waals"""
-    ai = parameters[0]
-    bi = parameters[1:]
+    xi = asarray(xi, dtype=float)
+    bi = asarray(parameters[1:], dtype=float)
 
     # Geometric mean rule for croos-energy parameter
-    a = 0
-    for x_i, a_i, kiji in zip(xi, ai, kij):
-        for x_j, a_j, k in zip(xi, ai, kiji):
-            a += x_i * x_j * (a_i*a_j)**0.5 * (1-k)
+    a = xi.dot(Aij(parameters[0], kij)).dot(xi)
 
     # Arithmetic mean rule for the aditional parameters
-    b = []
-    for b_i in bi:
-        suma = 0
-        for x_i, bii in zip(xi, b_i):
-            suma += x_i*bii
-        b.append(suma)
+    b = bi.dot(xi)
 
-    return tuple([a]+b)
+    return tuple([a]+list(b))
 
 
 def Mix_Stryjek_Vera(self, parameters, kij):
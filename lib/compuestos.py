@@ -123,11 +123,13 @@ Others method:
 '''
 
 
+from collections import OrderedDict
 import math
 import os
 import re
 import tempfile
 
+from numpy import select
 from scipy import exp, cosh, sinh, tanh, log, log10, roots, absolute, array
 from scipy.optimize import fsolve
 from scipy.constants import R, Avogadro, Boltzmann
@@ -744,7 +746,7 @@ def RhoL_Costald(T, Tc, w, Vc):
 
     # TODO: Add V* to the database
     V = Vc*Vr0*(1-w*Vr1)                                               # Eq 16
-    return unidades.Density(1/V)
+    return unidades.Density.array(1/V)
 
 
 def RhoL_Cavett(T, Tc, M, Vliq):
@@ -1210,7 +1212,7 @@ def RhoL_TaitCostald(T, P, Tc, Pc, w, Ps, rhos):
 
     # Eq 5
     rho = rhos/(1-C*log((B+P)/(B+Ps)))
-    return unidades.Density(rho, "gl")
+    return unidades.Density.array(rho, "gl")
 
 
 @refDoc(__doi__, [30])
@@ -1346,7 +1348,7 @@ def RhoL_AaltoKeskinen(T, P, Tc, Pc, w, Ps, rhos):
 
     # Eq 5
     rho = rhos*(A+C*(Pr-Psr))/(A+C**(1.00588-Tr)**B*(Pr-Psr))          # Eq 14
-    return unidades.Density(rho)
+    return unidades.Density.array(rho)
 
 
 @refDoc(__doi__, [37, 38])
@@ -1509,7 +1511,7 @@ def RhoL_Nasrifar(T, P, Tc, Pc, w, M, Ps, rhos):
 
     # Eq 9
     v = C*tanh(phi)*(v_inf-vs)+vs
-    return unidades.Density(1/v)
+    return unidades.Density.array(1/v)
 
 
 @refDoc(__doi__, [33, 5])
@@ -4000,20 +4002,18 @@ def ThG_StielThodos(T, Tc, Pc, Vc, M, V, ko):
     Zc = Pc*1e-3*Vc*M/Tc/R
 
     # The thermal conductivity in the paper define in cal/s·cm·K
-    ko = unidades.ThermalConductivity(ko).calscmK
+    ko = ko/unidades.ThermalConductivity.rates["calscmK"]
 
     rhor = Vc/V
     gamma = (Tc*M**3/(Pc/101325)**4)**(1/6)
 
-    if rhor < 0.5:
-        lr = 14*(exp(0.535*rhor) - 1)                                   # Eq 3
-    elif rhor < 2:
-        lr = 13.1*(exp(0.67*rhor) - 1.069)                              # Eq 4
-    else:
-        lr = 2.976*(exp(1.155*rhor) + 2.016)                            # Eq 5
+    lr = select([rhor < 0.5, rhor < 2], [
+        14*(exp(0.535*rhor) - 1),                                       # Eq 3
+        13.1*(exp(0.67*rhor) - 1.069)],                                 # Eq 4
+        2.976*(exp(1.155*rhor) + 2.016))                                # Eq 5
 
     k = ko + lr*1e-8/Zc**5/gamma
-    return unidades.ThermalConductivity(k, "calscmK")
+    return unidades.ThermalConductivity.array(k, "calscmK")
 
 
 @refDoc(__doi__, [49, 1])
@@ -4734,6 +4734,25 @@ def Henry(T, args):
     return unidades.Pressure(H, "psi")
 
 
+# Process-wide LRU registry of parsed constant records of compounds, keyed by
+# id, calculation method kwargs and the configuration used in the parsing
+_records = OrderedDict()
+_recordsSize = 256
+
+
+def _invalidateRecords(indice=None):
+    """Remove the cached records of a compound changed in custom databank,
+    all records if indice is None"""
+    if indice is None:
+        _records.clear()
+    else:
+        for key in [key for key in _records if key[0] == indice]:
+            del _records[key]
+
+
+sql.addInvalidateHook(_invalidateRecords)
+
+
 class Componente(object):
     """Class to define a chemical compound from the database
 
@@ -4762,6 +4781,14 @@ class Componente(object):
     for now only in API usage. Not custom stream property definition in main
     program
 
+    The constant properties parsed from database are saved in a process-wide
+    LRU registry, so the next instances of the same compound, for example the
+    components of a mixture in each stream, don't need to read the database
+    again. The registry is invalidated when the custom databank is changed
+
+    >>> Componente(5).Tc is Componente(5).Tc
+    True
+
     Examples
     --------
     This are several ejemples of usage of this class with several configuration
@@ -5022,6 +5049,24 @@ class Componente(object):
         self.kwargs = Componente.kwargs.copy()
         self.kwargs.update(kwargs)
         self.Config = config.getMainWindowConfig()
+
+        key = (id, self.Config.get("Transport", "f_acent"),
+               self.Config.get("Transport", "Pv"))
+        key += tuple(self.kwargs[k] for k in Componente.kwargs)
+        record = _records.get(key)
+        if record is not None:
+            _records.move_to_end(key)
+            self.__dict__.update(record)
+            return
+
+        self._parse(id)
+        _records[key] = {k: v for k, v in self.__dict__.items()
+                         if k not in ("kwargs", "Config")}
+        if len(_records) > _recordsSize:
+            _records.popitem(last=False)
+
+    def _parse(self, id):
+        """Load the constant properties of compound from database"""
         cmp = sql.getElement(id)
         self.formula = cmp[1]
         self.name = cmp[2]
@@ -5275,7 +5320,7 @@ class Componente(object):
         Explained in procedure 7A1.1, pag 543
 
         .. math::
-            Ho = BT + C/2T^2 + D/3T^3 + E/4T^4 + F/5T^5
+            Ho = AT + B/2T^2 + C/3T^3 + D/4T^4 + E/5T^5 + F/6T^6
 
         Parameters
         ----------
@@ -5289,8 +5334,9 @@ class Componente(object):
         """
         To = 298.15
         A, B, C, D, E, F = self.cp
-        H = B*T + C/2*T**2 + D/3*T**3 + E/4*T**4 + F/5*T**5
-        Ho = B*To + C/2*To**2 + D/3*To**3 + E/4*To**4 + F/5*To**5
+        H = A*T + B/2*T**2 + C/3*T**3 + D/4*T**4 + E/5*T**5 + F/6*T**6
+        Ho = A*To + B/2*To**2 + C/3*To**3 + D/4*To**4 + E/5*To**5 + \
+            F/6*To**6
         return unidades.Enthalpy((H-Ho)/self.M, "calg")
 
     @refDoc(__doi__, [5], tab=8)
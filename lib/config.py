@@ -26,20 +26,24 @@ Variables:
   * :const:`Preferences`: ConfigParser instance with pychemqt preferences
   * :const:`currentConfig`: ConfigParser instance with the configuration of
     current pychemqt project open or the last open project
+  * :const:`indiceBase`: Cost index of the equipment cost correlations
 
 Configuration tools
 
   * :func:`getComponents`: Get component list from project
   * :func:`getMainWindowConfig`: Return config of current project
   * :func:`setMainWindowConfig`: Update currentconfig variable
+  * :func:`getCostIndex`: Return the current cost index of user configuration
+  * :func:`getPreferences`: Return Preferences updated with file changes
+  * :func:`getNumericFormat`: Return the format function of a magnitud
+  * :func:`getUnits`: Return the unit index of magnitudes in current project
   * :class:`Entity`: General class for model object
 """
 
+from ast import literal_eval
 from configparser import ConfigParser
 import os
 
-from PyQt5 import QtWidgets
-
 # TODO: Delete when it isn´t necessary debug
 # os.environ["pychemqt"] = "/home/jjgomera/Programacion/pychemqt/"
 # os.environ["freesteam"] = "True"
@@ -54,7 +58,9 @@ from PyQt5 import QtWidgets
 # os.environ["PyQt5.Qsci"] = "True"
 
 
+from lib.qt import loaded
 from lib.sql import databank
+from lib.utilities import compileFormat
 
 
 conf_dir = os.path.expanduser('~') + os.sep + ".pychemqt" + os.sep
@@ -62,12 +68,15 @@ IMAGE_PATH = os.path.join(os.environ["pychemqt"], "images") + os.sep
 
 Preferences = ConfigParser()
 Preferences.read(conf_dir + "pychemqtrc")
-# FIXME: This instance is not updated when preferences are changed
+# This instance is only updated with file changes using getPreferences
 
 global currentConfig
 currentConfig = ConfigParser()
 currentConfig.read(conf_dir + "pychemqtrc_temporal")
 
+indiceBase = ["Jan-1982", 313.95, 336.19, 326.01, 312.03, 383.18, 297.63,
+              421.1, 235.42, 338.2, 263.92, 290.13, 303.26]
+
 
 def getComponents(solidos=False, config=None, name=True):
     """
@@ -116,6 +125,71 @@ def getComponents(solidos=False, config=None, name=True):
         return indices
 
 
+def _stat(filename):
+    """Return the modification signature of file"""
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# Memoized values parsed from configuration, the preferences values are
+# invalidated when pychemqtrc is modified and the project values when the
+# current config is changed with setMainWindowConfig
+_preferencesStat = _stat(conf_dir + "pychemqtrc")
+_numericFormat = {}
+_units = None
+
+
+class _Section(dict):
+    """Typed values of a config section, the keys are case insensitive like
+    the options of ConfigParser"""
+    def __missing__(self, key):
+        lower = key.lower()
+        if lower == key:
+            raise KeyError(key)
+        value = self[key] = self[lower]
+        return value
+
+
+def getPreferences():
+    """Return Preferences, read again if pychemqtrc has been modified"""
+    global _preferencesStat
+    stat = _stat(conf_dir + "pychemqtrc")
+    if stat != _preferencesStat:
+        Preferences.read(conf_dir + "pychemqtrc")
+        _preferencesStat = stat
+        _numericFormat.clear()
+    return Preferences
+
+
+def getNumericFormat(magnitud):
+    """Return the function to get the string representation of values of
+    magnitud with the numeric format defined in preferences, see
+    :func:`lib.utilities.representacion`"""
+    getPreferences()
+    try:
+        return _numericFormat[magnitud]
+    except KeyError:
+        kwargs = literal_eval(Preferences.get("NumericFormat", magnitud))
+        func = compileFormat(**kwargs)
+        _numericFormat[magnitud] = func
+        return func
+
+
+def getUnits():
+    """Return a dict with the index of configured unit for each magnitud
+    in current project"""
+    global _units
+    if _units is None or _units[0] is not currentConfig:
+        section = _Section()
+        for key, value in currentConfig.items("Units"):
+            section[key] = int(value)
+        _units = (currentConfig, section)
+    return _units[1]
+
+
 def getMainWindowConfig():
     """Return config of current project"""
     return currentConfig
@@ -123,11 +197,15 @@ def getMainWindowConfig():
 
 def setMainWindowConfig(config=None):
     """Set config as current project"""
-    global currentConfig
+    global currentConfig, _units
+    _units = None
     if config:
         currentConfig = config
         return
-    else:
+
+    # Without graphical interface the config is only set explicitly
+    QtWidgets = loaded()
+    if QtWidgets is not None:
         widget = QtWidgets.QApplication.activeWindow()
         if isinstance(widget, QtWidgets.QMainWindow) and \
            widget.__class__.__name__ == "UI_pychemqt":
@@ -141,6 +219,21 @@ def setMainWindowConfig(config=None):
                     break
 
 
+def getCostIndex():
+    """Return the current cost index saved in user configuration, a list with
+    the date and the index values with the same order of indiceBase"""
+    indiceActual = []
+    with open(conf_dir+"CostIndex.dat", "r") as archivo:
+        indiceActual.append(archivo.readline()[:-1])
+        while True:
+            data = archivo.readline().rstrip("\n")
+            if data:
+                indiceActual.append(float(data))
+                if len(indiceActual) == 13:
+                    break
+    return indiceActual
+
+
 class Entity(object):
     """General class for model object, with basic functionality:
 
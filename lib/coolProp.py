@@ -28,8 +28,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 import os
 from math import exp, log
 
-from PyQt5.QtWidgets import QApplication
-
 try:
     import CoolProp as CP
 except ImportError as e:
@@ -38,16 +36,17 @@ except ImportError as e:
 from lib import unidades, mEoS
 from lib.thermo import ThermoAdvanced
 from lib.compuestos import Componente
+from lib.qt import QApplication
 
 
-# Automatic loading of coolProp name from meos subclass _coolPropName property
+# Automatic loading of coolProp name of fluids from the lib.mEoS registry
 __all__ = {}
 noIds = []
-for cmp in mEoS.__all__:
-    if cmp.id and cmp._coolPropName:
-        __all__[cmp.id] = cmp._coolPropName
-    elif cmp._coolPropName:
-        noIds.append(cmp._coolPropName)
+for cmp in mEoS.registry.values():
+    if cmp.id and cmp.coolPropName:
+        __all__[cmp.id] = cmp.coolPropName
+    elif cmp.coolPropName:
+        noIds.append(cmp.coolPropName)
 
 
 class CoolProp(ThermoAdvanced):
@@ -25,18 +25,19 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 ###############################################################################
 
 
+from copy import copy
 import logging
 import os
 
-from PyQt5.QtWidgets import QApplication
-
 from lib.physics import R_atml, R
 from lib import unidades, config
 from lib import EoS, mEoS, gerg, iapws97, freeSteam, refProp, coolProp
+from lib import tabulated
 from lib.solids import Solid
 from lib.mezcla import Mezcla, mix_molarflow_molarfraction
 from lib.psycrometry import PsychroState
 from lib.thermo import ThermoWater, ThermoAdvanced, ThermoRefProp
+from lib.qt import QApplication
 
 
 class Corriente(config.Entity):
@@ -45,6 +46,11 @@ class Corriente(config.Entity):
         -T: temperature, Kelvin
         -P: Pressure, Pa
         -x: quality
+        -h: specific enthalpy, J/kg, with P define the state without T
+        -s: specific entropy, J/kgK, with P define the state without T, the
+            entropy specification is available with meos, tabulated, gerg,
+            iapws, freesteam, coolprop and refprop, the equations of state
+            raise a ValueError
 
         -caudalMasico: mass flow in kg/s (solid component excluded)
         -caudalMolar: molar flow in kmol/s (solid component excluded)
@@ -81,15 +87,56 @@ class Corriente(config.Entity):
             0 - Ideal parameters
             1 - DIPPR parameters
         -MEoS: Use meos equation if is available
+        -tabulated: Use the tabulated interpolation of meos equation, faster
+            with a controlled error, the states out of table use meos
         -iapws: Use iapws97 standard for water
         -GERG: Use GERG-2008 equation if is available
         -freesteam: Use freesteam external library for water
         -coolProp: Use coolProp external library if is available
         -refprop: Use refProp external library if is available
+
+    The state defined with pressure and enthalpy or entropy recover the
+    temperature of stream
+
+    >>> agua = Corriente(T=350, P=5e5, caudalMasico=2, ids=[62],
+    ...                  fraccionMolar=[1], MEoS=True)
+    >>> h = agua.h/agua.caudalmasico
+    >>> "%0.6f" % agua.clone(P=5e5, h=h).T
+    '350.000000'
+    >>> metano = Corriente(T=300, P=1e6, caudalMasico=1, ids=[2],
+    ...                    fraccionMolar=[1], MEoS=True)
+    >>> st = Corriente(P=1e6, s=metano.Gas.s, caudalMasico=1, ids=[2],
+    ...                fraccionMolar=[1], MEoS=True)
+    >>> "%0.6f %0.1f" % (st.T, st.x)
+    '300.000000 1.0'
+    >>> gas = Corriente(T=300, P=1e6, caudalMasico=1, ids=[2],
+    ...                 fraccionMolar=[1], MEoS=True, GERG=True)
+    >>> st = gas.clone(P=1e6, s=gas.s/gas.caudalmasico)
+    >>> "%s %0.6f" % (st._thermo, st.T)
+    'gerg 300.000000'
+
+    The equations of state solve the enthalpy specification with the T-P
+    flash, but don't support the entropy specification
+
+    >>> mix = Corriente(T=280, P=3e5, caudalMasico=1, ids=[4, 6],
+    ...                 fraccionMolar=[0.5, 0.5], K="Peng-Robinson",
+    ...                 H="Peng-Robinson")
+    >>> st = mix.clone(P=3e5, h=mix.h/mix.caudalmasico)
+    >>> "%0.6f %0.4f" % (st.T, st.x)
+    '280.000000 0.3534'
+    >>> Corriente(P=1e6, s=1e3, caudalMasico=1, ids=[2, 3],
+    ...           fraccionMolar=[0.5, 0.5])
+    Traceback (most recent call last):
+    ...
+    ValueError: Entropy specification not available with equations of \
+state, use a meos, tabulated, gerg, iapws, freesteam, coolprop or refprop \
+stream
     """
     kwargs = {"T": 0.0,
               "P": 0.0,
               "x": None,
+              "h": None,
+              "s": None,
 
               "caudalMasico": 0.0,
               "caudalVolumetrico": 0.0,
@@ -114,6 +161,7 @@ class Corriente(config.Entity):
               "H": "",
               "Cp_ideal": None,
               "MEoS": None,
+              "tabulated": None,
               "iapws": None,
               "GERG": None,
               "freesteam": None,
@@ -232,6 +280,18 @@ class Corriente(config.Entity):
         elif kwargs.get("P", 0.0) and self.kwargs["T"] and self.kwargs["x"]:
             self.kwargs["x"] = None
 
+        # The enthalpy or entropy specification replace the temperature and
+        # quality of state, and a new temperature or quality replace them
+        if kwargs.get("h", None) is not None or \
+                kwargs.get("s", None) is not None:
+            self.kwargs["T"] = 0.0
+            self.kwargs["x"] = None
+            self.kwargs["h"] = None
+            self.kwargs["s"] = None
+        elif kwargs.get("T", 0.0) or kwargs.get("x", None) is not None:
+            self.kwargs["h"] = None
+            self.kwargs["s"] = None
+
         self.kwargs.update(kwargs)
 
         for key, value in list(self.kwargs.items()):
@@ -285,6 +345,10 @@ class Corriente(config.Entity):
             self.tipoTermodinamica = "Tx"
         elif self.kwargs["P"] and self.kwargs["x"]:
             self.tipoTermodinamica = "Px"
+        elif self.kwargs["P"] and self.kwargs["h"] is not None:
+            self.tipoTermodinamica = "Ph"
+        elif self.kwargs["P"] and self.kwargs["s"] is not None:
+            self.tipoTermodinamica = "Ps"
 
         # Mix definition
         self.tipoFlujo = 0
@@ -332,8 +396,16 @@ class Corriente(config.Entity):
 
     def calculo(self):
         Config = config.getMainWindowConfig()
+
+        # Stream cloned with a change of thermodynamic state only, the
+        # mixture and the thermodynamic method are shared with the original
+        # stream, see clone
+        origin = self.__dict__.pop("_origin", None)
+
         if self.kwargs["mezcla"]:
             self.mezcla = self.kwargs["mezcla"]
+        elif origin is not None:
+            self.mezcla = origin.mezcla
         else:
             self.mezcla = Mezcla(self.tipoFlujo, **self.kwargs)
 
@@ -350,7 +422,11 @@ class Corriente(config.Entity):
         P = unidades.Pressure(self.kwargs.get("P", None))
         x = self.kwargs.get("x", None)
 
-        self._method()
+        if origin is not None:
+            self._thermo = origin._thermo
+            self._dependence = origin._dependence
+        else:
+            self._method()
         setData = True
 
         if self._thermo == "freesteam":
@@ -361,9 +437,14 @@ class Corriente(config.Entity):
             if not self.kwargs["ids"]:
                 self.kwargs["ids"] = self.ids
 
-            # Avoid overwrite refprop H parameter
+            # Avoid overwrite refprop H parameter, the enthalpy and entropy
+            # use the refprop namespace
             kwargs = self.kwargs.copy()
             del kwargs["H"]
+            if kwargs["h"] is not None:
+                kwargs["H"] = kwargs["h"]
+            if kwargs["s"] is not None:
+                kwargs["S"] = kwargs["s"]
 
             compuesto = refProp.RefProp(**kwargs)
         elif self._thermo == "gerg":
@@ -384,30 +465,66 @@ class Corriente(config.Entity):
                 compuesto = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])](T=T, x=x)
             elif self.tipoTermodinamica == "Px":
                 compuesto = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])](P=P, x=x)
+            elif self.tipoTermodinamica == "Ph":
+                compuesto = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])](
+                    P=P, h=self.kwargs["h"])
+            elif self.tipoTermodinamica == "Ps":
+                compuesto = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])](
+                    P=P, s=self.kwargs["s"])
+        elif self._thermo == "tabulated":
+            fluid = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])]
+            if self.tipoTermodinamica == "TP":
+                compuesto = tabulated.Tabulated(fluid=fluid, T=T, P=P)
+            elif self.tipoTermodinamica == "Tx":
+                compuesto = tabulated.Tabulated(fluid=fluid, T=T, x=x)
+            elif self.tipoTermodinamica == "Px":
+                compuesto = tabulated.Tabulated(fluid=fluid, P=P, x=x)
+            elif self.tipoTermodinamica == "Ph":
+                compuesto = tabulated.Tabulated(
+                    fluid=fluid, P=P, h=self.kwargs["h"])
+            elif self.tipoTermodinamica == "Ps":
+                compuesto = tabulated.Tabulated(
+                    fluid=fluid, P=P, s=self.kwargs["s"])
         elif self._thermo == "eos":
+            # The cubic equations don't calculate the entropy of stream, the
+            # entropy specification need a multiparameter equation or an
+            # external library
+            if self.tipoTermodinamica == "Ps":
+                raise ValueError(
+                    "Entropy specification not available with equations of "
+                    "state, use a meos, tabulated, gerg, iapws, freesteam, "
+                    "coolprop or refprop stream")
+
             if self.kwargs["K"]:
-                index = K_name.index(self.kwargs["K"])
+                index = EoS.K_name.index(self.kwargs["K"])
                 K = EoS.K[index]
-                print(K)
             else:
                 K = EoS.K[Config.getint("Thermo","K")]
             if self.kwargs["H"]:
-                index = H_name.index(self.kwargs["H"])
+                index = EoS.H_name.index(self.kwargs["H"])
                 H = EoS.H[index]
-                print(H)
             else:
                 H = EoS.H[Config.getint("Thermo","H")]
 
+            # The enthalpy specification is solved with the T-P flash
+            if self.tipoTermodinamica == "Ph":
+                if origin is not None:
+                    T0 = origin.T
+                else:
+                    T0 = 298.15
+                T = unidades.Temperature(
+                    self._temperature(P, self.kwargs["h"], T0))
+
             setData = False
             self.M = unidades.Dimensionless(self.mezcla.M)
             self.Tc = self.mezcla.Tc
             self.Pc = self.mezcla.Pc
             self.SG = unidades.Dimensionless(self.mezcla.SG)
 
-            if self.tipoTermodinamica == "TP":
+            if self.tipoTermodinamica in ("TP", "Ph"):
                 self.T = unidades.Temperature(T)
                 self.P = unidades.Pressure(P)
-                eos = K(self.T, self.P.atm, self.mezcla)
+                eos = K(self.T, self._eosPressure(K), self.mezcla)
                 self.eos = eos
                 self.x = unidades.Dimensionless(eos.x)
             else:
@@ -418,21 +535,21 @@ class Corriente(config.Entity):
 #            self.mezcla.recallZeros(eos.Ki, 1.)
 
             if 0. < self.x < 1.:
-                self.Liquido = Mezcla(tipo=5, fraccionMolar=eos.xi, caudalMolar=self.caudalmolar*(1-self.x))
-                self.Gas = Mezcla(tipo=5, fraccionMolar=eos.yi, caudalMolar=self.caudalmolar*self.x)
+                self.Liquido = Mezcla(tipo=5, ids=self.ids, fraccionMolar=eos.xi, caudalMolar=self.caudalmolar*(1-self.x))
+                self.Gas = Mezcla(tipo=5, ids=self.ids, fraccionMolar=eos.yi, caudalMolar=self.caudalmolar*self.x)
             elif self.x <= 0:
-                self.Liquido = self.mezcla
+                self.Liquido = copy(self.mezcla)
                 self.Gas = Mezcla()
             else:
                 self.Liquido = Mezcla()
-                self.Gas = self.mezcla
+                self.Gas = copy(self.mezcla)
             self.Gas.Z = unidades.Dimensionless(float(eos.Z[0]))
             self.Liquido.Z = unidades.Dimensionless(float(eos.Z[1]))
 
             if H == K:
                 eosH = eos
             else:
-                eosH = H(self.T, self.P.atm, self.mezcla)
+                eosH = H(self.T, self._eosPressure(H), self.mezcla)
             self.H_exc = eosH.H_exc
 
             self.Liquido.Q = unidades.VolFlow(0)
@@ -557,6 +674,49 @@ class Corriente(config.Entity):
             self.kwargs["caudalVolumetrico"] = Q
             self.kwargs["caudalMolar"] = None
 
+    def _temperature(self, P, h, T0, tol=1e-6, maxiter=100):
+        """Temperature of stream at pressure and specific enthalpy for
+        the equations of state, Newton iteration with the T-P flash reusing
+        the mixture and the isobaric heat capacity of phases as derivative.
+        The heat capacity of phases don't include the enthalpy of phase
+        change, so in two phases region the steps out of the bracket of
+        solution are replaced by a bisection"""
+        H = h*self.caudalmasico
+        T = T0
+        Tmin, Tmax = 0, float("inf")
+        for it in range(maxiter):
+            stream = Corriente()
+            stream.kwargs = self.kwargs.copy()
+            stream._origin = self
+            stream(T=T, P=P)
+
+            if stream.h > H:
+                Tmax = T
+            else:
+                Tmin = T
+
+            Cp = 0
+            if stream.x < 1:
+                Cp += stream.Liquido.cp*stream.Liquido.caudalmasico
+            if stream.x > 0:
+                Cp += stream.Gas.cp*stream.Gas.caudalmasico
+
+            # Step limited for the jump of enthalpy in phase change
+            dT = max(min((stream.h-H)/Cp, 50), -50)
+            if Tmax < float("inf") and not Tmin < T-dT < Tmax:
+                dT = T-(Tmin+Tmax)/2
+            T -= dT
+            if abs(dT) < tol:
+                return T
+        raise ValueError("Iteration not converge")
+
+    def _eosPressure(self, model):
+        """Pressure of stream in the units used by the equation of state,
+        Pa for cubic equations and atm for the other models"""
+        if issubclass(model, EoS.cubic.Cubic):
+            return self.P
+        return self.P.atm
+
     def _method(self):
         """Find the thermodynamic method to use"""
         Config = config.getMainWindowConfig()
@@ -569,6 +729,14 @@ class Corriente(config.Entity):
         mEoS_available = self.ids[0] in mEoS.id_mEoS
         MEoS = _meos and len(self.ids) == 1 and mEoS_available
 
+        # Tabulated MEoS, the option isn't in old project config files
+        if self.kwargs["tabulated"] is not None:
+            TABULATED = self.kwargs["tabulated"]
+        elif Config.has_option("Thermo", "tabulated"):
+            TABULATED = Config.getboolean("Thermo", "tabulated")
+        else:
+            TABULATED = False
+
         # iapws availability
         if self.kwargs["iapws"] is not None:
             _iapws = self.kwargs["iapws"]
@@ -628,6 +796,8 @@ class Corriente(config.Entity):
         elif _meos and COOLPROP:
             self._thermo = "coolprop"
             self._dependence = "CoolProp"
+        elif MEoS and TABULATED:
+            self._thermo = "tabulated"
         elif MEoS and GERG:
             self._thermo = "gerg"
         elif MEoS:
@@ -647,8 +817,59 @@ class Corriente(config.Entity):
         return psystream
 
     def clone(self, **kwargs):
-        """Create a new stream instance with change only kwags new values"""
+        """Create a new stream instance with change only kwags new values
+
+        When only the thermodynamic state change (T, P, x, h, s) the new stream
+        reuse the mixture, the compounds and the thermodynamic method of this
+        stream, the flash is the only calculation done
+
+        >>> agua = Corriente(T=300, P=1e5, caudalMasico=2, ids=[62],
+        ...                  fraccionMolar=[1], MEoS=True)
+        >>> vapor = agua.clone(T=400, P=2e5)
+        >>> vapor.mezcla is agua.mezcla
+        True
+        >>> new = Corriente(T=400, P=2e5, caudalMasico=2, ids=[62],
+        ...                 fraccionMolar=[1], MEoS=True)
+        >>> [getattr(vapor, p) == getattr(new, p)
+        ...  for p in ("x", "h", "s", "rho", "Q")]
+        [True, True, True, True, True]
+        >>> vapor.Gas.mu == new.Gas.mu, vapor.Gas.cp == new.Gas.cp
+        (True, True)
+
+        The new values are applied as a change of input, a temperature or
+        pressure keep the other variables, a quality replace the temperature
+
+        >>> st = agua.clone(T=350)
+        >>> "%0.1f %0.0f %0.1f" % (st.T, st.P, st.caudalmasico)
+        '350.0 100000 2.0'
+        >>> st = agua.clone(P=2e5)
+        >>> "%0.1f %0.0f %0.1f" % (st.T, st.P, st.caudalmasico)
+        '300.0 200000 2.0'
+        >>> st = agua.clone(x=0.5)
+        >>> "%0.3f %0.0f %0.1f" % (st.T, st.P, st.x)
+        '372.756 100000 0.5'
+
+        The split scale any flow definition, and a new flow or mixture
+        replace the old flow definition
+
+        >>> "%0.1f" % agua.clone(split=0.25).caudalmasico
+        '0.5'
+        >>> vol = Corriente(T=300, P=1e5, caudalVolumetrico=0.01, ids=[62],
+        ...                 fraccionMolar=[1], MEoS=True)
+        >>> "%0.4f" % vol.clone(split=0.5).Q
+        '0.0050'
+        >>> "%0.1f" % vol.clone(caudalMasico=3).caudalmasico
+        '3.0'
+        >>> from lib.mezcla import Mezcla
+        >>> mix = Mezcla(3, ids=[62], caudalMasico=5, fraccionMolar=[1])
+        >>> st = agua.clone(mezcla=mix)
+        >>> "%0.1f %0.1f" % (st.T, st.caudalmasico)
+        '300.0 5.0'
+        """
         old_kwargs = self.kwargs.copy()
+        reflash = self.status == 1 and kwargs and \
+            set(kwargs).issubset(("T", "P", "x", "h", "s")) and \
+            not self.kwargs["caudalVolumetrico"]
         if "split" in kwargs:
             split = kwargs["split"]
             del kwargs["split"]
@@ -664,13 +885,24 @@ class Corriente(config.Entity):
                 kwargs["caudalMasico"] = split*self.kwargs["caudalMasico"]
             if self.kwargs["caudalMolar"]:
                 kwargs["caudalMolar"] = split*self.kwargs["caudalMolar"]
+            if self.kwargs["caudalVolumetrico"]:
+                kwargs["caudalVolumetrico"] = \
+                    split*self.kwargs["caudalVolumetrico"]
         if "x" in kwargs:
-            del old_kwargs["T"]
+            old_kwargs["T"] = 0.0
         if "mezcla" in kwargs:
             old_kwargs.update(kwargs["mezcla"].kwargs)
             del kwargs["mezcla"]
-        old_kwargs.update(kwargs)
-        return Corriente(**old_kwargs)
+
+        # Apply the new values over the old ones as a change of input, so a
+        # new flow definition replace the old one instead of mix with it
+        stream = Corriente()
+        stream.kwargs = old_kwargs
+        if reflash:
+            stream._origin = self
+        stream(**kwargs)
+        stream.__dict__.pop("_origin", None)
+        return stream
 
     def __repr__(self):
         if self.status:
@@ -973,7 +1205,7 @@ class Corriente(config.Entity):
         if state["liquid"]:
             state["liquid"]["sigma"] = self.Liquido.sigma
 
-        if self._thermo == "meos":
+        if self._thermo in ["meos", "tabulated"]:
             state["meos_eq"] = self.cmp.kwargs["eq"]
 
     def readFromJSON(self, data):
@@ -1024,6 +1256,10 @@ class Corriente(config.Entity):
         elif self._thermo == "meos":
             eq = state["meos_eq"]
             self.cmp = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])](eq=eq)
+        elif self._thermo == "tabulated":
+            eq = state["meos_eq"]
+            fluid = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])]
+            self.cmp = tabulated.Tabulated(fluid=fluid, eq=eq)
 
         # Load advanced properties from global phase
         if self._thermo != "eos":
@@ -1033,7 +1269,7 @@ class Corriente(config.Entity):
         if self._thermo in ["iapws", "freesteam"]:
             self.Liquido = ThermoWater()
             self.Gas = ThermoWater()
-        elif self._thermo in ["coolprop", "meos"]:
+        elif self._thermo in ["coolprop", "meos", "tabulated"]:
             self.Liquido = ThermoAdvanced()
             self.Gas = ThermoAdvanced()
         elif self._thermo == "refprop":
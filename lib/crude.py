@@ -26,7 +26,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 
 import warnings
 
-from PyQt5.QtWidgets import QApplication
 from scipy import pi, exp, log10, log, sin
 from scipy.optimize import fsolve
 
@@ -37,6 +36,7 @@ from lib.compuestos import Componente
 from lib.petro import Petroleo
 from lib.sql import databank
 from lib.utilities import refDoc
+from lib.qt import QApplication
 
 
 __doi__ = {
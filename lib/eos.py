@@ -30,6 +30,7 @@ from scipy.optimize import fsolve
 
 from . import unidades
 from . import config
+from .flash import bubbleP, bubbleT, dewP, dewT, flash
 from .physics import R_atml, factor_acentrico_octano
 
 #from EoS import *
@@ -111,88 +112,47 @@ class EoS(object):
         self.kwargs = kwargs
 
     def _Flash(self):
-        """Cálculo de los coeficientes de reparto entre fases, Ref Naji - Conventional and rapid flash claculations"""
-        #Estimación inicial de K mediante correlación wilson Eq 19
-        Ki=[]
-        for i in self.componente:
-            Ki.append(i.Pc/self.P*exp(5.37*(1.+i.f_acent)*(1.-i.Tc/self.T)))
-
-        Rachford=lambda x: sum([zi*(ki-1.)/(1.-x+x*ki) for zi, ki in zip(self.fraccion, Ki)])
-
-        if Rachford(0)>0 and Rachford(1)>0: #x>1, por tanto solo fase vapor
-            xi=self.fraccion
-            yi=self.fraccion
-            x=1.
-        elif Rachford(0)<0 and Rachford(1)<0: #x<0, por tanto solo fase líquida
-            xi=self.fraccion
-            yi=self.fraccion
-            x=0.
-        else:
-            x=0.5
-            while True:
-                xo=x
-                solucion=fsolve(Rachford, x, full_output=True)
-                if solucion[2]!=1:
-                    print(solucion)
-                    break
-                else:
-                    x=solucion[0][0]
-
-                    xi=[]
-                    yi=[]
-                    for zi, ki in zip(self.fraccion, Ki):
-                        xi.append(float(zi/(1-x+x*ki)))
-                        yi.append(float(zi*ki/(1-x+x*ki)))
-
-                    tital=self._fug(self.Z[1], xi)
-                    titav=self._fug(self.Z[0], yi)
-                    fiv=[z*t*self.P for z, t in zip(yi, titav)]
-                    fil=[z*t*self.P for z, t in zip(xi, tital)]
-                    #criterio de convergencia Eq 21
-                    if sum([abs(l/v-1) for l, v in zip(fil, fiv)])< 1e-14 and abs(x-xo) < 1e-10:
-                        break
-                    else:
-                        Ki=[l/v for l, v in zip(tital, titav)]
-
-        if x < 0:
-            x = 0
-        elif x > 1:
-            x = 1
-
-        return x, xi, yi, Ki
-
+        """Calculate the vapor fraction, phase compositions and equilibrium
+        ratios of mixture with the flash engine, the full result with the
+        iterations and time used is saved in flashInfo attribute"""
+        self.flashInfo = flash(self, self.mezcla.fraccion)
+        res = self.flashInfo
+        return res["beta"], list(res["x"]), list(res["y"]), list(res["K"])
+
+    def _Z(self, xi):
+        """Liquid and gas compressibility factor of a phase with composition
+        xi, by default the values of state"""
+        return self.Z[1], self.Z[0]
+
+    def _lnphi(self, xi, Z):
+        """Logarithm of fugacity coefficient of components in a phase with
+        composition xi and compressibility factor Z"""
+        return log(self._fug(Z, xi))
+
+    def clone(self, T=None, P=None):
+        """Return the model of mixture at other temperature or pressure, in
+        Pa, used in the saturation point calculation"""
+        if T is None:
+            T = self.T
+        if P is None:
+            P = self.P
+        return self.__class__(T, P/101325, self.mezcla, **self.kwargs)
 
     def _Bubble_T(self):
-        def f(T):
-            eq=self.__class__(T, self.P.atm, self.mezcla)
-            return sum([k*x for k, x in zip(eq.Ki, self.fraccion)])-1.
-
-        T=fsolve(f, self.T)
-        return unidades.Temperature(T)
+        res = bubbleT(self, self.mezcla.fraccion)
+        return unidades.Temperature(res["T"])
 
     def _Bubble_P(self):
-        def f(P):
-            eq=self.__class__(self.T, P, self.mezcla)
-            return sum([k*x for k, x in zip(eq.Ki, self.fraccion)])-1.
-
-        P=fsolve(f, self.P.atm)
-        return unidades.Pressure(P, "atm")
+        res = bubbleP(self, self.mezcla.fraccion)
+        return unidades.Pressure(res["P"])
 
     def _Dew_T(self):
-        def f(T):
-            eq=self.__class__(T, self.P.atm, self.mezcla)
-            return 1./sum([x/k for k, x in zip(eq.Ki, self.fraccion)])-1.
-
-        T=fsolve(f, self.T)
-        return unidades.Temperature(T)
+        res = dewT(self, self.mezcla.fraccion)
+        return unidades.Temperature(res["T"])
 
     def _Dew_P(self):
-        def f(P):
-            eq=self.__class__(self.T, P, self.mezcla)
-            return sum([x/k for k, x in zip(eq.Ki, self.zi)])-1.
-
-        P=fsolve(f, self.P.atm)
-        return unidades.Pressure(P, "atm")
+        res = dewP(self, self.mezcla.fraccion)
+        return unidades.Pressure(res["P"])
 
     # @property
     # def H_exc(self):
@@ -0,0 +1,779 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+r"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Library with the isothermal two-phase flash and the saturation point
+calculation of mixtures for any thermodynamic model able to calculate the
+fugacity coefficients of components in a phase:
+
+    * :func:`Wilson`: Initial estimation of equilibrium ratios
+    * :func:`RachfordRice`: Vapor fraction from the material balance
+    * :func:`stability`: Tangent plane distance stability test
+    * :func:`flash`: Isothermal flash at the temperature and pressure of model
+    * :func:`bubbleP`, :func:`bubbleT`, :func:`dewP`, :func:`dewT`:
+      Saturation points
+    * :func:`flash_batch`: Flash of a set of states of the same components
+
+The model must define the attributes T, P (in Pa) and componente, the list of
+components with critical properties and acentric factor, and the methods:
+
+    * _Z(xi): Liquid and gas compressibility factor of a phase with
+      composition xi
+    * _lnphi(xi, Z): Logarithm of fugacity coefficients of components in a
+      phase with composition xi and compressibility factor Z
+    * clone(T=None, P=None): Model at other temperature or pressure
+
+All the solvers have a limited number of iterations and raise a ValueError
+when don't converge. The returned dictionaries include the iterations and the
+time spent in the calculation.
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor
+import time
+
+from numpy import (array_split, asarray, broadcast_shapes, broadcast_to,
+                   concatenate, dot, empty, exp, log, nan, ones, zeros)
+from numpy.linalg import solve
+
+from lib.utilities import refDoc
+
+
+__doi__ = {
+    1:
+        {"autor": "Michelsen, M.L.",
+         "title": "The Isothermal Flash Problem. Part I. Stability",
+         "ref": "Fluid Phase Equilibria 9(1) (1982) 1-19",
+         "doi": "10.1016/0378-3812(82)85001-2"},
+    2:
+        {"autor": "Michelsen, M.L.",
+         "title": "The Isothermal Flash Problem. Part II. Phase-Split "
+                  "Calculation",
+         "ref": "Fluid Phase Equilibria 9(1) (1982) 21-40",
+         "doi": "10.1016/0378-3812(82)85002-4"},
+    3:
+        {"autor": "Leibovici, C.F., Neoschil, J.",
+         "title": "A New Look at the Rachford-Rice Equation",
+         "ref": "Fluid Phase Equilibria 74 (1992) 303-308",
+         "doi": ""},
+    4:
+        {"autor": "Michelsen, M.L., Mollerup, J.M.",
+         "title": "Thermodynamic Models: Fundamentals & Computational "
+                  "Aspects, 2nd Edition",
+         "ref": "Tie-Line Publications, Holte, 2007",
+         "doi": ""},
+    5:
+        {"autor": "Wilson, G.M.",
+         "title": "A Modified Redlich-Kwong Equation of State, Application "
+                  "to General Physical Data Calculations",
+         "ref": "65th National AIChE Meeting, Cleveland, 1969",
+         "doi": ""},
+        }
+
+
+@refDoc(__doi__, [5])
+def Wilson(T, P, Tc, Pc, w):
+    """Equilibrium ratios of components using the Wilson correlation
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    Tc : array
+        Critical temperature of components, [K]
+    Pc : array
+        Critical pressure of components, [Pa]
+    w : array
+        Acentric factor of components, [-]
+
+    Returns
+    -------
+    K : array
+        Equilibrium ratios, [-]
+    """
+    Tc = asarray(Tc, dtype=float)
+    Pc = asarray(Pc, dtype=float)
+    w = asarray(w, dtype=float)
+    return Pc/P*exp(5.373*(1+w)*(1-Tc/T))
+
+
+@refDoc(__doi__, [3, 4])
+def RachfordRice(z, K, negative=False, beta=None, tol=1e-14, maxiter=100):
+    """Vapor fraction of a mixture from the material balance of components,
+    the Rachford-Rice equation
+
+    The equation is solved in the window of vapor fraction where all the
+    phase compositions are positive, using the Newton method with the
+    function of Leibovici-Neoschil without poles, with a bisection fallback
+    to keep the solution bracketed
+
+    Parameters
+    ----------
+    z : array
+        Mole fraction of components in the mixture, [-]
+    K : array
+        Equilibrium ratios, [-]
+    negative : boolean, optional
+        Let the vapor fraction out of the physical range, the negative flash
+        used in the iterations of phase split
+    beta : float, optional
+        Initial value of vapor fraction, used if it's in the solution window
+
+    Returns
+    -------
+    beta : float
+        Vapor fraction, 0 or 1 if the mixture is single phase, [-]
+
+    Examples
+    --------
+    >>> "%0.6f" % RachfordRice([0.5, 0.5], [2, 0.5])
+    '0.500000'
+    >>> RachfordRice([0.5, 0.5], [2, 1.5])
+    1.0
+    >>> "%0.6f" % RachfordRice([0.5, 0.5], [2, 0.8], negative=True)
+    '2.000000'
+    """
+    z = asarray(z, dtype=float)
+    K = asarray(K, dtype=float)
+    Km = K-1
+
+    def g(beta):
+        return dot(z, Km/(1+beta*Km))
+
+    vap = K > 1
+    liq = K < 1
+    if not vap.any():
+        return 0.
+    if not liq.any():
+        return 1.
+
+    # Window of vapor fraction with positive compositions
+    bmin = ((K[vap]*z[vap]-1)/Km[vap]).max()
+    bmax = ((1-z[liq])/(-Km[liq])).min()
+    if not negative:
+        if g(0) <= 0:
+            return 0.
+        if g(1) >= 0:
+            return 1.
+        bmin = max(0., bmin)
+        bmax = min(1., bmax)
+
+    low, high = bmin, bmax
+    if beta is None or not low < beta < high:
+        beta = (bmin+bmax)/2
+    for i in range(maxiter):
+        t = Km/(1+beta*Km)
+        f = dot(z, t)
+        if f > 0:
+            low = beta
+        else:
+            high = beta
+
+        # Newton step in the Leibovici-Neoschil function
+        # H = (β-βmin)(βmax-β)g(β)
+        df = -dot(z, t*t)
+        c = (beta-bmin)*(bmax-beta)
+        H = c*f
+        dH = (bmax+bmin-2*beta)*f + c*df
+        if dH:
+            new = beta - H/dH
+        else:
+            new = beta
+        if not low < new < high:
+            new = (low+high)/2
+
+        if abs(new-beta) < tol:
+            return new
+        beta = new
+    raise ValueError("Iteration not converge")
+
+
+def _lnphi(model, x, phase=None):
+    """Logarithm of fugacity coefficients of components in a phase, the
+    phase can be specified as liquid or gas to select the root of model, by
+    default it's used the root with lower Gibbs free energy"""
+    Zl, Zg = model._Z(x)
+    if phase == "liquid":
+        return model._lnphi(x, Zl), Zl
+    elif phase == "gas" or Zl == Zg:
+        return model._lnphi(x, Zg), Zg
+
+    lnphil = model._lnphi(x, Zl)
+    lnphig = model._lnphi(x, Zg)
+    if dot(x, lnphil) < dot(x, lnphig):
+        return lnphil, Zl
+    else:
+        return lnphig, Zg
+
+
+def _wilson(model):
+    """Wilson equilibrium ratios at the conditions of model"""
+    cmp = model.componente
+    return Wilson(model.T, model.P, [c.Tc for c in cmp], [c.Pc for c in cmp],
+                  [c.f_acent for c in cmp])
+
+
+@refDoc(__doi__, [1, 4])
+def stability(model, z, K=None, tol=1e-10, maxiter=100):
+    """Stability analysis of a mixture using the tangent plane distance
+    criterion of Michelsen, with a vapor-like and a liquid-like trial phase
+    solved with successive substitution
+
+    Parameters
+    ----------
+    model : object
+        Thermodynamic model at the temperature and pressure of mixture
+    z : array
+        Mole fraction of components in the mixture, [-]
+    K : array, optional
+        Equilibrium ratios for the initial trial phases, by default from the
+        Wilson correlation, [-]
+
+    Returns
+    -------
+    stable : boolean
+        True if the mixture is stable as single phase
+    K : array
+        Estimation of equilibrium ratios from the most unstable trial phase,
+        the initial value for stable mixtures, [-]
+    iterations : integer
+        Total number of iterations for the trial phases
+    """
+    z = asarray(z, dtype=float)
+    if K is None:
+        K = _wilson(model)
+    lnz = log(z)
+    d = lnz + _lnphi(model, z)[0]
+
+    iterations = 0
+    tmmin = 0
+    Kmin = K
+    for W, vapor in ((z*K, True), (z/K, False)):
+        lnW = log(W)
+        go = None
+        for i in range(maxiter):
+            iterations += 1
+            lnphi = _lnphi(model, W/W.sum())[0]
+            g = d - lnphi - lnW
+            error = dot(g, g)
+
+            # Dominant eigenvalue method acceleration
+            step = g
+            if go is not None and i % 5 == 4:
+                lamda = error/dot(go, g)
+                if 0 < lamda < 1:
+                    step = g/(1-lamda)
+            go = g
+            lnW = lnW + step
+            W = exp(lnW)
+            if dot(lnW-lnz, lnW-lnz) < 1e-8:
+                # Trivial solution, the trial phase converge to the mixture
+                break
+            if error < tol:
+                break
+
+        tm = 1-W.sum()
+        if tm < -1e-10 and tm < tmmin and dot(lnW-lnz, lnW-lnz) > 1e-8:
+            tmmin = tm
+            if vapor:
+                Kmin = W/W.sum()/z
+            else:
+                Kmin = z/(W/W.sum())
+
+    return tmmin == 0, Kmin, iterations
+
+
+def _split(z, K, beta):
+    """Phase compositions of a mixture split in two phases"""
+    x = z/(1+beta*(K-1))
+    y = K*x
+    return x/x.sum(), y/y.sum()
+
+
+@refDoc(__doi__, [2, 4])
+def flash(model, z, K=None, tol=1e-12, maxiter=200):
+    """Isothermal flash of a mixture at the temperature and pressure of model
+
+    The stability of the mixture is checked with the tangent plane distance
+    criterion and the unstable mixtures are split in two phases with
+    successive substitution of the equilibrium ratios, accelerated with the
+    dominant eigenvalue method, switching to the Newton method in ln K when
+    the convergence is slow, near the critical point
+
+    Parameters
+    ----------
+    model : object
+        Thermodynamic model at the temperature and pressure of mixture
+    z : array
+        Mole fraction of components in the mixture, [-]
+    K : array, optional
+        Initial equilibrium ratios, with it the stability test is skipped
+        unless the phase split converge to a single phase, [-]
+
+    Returns
+    -------
+    result : dict
+        Dictionary with the results of flash:
+
+            * beta: Vapor fraction, [-]
+            * x: Mole fraction of components in liquid phase, [-]
+            * y: Mole fraction of components in vapor phase, [-]
+            * K: Equilibrium ratios, [-]
+            * Zl: Compressibility factor of liquid phase, [-]
+            * Zg: Compressibility factor of vapor phase, [-]
+            * stable: True if the mixture is stable as single phase
+            * iterations: Dict with the iterations of each step, stability,
+              ss (successive substitution) and newton
+            * time: Time used in the calculation, [s]
+
+    Examples
+    --------
+    Equimolar mixture of propane and n-butane at 300K and 5 bar
+
+    >>> from lib.mezcla import Mezcla
+    >>> from lib.EoS.Cubic import PR
+    >>> mix = Mezcla(5, ids=[4, 6], caudalMolar=1, fraccionMolar=[.5, .5])
+    >>> eq = PR(300, 5e5, mix)
+    >>> res = flash(eq, [0.5, 0.5])
+    >>> "%0.4f %0.4f %0.4f" % (res["beta"], res["x"][0], res["y"][0])
+    '0.5294 0.3467 0.6362'
+    >>> res["stable"]
+    False
+    """
+    start = time.perf_counter()
+    z = asarray(z, dtype=float)
+    iterations = {"stability": 0, "ss": 0, "newton": 0}
+    Kw = _wilson(model)
+
+    def single(stable):
+        """Return the result of single phase mixture"""
+        Zl, Zg = model._Z(z)
+        beta = 1. if dot(z, Kw) > 1 else 0.
+        return {"beta": beta, "x": z, "y": z, "K": ones(len(z)),
+                "Zl": Zl, "Zg": Zg, "stable": stable,
+                "iterations": iterations, "time": time.perf_counter()-start}
+
+    if K is None:
+        stable, K, iterations["stability"] = stability(model, z, Kw)
+        if stable:
+            return single(True)
+    K = asarray(K, dtype=float)
+
+    def residual(lnK):
+        """Residual of equality of fugacity of components in phases"""
+        K = exp(lnK)
+        beta = RachfordRice(z, K, negative=True, beta=last[0])
+        last[0] = beta
+        x, y = _split(z, K, beta)
+        lnphil, Zl = _lnphi(model, x)
+        lnphig, Zg = _lnphi(model, y)
+        return lnK+lnphig-lnphil, beta, x, y, Zl, Zg
+
+    # Successive substitution with dominant eigenvalue method acceleration
+    last = [None]
+    lnK = log(K)
+    go = None
+    newton = False
+    for i in range(maxiter):
+        iterations["ss"] += 1
+        g, beta, x, y, Zl, Zg = residual(lnK)
+        if (lnK > 0).all() or (lnK < 0).all():
+            break
+        error = dot(g, g)
+        if error < tol:
+            break
+        if i >= 10 and error < 1e-3:
+            # Slow convergence of successive substitution, near the critical
+            # point
+            newton = True
+            break
+
+        step = -g
+        if go is not None and i % 5 == 4:
+            lamda = dot(g, g)/dot(go, g)
+            if 0 < lamda < 1:
+                step *= 1/(1-lamda)
+        go = g
+        lnK = lnK + step
+        if dot(lnK, lnK) < 1e-8:
+            # Trivial solution
+            break
+    else:
+        raise ValueError("Iteration not converge")
+
+    # Newton method in ln K with numerical jacobian
+    if newton:
+        n = len(z)
+        h = 1e-7
+        J = empty((n, n))
+        for i in range(maxiter):
+            iterations["newton"] += 1
+            for j in range(n):
+                dlnK = lnK.copy()
+                dlnK[j] += h
+                J[:, j] = (residual(dlnK)[0]-g)/h
+            lnK = lnK - solve(J, g)
+            g, beta, x, y, Zl, Zg = residual(lnK)
+            if dot(g, g) < tol**2:
+                break
+        else:
+            raise ValueError("Iteration not converge")
+
+    K = exp(lnK)
+    if not 0 < beta < 1 or dot(lnK, lnK) < 1e-8:
+        # The phase split converge to a single phase, check stability if
+        # don't done previously
+        if not iterations["stability"]:
+            stable, K, iterations["stability"] = stability(model, z, Kw)
+            if not stable:
+                return flash(model, z, K, tol, maxiter)
+        return single(True)
+
+    return {"beta": beta, "x": x, "y": y, "K": K, "Zl": Zl, "Zg": Zg,
+            "stable": False, "iterations": iterations,
+            "time": time.perf_counter()-start}
+
+
+def _saturation(model, z, var, bubble, value, tol=1e-10, maxiter=50):
+    """Newton solver of saturation point in ln K and the logarithm of the
+    variable, temperature or pressure, with numerical jacobian
+
+    Parameters
+    ----------
+    model : object
+        Thermodynamic model
+    z : array
+        Mole fraction of components in the mixture, [-]
+    var : string
+        Name of unknown variable, T or P
+    bubble : boolean
+        True for bubble point calculation, False for dew point
+    value : float
+        Initial value of variable
+    """
+    start = time.perf_counter()
+    z = asarray(z, dtype=float)
+    models = {}
+
+    def getModel(lnv):
+        """Model at the value of variable, with cache of calculated models"""
+        if lnv not in models:
+            models[lnv] = model.clone(**{var: exp(lnv)})
+        return models[lnv]
+
+    def residual(u):
+        """Equality of fugacity of components and sum of incipient phase
+        mole fractions"""
+        m = getModel(u[-1])
+        K = exp(u[:-1])
+        if bubble:
+            x = z
+            y = z*K
+            s = y.sum()
+            y = y/s
+        else:
+            x = z/K
+            y = z
+            s = x.sum()
+            x = x/s
+        F = empty(len(u))
+        F[:-1] = u[:-1] + _lnphi(m, y, "gas")[0] - _lnphi(m, x, "liquid")[0]
+        F[-1] = log(s)
+        return F, x, y
+
+    m = getModel(log(value))
+    K = Wilson(m.T, m.P, [c.Tc for c in m.componente],
+               [c.Pc for c in m.componente],
+               [c.f_acent for c in m.componente])
+    u = zeros(len(z)+1)
+    u[:-1] = log(K)
+    u[-1] = log(value)
+    F, x, y = residual(u)
+
+    h = 1e-7
+    J = empty((len(u), len(u)))
+    for iteration in range(1, maxiter+1):
+        for j in range(len(u)):
+            du = u.copy()
+            du[j] += h
+            J[:, j] = (residual(du)[0]-F)/h
+        step = -solve(J, F)
+
+        # Limit the step to avoid wrong convergence far from solution
+        smax = abs(step).max()
+        if smax > 1:
+            step /= smax
+        u = u + step
+        F, x, y = residual(u)
+        if dot(F, F) < tol**2 or dot(step, step) < tol**2:
+            break
+    else:
+        raise ValueError("Iteration not converge")
+
+    if dot(u[:-1], u[:-1]) < 1e-8 and len(z) > 1:
+        # Trivial solution
+        raise ValueError("Iteration not converge")
+
+    m = getModel(u[-1])
+    return {"T": float(m.T), "P": float(m.P), "x": x, "y": y,
+            "K": exp(u[:-1]), "iterations": iteration,
+            "time": time.perf_counter()-start}
+
+
+def _wilsonT(model, z, bubble):
+    """Saturation temperature estimation with the Wilson correlation"""
+    cmp = model.componente
+    Tc = asarray([c.Tc for c in cmp], dtype=float)
+    Pc = asarray([c.Pc for c in cmp], dtype=float)
+    w = asarray([c.f_acent for c in cmp], dtype=float)
+    T = dot(z, Tc)*0.7
+    for i in range(50):
+        K = Wilson(T, model.P, Tc, Pc, w)
+        dK = K*5.373*(1+w)*Tc/T**2
+        if bubble:
+            f = log(dot(z, K))
+            df = dot(z, dK)/dot(z, K)
+        else:
+            f = -log(dot(z, 1/K))
+            df = dot(z, dK/K**2)/dot(z, 1/K)
+        dT = -f/df
+        T += max(min(dT, T/4), -T/4)
+        if abs(dT) < 1e-6:
+            break
+    return T
+
+
+@refDoc(__doi__, [4, 5])
+def bubbleP(model, z, P=None):
+    """Bubble point pressure of a mixture at the temperature of model
+
+    Parameters
+    ----------
+    model : object
+        Thermodynamic model
+    z : array
+        Mole fraction of components in the mixture, [-]
+    P : float, optional
+        Initial pressure, by default from the Wilson correlation, [Pa]
+
+    Returns
+    -------
+    result : dict
+        Dictionary with the saturation point: T, P, x (liquid composition),
+        y (vapor composition), K (equilibrium ratios), iterations and time
+
+    Examples
+    --------
+    Vapor pressure of propane at 300K, example 4.3 from Poling
+
+    >>> from lib.mezcla import Mezcla
+    >>> from lib.EoS.Cubic import PR
+    >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
+    >>> eq = PR(300, 1e6, mix)
+    >>> "%0.3f" % (bubbleP(eq, [1])["P"]/1e5)
+    '9.975'
+    """
+    z = asarray(z, dtype=float)
+    if P is None:
+        P = dot(z, _wilson(model))*model.P
+    return _saturation(model, z, "P", True, P)
+
+
+@refDoc(__doi__, [4, 5])
+def dewP(model, z, P=None):
+    """Dew point pressure of a mixture at the temperature of model, see
+    :func:`bubbleP` for the parameters"""
+    z = asarray(z, dtype=float)
+    if P is None:
+        P = model.P/dot(z, 1/_wilson(model))
+    return _saturation(model, z, "P", False, P)
+
+
+@refDoc(__doi__, [4, 5])
+def bubbleT(model, z, T=None):
+    """Bubble point temperature of a mixture at the pressure of model
+
+    Parameters
+    ----------
+    model : object
+        Thermodynamic model
+    z : array
+        Mole fraction of components in the mixture, [-]
+    T : float, optional
+        Initial temperature, by default from the Wilson correlation, [K]
+
+    Returns
+    -------
+    result : dict
+        Dictionary with the saturation point, see :func:`bubbleP`
+    """
+    z = asarray(z, dtype=float)
+    if T is None:
+        T = _wilsonT(model, z, True)
+    return _saturation(model, z, "T", True, T)
+
+
+@refDoc(__doi__, [4, 5])
+def dewT(model, z, T=None):
+    """Dew point temperature of a mixture at the pressure of model, see
+    :func:`bubbleT` for the parameters"""
+    z = asarray(z, dtype=float)
+    if T is None:
+        T = _wilsonT(model, z, False)
+    return _saturation(model, z, "T", False, T)
+
+
+def _flashStates(model, ids, T, P, z):
+    """Flash of a sequence of states, each point starting from the
+    equilibrium ratios of the previous one and reusing its model"""
+    from lib.mezcla import Mezcla
+
+    N, n = z.shape
+    prop = {"beta": empty(N), "x": empty((N, n)), "y": empty((N, n)),
+            "Z": empty((N, 2)), "H_exc": empty((N, 2)),
+            "status": zeros(N, dtype=int)}
+    mezcla = Mezcla(5, ids=list(ids), caudalMolar=1, fraccionMolar=list(z[0]))
+    eq = None
+    K = None
+    for i in range(N):
+        try:
+            if eq is None:
+                eq = model(T[i], P[i], mezcla)
+            elif T[i] != eq.T or P[i] != eq.P:
+                eq = eq.clone(T=T[i], P=P[i])
+
+            res = flash(eq, z[i], K)
+            Hl = eq._Hexc(res["x"], res["Zl"])
+            Hg = eq._Hexc(res["y"], res["Zg"])
+        except (ValueError, ZeroDivisionError, FloatingPointError):
+            prop["beta"][i] = nan
+            prop["x"][i] = nan
+            prop["y"][i] = nan
+            prop["Z"][i] = nan
+            prop["H_exc"][i] = nan
+            prop["status"][i] = 5
+            K = None
+            continue
+
+        prop["beta"][i] = res["beta"]
+        prop["x"][i] = res["x"]
+        prop["y"][i] = res["y"]
+        prop["Z"][i] = res["Zg"], res["Zl"]
+        prop["H_exc"][i] = Hg, Hl
+        prop["status"][i] = 1
+        K = None if res["stable"] else res["K"]
+    return prop
+
+
+def flash_batch(mixture, T, P, z=None, model="PR", workers=1):
+    """Flash of a set of states of a mixture with the same components, like
+    a grid of temperature and pressure or a set of compositions
+
+    The model of mixture is built only once, the components properties and
+    the interaction parameters are reused for all states. Each state start
+    from the equilibrium ratios of the previous one, so the neighbour states
+    must be consecutive for a fast calculation. With several workers the
+    states are split in contiguous chunks calculated in a pool of processes.
+
+    Parameters
+    ----------
+    mixture : Mezcla or list
+        Mixture or list with the ids of components
+    T : float or array
+        Temperature, [K]
+    P : float or array
+        Pressure, [Pa]
+    z : array, optional
+        Mole fraction of components, a single composition or an array with a
+        composition for each state in the last dimension, by default the
+        mixture composition
+    model : string or class, optional
+        Equation of state, class of lib.EoS.K or its name
+    workers : integer, optional
+        Number of processes used in the calculation
+
+    Returns
+    -------
+    prop : dict
+        Dict with the arrays with the shape of the broadcasted input states:
+
+            * beta: Vapor fraction, [-]
+            * x: Mole fraction of components in liquid phase, [-]
+            * y: Mole fraction of components in vapor phase, [-]
+            * Z: Compressibility factor of vapor and liquid phase, [-]
+            * H_exc: Enthalpy departure (H°-H)/RT of vapor and liquid
+              phase, [-]
+            * status: 1 for calculated states, 5 if the flash don't
+              converge, the values of these states are nan
+
+    Examples
+    --------
+    >>> from lib.mezcla import Mezcla
+    >>> mix = Mezcla(5, ids=[4, 6], caudalMolar=1, fraccionMolar=[.5, .5])
+    >>> prop = flash_batch(mix, 300, [1e5, 5e5, 1e6])
+    >>> prop["status"]
+    array([1, 1, 1])
+    >>> "%0.4f %0.4f %0.4f" % tuple(prop["beta"])
+    '1.0000 0.5294 0.0000'
+    >>> prop["x"].shape, prop["Z"].shape
+    ((3, 2), (3, 2))
+    """
+    if isinstance(model, str):
+        from lib.EoS import K
+        models = {k.__name__: k for k in K}
+        if model not in models:
+            raise ValueError("Unknown model %s" % model)
+        model = models[model]
+
+    if isinstance(mixture, (list, tuple)):
+        ids = list(mixture)
+        if z is None:
+            raise ValueError("Composition of mixture undefined")
+    else:
+        ids = mixture.ids
+        if z is None:
+            z = mixture.fraccion
+
+    T = asarray(T, dtype=float)
+    P = asarray(P, dtype=float)
+    z = asarray(z, dtype=float)
+    n = len(ids)
+    shape = broadcast_shapes(T.shape, P.shape, z.shape[:-1])
+    T = broadcast_to(T, shape).ravel()
+    P = broadcast_to(P, shape).ravel()
+    z = broadcast_to(z, shape+(n, )).reshape(-1, n)
+
+    N = len(T)
+    if workers > 1 and N > 1:
+        chunks = [c for c in array_split(range(N), workers) if len(c)]
+        with ProcessPoolExecutor(min(workers, len(chunks))) as pool:
+            results = list(pool.map(
+                _flashStates, [model]*len(chunks), [ids]*len(chunks),
+                [T[c] for c in chunks], [P[c] for c in chunks],
+                [z[c] for c in chunks]))
+        prop = {key: concatenate([r[key] for r in results])
+                for key in results[0]}
+    else:
+        prop = _flashStates(model, ids, T, P, z)
+
+    for key, value in prop.items():
+        prop[key] = value.reshape(shape+value.shape[1:])
+    return prop
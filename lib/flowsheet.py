@@ -0,0 +1,622 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Sequential modular solver of project flowsheets.
+
+The flowsheet is a directed graph with the items of project (input streams,
+equipments and output streams) as nodes and the streams as edges. The graph
+is decomposed in strongly connected components, calculated in topological
+order, so each equipment is calculated only when its input streams are
+known. Only the equipments with a changed input stream are calculated again.
+
+The components with several nodes are recycle loops, solved by tearing the
+streams closing the cycles and converging the tear streams with Wegstein or
+Broyden acceleration. The tear streams need an initial estimate, the stream
+defined in project for them.
+
+    * :class:`Scheduler`: Incremental solver of project
+    * :func:`strongComponents`: Strongly connected components of graph
+    * :class:`Wegstein`: Wegstein acceleration of successive substitution
+    * :class:`Broyden`: Broyden quasi-Newton acceleration
+
+>>> graph = {"i1": ["e1"], "e1": ["e2"], "e2": ["e1", "o1"], "o1": []}
+>>> strongComponents(graph)
+[['i1'], ['e1', 'e2'], ['o1']]
+'''
+
+
+from concurrent.futures import ProcessPoolExecutor
+import json
+import logging
+import time
+
+from numpy import abs as npabs
+from numpy import array, clip, concatenate, dot, eye, maximum, outer, where
+
+from equipment import equipments
+from equipment.flux import Mixer
+from lib.corriente import Corriente
+
+
+def strongComponents(graph):
+    """Strongly connected components of a directed graph, using the Tarjan
+    algorithm
+
+    Parameters
+    ----------
+    graph : dict
+        Successors list of each node
+
+    Returns
+    -------
+    components : list
+        List of strongly connected components in topological order, each one
+        a sorted list of nodes
+    """
+    index = {}
+    low = {}
+    stack = []
+    onStack = set()
+    components = []
+
+    for root in sorted(graph):
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        onStack.add(root)
+        work = [(root, iter(sorted(graph[root])))]
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = low[succ] = len(index)
+                    stack.append(succ)
+                    onStack.add(succ)
+                    work.append((succ, iter(sorted(graph[succ]))))
+                    break
+                elif succ in onStack:
+                    low[node] = min(low[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        item = stack.pop()
+                        onStack.remove(item)
+                        component.append(item)
+                        if item == node:
+                            break
+                    components.append(sorted(component))
+
+    # Tarjan algorithm return the components in reverse topological order
+    components.reverse()
+    return components
+
+
+def _kwargsInput(equip, inputs):
+    """Kwargs to define the input streams of equipment, inputs is a list of
+    (input index, stream)"""
+    if isinstance(equip, Mixer):
+        inputs = sorted(inputs, key=lambda x: x[0])
+        return {"entrada": [obj for ind, obj in inputs]}
+    return {equip.kwargsInput[ind]: obj for ind, obj in inputs}
+
+
+def _calculate(index, data, inputs):
+    """Calculate an equipment in a worker process, the equipment and its
+    input streams are transfered with its json serialization
+
+    Parameters
+    ----------
+    index : int
+        Index of equipment class in equipment.equipments
+    data : str
+        json serialization of equipment
+    inputs : list
+        Input streams as list of (input index, json serialization)
+
+    Returns
+    -------
+    data : str
+        json serialization of calculated equipment
+    salida : str
+        json serialization of list of output streams
+    time : float
+        Calculation time
+    """
+    equip = equipments[index]()
+    state = json.loads(data)
+    state["status"] = 0
+    equip.readFromJSON(state)
+
+    streams = []
+    for ind, txt in inputs:
+        stream = Corriente()
+        stream.readFromJSON(json.loads(txt))
+        streams.append((ind, stream))
+
+    start = time.perf_counter()
+    equip(**_kwargsInput(equip, streams))
+    t = time.perf_counter()-start
+
+    data = {}
+    equip.writeToJSON(data)
+    salida = []
+    if equip.status:
+        for stream in equip.salida:
+            state = {}
+            stream.writeToJSON(state)
+            salida.append(state)
+    return json.dumps(data), json.dumps(salida), t
+
+
+class Wegstein(object):
+    """Wegstein acceleration of the successive substitution x = g(x), with
+    the acceleration factor of each variable bounded in [qmin, qmax]
+
+    >>> from numpy import array
+    >>> acc = Wegstein()
+    >>> x = array([0.])
+    >>> for i in range(3):
+    ...     x = acc(x, 0.5*x+1)
+    >>> "%0.8f" % x[0]
+    '2.00000000'
+    """
+
+    def __init__(self, qmin=-5, qmax=0):
+        self.qmin = qmin
+        self.qmax = qmax
+        self._x = None
+        self._g = None
+
+    def __call__(self, x, g):
+        """Return the next estimate from estimate x and its result g"""
+        if self._x is None:
+            xn = g
+        else:
+            dx = x-self._x
+            dg = g-self._g
+            s = dg/where(dx == 0, 1, dx)
+            q = s/where(s == 1, 1e-10, s-1)
+            q = where(dx == 0, 0, clip(q, self.qmin, self.qmax))
+            xn = q*x+(1-q)*g
+        self._x = x
+        self._g = g
+        return xn
+
+
+class Broyden(object):
+    """Broyden quasi-Newton acceleration of the successive substitution
+    x = g(x), solving the residual f(x) = g(x) - x with the inverse jacobian
+    updated with the good Broyden method
+
+    >>> from numpy import array, cos
+    >>> acc = Broyden()
+    >>> x = array([1.])
+    >>> for i in range(6):
+    ...     x = acc(x, cos(x))
+    >>> "%0.8f" % x[0]
+    '0.73908513'
+    """
+
+    def __init__(self):
+        self._x = None
+        self._f = None
+        self._H = None
+
+    def __call__(self, x, g):
+        """Return the next estimate from estimate x and its result g"""
+        f = g-x
+        if self._x is None:
+            self._H = -eye(len(x))
+        else:
+            dx = x-self._x
+            df = f-self._f
+            Hdf = dot(self._H, df)
+            den = dot(dx, Hdf)
+            if den:
+                self._H += outer(dx-Hdf, dot(dx, self._H))/den
+        self._x = x
+        self._f = f
+        return x-dot(self._H, f)
+
+
+class Scheduler(object):
+    """Incremental solver of project flowsheet
+
+    Parameters
+    ----------
+    project : Project
+        Project to solve, the items and streams are read in each run so the
+        changes in project are used
+    tol : float
+        Relative tolerance of tear streams convergence and threshold of
+        stream value change to calculate again the downstream equipment
+    maxiter : int
+        Maximum number of iteration in recycle loops
+    method : str
+        Acceleration method of tear streams, wegstein or broyden
+    workers : int
+        Number of worker processes to calculate in parallel the independent
+        equipments, 0 to calculate all in the current process
+
+    Notes
+    -----
+    After each run the statistics of calculation are available in:
+
+        * stats: dict with the number of calculation and the total time of
+          calculation of each item
+        * recycles: list with a dict for each recycle loop solved with the
+          nodes, tear streams, iterations, error and convergence status
+
+    With workers, the independent equipments of each level of graph are
+    calculated in a process pool. The equipment and its input streams are
+    sent to the worker with the json serialization used in project files,
+    and the calculated equipment and output streams are loaded back in the
+    project in a fixed order, so the result is the same of serial run. The
+    recycle loops are always calculated in the current process
+
+    >>> from lib.project import Project
+    >>> from equipment.flux import Divider, Valve
+    >>> def train(workers):
+    ...     feed = Corriente(T=400, P=10e5, caudalMasico=1, ids=[62],
+    ...                      fraccionMolar=[1], MEoS=True)
+    ...     items = {"i1": feed, "e1": Divider(salidas=2, split=[0.4, 0.6]),
+    ...              "e2": Valve(off=1, Pout=5e5), "o1": Corriente(),
+    ...              "e3": Valve(off=1, Pout=2e5), "o2": Corriente()}
+    ...     streams = {1: ("i1", "e1", 0, 0, feed),
+    ...                2: ("e1", "e2", 0, 0, Corriente()),
+    ...                3: ("e1", "e3", 1, 0, Corriente()),
+    ...                4: ("e2", "o1", 0, 0, Corriente()),
+    ...                5: ("e3", "o2", 0, 0, Corriente())}
+    ...     project = Project(items=items, streams=streams)
+    ...     project.scheduler.workers = workers
+    ...     project.run()
+    ...     return project
+    >>> serial, parallel = train(0), train(2)
+    >>> [len(level) for level in parallel.scheduler.levels()]
+    [1, 1, 2, 2]
+    >>> def outputs(project):
+    ...     return [(project.getOutput(i).h, project.getOutput(i).rho)
+    ...             for i in (1, 2)]
+    >>> outputs(serial) == outputs(parallel)
+    True
+    """
+
+    def __init__(self, project, tol=1e-6, maxiter=50, method="wegstein",
+                 workers=0):
+        self.project = project
+        self.tol = tol
+        self.maxiter = maxiter
+        self.method = method
+        self.workers = workers
+        self.stats = {}
+        self.recycles = []
+
+        # Value of each stream in last delivery to downstream item
+        self._values = {}
+
+    def graph(self):
+        """Graph of project, dict with the output streams of each node as
+        list of (stream id, downstream node)"""
+        graph = {}
+        for node in self.project.items:
+            graph[node] = []
+        for id, (up, down, ind_up, ind_down, obj) in \
+                sorted(self.project.streams.items()):
+            graph.setdefault(up, []).append((id, down))
+            graph.setdefault(down, [])
+        return graph
+
+    def order(self):
+        """Strongly connected components of project graph in calculation
+        order"""
+        graph = self.graph()
+        succ = {node: [down for id, down in edges]
+                for node, edges in graph.items()}
+        return strongComponents(succ)
+
+    def run(self, name=None):
+        """Calculate the project after a change in item or stream name, with
+        the usual name format: i1, e1, s1. None calculate all the project"""
+        graph = self.graph()
+        self.recycles = []
+        if name is None:
+            dirty = set(graph)
+            changed = set(self.project.streams)
+            self._values = {}
+        elif name[0] == "s":
+            dirty = set()
+            changed = {int(name[1:])}
+        else:
+            dirty = {name}
+            changed = set()
+
+        pool = None
+        try:
+            for level in self.levels():
+                pending = []
+                for component in level:
+                    inputs = [id for node in component
+                              for id, up in self._inputs(node)
+                              if up not in component]
+                    if dirty.intersection(component) or \
+                            changed.intersection(inputs):
+                        pending.append(component)
+
+                # Independent equipments calculated in worker processes
+                parallel = [c[0] for c in pending if len(c) == 1 and
+                            c[0][0] == "e" and c[0] not in [
+                                down for id, down in graph[c[0]]]]
+                if self.workers > 1 and len(parallel) > 1:
+                    if pool is None:
+                        pool = ProcessPoolExecutor(self.workers)
+                    changed.update(self._solveParallel(parallel, graph, pool))
+                else:
+                    parallel = []
+
+                for component in pending:
+                    if component[0] in parallel:
+                        continue
+                    loop = len(component) > 1 or component[0] in [
+                        down for id, down in graph[component[0]]]
+                    if loop:
+                        changed.update(self._solveRecycle(component, graph))
+                    else:
+                        changed.update(self._solve(component[0], graph))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def levels(self):
+        """Strongly connected components of project graph grouped in levels,
+        the components of a level only depend of components in previous
+        levels so they can be calculated in parallel"""
+        components = self.order()
+        index = {node: i for i, comp in enumerate(components) for node in comp}
+        depth = [0]*len(components)
+        levels = []
+        for i, component in enumerate(components):
+            for node in component:
+                for id, up in self._inputs(node):
+                    if index[up] != i:
+                        depth[i] = max(depth[i], depth[index[up]]+1)
+            while len(levels) <= depth[i]:
+                levels.append([])
+            levels[depth[i]].append(component)
+        return levels
+
+    def _inputs(self, node):
+        """Input streams of node as list of (stream id, upstream node)"""
+        return [(id, stream[0]) for id, stream in
+                sorted(self.project.streams.items()) if stream[1] == node]
+
+    @staticmethod
+    def _vector(stream):
+        """Values of stream to check changes and converge tear streams:
+        temperature, pressure and mass flow of each component"""
+        if not stream or not stream.status:
+            return None
+        return array([stream.T, stream.P]+list(stream.caudalunitariomasico))
+
+    def _isChanged(self, id, stream):
+        """Check if the stream has changed since the last delivery"""
+        new = self._vector(stream)
+        old = self._values.get(id)
+        if new is None or old is None or len(new) != len(old):
+            return new is not None or old is not None
+        return (npabs(new-old) > self.tol*maximum(npabs(old), 1)).any()
+
+    def _setStream(self, id, obj):
+        """Change the object of stream id in project"""
+        stream = self.project.streams[id]
+        self.project.streams[id] = stream[0:4]+(obj, )
+
+    def _solve(self, node, graph):
+        """Calculate the node with its input streams, return the id of output
+        streams changed"""
+        items = self.project.items
+        if node[0] == "i":
+            # The input streams of project files are defined only as stream
+            outputs = []
+            for id, down in graph[node]:
+                obj = items.get(node)
+                if obj is None:
+                    obj = self.project.streams[id][4]
+                outputs.append((id, obj))
+
+        elif node[0] == "e":
+            equip = items[node]
+            kwargs = _kwargsInput(equip, self._inputStreams(node))
+
+            logging.info("Flowsheet calculate: %s" % node)
+            start = time.perf_counter()
+            equip(**kwargs)
+            self._stat(node, time.perf_counter()-start)
+            outputs = self._outputs(node, graph)
+
+        else:
+            for id, up in self._inputs(node):
+                items[node] = self.project.streams[id][4]
+            outputs = []
+
+        return self._deliver(outputs)
+
+    def _deliver(self, outputs):
+        """Set the output streams in project, outputs is a list of (stream
+        id, stream), return the id of streams changed"""
+        changed = set()
+        for id, obj in outputs:
+            self._setStream(id, obj)
+            if self._isChanged(id, obj):
+                self._values[id] = self._vector(obj)
+                changed.add(id)
+        return changed
+
+    def _inputStreams(self, node):
+        """Input streams of equipment as list of (input index, stream)"""
+        return [(self.project.streams[id][3], self.project.streams[id][4])
+                for id, up in self._inputs(node)]
+
+    def _outputs(self, node, graph):
+        """Output streams of calculated equipment as list of (stream id,
+        stream)"""
+        equip = self.project.items[node]
+        outputs = []
+        if equip.status:
+            for id, down in graph[node]:
+                ind_up = self.project.streams[id][2]
+                outputs.append((id, equip.salida[ind_up]))
+        return outputs
+
+    def _stat(self, node, t):
+        """Add a calculation of node to statistics"""
+        stat = self.stats.setdefault(node, {"calls": 0, "time": 0.})
+        stat["calls"] += 1
+        stat["time"] += t
+
+    def _solveParallel(self, nodes, graph, pool):
+        """Calculate the independent equipments in the worker processes of
+        pool, return the id of output streams changed"""
+        futures = []
+        for node in nodes:
+            equip = self.project.items[node]
+            data = {}
+            equip.writeToJSON(data)
+            inputs = []
+            for ind, stream in self._inputStreams(node):
+                state = {}
+                stream.writeToJSON(state)
+                inputs.append((ind, json.dumps(state)))
+            logging.info("Flowsheet calculate in worker: %s" % node)
+            futures.append(pool.submit(
+                _calculate, equipments.index(equip.__class__),
+                json.dumps(data), inputs))
+
+        # Results loaded in project in the order of nodes
+        changed = set()
+        for node, future in zip(nodes, futures):
+            data, salida, t = future.result()
+            equip = self.project.items[node]
+            equip.readFromJSON(json.loads(data))
+            equip.cleanOldValues(**_kwargsInput(
+                equip, self._inputStreams(node)))
+            equip.salida = []
+            for state in json.loads(salida):
+                stream = Corriente()
+                stream.readFromJSON(state)
+                equip.salida.append(stream)
+            self._stat(node, t)
+            changed.update(self._deliver(self._outputs(node, graph)))
+        return changed
+
+    def _tears(self, component, graph):
+        """Choose the tear streams of recycle loop, the back edges of a depth
+        first search from the entry of the loop"""
+        inside = set(component)
+        entries = [node for node in component
+                   if any(up not in inside for id, up in self._inputs(node))]
+        start = entries[0] if entries else component[0]
+
+        tears = []
+        state = {start: 1}
+        work = [(start, iter(graph[start]))]
+        while work:
+            node, edges = work[-1]
+            for id, down in edges:
+                if down not in inside:
+                    continue
+                if state.get(down) == 1:
+                    tears.append(id)
+                elif down not in state:
+                    state[down] = 1
+                    work.append((down, iter(graph[down])))
+                    break
+            else:
+                state[node] = 2
+                work.pop()
+        return sorted(tears)
+
+    def _solveRecycle(self, component, graph):
+        """Converge the recycle loop component, return the id of output
+        streams changed"""
+        tears = self._tears(component, graph)
+
+        # Calculation order of loop without the tear streams
+        succ = {node: [down for id, down in graph[node]
+                       if down in component and id not in tears]
+                for node in component}
+        order = [node for scc in strongComponents(succ) for node in scc]
+
+        info = {"nodes": component, "tears": tears, "iterations": 0,
+                "error": None, "converged": False}
+        self.recycles.append(info)
+
+        streams = [self.project.streams[id][4] for id in tears]
+        x = [self._vector(obj) for obj in streams]
+        if any(v is None for v in x):
+            logging.warning("Flowsheet: tear streams %s without estimate"
+                            % tears)
+            return set()
+        sizes = [len(v) for v in x]
+        x = concatenate(x)
+
+        if self.method == "broyden":
+            acc = Broyden()
+        else:
+            acc = Wegstein()
+
+        changed = set()
+        for it in range(self.maxiter):
+            for id, obj in zip(tears, streams):
+                self._setStream(id, obj)
+            for node in order:
+                changed.update(self._solve(node, graph))
+
+            out = [self._vector(self.project.streams[id][4]) for id in tears]
+            if any(v is None for v in out) or \
+                    [len(v) for v in out] != sizes:
+                break
+            g = concatenate(out)
+            info["iterations"] = it+1
+            info["error"] = (npabs(g-x)/maximum(npabs(x), 1)).max()
+            if info["error"] < self.tol:
+                info["converged"] = True
+                break
+
+            # New estimate of tear streams, with positive values
+            x = maximum(acc(x, g), 0)
+            streams = []
+            i = 0
+            for id, size in zip(tears, sizes):
+                obj = self.project.streams[id][4]
+                T, P = x[i:i+2]
+                flow = list(x[i+2:i+size])
+                streams.append(obj.clone(T=T, P=P, x=None,
+                                         caudalUnitarioMasico=flow))
+                i += size
+
+        if not info["converged"]:
+            logging.warning("Flowsheet: recycle %s not converged" % component)
+        return changed.difference(tears)
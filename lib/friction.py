@@ -64,9 +64,8 @@ TODO
 '''
 
 
-from math import exp, log, log10, sqrt, sin, pi
-
-from scipy.optimize import fsolve
+from numpy import asarray, errstate, exp, log, log10, nan, pi, sin, sqrt, where
+from scipy.special import wrightomega
 
 from lib.unidades import Dimensionless
 from lib.utilities import refDoc
@@ -257,26 +256,39 @@ def f_colebrook(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
     -----
-    This is the original, implicit expression, slowlest to solve
+    This is the original, implicit expression, solved explicitly with the
+    Lambert W function in the form of Wright omega function, with x=1/√f:
+
+    .. math::
+        x = \frac{2}{\ln 10}\omega\left(\frac{b\ln 10}{2a}-
+        \ln\frac{2a}{\ln 10}\right)-\frac{b}{a}
+
+    with :math:`a=2.51/Re` and :math:`b=\epsilon/3.7D`. For smooth pipes the
+    Prandtl-Karman equation is used, same expression with
+    :math:`a=10^{0.4}/Re`. Two Newton steps recover the digits lost by the
+    cancellation of terms in rough pipes.
     """
-    fo = f_chen(Re, eD)
-    if eD:
-        f = fsolve(lambda x: 1/x**0.5+2.0*log10(eD/3.7+2.51/Re/x**0.5), fo)
-    else:
-        f = fsolve(lambda x: 1/x**0.5-2.0*log10(Re*x**0.5)+0.8, fo)
-    return Dimensionless(f[0])
+    Re = asarray(Re, dtype=float)
+    eD = asarray(eD, dtype=float)
+    c = 2/log(10)
+    a = where(eD > 0, 2.51, 10**0.4)/Re
+    b = eD/3.7
+    x = c*wrightomega(b/a/c-log(a*c)).real-b/a
+    for i in range(2):
+        x -= (x+c*log(b+a*x))/(1+c*a/(b+a*x))
+    return Dimensionless.array(1/x**2)
 
 
 @refDoc(__doi__, [2])
@@ -290,14 +302,14 @@ def f_chen1979(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -310,7 +322,7 @@ def f_chen1979(Re, eD):
     # Eq 7
     A = eD**1.1098/2.8257+5.8506/Re**0.8981
     f = 1/(-2*log10(eD/3.7065-5.0452/Re*log10(A)))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [3])
@@ -324,14 +336,14 @@ def f_chen(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -340,7 +352,7 @@ def f_chen(Re, eD):
     """
     A = eD/3.7+(6.7/Re)**0.9
     f = 1/(-2*log10(eD/3.7-5.02/Re*log10(A)))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [4])
@@ -353,14 +365,14 @@ def f_moody(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -371,7 +383,7 @@ def f_moody(Re, eD):
         * 0<= eD < 0.01.
     """
     f = 5.5e-3*(1+(2e4*eD+1e6/Re)**(1./3))
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [5])
@@ -390,14 +402,14 @@ def f_churchill(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -409,7 +421,7 @@ def f_churchill(Re, eD):
     A = (2.457*log(1/(0.27*eD+(7./Re)**0.9)))**16
     B = (37530./Re)**16
     f = 8.*((8./Re)**12+(A+B)**-1.5)**(1./12)
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [6])
@@ -425,14 +437,14 @@ def f_wood(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -446,7 +458,7 @@ def f_wood(Re, eD):
     b = 88*eD**0.44
     c = -1.62*eD**0.134
     f = a + b*Re**c
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [7])
@@ -459,14 +471,14 @@ def f_haaland(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -478,7 +490,7 @@ def f_haaland(Re, eD):
     """
     # Eq 8
     f = 1/(-1.8*log10((eD/3.75)**1.11+6.9/Re))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [8])
@@ -499,21 +511,21 @@ def f_serghides(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     A = -2*log10(eD/3.7+12/Re)
     B = -2*log10(eD/3.7+2.51*A/Re)
     C = -2*log10(eD/3.7+2.51*B/Re)
     f = (A-(B-A)**2/(C-2*B+A))**-2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [9])
@@ -526,14 +538,14 @@ def f_round(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -545,7 +557,7 @@ def f_round(Re, eD):
     """
     # Eq 8
     f = 1/(1.8*log10(Re/(0.135*Re*eD+6.5)))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [10])
@@ -558,14 +570,14 @@ def f_swamee(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -576,7 +588,7 @@ def f_swamee(Re, eD):
         * 1e-6 <= eD <= 5e-2
     """
     f = 1/(-2*log10(eD/3.7+(6.97/Re)**0.9))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [11])
@@ -589,14 +601,14 @@ def f_jain(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -607,7 +619,7 @@ def f_jain(Re, eD):
         * 4e-5 <= eD <= 0.05
     """
     f = 1/(1.14-2*log10(eD+(29.843/Re)**0.9))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [12])
@@ -621,9 +633,9 @@ def f_barr(Re, eD):
 
     Parameters
     ----------
-        Re : float
+        Re : float or array
             Reynolds number, [-]
-        eD : float
+        eD : float or array
             Relative roughness of a pipe, [-]
 
     Returns
@@ -633,7 +645,7 @@ def f_barr(Re, eD):
     """
     # Eq 6
     f = 1/(2*log10(eD/3.7+4.518*log10(Re/7)/Re/(1+Re**0.52/29*eD**0.7)))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [13])
@@ -649,14 +661,14 @@ def f_zigrang(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -669,7 +681,7 @@ def f_zigrang(Re, eD):
     # Eq 12
     A = log10(eD/3.7-5.02/Re*log10(eD/3.7+13./Re))
     f = 1/(-2*log10(eD/3.7-5.02*A/Re))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [14])
@@ -681,18 +693,18 @@ def f_altshul(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     f = 0.11*(eD+68/Re)**0.25
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [14])
@@ -708,14 +720,14 @@ def f_tsal(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -725,10 +737,9 @@ def f_tsal(Re, eD):
         * 4e3 <= Re <= 1e8
         * eD <= 0.05
     """
-    f = 0.11*(68/Re+eD)**0.25
-    if f < 0.018:
-        f = 0.0028+0.85*f
-    return f
+    A = 0.11*(68/Re+eD)**0.25
+    f = where(A < 0.018, 0.0028+0.85*A, A)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [15])
@@ -741,18 +752,18 @@ def f_eck(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     f = 1/(-2*log10(eD/3.71+15/Re))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [16])
@@ -766,14 +777,14 @@ def f_shacham(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -783,7 +794,7 @@ def f_shacham(Re, eD):
         * 4e3 <= Re <= 4e8
     """
     f = 1/(-2*log10(eD/3.7-5.02/Re*log10(eD/3.7+14.5/Re)))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [17])
@@ -796,14 +807,14 @@ def f_manadilli(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -814,7 +825,7 @@ def f_manadilli(Re, eD):
         * eD <= 0.05
     """
     f = 1/(-2*log10(eD/3.7+95./Re**0.983-96.82/Re))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [18])
@@ -829,14 +840,14 @@ def f_romeo(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -849,7 +860,7 @@ def f_romeo(Re, eD):
     A = log10((eD/7.7918)**0.9924+(5.3326/(208.815+Re))**0.9345)
     B = log10(eD/3.827-4.567/Re*A)
     f = 1/(-2*log10(eD/3.7065-5.0272*B/Re))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [19])
@@ -864,14 +875,14 @@ def f_goudar2007(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -883,7 +894,7 @@ def f_goudar2007(Re, eD):
     """
     C = 0.124*Re*eD+log(0.4587*Re)
     f = 1/(0.8686*log(0.4587*Re/(C-0.31)**(C/(C+1))))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [27])
@@ -892,14 +903,14 @@ def f_goudar(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     a = 2/log(10)
@@ -913,7 +924,7 @@ def f_goudar(Re, eD):
     Dcfa = Dla*(1+z/2/((g+1)**2+z/3*(2*g-1)))
 
     f = (a*(log(d/q)+Dcfa))**-2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [20])
@@ -932,21 +943,21 @@ def f_buzzelli(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     # Eq 2
     A = (0.744*log(Re)-1.41)/(1+1.32*eD**0.5)
     B = eD/3.7*Re+2.51*A
     f = 1/(A-((A+2*log10(B/Re))/(1+2.18/B)))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [21])
@@ -955,19 +966,19 @@ def f_Vatankhah(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     S = 0.124*Re*eD+log(0.4587*Re)
     f = 1/(0.8686*log(0.4587*Re/(S-0.31)**(S/(S+0.9633))))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [22])
@@ -981,19 +992,19 @@ def f_avci(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     # Eq 17
     f = 6.4/(log(Re)-log(1+0.01*Re*eD*(1+10*eD**0.5)))**2.4
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [23])
@@ -1006,14 +1017,14 @@ def f_papaevangelou(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -1025,7 +1036,7 @@ def f_papaevangelou(Re, eD):
     """
     # Eq 12
     f = (0.2479-9.47e-5*(7-log10(Re))**4)/log10(eD/3.615+7.366/Re**0.9142)**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [24])
@@ -1040,16 +1051,16 @@ def f_brkic(Re, eD, alternate=False):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
     alternate : boolean
         Choose the alternate correlation from the paper
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     S = log(Re/1.816/log(1.1*Re/log(1+1.1*Re)))                          # Eq 8
@@ -1060,7 +1071,7 @@ def f_brkic(Re, eD, alternate=False):
     else:
         f = 1/(-2*log10(10**(-0.4343*S)+eD/3.71))**2
 
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [25])
@@ -1074,14 +1085,14 @@ def f_fang(Re, eD):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Notes
@@ -1093,7 +1104,7 @@ def f_fang(Re, eD):
     """
     # Eq 13
     f = 1.613/(log(0.234*eD**1.1007-60.525/Re**1.1105+56.291/Re**1.0712))**2
-    return Dimensionless(f)
+    return Dimensionless.array(f)
 
 
 @refDoc(__doi__, [26])
@@ -1107,14 +1118,14 @@ def f_ghanbari(Re, eD):
 
     Parameters
     ----------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     # Eq 10
@@ -1133,14 +1144,14 @@ def f_Samadianfard(Re, eD):
 
     Parameters
     ----------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
 
     Returns
     -------
-    f : float
+    f : float or array
         Friction factor, [-]
     """
     # Eq 29
@@ -1185,9 +1196,9 @@ def f_friccion(Re, eD=0, method=0, geometry=0, *args):
 
     Parameters
     ----------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
     method: int
         Index of method to use (default 0 for use Colebrook original function):
@@ -1240,43 +1251,74 @@ def f_friccion(Re, eD=0, method=0, geometry=0, *args):
             * Ellipse: Both diameters of ellipse, [m]
             * Right triangle: Angle, [º]
             * Anulli: Internal and external diameter, [m]
+
+    Examples
+    --------
+    The diameters of annulli are only necessary in laminar flow
+
+    >>> "%0.7f" % f_friccion(1e4, geometry=6)
+    '0.0043982'
+    >>> "%0.7f" % f_friccion(1e3, 0, 0, 6, 0.02, 0.04)
+    '0.0238125'
+
+    Array input with laminar and turbulent values
+
+    >>> f = f_friccion([1e3, 1e4, 1e5], 1e-4)
+    >>> " ".join("%0.6f" % x for x in f)
+    '0.016000 0.031037 0.018514'
     """
-    if Re < 2100:
-        if geometry == 0:
-            # Circle
-            f_friccion = 16./Re
-        elif geometry == 1:
-            # Square
-            f_friccion = 14.2/Re
-        elif geometry == 2:
-            # Isosceles triangle
-            pass
-        elif geometry == 3:
-            # Rectangle
-            D, d = args[1], args[0]
-            f_friccion = 16/(2/3+11/24*d/D*(2-d/D))/Re
-        elif geometry == 4:
-            # Ellipse
-            D, d = args[1], args[0]
-            c = (D-d)/(D+d)
-            Dh = 4*d*D*(64-16*c**2)/((d+D)*(64-3*c**4))
-            f_friccion = 2*Dh**2*(D**2+d**2)/D**2/d**2/Re
-        elif geometry == 5:
-            pass
-        elif geometry == 6:
-            # Annulli
-            # Eq 7.9, 7.10, pag 183
-            Di, Do = args
-            alpha = (Do-Di)**2/(Do**2+Di**2-(Do**2-Di**2)/log(Do/Di))
-            f_friccion = 16*alpha/Re
+    Re = asarray(Re, dtype=float)
+    laminar = Re < 2100
 
+    # Turbulent flow, skipped for a laminar input
+    if laminar.all():
+        turbulent = None
     else:
-        if geometry == 6:
-            f_friccion = f_Gnielinsky(Re)
-        else:
-            f_friccion = f_list[method](Re, eD)
-
-    return Dimensionless(f_friccion)
+        with errstate(all="ignore"):
+            if geometry == 6:
+                turbulent = f_Gnielinsky(Re)
+            else:
+                turbulent = f_list[method](Re, eD)
+        if not laminar.any():
+            return Dimensionless.array(turbulent)
+
+    # Laminar flow, only evaluated with some laminar value, so the geometries
+    # with parameters can be used without them in turbulent flow
+    with errstate(all="ignore"):
+        f = _f_laminar(Re, geometry, *args)
+    if turbulent is None:
+        return Dimensionless.array(f)
+    return Dimensionless.array(where(laminar, f, turbulent))
+
+
+def _f_laminar(Re, geometry=0, *args):
+    """Laminar friction factor of duct geometries, the geometries without
+    expression return nan"""
+    if geometry == 0:
+        # Circle
+        f = 16./Re
+    elif geometry == 1:
+        # Square
+        f = 14.2/Re
+    elif geometry == 3:
+        # Rectangle
+        D, d = args[1], args[0]
+        f = 16/(2/3+11/24*d/D*(2-d/D))/Re
+    elif geometry == 4:
+        # Ellipse
+        D, d = args[1], args[0]
+        c = (D-d)/(D+d)
+        Dh = 4*d*D*(64-16*c**2)/((d+D)*(64-3*c**4))
+        f = 2*Dh**2*(D**2+d**2)/D**2/d**2/Re
+    elif geometry == 6:
+        # Annulli
+        # Eq 7.9, 7.10, pag 183
+        Di, Do = args
+        alpha = (Do-Di)**2/(Do**2+Di**2-(Do**2-Di**2)/log(Do/Di))
+        f = 16*alpha/Re
+    else:
+        f = nan*Re
+    return f
 
 
 @refDoc(__doi__, [1])
@@ -1285,14 +1327,14 @@ def eD(Re, f):
 
     Parameters
     ------------
-    Re : float
+    Re : float or array
         Reynolds number, [-]
-    f : float
+    f : float or array
         Friction factor, [-]
 
     Returns
     -------
-    eD : float
+    eD : float or array
         Relative roughness of a pipe, [-]
     """
     eD = (10**(-0.5/f**0.5)-2.51/Re/f**0.5)*3.7
@@ -25,31 +25,72 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 #   n-pentane, i-pentane, hexane, heptane, octane, hydrogen, oxygen, carbon
 #   monoxide, water, helium, argón
 #   hydrogen sulfide, nonane, decane from 2008 update
+#
+# The equation is evaluated with a kernel with the coefficients of pure
+# fluids and binary departure functions of a mixture in flat arrays, so every
+# term of the residual Helmholtz energy is calculated once for all its
+# derivatives
 ###############################################################################
 
-# TODO: Not implemented gas-liquid equilibrium yet
 
+import copy
 import os
 import pickle
 
-from scipy import exp, log, zeros, r_
-from scipy.constants import R
+from numpy import (add, array, asarray, bincount, concatenate, cosh,
+                   dot, exp, hstack, log, ones, sinh, sqrt, tanh,
+                   triu_indices, zeros)
+from numpy.linalg import solve
 from scipy.optimize import fsolve
 
 from lib import unidades
-from lib.physics import R_atml
 from lib import mEoS
+from lib.flash import flash
 from lib.thermo import ThermoAdvanced
 
+
 Tref = 298.15
 Pref = 101325.
 # so=0
 # ho=0
 
+R = 8.314472
+Ro = 8.31451
+
+# Reducing parameters of pure fluids and molecular weight, Table A3.5, in the
+# order of GERG.componentes
+# Critic temperature, K
+_Tc = array([
+    190.564, 126.192, 304.1282, 305.322, 369.825, 425.125, 407.817, 469.7,
+    460.35, 507.82, 540.13, 569.32, 33.19, 154.595, 132.86, 647.096, 5.1953,
+    150.687, 373.1, 594.55, 617.7])
+
+# Critic density, mol/m³
+_rhoc = 1e3*array([
+    10.139342719, 11.1839, 10.624978698, 6.870854540, 5.000043088,
+    3.920016792, 3.860142940, 3.215577588, 3.271018581, 2.705877875,
+    2.315324434, 2.056404127, 14.94, 13.63, 10.85, 17.873716090, 17.399,
+    13.407429659, 10.19, 1.81, 1.64])
+
+# Molecular weight, g/mol
+_M = array([
+    16.04246, 28.0134, 44.0095, 30.06904, 44.09562, 58.1222, 58.1222,
+    72.14878, 72.14878, 86.17536, 100.20194, 114.22852, 2.01588, 31.9988,
+    28.0101, 18.01528, 4.002602, 39.948, 34.08088, 128.2551, 142.28168])
+
+# Coefficients of ideal gas contribution not defined in the pure fluid
+# equation because it use a custom reference state
+_ao_pow = {7: [14.536611217, -89.919548319]}
+
 
 class GERG(object):
     """Multiparameter equation of state GERG 2008
-    ref http://dx.doi.org/10.1021/je300655b"""
+    ref http://dx.doi.org/10.1021/je300655b
+
+    >>> st = GERG(componente=[0, 4, 7], fraccion=[.5, .3, .2], T=280, P=2e6)
+    >>> "%0.4f %0.4f %0.4f" % (st.x, st.xl[0], st.xv[0])
+    '0.5584 0.1096 0.8087'
+    """
     kwargs = {"componente": [],
               "fraccion": [],
               "T": 0.0,
@@ -62,15 +103,10 @@ class GERG(object):
               "x": None,
               "mezcla": None}
 
-    componentes = [mEoS.CH4, mEoS.N2, mEoS.CO2, mEoS.C2, mEoS.C3, mEoS.nC4,
-                   mEoS.iC4, mEoS.nC5, mEoS.iC5, mEoS.nC6, mEoS.nC7, mEoS.nC8,
-                   mEoS.H2, mEoS.O2, mEoS.CO, mEoS.H2O, mEoS.He, mEoS.Ar,
-                   mEoS.H2S, mEoS.nC9, mEoS.nC10]
-
-    Fij = pickle.load(open(os.path.join(os.environ["pychemqt"], "dat",
-                                        "mEoS_Fij.pkl"), "rb"))
-    Prop_c = pickle.load(open(os.path.join(os.environ["pychemqt"], "dat",
-                                           "mEoS_Tc.pkl"), "rb"))
+    componentes = mEoS.FluidList([
+        "CH4", "N2", "CO2", "C2", "C3", "nC4", "iC4", "nC5", "iC5", "nC6",
+        "nC7", "nC8", "H2", "O2", "CO", "H2O", "He", "Ar", "H2S", "nC9",
+        "nC10"])
 
     fir_ij = {
         "0-1": {
@@ -253,7 +289,6 @@ class GERG(object):
                 -h: enthalpy, J/kg
                 -s: entropy, J/kgK
                 -u: internal energy, J/kg
-                -x: quality
             """
         self.kwargs = GERG.kwargs.copy()
         self.__call__(**kwargs)
@@ -290,433 +325,645 @@ class GERG(object):
         h = self.kwargs["h"]
         s = self.kwargs["s"]
         u = self.kwargs["u"]
-        x = self.kwargs["x"]
 
-        self.comp = []
-        for i in self.kwargs["componente"]:
-            c = self.componentes[i](eq="GERG", **self.kwargs)
-            self.comp.append(c)
         self.id = self.kwargs["componente"]
-        self.xi = self.kwargs["fraccion"]
+        self.componente = [self.componentes[i] for i in self.id]
+        self.kernel = _kernel(self.id)
+        xi = asarray(self.kwargs["fraccion"], dtype=float)
+        self.xi = xi/xi.sum()
 
         # Critic properties for mixture,
         # eq. 7.9, 7.10 pag.125, Tabla 7.10 pag 136
-        bt = self.Prop_c["beta_t"]
-        bv = self.Prop_c["beta_v"]
-        gt = self.Prop_c["gamma_t"]
-        gv = self.Prop_c["gamma_v"]
-        c_T = zeros((len(self.comp), len(self.comp)))
-        c_rho = zeros((len(self.comp), len(self.comp)))
-        for i, cmpi in enumerate(self.comp):
-            for j, cmpj in enumerate(self.comp):
-                c_T[i, j] = 2*bt[i][j]*gt[i][j]*(cmpi.Tc*cmpj.Tc)**0.5
-                c_rho[i, j] = 2*bv[i][j]*gv[i][j]/8. * \
-                    (1./cmpi.rhoc**(1./3)+1./cmpj.rhoc**(1./3))**3
-
-        f_T = zeros((len(self.comp), len(self.comp)))
-        f_rho = zeros((len(self.comp), len(self.comp)))
-        dFT_ik = zeros((len(self.comp), len(self.comp)))
-        dFT_ki = zeros((len(self.comp), len(self.comp)))
-        dFrho_ik = zeros((len(self.comp), len(self.comp)))
-        dFrho_ki = zeros((len(self.comp), len(self.comp)))
-        for i, x_i in enumerate(self.xi):
-            for j, x_j in enumerate(self.xi):
-                f_T[i, j] = x_i*x_j*(x_i+x_j)/(bt[i][j]**2*x_i+x_j)
-                f_rho[i, j] = x_i*x_j*(x_i+x_j)/(bv[i][j]**2*x_i+x_j)
-                dFT_ik[i, j] = x_j*(x_j+x_i)/(bt[i][j]**2*x_i+x_j) + \
-                    x_j*x_i/(bt[i][j]**2*x_i+x_j) * \
-                    (1-bt[i][j]**2*(x_j+x_i)/(bt[i][j]**2*x_i+x_j))
-                dFrho_ik[i, j] = x_j*(x_j+x_i)/(bv[i][j]**2*x_i+x_j) + \
-                    x_j*x_i/(bv[i][j]**2*x_i+x_j) * \
-                    (1-bv[i][j]**2*(x_j+x_i)/(bv[i][j]**2*x_i+x_j))
-                dFT_ki[j, i] = x_j*(x_j+x_i)/(bt[i][j]**2*x_j+x_i)+x_j*x_i / \
-                    (bt[i][j]**2*x_j+x_i)*(1-(x_j+x_i)/(bt[i][j]**2*x_j+x_i))
-                dFrho_ki[j, i] = x_j*(x_j+x_i)/(bv[i][j]**2*x_j+x_i)+x_j*x_i /\
-                    (bv[i][j]**2*x_j+x_i)*(1-(x_j+x_i)/(bv[i][j]**2*x_j+x_i))
-
-        sumai_v = sumaij_v = sumai_T = sumaij_T = m = 0
-        for i, componentei in enumerate(self.comp):
-            sumai_v += self.xi[i]**2/componentei.rhoc
-            sumai_T += self.xi[i]**2*componentei.Tc
-            m += self.xi[i]*componentei.M
-            for j, componentej in enumerate(self.comp):
-                if j > i:
-                    sumaij_v += c_rho[i, j]*f_rho[i, j]
-                    sumaij_T += c_T[i, j]*f_T[i, j]
-
-        self.rhoc = unidades.Density(1./(sumai_v+sumaij_v))
-        self.Tc = unidades.Temperature(sumai_T+sumaij_T)
-        self.M = m  # g/mol
+        Tr, vr = self.kernel.reducing(self.xi)[:2]
+        self.M = dot(self.xi, self.kernel.M)  # g/mol
         self.R = unidades.SpecificHeat(R/self.M, "kJkgK")
-
-        Tcxi = rhocxi = []
-        for i, componentei in enumerate(self.comp):
-            sumav1 = sumat1 = 0
-            for k in range(i):
-                sumav1 += c_rho[k, i]*dFrho_ki[k, i]
-                sumat1 += c_T[k, i]*dFT_ki[k, i]
-            sumav2 = sumat2 = 0
-            for k in range(i+1, len(self.xi)):
-                sumav2 += c_rho[i, k]*dFrho_ik[i, k]
-                sumat2 += c_T[i, k]*dFT_ik[i, k]
-
-            Tcxi.append(2*self.xi[i]*componentei.Tc+sumat1+sumat2)
-            rhocxi.append(2*self.xi[i]/componentei.rhoc+sumav1+sumav2)
-        self.Tcxi = Tcxi
-        self.rhocxi = rhocxi
+        self.Tc = unidades.Temperature(Tr)
+        self.rhoc = unidades.Density(self.M/vr, "gm3")
 
         if v and not rho:
             rho = 1./v
 
-        if T and x is not None:
+        if T and P:
+            rho = self._rhoTP(T, P)
+        elif T and rho:
             pass
+        elif T and h is not None:
+            rho = fsolve(lambda rho: self._solve(rho, T)["h"]-h, 200)[0]
+        elif T and s is not None:
+            rho = fsolve(lambda rho: self._solve(rho, T)["s"]-s, 200)[0]
+        elif T and u is not None:
+            rho = fsolve(lambda rho: self._solve(rho, T)["u"]-u, 200)[0]
+        elif P and rho:
+            T = fsolve(lambda T: self._solve(rho, T)["P"]-P, 600)[0]
+        elif P and h is not None:
+            T, rho = self._isobaric(P, "h", h)
+        elif P and s is not None:
+            T, rho = self._isobaric(P, "s", s)
+        elif P and u is not None:
+            rho, T = fsolve(lambda par: (
+                self._solve(par[0], par[1])["P"]-P, self._solve(
+                    par[0], par[1])["u"]-u), [200, 600])
+        elif rho and h is not None:
+            T = fsolve(lambda T: self._solve(rho, T)["h"]-h, 600)[0]
+        elif rho and s is not None:
+            T = fsolve(lambda T: self._solve(rho, T)["s"]-s, 600)[0]
+        elif rho and u is not None:
+            T = fsolve(lambda T: self._solve(rho, T)["u"]-u, 600)[0]
+        elif h is not None and s is not None:
+            rho, T = fsolve(lambda par: (
+                self._solve(par[0], par[1])["h"]-h, self._solve(
+                    par[0], par[1])["s"]-s), [200, 600])
+        elif h is not None and u is not None:
+            rho, T = fsolve(lambda par: (
+                self._solve(par[0], par[1])["h"]-h, self._solve(
+                    par[0], par[1])["u"]-u), [200, 600])
+        elif s is not None and u is not None:
+            rho, T = fsolve(lambda par: (
+                self._solve(par[0], par[1])["s"]-s, self._solve(
+                    par[0], par[1])["u"]-u), [200, 600])
         else:
-            if T and P:
-                rhoo = 2.
-                rho = fsolve(lambda rho: self._solve(rho, T)["P"]-P*1e6, rhoo)
-            elif T and rho:
-                pass
-            elif T and h is not None:
-                rho = fsolve(lambda rho: self._solve(rho, T)["h"]-h, 200)
-            elif T and s is not None:
-                rho = fsolve(lambda rho: self._solve(rho, T)["s"]-s, 200)
-            elif T and u is not None:
-                rho = fsolve(lambda rho: self._solve(rho, T)["u"]-u, 200)
-            elif P and rho:
-                T = fsolve(lambda T: self._solve(rho, T)["P"]-P*1e6, 600)
-            elif P and h is not None:
-                rho, T = fsolve(lambda par: (
-                    self._solve(par[0], par[1])["P"]-P*1e6, self._solve(
-                        par[0], par[1])["h"]-h), [200, 600])
-            elif P and s is not None:
-                rho, T = fsolve(lambda par: (
-                    self._solve(par[0], par[1])["P"]-P*1e6, self._solve(
-                        par[0], par[1])["s"]-s), [200, 600])
-            elif P and u is not None:
-                rho, T = fsolve(lambda par: (
-                    self._solve(par[0], par[1])["P"]-P*1e6, self._solve(
-                        par[0], par[1])["u"]-u), [200, 600])
-            elif rho and h is not None:
-                T = fsolve(lambda T: self._solve(rho, T)["h"]-h, 600)
-            elif rho and s is not None:
-                T = fsolve(lambda T: self._solve(rho, T)["s"]-s, 600)
-            elif rho and u is not None:
-                T = fsolve(lambda T: self._solve(rho, T)["u"]-u, 600)
-            elif h is not None and s is not None:
-                rho, T = fsolve(lambda par: (
-                    self._solve(par[0], par[1])["h"]-h, self._solve(
-                        par[0], par[1])["s"]-s), [200, 600])
-            elif h is not None and u is not None:
-                rho, T = fsolve(lambda par: (
-                    self._solve(par[0], par[1])["h"]-h, self._solve(
-                        par[0], par[1])["u"]-u), [200, 600])
-            elif s is not None and u is not None:
-                rho, T = fsolve(lambda par: (
-                    self._solve(par[0], par[1])["s"]-s, self._solve(
-                        par[0], par[1])["u"]-u), [200, 600])
-            else:
-                raise IOError
-
-        fio, fiot, fiott, fiod, fiodd, fiodt, fir, firt, firtt, fird, firdd,\
-            firdt, firdtt, nfioni, nfirni = self._eq(rho, T)
+            raise IOError
 
-        # Tabla 7.1 pag 127
-        tau = self.Tc/T
-        delta = rho/self.rhoc
+        prop = self._solve(rho, T)
 
         self.T = unidades.Temperature(T)
         self.rho = unidades.Density(rho)
         self.v = unidades.SpecificVolume(1./rho)
-        self.P = unidades.Pressure((1+delta*fird)*self.R.JkgK*T*rho)
-        self.Z = 1+delta*fird
-        self.s = unidades.SpecificHeat(self.R.kJkgK*(tau*(fiot+firt)-fio-fir))
-        self.u = unidades.Enthalpy(self.R*T*tau*(fiot+firt))
-        self.h = unidades.Enthalpy(self.R*T*(1+tau*(fiot+firt)+delta*fird))
-        self.cp = unidades.SpecificHeat(self.R*(
-            -tau**2*(fiott+firtt)+(1+delta*fird-delta*tau*firdt)**2 /
-            (1+2*delta*fird+delta**2*firdd)))
-        self.cv = unidades.SpecificHeat(-self.R*tau**2*(fiott+firtt))
-        self.g = unidades.Enthalpy(self.R*T*(1+fio+fir+delta*fird))
-        self.w = unidades.Speed((self.R*T*(
-            1+2*delta*fird+delta**2*firdd-(1+delta*fird-delta*tau*firdt)**2 /
-            tau**2/(fiott+firtt)))**0.5)
-
-        f, FI = self.fug(rho, T, nfirni)
-        Ki, xi, yi, Q = self.flash()
-        self.x = unidades.Dimensionless(Q)
-        self.xl = xi
-        self.xv = yi
+        self.P = unidades.Pressure(prop["P"])
+        self.Z = prop["Z"]
+        self.s = unidades.SpecificHeat(prop["s"])
+        self.u = unidades.Enthalpy(prop["u"])
+        self.h = unidades.Enthalpy(prop["h"])
+        self.cp = unidades.SpecificHeat(prop["cp"])
+        self.cv = unidades.SpecificHeat(prop["cv"])
+        self.g = unidades.Enthalpy(prop["g"])
+        self.w = unidades.Speed(prop["w"])
+
+        self.fi = exp(self._lnphi(self.xi, self.Z))
+        self.f = [unidades.Pressure(x*fi*self.P)
+                  for x, fi in zip(self.xi, self.fi)]
+        res = flash(self, self.xi)
+        self.x = unidades.Dimensionless(res["beta"])
+        self.xl = res["x"]
+        self.xv = res["y"]
+        self.Tr = unidades.Dimensionless(self.T/self.Tc)
         if self.kwargs["mezcla"]:
             self.Pc = self.kwargs["mezcla"].Pc
+            self.Pr = unidades.Dimensionless(self.P/self.Pc)
+        else:
+            self.Pr = unidades.Dimensionless(None)
+
+        # Ideal properties
+        rho0 = self.P/R/self.T
+        a0, ta0t, t2a0tt = self.kernel.ideal0(self.xi, self.T, rho0)
+        self.v0 = unidades.SpecificVolume(1/rho0/self.M*1e3)
+        self.rho0 = unidades.Density(1/self.v0)
+        self.h0 = unidades.Enthalpy(R*self.T*(1+ta0t)/self.M*1e3)
+        self.u0 = unidades.Enthalpy(R*self.T*ta0t/self.M*1e3)
+        self.s0 = unidades.SpecificHeat(R*(ta0t-a0)/self.M*1e3)
+        self.a0 = unidades.Enthalpy(self.u0-self.T*self.s0)
+        self.g0 = unidades.Enthalpy(self.h0-self.T*self.s0)
+        self.cv0 = unidades.SpecificHeat(-R*t2a0tt/self.M*1e3)
+        self.cp0 = unidades.SpecificHeat(self.cv0+self.R)
+        self.cp0_cv = unidades.Dimensionless(self.cp0/self.cv0)
+        self.gamma0 = self.cp0_cv
+
         self.Liquido = ThermoAdvanced()
         self.Gas = ThermoAdvanced()
-
-    def fug(self, rho, T, nfirni=None):
-        if not nfirni:
-            tau = self.Tc/T
-            delta = rho/self.rhoc
-            fir, firt, firtt, fird, firdd, firdt, firdtt, nfirni = self._phir(tau, delta)
-        f = []
-        FI = []
-        for xi, dn in zip(self.xi, nfirni):
-            f.append(unidades.Pressure(xi*rho/self.M*R_atml*T*exp(dn), "atm"))
-            FI.append(dn-log(self.Z))
-        return f, FI
-
-#        firn=delta*fird*(1-1./self.rhoc*n*rhodn)+tau*firt/self.Tc*n*Tcdn
-#        nfirn=fir+n*dfirn
-#        f
-
-
-#        propiedades["alfap"]=(1-delta*tau*firdt/(1+delta*fird))/T
-#        propiedades["betap"]=rho*(1+(delta*fird+delta**2*firdd)/(1+delta*fird))
-#        propiedades["fugacity"]=exp(fir+delta*fird-log(1+delta*fird))
-#        propiedades["B"]=B
-#        propiedades["C"]=C
-#        propiedades["dpdrho"]=self.R*T*(1+2*delta*fird+delta**2*firdd)
-#        propiedades["dpdT"]=self.R*rho*(1+delta*fird+delta*tau*firdt)
-#
-#        self.a=unidades.Enthalpy(self.u-self.T*self.s)
-#        self.Z=self.P*self.v/self.T/self.R.kJkgK/1000
-#        self.alfap=propiedades["alfap"]     #inversa de la temperatura
-#        self.betap=unidades.Density(propiedades["betap"])
-#
-#        self.Tr=T/self.Tc
-#
-#        self.cp0=self._Cp0(self._constants["cp"])
-#        self.gamma=-self.v/self.P.kPa*self.derivative("P", "v", "s")
-#        self.fi=propiedades["fugacity"]
-#        self.f=unidades.Pressure(self.fi*self.P)
-#        self.virialB=propiedades["B"]
-#        self.virialC=propiedades["C"]
-
-    def _eq(self, rho, T):
-        tau = self.Tc/T
-        delta = rho/self.rhoc
-        fio, fiot, fiott, fiod, fiodd, fiodt, nfioni = self._phi0(tau, delta)
-        fir, firt, firtt, fird, firdd, firdt, firdtt, nfirni = self._phir(tau, delta)
-        return (fio, fiot, fiott, fiod, fiodd, fiodt, fir, firt, firtt, fird,
-                firdd, firdt, firdtt, nfioni, nfirni)
+        if self.x == 0:
+            self._fillPhase(self.Liquido, self.xi, rho/self.M*1e3)
+        elif self.x == 1:
+            self._fillPhase(self.Gas, self.xi, rho/self.M*1e3)
+        else:
+            self._fillPhase(self.Liquido, self.xl, self.kernel.density(
+                self.xl, self.T, self.P, liquid=True))
+            self._fillPhase(self.Gas, self.xv, self.kernel.density(
+                self.xv, self.T, self.P))
+
+        if 0 < self.x < 1:
+            self.Hvap = unidades.Enthalpy(self.Gas.h-self.Liquido.h)
+            self.Svap = unidades.SpecificHeat(self.Gas.s-self.Liquido.s)
+        else:
+            self.Hvap = unidades.Enthalpy(None)
+            self.Svap = unidades.SpecificHeat(None)
+        self.invT = unidades.InvTemperature(-1/self.T)
+
+        # The surface tension isn't available
+        self.sigma = unidades.Tension(None)
+
+    def _fillPhase(self, fase, xi, rho):
+        """Populate a phase with the properties at its composition and molar
+        density, in mol/m³"""
+        prop = self.kernel.properties(xi, self.T, rho)
+        M = prop["M"]
+        fase._bool = True
+        fase.M = unidades.Dimensionless(M)
+        fase.fraccion = [unidades.Dimensionless(x) for x in xi]
+        fase.rho = unidades.Density(rho*M/1e3)
+        fase.v = unidades.SpecificVolume(1/fase.rho)
+        fase.Z = unidades.Dimensionless(prop["Z"])
+        fase.h = unidades.Enthalpy(prop["h"]/M*1e3)
+        fase.u = unidades.Enthalpy(prop["u"]/M*1e3)
+        fase.g = unidades.Enthalpy(prop["g"]/M*1e3)
+        fase.s = unidades.SpecificHeat(prop["s"]/M*1e3)
+        fase.cp = unidades.SpecificHeat(prop["cp"]/M*1e3)
+        fase.cv = unidades.SpecificHeat(prop["cv"]/M*1e3)
+        fase.cp_cv = unidades.Dimensionless(fase.cp/fase.cv)
+        fase.w = unidades.Speed(prop["w"])
+
+    def _fillCorriente(self, corriente):
+        """Procedure to populate the corriente with the global properties
+        corriente: instance of corriente to populate"""
+        for prop in ThermoAdvanced.propertiesGlobal():
+            corriente.__setattr__(prop, self.__getattribute__(prop))
 
     def _solve(self, rho, T):
-        tau = self.Tc/T
-        delta = rho/self.rhoc
-        fio, fiot, fiott, fiod, fiodd, fiodt, nfioni = self._phi0(tau, delta)
-        fir, firt, firtt, fird, firdd, firdt, firdtt, nfirni = self._phir(tau, delta)
+        """Properties at density in kg/m³ and temperature, in mass basis"""
+        prop = self.kernel.properties(self.xi, T, rho/self.M*1e3)
         propiedades = {}
-        propiedades["P"] = (1+delta*fird)*self.R.JkgK*T*rho
-        propiedades["s"] = self.R.kJkgK*(tau*(fiot+firt)-fio-fir)
-        propiedades["u"] = self.R.kJkgK*T*tau*(fiot+firt)
-        propiedades["h"] = self.R.kJkgK*T*(1+tau*(fiot+firt)+delta*fird)
+        propiedades["P"] = prop["P"]
+        propiedades["Z"] = prop["Z"]
+        propiedades["w"] = prop["w"]
+        for key in ("s", "cv", "cp"):
+            propiedades[key] = prop[key]/self.M*1e3
+        for key in ("u", "h", "g"):
+            propiedades[key] = prop[key]/self.M*1e3
         return propiedades
 
-    def _phi0(self, tau, delta):
-        """Contribución ideal de la energía libre de Helmholtz eq. 7.5"""
-        fio = fiot = fiott = fiod = fiodd = fiodt = 0
-        nfioni = []   # ðnao/ðni
-        for i, componente in enumerate(self.comp):
-            deltai = delta*self.rhoc/componente.rhoc
-            taui = componente.Tc*tau/self.Tc
-            fio_, fiot_, fiott_, fiod_, fiodd_, fiodt_ = componente._phi0(
-                componente.GERG["cp"], taui, deltai)
-            fio += self.xi[i]*(fio_+log(self.xi[i]))
-            fiot += self.xi[i]*fiot_
-            fiott += self.xi[i]*fiott_
-            fiod += self.xi[i]*fiod_
-            fiodd += self.xi[i]*fiodd_
-            fiodt += self.xi[i]*fiodt_
-            nfioni.append(fio_+1+log(self.xi[i]))
-        return fio, fiot, fiott, fiod, fiodd, fiodt, nfioni
-
-    def _phir(self, tau, delta):
-        """Contribución residual de la energía libre de Helmholtz eq. 7.7"""
-        fir = firt = firtt = fird = firdd = firdt = firdtt = 0
-        firxi = []
-        firxixj = zeros((len(self.comp), len(self.comp)))
-        firdxi = []
-        firtxi = []
-
-        for i, componente in enumerate(self.comp):
-            deltai = delta*self.rhoc/componente.rhoc
-            taui = componente.Tc*tau/self.Tc
-            fir_, firt_, firtt_, fird_, firdd_, firdt_, firdtt_, B_, C_ = \
-                componente._Helmholtz(taui, deltai)
-            fir += self.xi[i]*fir_
-            firt += self.xi[i]*firt_
-            firtt += self.xi[i]*firtt_
-            fird += self.xi[i]*fird_
-            firdd += self.xi[i]*firdd_
-            firdt += self.xi[i]*firdt_
-
-            firxi.append(fir_)
-            firdxi.append(fird_)
-            firtxi.append(firt_)
-
-        # Contribución residual cruzada eq 7.8
-        for i, x_i in enumerate(self.xi):
-            for j, x_j in enumerate(self.xi):
-                if j > i:
-                    (fir_, firt_, firtt_, fird_, firdd_, firdt_, firdtt_, B_,
-                        C_) = self._phijr(i, j, tau, delta)
-                    fir += x_i*x_j*self.Fij[self.id[i]][self.id[j]]*fir_
-                    firt += x_i*x_j*self.Fij[self.id[i]][self.id[j]]*firt_
-                    firtt += x_i*x_j*self.Fij[self.id[i]][self.id[j]]*firtt_
-                    fird += x_i*x_j*self.Fij[self.id[i]][self.id[j]]*fird_
-                    firdd += x_i*x_j*self.Fij[self.id[i]][self.id[j]]*firdd_
-                    firdt += x_i*x_j*self.Fij[self.id[i]][self.id[j]]*firdt_
-
-                    firxi[i] += x_j*self.Fij[self.id[i]][self.id[j]]*fir_
-                    firxixj[i, j] = self.Fij[self.id[i]][self.id[j]]*fir_
-                    firdxi[i] += x_j*self.Fij[self.id[i]][self.id[j]]*fird_
-                    firtxi[i] += x_j*self.Fij[self.id[i]][self.id[j]]*firt_
-
-        suma = suma_rho = suma_T = 0
-        for i, x_i in enumerate(self.xi):
-            suma += x_i*firxi[i]
-            suma_rho += x_i*self.rhocxi[i]
-            suma_T += x_i*self.Tcxi[i]
-
-        n_rhocni = []
-        n_Tcni = []
-        for i, x_i in enumerate(self.xi):
-            n_rhocni.append(self.rhocxi[i]-suma_rho)
-            n_Tcni.append(self.Tcxi[i]-suma_T)
-
-        n_firni = []  # ðar/ðni
-        nfirni = []   # ðnar/ðni
-        for i, componente in enumerate(self.comp):
-            n_firni.append(delta*fird*(1-1./self.rhoc*n_rhocni[i]) +
-                           tau*firt/self.Tc*n_Tcni[i]+firxi[i]-suma)
-            nfirni.append(fir_+n_firni[i])
-        return fir, firt, firtt, fird, firdd, firdt, firdtt, nfirni
-
-    def _phijr(self, i, j, tau, delta):
-        txt = str(i)+"-"+str(j)
-        constants = self.fir_ij.get(txt, 0)
-        fir = fird = firdd = firt = firtt = firdt = firdtt = B = C = 0
-        if constants:
-            delta_0 = 1e-50
-            nr1 = constants["nr1"]
-            d1 = constants["d1"]
-            t1 = constants["t1"]
-            for i in range(len(constants.get("nr1", []))):
-                # Polinomial terms
-                fir += nr1[i]*delta**d1[i]*tau**t1[i]
-                fird += nr1[i]*d1[i]*delta**(d1[i]-1)*tau**t1[i]
-                firdd += nr1[i]*d1[i]*(d1[i]-1)*delta**(d1[i]-2)*tau**t1[i]
-                firt += nr1[i]*t1[i]*delta**d1[i]*tau**(t1[i]-1)
-                firtt += nr1[i]*t1[i]*(t1[i]-1)*delta**d1[i]*tau**(t1[i]-2)
-                firdt += nr1[i]*t1[i]*d1[i]*delta**(d1[i]-1)*tau**(t1[i]-1)
-                firdtt += nr1[i]*t1[i]*d1[i]*(t1[i]-1)*delta**(d1[i]-1)*tau**(t1[i]-2)
-                B += nr1[i]*d1[i]*delta_0**(d1[i]-1)*tau**t1[i]
-                C += nr1[i]*d1[i]*(d1[i]-1)*delta_0**(d1[i]-2)*tau**t1[i]
-
-            nr2 = constants["nr2"]
-            if nr2:
-                d2 = constants["d2"]
-                t2 = constants["t2"]
-                n2 = constants["n2"]
-                e2 = constants["e2"]
-                b2 = constants["b2"]
-                g2 = constants["g2"]
-                for i in range(len(constants.get("nr2", []))):
-                    # Gaussian terms
-                    fir += nr2[i]*delta**d2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta-e2[i])**2-b2[i]*(tau-g2[i])**(2))
-                    fird += nr2[i]*delta**d2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        (d2[i]/delta-2*n2[i]*(delta-e2[i]))
-                    firdd += nr2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        (-2*n2[i]*delta**d2[i]+4*n2[i]**2*delta**d2[i] *
-                         (delta-e2[i])**2-4*d2[i]*n2[i]*delta**2*(delta-e2[i])+d2[i]*2*delta)
-                    firt += nr2[i]*delta**d2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        (t2[i]/tau-2*b2[i]*(tau-g2[i]))
-                    firtt += nr2[i]*delta**d2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        ((t2[i]/tau-2*b2[i]*(tau-g2[i]))**(2)-t2[i]/tau**2-2*b2[i])
-                    firdt += nr2[i]*delta**d2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        (t2[i]/tau-2*b2[i]*(tau-g2[i])) * \
-                        (d2[i]/delta-2*n2[i]*(delta-e2[i]))
-                    firdtt += nr2[i]*delta**d2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        ((t2[i]/tau-2*b2[i]*(tau-g2[i]))**(2)-t2[i]/tau**2-2*b2[i]) * \
-                        (d2[i]/delta-2*n2[i]*(delta-e2[i]))
-                    B += nr2[i]*delta_0**d2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta_0-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        (d2[i]/delta_0-2*n2[i]*(delta_0-e2[i]))
-                    C += nr2[i]*tau**t2[i] * \
-                        exp(-n2[i]*(delta_0-e2[i])**2-b2[i]*(tau-g2[i])**(2)) * \
-                        (-2*n2[i]*delta_0**d2[i]+4*n2[i]**2*delta_0**d2[i]*(delta_0-e2[i])**2 -
-                         4*d2[i]*n2[i]*delta_0**2*(delta_0-e2[i])+d2[i]*2*delta_0)
-
-        return fir, firt, firtt, fird, firdd, firdt, firdtt, B, C
-
-    def flash(self):
-        """Cálculo de los coeficientes de reparto entre fases"""
-        #Estimación inicial de K mediante correlación wilson Eq 5.61 Pag 82
-        Ki = []
-        for componente in self.comp:
-            Ki.append(componente.Pc/self.P*exp(5.373*(1.+componente.f_acent)*(1.-componente.Tc/self.T)))
-
-        def f(Q):
-            sum = 0
-            for i, x in enumerate(self.xi):
-                sum += x*(Ki[i]-1.)/(1.+Q+Q*Ki[i])
-            return sum
-
-        if f(0) > 0 and f(1) > 0:
-            # x>1, vapor only
-            xi = self.xi
-            yi = self.xi
-            Q = 1
-        elif f(0) < 0 and f(1) < 0:
-            # x<0, liquid only
-            xi = self.xi
-            yi = self.xi
-            Q = 0
-        else:
-            # two phases
-            Qo = 0.5
-            while True:
-                Q = Qo
-                Qo = fsolve(Vr, Q)
-                xi = []
-                yi = []
-                for i, fraccion in enumerate(self.xi):
-                    xi.append(fraccion/(1+Qo*(Ki[i]-1)))
-                    yi.append(fraccion*Ki[i]/(1+Qo*(Ki[i]-1)))
-
-                fi, Fi = self.fug(self.rho, self.T)
-                fiv = r_[yi]*r_[self.titaiv]*self.P
-                fil = r_[xi]*r_[self.titail]*self.P
-                # criterio de convergencia Eq 21
-                if sum((fil/fiv-1)**2) < 1e-15 and (Q-Qo)**2 < 1e-15:
-                    break
+    def _rhoTP(self, T, P):
+        """Density of the stable root at temperature and pressure, the lower
+        Gibbs free energy root when there are liquid and gas roots"""
+        self.T = unidades.Temperature(T)
+        self.P = unidades.Pressure(P)
+        Zl, Zg = self._Z(self.xi)
+        Z = Zg
+        if Zl != Zg and dot(self.xi, self._lnphi(self.xi, Zl)) < dot(
+                self.xi, self._lnphi(self.xi, Zg)):
+            Z = Zl
+        return P/Z/R/T*self.M/1e3
+
+    def _isobaric(self, P, prop, value, T0=300, tol=1e-10, maxiter=20):
+        """Temperature and density at pressure P with known enthalpy or
+        entropy, Newton-Raphson iteration in density and temperature starting
+        from the stable root at T, with a bracketed iteration along the
+        isobar when it fails. The analytic jacobian use:
+            (∂h/∂T)ρ = cv + (∂P/∂T)ρ/ρ
+            (∂h/∂ρ)T = (∂P/∂ρ)T/ρ - T(∂P/∂T)ρ/ρ²
+            (∂s/∂T)ρ = cv/T
+            (∂s/∂ρ)T = -(∂P/∂T)ρ/ρ²
+        """
+        # Molar basis in iteration
+        valuem = value*self.M/1e3
+        T = T0
+        rho = self._rhoTP(T, P)/self.M*1e3
+        converge = False
+        for it in range(maxiter):
+            p = self.kernel.properties(self.xi, T, rho)
+            f = array([p["P"]-P, p[prop]-valuem])
+            if prop == "h":
+                J = [[p["dpdrho"], p["dpdT"]],
+                     [p["dpdrho"]/rho-T*p["dpdT"]/rho**2,
+                      p["cv"]+p["dpdT"]/rho]]
+            else:
+                J = [[p["dpdrho"], p["dpdT"]],
+                     [-p["dpdT"]/rho**2, p["cv"]/T]]
+            drho, dT = solve(J, -f)
+
+            # Keep the iteration in the positive range of variables
+            step = 1
+            while rho+step*drho <= 0 or T+step*dT <= 0:
+                step /= 2
+            rho += step*drho
+            T += step*dT
+            if abs(drho) < tol*rho and abs(dT) < tol*T:
+                converge = True
+                break
+
+        # Check the solution is the stable root
+        if converge:
+            rhos = self._rhoTP(T, P)
+            if abs(rhos/self.M*1e3-rho) < 1e-6*rho:
+                return T, rhos
+
+        # Bad initial value or metastable solution, the iteration is done
+        # along the isobar with the stable root, limiting the step to the
+        # bracket of solution found, the property increase with temperature
+        # at constant pressure
+        T = T0
+        Tmin, Tmax = 0, float("inf")
+        for it in range(2*maxiter):
+            rho = self._rhoTP(T, P)
+            p = self._solve(rho, T)
+            f = p[prop]-value
+            if f > 0:
+                Tmax = T
+            else:
+                Tmin = T
+            dfdT = p["cp"]
+            if prop == "s":
+                dfdT /= T
+            Tnew = T-f/dfdT
+            if not Tmin < Tnew < Tmax:
+                if Tmax == float("inf"):
+                    Tnew = 2*T
                 else:
-                    Ki = r_[self.titail]/r_[self.titaiv]
-        return Ki, xi, yi, Q
-
-
-id_GERG = [i.id for i in GERG.componentes]
-
-
-if __name__ == "__main__":
-#    import doctest
-#    doctest.testmod()
-    T = unidades.Temperature(205, "F")
-    P = unidades.Pressure(315, "psi")
-    aire = GERG(T=T, P=P, componente=[0, 3, 4, 5, 7, 9], fraccion=[0.26, 0.09, 0.25, 0.17, 0.11, 0.12])
-#    print "%0.1f %0.4f %0.3f %0.3f %0.5f %0.4f %0.2f" % (aire.T, aire.rho, aire.h.kJkg, aire.s.kJkgK, aire.cv.kJkgK, aire.cp.kJkgK, aire.w), aire.P.MPa
-
-#    aire=GERG([0], [1.], P=0.1, T=300)
-#    print "%0.1f %0.4f %0.3f %0.3f %0.5f %0.4f %0.2f" % (aire.T, aire.rho, aire.h.kJkg, aire.s.kJkgK, aire.cv.kJkgK, aire.cp.kJkgK, aire.w), aire.P.MPa
-
-#    aire=GERG([1], [1.], P=0.1, T=300)
-#    print "%0.1f %0.4f %0.3f %0.3f %0.5f %0.4f %0.2f" % (aire.T, aire.rho, aire.h.kJkg, aire.s.kJkgK, aire.cv.kJkgK, aire.cp.kJkgK, aire.w), aire.P.MPa
-
-#    aire=GERG([15], [1.], P=0.1, T=500)
-#    print "%0.1f %0.4f %0.3f %0.3f %0.5f %0.4f %0.2f" % (aire.T, aire.rho, aire.h.kJkg, aire.s.kJkgK, aire.cv.kJkgK, aire.cp.kJkgK, aire.w), aire.P.MPa
-
+                    Tnew = (Tmin+Tmax)/2
+            if abs(Tnew-T) < tol*T:
+                return Tnew, self._rhoTP(Tnew, P)
+            T = Tnew
+        raise ValueError("Iteration not converge")
+
+    def _Z(self, xi):
+        """Compressibility factor of liquid and gas roots of a phase with
+        composition xi at the temperature and pressure of model, with an only
+        root both values are the same"""
+        Z = []
+        for liquid in (True, False):
+            try:
+                rho = self.kernel.density(xi, self.T, self.P, liquid)
+            except ValueError:
+                continue
+            Z.append(self.P/rho/R/self.T)
+        if not Z:
+            raise ValueError("Iteration not converge")
+        return min(Z), max(Z)
+
+    def _lnphi(self, xi, Z):
+        """Logarithm of fugacity coefficients of components in a phase with
+        composition xi and compressibility factor Z"""
+        return self.kernel.lnphi(xi, self.T, self.P/Z/R/self.T)
+
+    def clone(self, T=None, P=None):
+        """Model at other temperature or pressure for the phase equilibrium
+        calculations, without calculating the state properties"""
+        eq = copy.copy(self)
+        if T is not None:
+            eq.T = unidades.Temperature(T)
+        if P is not None:
+            eq.P = unidades.Pressure(P)
+        return eq
+
+
+id_GERG = GERG.componentes.ids
+
+
+_coefficients = {}
+_kernels = {}
+
+
+def _loadCoefficients():
+    """Coefficients of GERG-2008 in arrays, loaded in the first use
+
+    Each term of the residual contribution of pure fluids and binary
+    departure functions is defined by the parameters n, d, t, c, η, ε, β, γ
+    of the general form::
+
+        n·δ^d·τ^t·exp(-δ^c-η(δ-ε)²-β(δ-γ))
+
+    with the δ^c term only for the exponential terms of pure fluids
+    """
+    if _coefficients:
+        return _coefficients
+
+    pure = []
+    for i, cmp in enumerate(GERG.componentes):
+        cte = cmp.GERG
+        n1, n2 = len(cte["nr1"]), len(cte["nr2"])
+        zero = zeros(n1+n2)
+        c = concatenate((zeros(n1), cte["c2"]))
+        pure.append(array([
+            cte["nr1"]+cte["nr2"], cte["d1"]+cte["d2"], cte["t1"]+cte["t2"],
+            c, zero, zero, zero, zero]))
+    _coefficients["pure"] = pure
+
+    # Ideal gas contribution, Eq 7.6
+    ideal = zeros((len(pure), 3))
+    hyp = []
+    for i, cmp in enumerate(GERG.componentes):
+        cte = cmp.GERG["cp"]
+        ideal[i, :2] = cte["ao_pow"] or _ao_pow[i]
+        ideal[i, 2] = cte["ao_log"][1]
+        for n, tita in zip(cte.get("ao_sinh", []), cte.get("sinh", [])):
+            hyp.append((i, n, tita, 1))
+        for n, tita in zip(cte.get("ao_cosh", []), cte.get("cosh", [])):
+            hyp.append((i, n, tita, 0))
+    _coefficients["ideal"] = ideal*Ro/R
+    _coefficients["hyp"] = array(hyp)
+    _coefficients["Tc0"] = array([cmp.Tc for cmp in GERG.componentes])
+
+    binary = {}
+    for key, cte in GERG.fir_ij.items():
+        i, j = map(int, key.split("-"))
+        n1, n2 = len(cte["nr1"]), len(cte["nr2"])
+        zero = zeros(n1)
+        binary[(i, j)] = hstack((
+            array([cte["nr1"], cte["d1"], cte["t1"], zero, zero, zero, zero,
+                   zero]),
+            array([cte.get(k, []) for k in ("nr2", "d2", "t2")] +
+                  [zeros(n2)] +
+                  [cte.get(k, []) for k in ("n2", "e2", "b2", "g2")]
+                  ).reshape(8, n2)))
+    _coefficients["binary"] = binary
+
+    path = os.path.join(os.environ["pychemqt"], "dat")
+    with open(os.path.join(path, "mEoS_Fij.pkl"), "rb") as archivo:
+        _coefficients["F"] = array(pickle.load(archivo))
+
+    # Binary parameters of reducing functions, with the upper triangle
+    # defined, βji = 1/βij and γji = γij. The tables follow the order of
+    # components in GERG-2008, the β of pairs with reversed order in
+    # componentes must be inverted
+    with open(os.path.join(path, "mEoS_Tc.pkl"), "rb") as archivo:
+        prop = pickle.load(archivo)
+    order = array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 14, 15, 16, 17, 19,
+                   20, 18, 12, 13])
+    for key in ("beta_t", "beta_v", "gamma_t", "gamma_v"):
+        par = ones((len(pure), len(pure)))
+        par[:-1][triu_indices(len(pure)-1, 1, len(pure))] = \
+            asarray(prop[key])[triu_indices(len(pure)-1, 1, len(pure))]
+        lower = triu_indices(len(pure), 1)
+        if key[0] == "b":
+            reverse = order[lower[0]] > order[lower[1]]
+            par[lower[0][reverse], lower[1][reverse]] **= -1
+            par.T[lower] = 1/par[lower]
+        else:
+            par.T[lower] = par[lower]
+        _coefficients[key] = par
+
+    return _coefficients
+
+
+def _kernel(ids):
+    """Kernel of the mixture of components with index ids, cached"""
+    key = tuple(ids)
+    if key not in _kernels:
+        _kernels[key] = Kernel(ids)
+    return _kernels[key]
+
+
+def _pairFunction(xi, xj, b2):
+    """Composition function of reducing parameters of pairs, Eq 7.9, with the
+    derivatives with the molar fraction of both components"""
+    den = b2*xi+xj
+    den[den == 0] = 1
+    f = xi*xj*(xi+xj)/den
+    dfi = (xj*(xi+xj)+xi*xj)/den-f*b2/den
+    dfj = (xi*(xi+xj)+xi*xj)/den-f/den
+    return f, dfi, dfj
+
+
+class Kernel(object):
+    """GERG-2008 equation of state of a mixture of fixed components
+
+    The coefficient arrays of pure fluids and binary departure functions of
+    the components are selected at creation, and all the terms of the
+    residual Helmholtz energy are evaluated with an only exponential for each
+    term, from which are calculated all the derivatives. The composition
+    derivatives of reducing functions and residual contribution are
+    analytic.
+
+    Parameters
+    ----------
+    ids : list
+        Index of components in :attr:`GERG.componentes`
+
+    Units are SI with molar basis: temperature in K, pressure in Pa and
+    density in mol/m³
+
+    Examples
+    --------
+    Natural gas of example in AGA8 GERG-2008 reference code
+
+    >>> ids = [0, 1, 2, 3, 4, 6, 5, 8, 7, 9, 10, 11, 19, 20, 12, 13, 14, 15,
+    ...        18, 16, 17]
+    >>> x = [.77824, .02, .06, .08, .03, .0015, .003, .0005, .00165, .00215,
+    ...      .00088, .00024, .00015, .00009, .004, .005, .002, .0001, .0025,
+    ...      .007, .001]
+    >>> kernel = Kernel(ids)
+    >>> rho = kernel.density(x, 400, 5e7)
+    >>> prop = kernel.properties(x, 400, rho)
+    >>> "%0.3f %0.4f %0.2f %0.2f %0.1f" % (rho/1e3, prop["Z"], prop["cv"],
+    ...     prop["cp"], prop["w"])
+    '12.798 1.1747 39.03 58.46 714.4'
+    """
+
+    def __init__(self, ids):
+        coef = _loadCoefficients()
+        self.ids = ids = asarray(ids)
+        n = len(ids)
+
+        self.Tc = _Tc[ids]
+        self.vc = 1/_rhoc[ids]
+        self.M = _M[ids]
+
+        # Reducing functions parameters of all pairs, Eq 7.9 and 7.10
+        self.i, self.j = i, j = triu_indices(n, 1)
+        a, b = ids[i], ids[j]
+        self.bT2 = coef["beta_t"][a, b]**2
+        self.bv2 = coef["beta_v"][a, b]**2
+        self.cT = 2*coef["beta_t"][a, b]*coef["gamma_t"][a, b] * \
+            sqrt(self.Tc[i]*self.Tc[j])
+        self.cv = 2*coef["beta_v"][a, b]*coef["gamma_v"][a, b] / 8 * (
+            self.vc[i]**(1/3)+self.vc[j]**(1/3))**3
+
+        # Terms of residual contribution, the terms of pure fluids and the
+        # binary departure functions of pairs with F≠0 correlative
+        blocks = [coef["pure"][k] for k in ids]
+        pairs = []
+        for p, (k, l) in enumerate(zip(a, b)):
+            key = (min(k, l), max(k, l))
+            if coef["F"][k, l] and key in coef["binary"]:
+                blocks.append(coef["binary"][key])
+                pairs.append(p)
+        self.pairs = asarray(pairs, dtype=int)
+        self.F = coef["F"][a, b][self.pairs]
+        self.starts = concatenate(([0], [blq.shape[1] for blq in blocks]))
+        self.starts = self.starts.cumsum()[:-1]
+        (self.n, self.d, self.t, self.c, self.eta, self.eps, self.beta,
+         self.gamma) = hstack(blocks)
+        self.exp = self.c > 0
+
+        # Ideal gas contribution
+        self.ideal = coef["ideal"][ids]
+        self.Tc0 = coef["Tc0"][ids]
+        hyp = coef["hyp"]
+        hyp = hyp[(hyp[:, 0] == ids[:, None]).any(axis=0)]
+        self.hypOwner = (hyp[:, 0] == ids[:, None]).argmax(axis=0)
+        self.hypN = hyp[:, 1]
+        self.hypTita = hyp[:, 2]
+        self.hypSinh = hyp[:, 3] == 1
+
+    def reducing(self, x):
+        """Reducing temperature and molar volume of mixture and its
+        derivatives with molar fractions, Eq 7.9, 7.10
+
+        Returns
+        -------
+        Tr, vr : float
+            Reducing temperature and molar volume
+        dTr, dvr : array
+            Derivatives of reducing parameters with molar fractions
+        """
+        x = asarray(x, dtype=float)
+        xi, xj = x[self.i], x[self.j]
+        n = len(x)
+
+        f, fi, fj = _pairFunction(xi, xj, self.bT2)
+        Tr = dot(x**2, self.Tc)+dot(self.cT, f)
+        dTr = 2*x*self.Tc+bincount(self.i, self.cT*fi, n) + \
+            bincount(self.j, self.cT*fj, n)
+
+        f, fi, fj = _pairFunction(xi, xj, self.bv2)
+        vr = dot(x**2, self.vc)+dot(self.cv, f)
+        dvr = 2*x*self.vc+bincount(self.i, self.cv*fi, n) + \
+            bincount(self.j, self.cv*fj, n)
+        return Tr, vr, dTr, dvr
+
+    def _terms(self, delta, tau):
+        """Residual contribution of pure fluids and binary departure
+        functions, with a row for each derivative:
+
+            αr, δ·αr_δ, δ²·αr_δδ, τ·αr_τ, τ²·αr_ττ, δ·τ·αr_δτ
+        """
+        d, t = self.d, self.t
+        dc = delta**self.c*self.exp
+        de = delta-self.eps
+        A = self.n*exp(d*log(delta)+t*log(tau)-dc-self.eta*de**2 -
+                       self.beta*(delta-self.gamma))
+
+        # δ times the first and δ² the second derivative of the exponent
+        D1 = d-self.c*dc-delta*(2*self.eta*de+self.beta)
+        D2 = -self.c*(self.c-1)*dc-2*self.eta*delta**2
+        Ad = A*D1
+        terms = array([A, Ad, A*(D1**2-d+D2), A*t, A*t*(t-1), Ad*t])
+        return add.reduceat(terms, self.starts, axis=1)
+
+    def residual(self, x, delta, tau):
+        """Residual contribution to Helmholtz free energy of mixture, Eq 7.7
+
+        Returns
+        -------
+        ar : array
+            αr, δ·αr_δ, δ²·αr_δδ, τ·αr_τ, τ²·αr_ττ, δ·τ·αr_δτ
+        arx : array
+            Derivative of αr with molar fractions at constant δ and τ
+        """
+        x = asarray(x, dtype=float)
+        n = len(x)
+        terms = self._terms(delta, tau)
+        pure = terms[:, :n]
+        binary = terms[0, n:]*self.F
+
+        i, j = self.i[self.pairs], self.j[self.pairs]
+        ar = dot(pure, x)+dot(terms[:, n:], self.F*x[i]*x[j])
+        arx = pure[0]+bincount(i, binary*x[j], n)+bincount(j, binary*x[i], n)
+        return ar, arx
+
+    def ideal0(self, x, T, rho):
+        """Ideal gas contribution to Helmholtz free energy of mixture, Eq 7.5
+
+        Returns
+        -------
+        a0, ta0t, t2a0tt : float
+            α0, τ·α0_τ, τ²·α0_ττ
+        """
+        x = asarray(x, dtype=float)
+        tau = self.Tc0/T
+        n1, n2, n3 = self.ideal.T
+        th = self.hypTita*tau[self.hypOwner]
+        sh = self.hypSinh
+
+        a0 = log(rho*self.vc)+n1+n2*tau+n3*log(tau)
+        ta0t = n2*tau+n3
+        t2a0tt = -n3
+        a = zeros(len(th))
+        at = zeros(len(th))
+        att = zeros(len(th))
+        a[sh] = log(abs(sinh(th[sh])))
+        a[~sh] = -log(cosh(th[~sh]))
+        at[sh] = th[sh]/tanh(th[sh])
+        at[~sh] = -th[~sh]*tanh(th[~sh])
+        att[sh] = -(th[sh]/sinh(th[sh]))**2
+        att[~sh] = -(th[~sh]/cosh(th[~sh]))**2
+        n = len(x)
+        N = self.hypN*Ro/R
+        a0 = a0+bincount(self.hypOwner, N*a, n)
+        ta0t = ta0t+bincount(self.hypOwner, N*at, n)
+        t2a0tt = t2a0tt+bincount(self.hypOwner, N*att, n)
+
+        mask = x > 0
+        return (dot(x, a0)+dot(x[mask], log(x[mask])), dot(x, ta0t),
+                dot(x, t2a0tt))
+
+    def density(self, x, T, P, liquid=False, tol=1e-12, maxiter=50):
+        """Density of mixture at T and P, with the Newton method in the
+        logarithm of density starting from the ideal gas or, for the liquid
+        root, from the triple of the reducing density"""
+        Tr, vr = self.reducing(x)[:2]
+        tau = Tr/T
+        if liquid:
+            lnrho = log(3/vr)
+        else:
+            lnrho = log(P/R/T)
+
+        for i in range(maxiter):
+            rho = exp(lnrho)
+            ar = self.residual(x, rho*vr, tau)[0]
+            Pi = rho*R*T*(1+ar[1])
+            dPdlnrho = rho*R*T*(1+2*ar[1]+ar[2])
+            if dPdlnrho > 0:
+                step = (P-Pi)/dPdlnrho
+                step = max(min(step, 1), -1)
+            elif liquid:
+                step = 0.1
+            else:
+                step = -0.1
+            lnrho += step
+            if abs(step) < tol:
+                return exp(lnrho)
+        raise ValueError("Iteration not converge")
+
+    def properties(self, x, T, rho):
+        """Thermodynamic properties of mixture at T and density, Table 7.1
+
+        Returns
+        -------
+        prop : dict
+            P, Z, u, h, s, g, cv, cp, w, dpdrho, dpdT, M in SI with molar
+            basis
+        """
+        x = asarray(x, dtype=float)
+        Tr, vr = self.reducing(x)[:2]
+        delta = rho*vr
+        tau = Tr/T
+        ar = self.residual(x, delta, tau)[0]
+        a0, a0t, a0tt = self.ideal0(x, T, rho)
+
+        M = dot(x, self.M)
+        prop = {}
+        prop["M"] = M
+        prop["Z"] = 1+ar[1]
+        prop["P"] = rho*R*T*prop["Z"]
+        prop["u"] = R*T*(a0t+ar[3])
+        prop["h"] = R*T*(1+a0t+ar[3]+ar[1])
+        prop["s"] = R*(a0t+ar[3]-a0-ar[0])
+        prop["g"] = R*T*(1+a0+ar[0]+ar[1])
+        prop["cv"] = -R*(a0tt+ar[4])
+        dpdrho = 1+2*ar[1]+ar[2]
+        dpdT = 1+ar[1]-ar[5]
+        prop["cp"] = prop["cv"]+R*dpdT**2/dpdrho
+        prop["w"] = sqrt(prop["cp"]/prop["cv"]*R*T*dpdrho/M*1e3)
+        prop["dpdrho"] = R*T*dpdrho
+        prop["dpdT"] = R*rho*dpdT
+        return prop
+
+    def lnphi(self, x, T, rho):
+        """Logarithm of fugacity coefficients of components, Eq 7.29 with the
+        analytic composition derivatives of Eq 7.41-7.45"""
+        x = asarray(x, dtype=float)
+        Tr, vr, dTr, dvr = self.reducing(x)
+        ar, arx = self.residual(x, rho*vr, Tr/T)
+        ndTr = dTr-dot(x, dTr)
+        ndvr = dvr-dot(x, dvr)
+        nar = ar[0]+ar[1]*(1+ndvr/vr)+ar[3]*ndTr/Tr+arx-dot(x, arx)
+        return nar-log(1+ar[1])
@@ -214,12 +214,9 @@ class IAPWS97(ThermoWater):
     momentoDipolar = unidades.DipoleMoment(Dipole, "Debye")
 
     def __init__(self, **kwargs):
-        if "P" in kwargs:
-            kwargs["P"] /= 1e6
-        elif "h" in kwargs:
-            kwargs["h"] /= 1e3
-        elif "s" in kwargs:
-            kwargs["s"] /= 1e3
+        for key, factor in (("P", 1e6), ("h", 1e3), ("s", 1e3)):
+            if kwargs.get(key, None) is not None:
+                kwargs[key] /= factor
 
         st = IAPWS(**kwargs)
         self.status = st.status
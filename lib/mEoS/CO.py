@@ -136,7 +136,7 @@ class CO(MEoS):
         "nr1":  [0.92310041400851, -0.248858452058e1, 0.58095213783396,
                  0.028859164394654, 0.070256257276544, 0.21687043269488e-3],
         "d1": [1, 1, 1, 2, 3, 7],
-        "t1": [0.25, 0.125, 1.5, 1.375, 0.25, 0.875],
+        "t1": [0.25, 1.125, 1.5, 1.375, 0.25, 0.875],
 
         "nr2": [0.13758331015182, -0.51501116343466e-1, -0.14865357483379,
                 -0.03885710088681, -0.029100433948943, 0.14155684466279e-1],
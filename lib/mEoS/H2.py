@@ -124,7 +124,7 @@ class H2(MEoS):
         "nr1": [0.53579928451252e1, -0.62050252530595e1,  0.13830241327086,
                 -0.71397954896129e-1,  0.15474053959733e-1],
         "d1": [1, 1, 2, 2, 4],
-        "t1": [0.5, 0.625, 0.384, 0.625, 1.125],
+        "t1": [0.5, 0.625, 0.375, 0.625, 1.125],
 
         "nr2": [-0.14976806405771, -0.26368723988451e-1,  0.56681303156066e-1,
                 -0.60063958030436e-1, -0.45043942027132,  0.42478840244500,
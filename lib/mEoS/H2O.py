@@ -59,7 +59,7 @@ class H2O(MEoS):
            "ao_pow": [8.203520690, -11.996306443],
            "ao_exp": [], "titao": [],
            "ao_sinh": [0.01059, 3.06904], "sinh": [0.415386589, 3.874803739],
-           "ao_cosh": [-0.98763], "cosh": [1.763895929]}
+           "ao_cosh": [0.98763], "cosh": [1.763895929]}
 
     Fi3 = {"ao_log": [1, 3.00632],
            "pow": [0, 1],
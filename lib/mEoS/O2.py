@@ -130,7 +130,7 @@ class O2(MEoS):
         "nr2": [0.18558686391474, -0.038129368035760, -0.15352245383006,
                 -0.026726814910919, -0.025675298677127, 0.95714302123668e-2],
         "d2": [2, 5, 1, 4, 3, 4],
-        "t2": [0.625, 1.75, 3.623, 3.625, 14.5, 12],
+        "t2": [0.625, 1.75, 3.625, 3.625, 14.5, 12],
         "c2": [1, 1, 2, 2, 3, 3],
         "gamma2": [1]*20,
 
@@ -15,218 +15,345 @@ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 GNU General Public License for more details.
 
 You should have received a copy of the GNU General Public License
-along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+Multiparameter equations of state of pure fluids, each fluid is defined in its
+own module with a :class:`lib.meos.MEoS` subclass. The modules are big so they
+are imported only in first use of fluid, the registry of fluids has the
+information needed without import the modules:
 
+    * :data:`registry`: Dict with module, CAS id, refprop and coolprop names
+      of fluids
+    * :data:`__all__`: List of fluid classes in standard order
+    * :data:`id_mEoS`: List with CAS id of fluids in __all__ order
+    * :func:`getFluid`: Fluid class by name or CAS id
+
+The fluid classes are available as module attributes, lib.mEoS.H2O, imported
+too in first use.
+'''
+
+
+from collections import namedtuple
+from collections.abc import Sequence
+from importlib import import_module
+import sys
+from types import ModuleType
 from unittest import TestCase
 
-# Noble Gases
-from lib.mEoS.He import He
-from lib.mEoS.Ne import Ne
-from lib.mEoS.Ar import Ar
-from lib.mEoS.Kr import Kr
-from lib.mEoS.Xe import Xe
-
-# Gases
-from lib.mEoS.H2 import H2
-from lib.mEoS.D2 import D2, pD2, oD2
-from lib.mEoS.pH2 import pH2
-from lib.mEoS.oH2 import oH2
-from lib.mEoS.N2 import N2
-from lib.mEoS.O2 import O2
-from lib.mEoS.F2 import F2
-from lib.mEoS.H2O import H2O
-from lib.mEoS.D2O import D2O
-from lib.mEoS.CO2 import CO2
-from lib.mEoS.CO import CO
-from lib.mEoS.N2O import N2O
-from lib.mEoS.SO2 import SO2
-from lib.mEoS.COS import COS
-from lib.mEoS.NH3 import NH3
-from lib.mEoS.H2S import H2S
-
-# Alkanes
-from lib.mEoS.CH4 import CH4
-from lib.mEoS.C2 import C2
-from lib.mEoS.C3 import C3
-from lib.mEoS.nC4 import nC4
-from lib.mEoS.iC4 import iC4
-from lib.mEoS.nC5 import nC5
-from lib.mEoS.neoC5 import neoC5
-from lib.mEoS.iC5 import iC5
-from lib.mEoS.nC6 import nC6
-from lib.mEoS.iC6 import iC6
-from lib.mEoS.nC7 import nC7
-from lib.mEoS.nC8 import nC8
-from lib.mEoS.iC8 import iC8
-from lib.mEoS.nC9 import nC9
-from lib.mEoS.nC10 import nC10
-from lib.mEoS.nC11 import nC11
-from lib.mEoS.nC12 import nC12
-from lib.mEoS.nC16 import nC16
-from lib.mEoS.nC22 import nC22
-
-# Naphthenes
-from lib.mEoS.Cyclopropane import Cyclopropane
-from lib.mEoS.Cyclopentane import Cyclopentane
-from lib.mEoS.Cyclohexane import Cyclohexane
-from lib.mEoS.C1Cyclohexane import C1Cyclohexane
-from lib.mEoS.C3Cyclohexane import C3Cyclohexane
-
-# Alkenes
-from lib.mEoS.Benzene import Benzene
-from lib.mEoS.Toluene import Toluene
-from lib.mEoS.oXylene import oXylene
-from lib.mEoS.mXylene import mXylene
-from lib.mEoS.pXylene import pXylene
-from lib.mEoS.EthylBenzene import EthylBenzene
-from lib.mEoS.Ethylene import Ethylene
-from lib.mEoS.Propylene import Propylene
-from lib.mEoS.Butene_1 import Butene_1
-from lib.mEoS.iButene import iButene
-from lib.mEoS.Cis_2_butene import Cis_2_butene
-from lib.mEoS.Trans_2_butene import Trans_2_butene
-from lib.mEoS.Propyne import Propyne
-from lib.mEoS.C1Oleate import C1Oleate
-from lib.mEoS.C1Linolenate import C1Linolenate
-from lib.mEoS.C1Linoleate import C1Linoleate
-from lib.mEoS.C1Palmitate import C1Palmitate
-from lib.mEoS.C1Stearate import C1Stearate
-
-# Heteroatom
-from lib.mEoS.Methanol import Methanol
-from lib.mEoS.Ethanol import Ethanol
-from lib.mEoS.Acetone import Acetone
-from lib.mEoS.EthyOxide import EthyOxide
-from lib.mEoS.DME import DME
-from lib.mEoS.DEE import DEE
-from lib.mEoS.DMC import DMC
-from lib.mEoS.NF3 import NF3
-from lib.mEoS.SF6 import SF6
-from lib.mEoS.HCl import HCl
-
-# CFCs
-from lib.mEoS.R13I1 import R13I1
-from lib.mEoS.R11 import R11
-from lib.mEoS.R12 import R12
-from lib.mEoS.R13 import R13
-from lib.mEoS.R14 import R14
-from lib.mEoS.R21 import R21
-from lib.mEoS.R22 import R22
-from lib.mEoS.R23 import R23
-from lib.mEoS.R32 import R32
-from lib.mEoS.R40 import R40
-from lib.mEoS.R41 import R41
-from lib.mEoS.R113 import R113
-from lib.mEoS.R114 import R114
-from lib.mEoS.R115 import R115
-from lib.mEoS.R116 import R116
-from lib.mEoS.R123 import R123
-from lib.mEoS.R124 import R124
-from lib.mEoS.R125 import R125
-from lib.mEoS.R134a import R134a
-from lib.mEoS.R141b import R141b
-from lib.mEoS.R142b import R142b
-from lib.mEoS.R143a import R143a
-from lib.mEoS.R152a import R152a
-from lib.mEoS.R161 import R161
-from lib.mEoS.R218 import R218
-from lib.mEoS.R227ea import R227ea
-from lib.mEoS.R236ea import R236ea
-from lib.mEoS.R236fa import R236fa
-from lib.mEoS.R245ca import R245ca
-from lib.mEoS.R245fa import R245fa
-from lib.mEoS.R365mfc import R365mfc
-from lib.mEoS.RC318 import RC318
-from lib.mEoS.R1234yf import R1234yf
-from lib.mEoS.R1234ze import R1234ze
-from lib.mEoS.R1216 import R1216
-from lib.mEoS.R1233zd import R1233zd
-from lib.mEoS.RE143a import RE143a
-from lib.mEoS.RE245cb2 import RE245cb2
-from lib.mEoS.RE245fa2 import RE245fa2
-from lib.mEoS.RE347mcc import RE347mcc
-from lib.mEoS.Novec649 import Novec649
-
-# Siloxanes
-from lib.mEoS.D4 import D4
-from lib.mEoS.D5 import D5
-from lib.mEoS.D6 import D6
-from lib.mEoS.MDM import MDM
-from lib.mEoS.MD2M import MD2M
-from lib.mEoS.MD3M import MD3M
-from lib.mEoS.MD4M import MD4M
-from lib.mEoS.MM import MM
-
-# PseudoCompound
-from lib.mEoS.Air import Air
-from lib.mEoS.R404a import R404a
-from lib.mEoS.R407c import R407c
-from lib.mEoS.R410a import R410a
-from lib.mEoS.R507a import R507a
-
-
-# Component grouping by chemical class
-Nobles = [He, Ne, Ar, Kr, Xe]
-Gases = [H2, D2, pD2, oD2, pH2, oH2, N2, O2, F2, H2O, D2O, CO2, CO, N2O, SO2,
-         COS, NH3, H2S]
-Alkanes = [CH4, C2, C3, nC4, iC4, nC5, neoC5, iC5, nC6, iC6, nC7, nC8, iC8,
-           nC9, nC10, nC11, nC12, nC16, nC22]
-Naphthenes = [Cyclopropane, Cyclopentane, Cyclohexane, C1Cyclohexane,
-              C3Cyclohexane]
-Alkenes = [Benzene, Toluene, oXylene, mXylene, pXylene, EthylBenzene,
-           Ethylene, Propylene, Butene_1, iButene, Cis_2_butene,
-           Trans_2_butene, Propyne, C1Oleate, C1Linolenate, C1Linoleate,
-           C1Palmitate, C1Stearate]
-Heteroatom = [Methanol, Ethanol, Acetone, EthyOxide, DME, DEE, DMC, NF3, SF6,
-              HCl]
-CFCs = [R13I1, R11, R12, R13, R14, R21, R22, R23, R32, R40, R41, R113, R114,
-        R115, R116, R123, R124, R125, R134a, R141b, R142b, R143a, R152a, R161,
-        R218, R227ea, R236ea, R236fa, R245ca, R245fa, R365mfc, RC318, R1234yf,
-        R1234ze, R1216, R1233zd, RE143a, RE245cb2, RE245fa2, RE347mcc,
-        Novec649]
-Siloxanes = [D4, D5, D6, MDM, MD2M, MD3M, MD4M, MM]
-PseudoCompounds = [Air, R404a, R407c, R410a, R507a]
 
-__all__ = Nobles + Gases + Alkanes + Naphthenes + Alkenes + Heteroatom + \
-    CFCs + Siloxanes + PseudoCompounds
+FluidInfo = namedtuple("FluidInfo",
+                       ["module", "id", "refPropName", "coolPropName"])
+
+# Fluids as (class name, module, CAS id, refprop name, coolprop name), they
+# must be the values defined in class, checked in Test.test_registry
+_fluids = (
+    # Noble Gases
+    ("He", "He", 212, "HELIUM", "Helium"),
+    ("Ne", "Ne", 107, "NEON", "Neon"),
+    ("Ar", "Ar", 98, "ARGON", "Argon"),
+    ("Kr", "Kr", None, "KRYPTON", "Krypton"),
+    ("Xe", "Xe", None, "XENON", "Xenon"),
+
+    # Gases
+    ("H2", "H2", 1, "HYDROGEN", "Hydrogen"),
+    ("D2", "D2", None, "D2", "Deuterium"),
+    ("pD2", "D2", None, "", "ParaDeuterium"),
+    ("oD2", "D2", None, "", "OrthoDeuterium"),
+    ("pH2", "pH2", None, "PARAHYD", "ParaHydrogen"),
+    ("oH2", "oH2", None, "ORTHOHYD", "OrthoHydrogen"),
+    ("N2", "N2", 46, "NITROGEN", "Nitrogen"),
+    ("O2", "O2", 47, "OXYGEN", "Oxygen"),
+    ("F2", "F2", 208, "FLUORINE", "Fluorine"),
+    ("H2O", "H2O", 62, "WATER", "Water"),
+    ("D2O", "D2O", None, "D2O", "HeavyWater"),
+    ("CO2", "CO2", 49, "CO2", "CarbonDioxide"),
+    ("CO", "CO", 48, "CO", "CarbonMonoxide"),
+    ("N2O", "N2O", 110, "N2O", "NitrousOxide"),
+    ("SO2", "SO2", 51, "SO2", "SulfurDioxide"),
+    ("COS", "COS", 219, "COS", "CarbonylSulfide"),
+    ("NH3", "NH3", 63, "AMMONIA", "Ammonia"),
+    ("H2S", "H2S", 50, "H2S", "HydrogenSulfide"),
+
+    # Alkanes
+    ("CH4", "CH4", 2, "METHANE", "Methane"),
+    ("C2", "C2", 3, "ETHANE", "Ethane"),
+    ("C3", "C3", 4, "PROPANE", "n-Propane"),
+    ("nC4", "nC4", 6, "BUTANE", "n-Butane"),
+    ("iC4", "iC4", 5, "ISOBUTAN", "IsoButane"),
+    ("nC5", "nC5", 8, "PENTANE", "n-Pentane"),
+    ("neoC5", "neoC5", 9, "NEOPENTN", "Neopentane"),
+    ("iC5", "iC5", 7, "IPENTANE", "Isopentane"),
+    ("nC6", "nC6", 10, "HEXANE", "n-Hexane"),
+    ("iC6", "iC6", 52, "IHEXANE", "Isohexane"),
+    ("nC7", "nC7", 11, "HEPTANE", "n-Heptane"),
+    ("nC8", "nC8", 12, "OCTANE", "n-Octane"),
+    ("iC8", "iC8", 82, "IOCTANE", ""),
+    ("nC9", "nC9", 13, "NONANE", "n-Nonane"),
+    ("nC10", "nC10", 14, "DECANE", "n-Decane"),
+    ("nC11", "nC11", 15, "C11", "n-Undecane"),
+    ("nC12", "nC12", 16, "C12", "n-Dodecane"),
+    ("nC16", "nC16", 20, "", ""),
+    ("nC22", "nC22", None, "", ""),
+
+    # Naphthenes
+    ("Cyclopropane", "Cyclopropane", 258, "CYCLOPRO", "CycloPropane"),
+    ("Cyclopentane", "Cyclopentane", 36, "CYCLOPEN", "Cyclopentane"),
+    ("Cyclohexane", "Cyclohexane", 38, "CYCLOHEX", "CycloHexane"),
+    ("C1Cyclohexane", "C1Cyclohexane", 39, "C1CC6", ""),
+    ("C3Cyclohexane", "C3Cyclohexane", 184, "C2CC6", ""),
+
+    # Alkenes
+    ("Benzene", "Benzene", 40, "BENZENE", "Benzene"),
+    ("Toluene", "Toluene", 41, "TOLUENE", "Toluene"),
+    ("oXylene", "oXylene", 42, "OXYLENE", "o-Xylene"),
+    ("mXylene", "mXylene", 43, "MXYLENE", "m-Xylene"),
+    ("pXylene", "pXylene", 44, "PXYLENE", "p-Xylene"),
+    ("EthylBenzene", "EthylBenzene", 45, "EBENZENE", "EthylBenzene"),
+    ("Ethylene", "Ethylene", 22, "ETHYLENE", "Ethylene"),
+    ("Propylene", "Propylene", 23, "PROPYLEN", "Propylene"),
+    ("Butene_1", "Butene_1", 24, "1BUTENE", "1-Butene"),
+    ("iButene", "iButene", 27, "IBUTENE", "IsoButene"),
+    ("Cis_2_butene", "Cis_2_butene", 25, "C2BUTENE", "cis-2-Butene"),
+    ("Trans_2_butene", "Trans_2_butene", 26, "T2BUTENE", "trans-2-Butene"),
+    ("Propyne", "Propyne", 66, "PROPYNE", "Propyne"),
+    ("C1Oleate", "C1Oleate", None, "MOLEATE", "MethylOleate"),
+    ("C1Linolenate", "C1Linolenate", None, "MLINOLEN", "MethylLinolenate"),
+    ("C1Linoleate", "C1Linoleate", None, "MLINOLEA", "MethylLinoleate"),
+    ("C1Palmitate", "C1Palmitate", None, "MPALMITA", "MethylPalmitate"),
+    ("C1Stearate", "C1Stearate", None, "MSTEARAT", "MethylStearate"),
+
+    # Heteroatom
+    ("Methanol", "Methanol", 117, "METHANOL", "Methanol"),
+    ("Ethanol", "Ethanol", 134, "ETHANOL", "Ethanol"),
+    ("Acetone", "Acetone", 140, "ACETONE", "Acetone"),
+    ("EthyOxide", "EthyOxide", 129, "", "EthyleneOxide"),
+    ("DME", "DME", 133, "DME", "DimethylEther"),
+    ("DEE", "DEE", 162, "DEE", "DiethylEther"),
+    ("DMC", "DMC", None, "DMC", "DimethylCarbonate"),
+    ("NF3", "NF3", None, "NF3", ""),
+    ("SF6", "SF6", None, "SF6", "SulfurHexafluoride"),
+    ("HCl", "HCl", 104, "HCL", "HydrogenChloride"),
+
+    # CFCs
+    ("R13I1", "R13I1", None, "CF3I", "R13I1"),
+    ("R11", "R11", 217, "R11", "R11"),
+    ("R12", "R12", 216, "R12", "R12"),
+    ("R13", "R13", 215, "R13", "R13"),
+    ("R14", "R14", 218, "R14", "R14"),
+    ("R21", "R21", 642, "R21", "R21"),
+    ("R22", "R22", 220, "R22", "R22"),
+    ("R23", "R23", 643, "R23", "R23"),
+    ("R32", "R32", 645, "R32", "R32"),
+    ("R40", "R40", 115, "R40", "R40"),
+    ("R41", "R41", 225, "R41", "R41"),
+    ("R113", "R113", 232, "R113", "R113"),
+    ("R114", "R114", 231, "R114", "R114"),
+    ("R115", "R115", 229, "R115", "R115"),
+    ("R116", "R116", 236, "R116", "R116"),
+    ("R123", "R123", 1631, "R123", "R123"),
+    ("R124", "R124", None, "R124", "R124"),
+    ("R125", "R125", 1231, "R125", "R125"),
+    ("R134a", "R134a", 1235, "R134A", ""),
+    ("R141b", "R141b", None, "R141B", "R141b"),
+    ("R142b", "R142b", 241, "R142B", "R142b"),
+    ("R143a", "R143a", 243, "R143A", "R143a"),
+    ("R152a", "R152a", 245, "R152A", "R152A"),
+    ("R161", "R161", 247, "R161", "R161"),
+    ("R218", "R218", 671, "R218", "R218"),
+    ("R227ea", "R227ea", None, "R227EA", "R227EA"),
+    ("R236ea", "R236ea", None, "R236EA", "R236EA"),
+    ("R236fa", "R236fa", None, "R236FA", "R236FA"),
+    ("R245ca", "R245ca", None, "R245CA", "R245ca"),
+    ("R245fa", "R245fa", None, "R245FA", "R245fa"),
+    ("R365mfc", "R365mfc", None, "R365MFC", "R365mfc"),
+    ("RC318", "RC318", 692, "RC318", "RC318"),
+    ("R1234yf", "R1234yf", None, "R1234YF", ""),
+    ("R1234ze", "R1234ze", None, "R1234ZE", ""),
+    ("R1216", "R1216", 669, "R1216", ""),
+    ("R1233zd", "R1233zd", None, "R1233ZD", "R1233zd(E)"),
+    ("RE143a", "RE143a", None, "RE143A", ""),
+    ("RE245cb2", "RE245cb2", None, "RE245CB2", ""),
+    ("RE245fa2", "RE245fa2", None, "RE245FA2", ""),
+    ("RE347mcc", "RE347mcc", None, "RE347MCC", ""),
+    ("Novec649", "Novec649", None, "NOVEC649", "Novec649"),
+
+    # Siloxanes
+    ("D4", "D4", None, "D4", "D4"),
+    ("D5", "D5", None, "D5", "D5"),
+    ("D6", "D6", None, "D6", "D6"),
+    ("MDM", "MDM", None, "MDM", "MDM"),
+    ("MD2M", "MD2M", None, "MD2M", "MD2M"),
+    ("MD3M", "MD3M", None, "MD3M", "MD3M"),
+    ("MD4M", "MD4M", None, "MD4M", "MD4M"),
+    ("MM", "MM", 1376, "MM", "MM"),
+
+    # Pseudo compounds
+    ("Air", "Air", 475, "AIR", "Air"),
+    ("R404a", "R404a", None, "R404A", "R404A"),
+    ("R407c", "R407c", None, "R407C", "R407C"),
+    ("R410a", "R410a", None, "R410A", "R410A"),
+    ("R507a", "R507a", None, "R507A", "R507A"),
+)
+
+registry = {name: FluidInfo(*info) for name, *info in _fluids}
+
+
+def _load(name):
+    """Import the class of fluid name from its module"""
+    info = registry[name]
+    cls = getattr(import_module("lib.mEoS." + info.module), name)
+    globals()[name] = cls
+    return cls
+
+
+def __getattr__(name):
+    """Load lazily the fluid classes and the references of equations"""
+    if name in registry:
+        return _load(name)
+    if name == "__doi__":
+        return _doi()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(registry) + ["__doi__"])
+
 
+class _Package(ModuleType):
+    """Package module, the import of a fluid module set it as attribute of
+    package, it's replaced with the fluid class so lib.mEoS.H2O is always
+    the class"""
+    def __setattr__(self, name, value):
+        if isinstance(value, ModuleType) and name in registry and \
+                value.__name__ == "%s.%s" % (self.__name__, name):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
 
-# Id of compound supported for meos library
-id_mEoS = [i.id for i in __all__]
 
+sys.modules[__name__].__class__ = _Package
 
-# Add references from equation hardcoded in __doi__ property
-__doi__ = {}
-for obj in __all__:
-    subdict = {}
-    for prop in ["eq", "_viscosity", "_thermal"]:
-        if prop not in obj.__dict__ or not obj.__dict__[prop]:
-            continue
-        for i, eq in enumerate(obj.__dict__[prop]):
-            if eq and "__doi__" in eq:
-                key = "%s_%i" % (prop.replace("_", ""), i)
-                subdict[key] = eq["__doi__"]
-    if obj._surface and "__doi__" in obj._surface:
-        subdict["surface"] = obj._surface["__doi__"]
-    if obj._dielectric and "__doi__" in obj._dielectric:
-        subdict["dielectric"] = obj._dielectric["__doi__"]
-    if obj._melting and "__doi__" in obj._melting:
-        subdict["melting"] = obj._melting["__doi__"]
-    if obj._sublimation and "__doi__" in obj._sublimation:
-        subdict["sublimation"] = obj._sublimation["__doi__"]
 
-    __doi__[obj.__name__] = subdict
+def getFluid(key):
+    """Return the fluid class with name or CAS id key"""
+    if isinstance(key, str):
+        if key not in registry:
+            raise KeyError("Unknown fluid %s" % key)
+        return globals().get(key) or _load(key)
+    return __all__[id_mEoS.index(key)]
 
 
-# TODO: Add 1-propanol from 10.1016_j.fluid.2004.06.028
-# TODO: Add 2-propanol from 10.1063/1.3112608
-# TODO: Add 1,2-dichloroethane from Thol thesis
+class FluidList(Sequence):
+    """List of fluid classes, the classes are only imported in access"""
+    def __init__(self, names):
+        self.names = list(names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FluidList(self.names[index])
+        return getFluid(self.names[index])
+
+    def __len__(self):
+        return len(self.names)
+
+    def __add__(self, other):
+        return FluidList(self.names + list(other.names))
+
+    def __contains__(self, cls):
+        name = getattr(cls, "__name__", None)
+        return name in self.names and getFluid(name) is cls
+
+    def __repr__(self):
+        return "FluidList(%s)" % self.names
+
+    def index(self, cls, *args):
+        """Index of fluid class in list"""
+        if cls not in self:
+            raise ValueError("%s is not in list" % cls)
+        return self.names.index(cls.__name__, *args)
+
+    @property
+    def ids(self):
+        """CAS id of fluids, without import them"""
+        return [registry[name].id for name in self.names]
+
+
+Nobles = FluidList(["He", "Ne", "Ar", "Kr", "Xe"])
+Gases = FluidList(["H2", "D2", "pD2", "oD2", "pH2", "oH2", "N2", "O2", "F2",
+                   "H2O", "D2O", "CO2", "CO", "N2O", "SO2", "COS", "NH3",
+                   "H2S"])
+Alkanes = FluidList(["CH4", "C2", "C3", "nC4", "iC4", "nC5", "neoC5", "iC5",
+                     "nC6", "iC6", "nC7", "nC8", "iC8", "nC9", "nC10",
+                     "nC11", "nC12", "nC16", "nC22"])
+Naphthenes = FluidList(["Cyclopropane", "Cyclopentane", "Cyclohexane",
+                        "C1Cyclohexane", "C3Cyclohexane"])
+Alkenes = FluidList(["Benzene", "Toluene", "oXylene", "mXylene", "pXylene",
+                     "EthylBenzene", "Ethylene", "Propylene", "Butene_1",
+                     "iButene", "Cis_2_butene", "Trans_2_butene", "Propyne",
+                     "C1Oleate", "C1Linolenate", "C1Linoleate",
+                     "C1Palmitate", "C1Stearate"])
+Heteroatom = FluidList(["Methanol", "Ethanol", "Acetone", "EthyOxide", "DME",
+                        "DEE", "DMC", "NF3", "SF6", "HCl"])
+CFCs = FluidList(["R13I1", "R11", "R12", "R13", "R14", "R21", "R22", "R23",
+                  "R32", "R40", "R41", "R113", "R114", "R115", "R116",
+                  "R123", "R124", "R125", "R134a", "R141b", "R142b", "R143a",
+                  "R152a", "R161", "R218", "R227ea", "R236ea", "R236fa",
+                  "R245ca", "R245fa", "R365mfc", "RC318", "R1234yf",
+                  "R1234ze", "R1216", "R1233zd", "RE143a", "RE245cb2",
+                  "RE245fa2", "RE347mcc", "Novec649"])
+Siloxanes = FluidList(["D4", "D5", "D6", "MDM", "MD2M", "MD3M", "MD4M", "MM"])
+PseudoCompounds = FluidList(["Air", "R404a", "R407c", "R410a", "R507a"])
+
+__all__ = Nobles + Gases + Alkanes + Naphthenes + Alkenes + Heteroatom + \
+    CFCs + Siloxanes + PseudoCompounds
+
+
+id_mEoS = __all__.ids
+
+
+def _doi():
+    """References of equations of all fluids, it needs import all fluids"""
+    doi = {}
+    for obj in __all__:
+        subdict = {}
+        for prop in ["eq", "_viscosity", "_thermal"]:
+            if prop not in obj.__dict__ or not obj.__dict__[prop]:
+                continue
+            for i, eq in enumerate(obj.__dict__[prop]):
+                if eq and "__doi__" in eq:
+                    key = "%s_%i" % (prop.replace("_", ""), i)
+                    subdict[key] = eq["__doi__"]
+        if obj._surface and "__doi__" in obj._surface:
+            subdict["surface"] = obj._surface["__doi__"]
+        if obj._dielectric and "__doi__" in obj._dielectric:
+            subdict["dielectric"] = obj._dielectric["__doi__"]
+        if obj._melting and "__doi__" in obj._melting:
+            subdict["melting"] = obj._melting["__doi__"]
+        if obj._sublimation and "__doi__" in obj._sublimation:
+            subdict["sublimation"] = obj._sublimation["__doi__"]
+
+        doi[obj.__name__] = subdict
+    globals()["__doi__"] = doi
+    return doi
 
 
 class Test(TestCase):
+    def test_registry(self):
+        """Check the registry values with the fluid classes"""
+        for name, module, id, refprop, coolprop in _fluids:
+            cls = getFluid(name)
+            self.assertEqual(cls.__name__, name)
+            self.assertEqual(cls.__module__, "lib.mEoS." + module)
+            self.assertEqual(cls.id, id)
+            self.assertEqual(cls._refPropName, refprop)
+            self.assertEqual(cls._coolPropName, coolprop)
+        self.assertEqual(len(__all__), len(registry))
+        self.assertIs(getFluid(62), getFluid("H2O"))
+        self.assertEqual(__all__.index(getFluid("CO2")), id_mEoS.index(49))
+
     def test_meos(self):
         """Cycle input parameter from selected point to check iteration"""
+        from lib.mEoS.H2O import H2O
+
         # The input pair T-h, P-s, h-u has inconsistency, several point has
         # equal values so are not good as input definition, they need another
         # input like saturation state
@@ -304,3 +431,18 @@ class Test(TestCase):
         f_su = H2O(s=f_hs.s, u=f_hs.u)
         self.assertEqual(round(f_su.P-P, 1), 0)
         self.assertEqual(round(f_su.T-T, 5), 0)
+
+    def test_satTable(self):
+        """Check the saturation table interpolation with its error bound"""
+        from lib.mEoS.H2O import H2O
+
+        st = H2O(T=300, P=1e5)
+        table = st._satTable()
+        for T in (300, 450, 600, 640):
+            rhoL, rhoG, Ps = st._saturation(T)
+            Tsat, rhol, rhog, P = st._satInterpolate(T)
+            self.assertLess(abs(P/Ps-1), 1.01*table["error"]["P"])
+            self.assertLess(abs(rhol/rhoL-1), 1.01*table["error"]["rhoL"])
+            self.assertLess(abs(rhog/rhoG-1), 1.01*table["error"]["rhoG"])
+            self.assertEqual(round(st._satInterpolate(P=P)[0], 3), T)
+        self.assertIsNone(st._satInterpolate(700))
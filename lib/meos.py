@@ -142,6 +142,7 @@ Other functions used in iteration calculation to try to speed up it:
     * :func:`_Helmholtz_phir`
     * :func:`_Helmholtz_phird`
     * :func:`_Helmholtz_phirt`
+    * :func:`_Helmholtz_derivatives`
 
     * :func:`_MBWR_phir`
     * :func:`_MBWR_phird`
@@ -151,18 +152,31 @@ Other functions used in iteration calculation to try to speed up it:
     * :func:`_PR_phird`
     * :func:`_PR_phirt`
 
+The enthalpy and entropy offsets of reference states are saved in the config
+folder and loaded once in :data:`refOffsets`, :func:`precomputeRefOffsets`
+calculate them for all fluids in a single offline step.
+
 '''
 
 
+from contextlib import contextmanager
 from itertools import product
+import hashlib
 import json
 import logging
 import os
-
-from PyQt5.QtWidgets import QApplication
-from scipy import exp, log, sinh, cosh, tanh, arctan
+import pickle
+import tempfile
+import time
+
+from numpy import (ascontiguousarray, asarray, broadcast_arrays, concatenate,
+                   errstate, full, linspace, nan, where, zeros)
+from numpy import exp, sinh, cosh, tanh, arctan
+from numpy.linalg import LinAlgError, solve
+from scipy import log
 from scipy.constants import Boltzmann, pi, Avogadro, R, u
-from scipy.optimize import fsolve
+from scipy.interpolate import PchipInterpolator
+from scipy.optimize import brentq, fsolve
 
 from lib import unidades
 from lib.config import conf_dir
@@ -172,6 +186,12 @@ from lib.thermo import ThermoAdvanced
 from lib.compuestos import RhoL_Costald, Pv_Lee_Kesler, MuG_Chung, MuG_P_Chung
 from lib.compuestos import ThG_Chung, ThG_P_Chung, Tension_Pitzer
 from lib.utilities import refDoc
+from lib.qt import QApplication
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 __doi__ = {
@@ -329,89 +349,461 @@ __doi__ = {
         }
 
 
+# Compiled coefficients of residual Helmholtz equations of state, indexed by
+# the id of equation dict. The dict itself is saved too to avoid id reuse
+_compiled = {}
+
+# Reduced density used to evaluate the virial coefficients as delta → 0
+_delta0 = 1e-100
+
+# Statistics of iterative procedure to solve the input pair of states, indexed
+# by the input mode, with the number of calls, the calls solved by the Newton
+# solver, its total iterations, the calls using the multi-start fallback and
+# the total wall time in seconds
+solverStats = {}
+
+# Saturation tables of fluids indexed by fluid and equation code, loaded or
+# calculated in first use, see MEoS._satTable
+satTables = {}
+
+# Enthalpy and entropy offsets of reference states indexed by (fluid, equation
+# code, reference state), loaded from the config folder in first use, see
+# MEoS._refOffset
+refOffsets = {}
+_refOffsetsLoaded = False
+
+# Reference states unavailable in this process, with null offsets only in
+# memory, so a failed calculation isn't saved for other processes
+_refOffsetsFailed = set()
+
+
+def _arrays(coef, *keys):
+    """Return the coefficient lists of keys as contiguous float arrays, with
+    the same truncation to the shortest list as zip"""
+    lists = [coef.get(key, []) for key in keys]
+    size = min(len(lst) for lst in lists)
+    return [ascontiguousarray(lst[:size], dtype=float) for lst in lists]
+
+
+def _compileHelmholtz(coef):
+    r"""Compile the residual Helmholtz free energy coefficients of a mEoS in
+    contiguous numpy arrays so all terms can be evaluated in a vectorized
+    way. The compilation is done only once for each equation dict, later calls
+    return the cached value.
+
+    Polynomial, exponential and gaussian terms are merged in a single set of
+    terms with the general form
+
+    .. math::
+        \phi^r_i = n_i\delta^{d_i}\tau^{t_i}\exp\left(-g_i\delta^{c_i}
+        -\alpha_i(\delta-\epsilon_i)^{e_{1i}}-\beta_i(\tau-\gamma_i)^{e_{2i}}
+        \right)
+
+    so the derivatives can be calculated from the logarithmic derivatives
+    of each term. The coefficients of virial expansion, only dependent of
+    :math:`\delta \to 0`, are precalculated here too.
+
+    Parameters
+    ----------
+    coef : dict
+        Parameters of multiparameter equation of state
+
+    Returns
+    -------
+    cmp : dict
+        Dictionary with the coefficient arrays
+    """
+    key = id(coef)
+    if key in _compiled and _compiled[key][0] is coef:
+        return _compiled[key][1]
+
+    # Polinomial terms
+    n1, d1, t1 = _arrays(coef, "nr1", "d1", "t1")
+
+    # Exponential terms
+    n2, d2, g2, t2, c2 = _arrays(coef, "nr2", "d2", "gamma2", "t2", "c2")
+
+    # Gaussian terms
+    nr3 = coef.get("nr3", [])
+    gauss = {"exp1": [2]*len(nr3), "exp2": [2]*len(nr3)}
+    gauss.update(coef)
+    n3, d3, t3, a3, e3, b3, g3, ex1, ex2 = _arrays(
+        gauss, "nr3", "d3", "t3", "alfa3", "epsilon3", "beta3", "gamma3",
+        "exp1", "exp2")
+
+    z1, z2, z3 = [zeros(len(n)) for n in (n1, n2, n3)]
+    n = concatenate((n1, n2, n3))
+    d = concatenate((d1, d2, d3))
+    t = concatenate((t1, t2, t3))
+    c = concatenate((z1, c2, z3))
+    g = concatenate((z1, g2, z3))
+    a = concatenate((z1, z2, a3))
+    e = concatenate((z1, z2, e3))
+    b = concatenate((z1, z2, b3))
+    gm = concatenate((z1, z2, g3))
+    ex1 = concatenate((z1+2, z2+2, ex1))
+    ex2 = concatenate((z1+2, z2+2, ex2))
+
+    # The exponent of expressions multiplied by (ex-1) are set to zero for
+    # linear exponent to avoid 0*inf values
+    ex1_2 = where(ex1 == 1, 0, ex1-2)
+    ex2_2 = where(ex2 == 1, 0, ex2-2)
+
+    cmp = {"n": n, "d": d, "t": t, "c": c, "g": g, "a": a, "e": e, "b": b,
+           "gamma": gm, "ex1": ex1, "ex2": ex2,
+           "gc": g*c, "gcc": g*c*(c-1),
+           "aex1": a*ex1, "aex11": a*ex1*(ex1-1), "ex1_1": ex1-1,
+           "ex1_2": ex1_2,
+           "bex2": b*ex2, "bex21": b*ex2*(ex2-1), "ex2_1": ex2-1,
+           "ex2_2": ex2_2,
+           "gauss": bool(n3.size)}
+
+    # Virial coefficients, δ^d·(∂lnφ/∂δ) and δ^d·(∂²φ/∂δ²/φ) expanded to
+    # avoid the cancellation of the singular terms
+    with errstate(all="ignore"):
+        d0 = _delta0
+        x1 = g*c*d0**c + a*ex1*d0*(d0-e)**(ex1-1)
+        x2 = g*c*(c-1)*d0**c + a*ex1*(ex1-1)*d0**2*(d0-e)**ex1_2
+        f0 = n*exp(-g*d0**c-a*(d0-e)**ex1)
+        cmp["B"] = f0*d0**(d-1)*(d-x1)
+        cmp["C"] = f0*d0**(d-2)*(d*(d-1)-2*d*x1+x1**2-x2)
+
+    # Non analitic terms
+    cmp["na"] = _arrays(coef, "nr4", "a4", "b4", "A", "B", "C", "D", "beta4")
+
+    # Special form from Saul-Wagner Water 58 coefficient equation
+    if "nr5" in coef:
+        cmp["sw"] = _arrays(coef, "nr5", "d5", "t5")
+
+    _compiled[key] = (coef, cmp)
+    return cmp
+
+
+def _grid(tau, delta):
+    """Prepare the input of vectorized Helmholtz functions, broadcasting tau
+    and delta and adding a trailing axis to iterate over the terms
+
+    Returns
+    -------
+    tau, delta : array
+        Broadcast inputs, zero delta replaced by unity to avoid singularities
+    mask : array
+        Boolean array with the points with zero density
+    t_, d_ : array
+        Input with a trailing axis
+    """
+    tau = asarray(tau, dtype=float)
+    delta = asarray(delta, dtype=float)
+    if tau.shape != delta.shape:
+        tau, delta = broadcast_arrays(tau, delta)
+    mask = delta == 0
+    if mask.any():
+        delta = where(mask, 1, delta)
+    return tau, delta, mask, tau[..., None], delta[..., None]
+
+
+def _ungrid(value, mask):
+    """Set the zero density point to zero as the residual contribution of
+    ideal gas and return python float for scalar input"""
+    value = asarray(value)
+    if mask.any():
+        value = where(mask, 0, value)
+    if value.ndim == 0:
+        value = float(value)
+    return value
+
+
+def _dot(x, y):
+    """Sum of the products of terms, the last axis of arrays"""
+    if x.ndim == 1 and x.shape == y.shape:
+        return x.dot(y)
+    return (x*y).sum(axis=-1)
+
+
+def _terms(cmp, t_, d_):
+    """Calculate the value of merged terms, polynomial, exponential and
+    gaussian
+
+    Returns
+    -------
+    fi : array
+        Value of each term
+    Tfac : array
+        Temperature dependent factor of each term, used in virial
+    aux : tuple
+        Intermediate values to reuse in derivatives calculation
+    """
+    # Power of δ calculated directly to support the negative values can be
+    # reached in the iteration procedures
+    dc = d_**cmp["c"]
+    Dpart = -cmp["g"]*dc
+    Tfac = t_**cmp["t"]
+
+    if cmp["gauss"]:
+        de = d_-cmp["e"]
+        tg = t_-cmp["gamma"]
+        Dpart = Dpart-cmp["a"]*de**cmp["ex1"]
+        Tfac = Tfac*exp(-cmp["b"]*tg**cmp["ex2"])
+    else:
+        de = tg = None
+
+    fi = cmp["n"]*d_**cmp["d"]*exp(Dpart)*Tfac
+    return fi, Tfac, (dc, de, tg)
+
+
+def _dterms(cmp, d_, aux, second=True):
+    """Calculate the first and optionally the second partial derivative of
+    logarithm of merged terms respect to δ"""
+    dc, de, tg = aux
+    Pd = (cmp["d"]-cmp["gc"]*dc)/d_
+    if cmp["gauss"]:
+        Pd = Pd-cmp["aex1"]*de**cmp["ex1_1"]
+    if not second:
+        return Pd
+
+    Pdd = (-cmp["d"]-cmp["gcc"]*dc)/d_**2
+    if cmp["gauss"]:
+        Pdd = Pdd-cmp["aex11"]*de**cmp["ex1_2"]
+    return Pd, Pdd
+
+
+def _tterms(cmp, t_, aux, second=True):
+    """Calculate the first and optionally the second partial derivative of
+    logarithm of merged terms respect to τ"""
+    dc, de, tg = aux
+    Pt = cmp["t"]/t_
+    if cmp["gauss"]:
+        Pt = Pt-cmp["bex2"]*tg**cmp["ex2_1"]
+    if not second:
+        return Pt
+
+    Ptt = -cmp["t"]/t_**2
+    if cmp["gauss"]:
+        Ptt = Ptt-cmp["bex21"]*tg**cmp["ex2_2"]
+    return Pt, Ptt
+
+
+def _Helmholtz_derivatives(tau, delta, coef):
+    r"""Residual contribution to the free Helmholtz energy and its
+    derivatives, evaluated for all terms of equation in a single vectorized
+    pass. The input can be arrays, broadcast together, to evaluate a complete
+    grid of state points in one call
+
+    Parameters
+    ----------
+    tau : float or array
+        Inverse reduced temperature, Tc/T [-]
+    delta : float or array
+        Reduced density, rho/rhoc [-]
+    coef : dict
+        Parameters of multiparameter equation of state
+
+    Returns
+    -------
+    prop : dict
+        Dictionary with residual adimensional helmholtz energy and
+        derivatives, with the broadcast shape of input:
+
+            * fir  [-]
+            * firt: [∂fir/∂τ]δ,x  [-]
+            * fird: [∂fir/∂δ]τ,x  [-]
+            * firtt: [∂²fir/∂τ²]δ,x  [-]
+            * firdt: [∂²fir/∂τ∂δ]x  [-]
+            * firdd: [∂²fir/∂δ²]τ,x  [-]
+            * firdtt: [∂³fir/∂τ²∂δ]x  [-]
+            * B: Second virial coefficient, [-]
+            * C: Third virial coefficient, [-]
+
+    Examples
+    --------
+    Grid evaluation give the same values than the point by point calculation
+
+    >>> from numpy import array
+    >>> from lib.mEoS import H2O
+    >>> tau = H2O.Tc/array([500, 647])
+    >>> delta = array([838.025, 358])/H2O.rhoc
+    >>> grid = _Helmholtz_derivatives(tau, delta, H2O.eq[0])
+    >>> point = _Helmholtz_derivatives(tau[1], delta[1], H2O.eq[0])
+    >>> "%0.8f %0.8f" % tuple(grid["fir"])
+    '-3.42693206 -1.21202657'
+    >>> "%0.8f" % point["firdt"], "%0.8f" % grid["firdt"][1]
+    ('-1.33214720', '-1.33214720')
+    """
+    cmp = _compileHelmholtz(coef)
+    tau, delta, mask, t_, d_ = _grid(tau, delta)
+
+    with errstate(all="ignore"):
+        # Polinomial, exponential and gaussian terms
+        fi, Tfac, aux = _terms(cmp, t_, d_)
+        Pd, Pdd = _dterms(cmp, d_, aux)
+        Pt, Ptt = _tterms(cmp, t_, aux)
+        fiPd = fi*Pd
+        Pt2 = Pt**2+Ptt
+        fir = fi.sum(axis=-1)
+        fird = fiPd.sum(axis=-1)
+        firdd = _dot(fi, Pd**2+Pdd)
+        firt = _dot(fi, Pt)
+        firtt = _dot(fi, Pt2)
+        firdt = _dot(fiPd, Pt)
+        firdtt = _dot(fiPd, Pt2)
+        B = _dot(Tfac, cmp["B"])
+        C = _dot(Tfac, cmp["C"])
+
+        # Non analitic terms
+        n, a, b, A, Bi, Ci, Di, bt = cmp["na"]
+        if n.size:
+            d1 = d_-1
+            d12 = d1**2
+            critical = d12 == 0
+            d12_ = where(critical, 1, d12)
+            Tita = (1-t_)+A*d12**(0.5/bt)
+            F = exp(-Ci*d12-Di*(t_-1)**2)
+            Fd = -2*Ci*F*d1
+            Fdd = 2*Ci*F*(2*Ci*d12-1)
+            Ft = -2*Di*F*(t_-1)
+            Ftt = 2*Di*F*(2*Di*(t_-1)**2-1)
+            Fdt = 4*Ci*Di*F*d1*(t_-1)
+            Fdtt = 4*Ci*Di*F*d1*(2*Di*(t_-1)**2-1)
+
+            Delta = Tita**2+Bi*d12**a
+            Deltad = where(critical, 0, d1*(
+                A*Tita*2/bt*d12_**(0.5/bt-1) + 2*Bi*a*d12_**(a-1)))
+            Deltadd = where(critical, 0, Deltad/where(critical, 1, d1)+d12*(
+                4*Bi*a*(a-1)*d12_**(a-2) +
+                2*A**2/bt**2*(d12_**(0.5/bt-1))**2 +
+                A*Tita*4/bt*(0.5/bt-1)*d12_**(0.5/bt-2)))
+
+            Deltab = Delta**b
+            DeltaBd = b*Delta**(b-1)*Deltad
+            DeltaBdd = b*(Delta**(b-1)*Deltadd + (b-1)*Delta**(b-2)*Deltad**2)
+            DeltaBt = -2*Tita*b*Delta**(b-1)
+            DeltaBtt = 2*b*Delta**(b-1)+4*Tita**2*b*(b-1)*Delta**(b-2)
+            DeltaBdt = where(critical, 0, -A*b*2/bt*Delta**(b-1)*d1 *
+                             d12_**(0.5/bt-1)) - \
+                2*Tita*b*(b-1)*Delta**(b-2)*Deltad
+            DeltaBdtt = 2*b*(b-1)*Delta**(b-2)*(
+                Deltad*(1+2*Tita**2*(b-2)/Delta) +
+                where(critical, 0, 4*Tita*A*d1/bt*d12_**(0.5/bt-1)))
+
+            fir = fir + _dot(n, Deltab*d_*F)
+            fird = fird + _dot(n, Deltab*(F+d_*Fd)+DeltaBd*d_*F)
+            firdd = firdd + _dot(n, Deltab*(2*Fd+d_*Fdd) +
+                                 2*DeltaBd*(F+d_*Fd) + DeltaBdd*d_*F)
+            firt = firt + _dot(n, d_*(DeltaBt*F+Deltab*Ft))
+            firtt = firtt + _dot(n, d_*(DeltaBtt*F+2*DeltaBt*Ft+Deltab*Ftt))
+            firdt = firdt + _dot(n, Deltab*(Ft+d_*Fdt)+d_*DeltaBd*Ft +
+                                 DeltaBt*(F+d_*Fd)+DeltaBdt*d_*F)
+            firdtt = firdtt + _dot(n, (
+                DeltaBtt*F+2*DeltaBt*Ft+Deltab*Ftt) + d_*(
+                    DeltaBdtt*F+DeltaBtt*Fd+2*DeltaBdt*Ft + 2*DeltaBt*Fdt +
+                    DeltaBt*Ftt+Deltab*Fdtt))
+
+            # Virial coefficients
+            d1 = _delta0-1
+            Tita_ = (1-t_)+A*(d1**2)**(0.5/bt)
+            Delta_ = Tita_**2+Bi*(d1**2)**a
+            Deltad_ = d1*(A*Tita_*2/bt*(d1**2)**(0.5/bt-1) +
+                          2*Bi*a*(d1**2)**(a-1))
+            Deltadd_ = Deltad_/d1 + d1**2*(
+                4*Bi*a*(a-1)*(d1**2)**(a-2) +
+                2*A**2/bt**2*((d1**2)**(0.5/bt-1))**2 +
+                A*Tita_*4/bt*(0.5/bt-1)*(d1**2)**(0.5/bt-2))
+            DeltaBd_ = b*Delta_**(b-1)*Deltad_
+            DeltaBdd_ = b*(Delta_**(b-1)*Deltadd_ +
+                           (b-1)*Delta_**(b-2)*Deltad_**2)
+            F_ = exp(-Ci*d1**2-Di*(t_-1)**2)
+            Fd_ = -2*Ci*F_*d1
+            Fdd_ = 2*Ci*F_*(2*Ci*d1**2-1)
+
+            B = B + _dot(n, Delta_**b*(F_+_delta0*Fd_)+DeltaBd_*_delta0*F_)
+            C = C + _dot(n, Delta_**b*(2*Fd_+_delta0*Fdd_) +
+                         2*DeltaBd_*(F_+_delta0*Fd_) + DeltaBdd_*_delta0*F_)
+
+        # Special form from Saul-Wagner Water 58 coefficient equation, the
+        # contribution to virial coefficients is negligible
+        if "sw" in cmp:
+            n, d, t = cmp["sw"]
+            d6 = delta**6
+            factor = where(
+                delta < 0.2, 1.6*d6*(1-1.2*d6), exp(-0.4*d6)-exp(-2*d6))
+            factor1 = -2.4*exp(-0.4*d6)+12*exp(-2*d6)
+            factor2 = 5.76*exp(-0.4*d6)-144*exp(-2*d6)
+
+            taut = t_**t
+            fi = n*d_**d*taut
+            fid5 = n*d_**(d+5)*taut
+            fir = fir + factor*fi.sum(axis=-1)
+            fird = fird + factor1*fid5.sum(axis=-1) + \
+                factor*_dot(fi, d/d_)
+            firdd = firdd + factor2*_dot(fid5, d_**5) + \
+                factor1*_dot(fid5, (2*d+5)/d_) + \
+                factor*_dot(fi, d*(d-1)/d_**2)
+            firt = firt + factor*_dot(fi, t/t_)
+            firtt = firtt + factor*_dot(fi, t*(t-1)/t_**2)
+            firdt = firdt + factor1*_dot(fid5, t/t_) + \
+                factor*_dot(fi, d*t/d_/t_)
+            firdtt = firdtt + factor1*_dot(fid5, t*(t-1)/t_**2) + \
+                factor*_dot(fi, d*t*(t-1)/d_/t_**2)
+
+    prop = {}
+    prop["fir"] = _ungrid(fir, mask)
+    prop["firt"] = _ungrid(firt, mask)
+    prop["firtt"] = _ungrid(firtt, mask)
+    prop["fird"] = _ungrid(fird, mask)
+    prop["firdd"] = _ungrid(firdd, mask)
+    prop["firdt"] = _ungrid(firdt, mask)
+    prop["firddd"] = 0
+    prop["firddt"] = 0
+    prop["firdtt"] = _ungrid(firdtt, mask)
+    prop["firttt"] = 0
+    prop["B"] = _ungrid(B, mask)
+    prop["C"] = _ungrid(C, mask)
+    prop["D"] = 0
+    return prop
+
+
 def _Helmholtz_phir(tau, delta, coef):
     r"""Residual contribution to the free Helmholtz energy
 
     Parameters
     ----------
-    tau : float
+    tau : float or array
         Inverse reduced temperature, Tc/T [-]
-    delta : float
+    delta : float or array
         Reduced density, rho/rhoc [-]
     coef : dict
         Parameters of multiparameter equation of state
 
     Returns
     -------
-    fir : float
+    fir : float or array
         :math:`\phi^r`, adimensional free Helmholtz energy, [-]
     """
-    fir = 0
-
-    if delta:
-        # Polinomial terms
-        nr1 = coef.get("nr1", [])
-        d1 = coef.get("d1", [])
-        t1 = coef.get("t1", [])
-        for n, d, t in zip(nr1, d1, t1):
-            fir += n*delta**d*tau**t
-
-        # Exponential terms
-        nr2 = coef.get("nr2", [])
-        d2 = coef.get("d2", [])
-        g2 = coef.get("gamma2", [])
-        t2 = coef.get("t2", [])
-        c2 = coef.get("c2", [])
-        for n, d, g, t, c in zip(nr2, d2, g2, t2, c2):
-            fir += n*delta**d*tau**t*exp(-g*delta**c)
-
-        # Gaussian terms
-        nr3 = coef.get("nr3", [])
-        d3 = coef.get("d3", [])
-        t3 = coef.get("t3", [])
-        a3 = coef.get("alfa3", [])
-        e3 = coef.get("epsilon3", [])
-        b3 = coef.get("beta3", [])
-        g3 = coef.get("gamma3", [])
-        exp1 = coef.get("exp1", [2]*len(nr3))
-        exp2 = coef.get("exp2", [2]*len(nr3))
-        for n, d, t, a, e, b, g, ex1, ex2 in zip(
-                nr3, d3, t3, a3, e3, b3, g3, exp1, exp2):
-            expr = exp(-a*(delta-e)**ex1-b*(tau-g)**ex2)
-            fir += n*delta**d*tau**t * expr
+    cmp = _compileHelmholtz(coef)
+    tau, delta, mask, t_, d_ = _grid(tau, delta)
+
+    with errstate(all="ignore"):
+        # Polinomial, exponential and gaussian terms
+        fir = _terms(cmp, t_, d_)[0].sum(axis=-1)
 
         # Non analitic terms
-        ni = coef.get("nr4", [])
-        ai = coef.get("a4", [])
-        bi = coef.get("b4", [])
-        Ai = coef.get("A", [])
-        Bi = coef.get("B", [])
-        Ci = coef.get("C", [])
-        Di = coef.get("D", [])
-        b_ = coef.get("beta4", [])
-
-        for n, a, b, A, B, C, D, bt in zip(ni, ai, bi, Ai, Bi, Ci, Di, b_):
-            Tita = (1-tau)+A*((delta-1)**2)**(0.5/bt)
-            F = exp(-C*(delta-1)**2-D*(tau-1)**2)
-            Delta = Tita**2+B*((delta-1)**2)**a
-            fir += n*Delta**b*delta*F
+        n, a, b, A, Bi, Ci, Di, bt = cmp["na"]
+        if n.size:
+            d12 = (d_-1)**2
+            Tita = (1-t_)+A*d12**(0.5/bt)
+            F = exp(-Ci*d12-Di*(t_-1)**2)
+            Delta = Tita**2+Bi*d12**a
+            fir = fir + _dot(n, Delta**b*d_*F)
 
         # Special form from Saul-Wagner Water 58 coefficient equation
-        if "nr5" in coef:
-            if delta < 0.2:
-                factor = 1.6*delta**6*(1-1.2*delta**6)
-            else:
-                factor = exp(-0.4*delta**6)-exp(-2*delta**6)
-
-            nr5 = coef.get("nr5", [])
-            d5 = coef.get("d5", [])
-            t5 = coef.get("t5", [])
-            fr = 0
-            for n, d, t in zip(nr5, d5, t5):
-                fr += n*delta**d*tau**t
-            fir += factor*fr
+        if "sw" in cmp:
+            n, d, t = cmp["sw"]
+            d6 = delta**6
+            factor = where(
+                delta < 0.2, 1.6*d6*(1-1.2*d6), exp(-0.4*d6)-exp(-2*d6))
+            fir = fir + factor*(n*d_**d*t_**t).sum(axis=-1)
 
-    return fir
+    return _ungrid(fir, mask)
 
 
 def _MBWR_phir(T, rho, rhoc, M, coef):
@@ -485,93 +877,54 @@ def _Helmholtz_phird(tau, delta, coef):
 
     Parameters
     ----------
-    tau : float
+    tau : float or array
         Inverse reduced temperature, Tc/T [-]
-    delta : float
+    delta : float or array
         Reduced density, rho/rhoc [-]
     coef : dict
         Parameters of multiparameter equation of state
 
     Returns
     -------
-    fird : float
+    fird : float or array
         :math:`\left.\frac{\partial \phi^r}{\partial \delta}\right|_{\tau}`
     """
-    fird = 0
-
-    if delta:
-        # Polinomial terms
-        nr1 = coef.get("nr1", [])
-        d1 = coef.get("d1", [])
-        t1 = coef.get("t1", [])
-        for n, d, t in zip(nr1, d1, t1):
-            fird += n*d*delta**(d-1)*tau**t
-
-        # Exponential terms
-        nr2 = coef.get("nr2", [])
-        d2 = coef.get("d2", [])
-        g2 = coef.get("gamma2", [])
-        t2 = coef.get("t2", [])
-        c2 = coef.get("c2", [])
-        for n, d, g, t, c in zip(nr2, d2, g2, t2, c2):
-            fird += n*exp(-g*delta**c)*delta**(d-1)*tau**t*(d-g*c*delta**c)
-
-        # Gaussian terms
-        nr3 = coef.get("nr3", [])
-        d3 = coef.get("d3", [])
-        t3 = coef.get("t3", [])
-        a3 = coef.get("alfa3", [])
-        e3 = coef.get("epsilon3", [])
-        b3 = coef.get("beta3", [])
-        g3 = coef.get("gamma3", [])
-        exp1 = coef.get("exp1", [2]*len(nr3))
-        exp2 = coef.get("exp2", [2]*len(nr3))
-        for n, d, t, a, e, b, g, ex1, ex2 in zip(
-                nr3, d3, t3, a3, e3, b3, g3, exp1, exp2):
-            expr = exp(-a*(delta-e)**ex1-b*(tau-g)**ex2)
-            fird += expr * (n*d*delta**(d-1)*tau**t -
-                            n*a*delta**d*(delta-e)**(ex1-1)*ex1*tau**t)
+    cmp = _compileHelmholtz(coef)
+    tau, delta, mask, t_, d_ = _grid(tau, delta)
+
+    with errstate(all="ignore"):
+        # Polinomial, exponential and gaussian terms
+        fi, Tfac, aux = _terms(cmp, t_, d_)
+        fird = _dot(fi, _dterms(cmp, d_, aux, second=False))
 
         # Non analitic terms
-        ni = coef.get("nr4", [])
-        ai = coef.get("a4", [])
-        bi = coef.get("b4", [])
-        Ai = coef.get("A", [])
-        Bi = coef.get("B", [])
-        Ci = coef.get("C", [])
-        Di = coef.get("D", [])
-        b_ = coef.get("beta4", [])
-
-        for n, a, b, A, B, C, D, bt in zip(ni, ai, bi, Ai, Bi, Ci, Di, b_):
-            Tita = (1-tau)+A*((delta-1)**2)**(0.5/bt)
-            F = exp(-C*(delta-1)**2-D*(tau-1)**2)
-            Fd = -2*C*F*(delta-1)
-            Delta = Tita**2+B*((delta-1)**2)**a
-            Deltad = (delta-1)*(A*Tita*2/bt*((delta-1)**2)**(0.5/bt-1) +
-                                2*B*a*((delta-1)**2)**(a-1))
+        n, a, b, A, Bi, Ci, Di, bt = cmp["na"]
+        if n.size:
+            d1 = d_-1
+            d12 = d1**2
+            critical = d12 == 0
+            d12_ = where(critical, 1, d12)
+            Tita = (1-t_)+A*d12**(0.5/bt)
+            F = exp(-Ci*d12-Di*(t_-1)**2)
+            Fd = -2*Ci*F*d1
+            Delta = Tita**2+Bi*d12**a
+            Deltad = where(critical, 0, d1*(
+                A*Tita*2/bt*d12_**(0.5/bt-1) + 2*Bi*a*d12_**(a-1)))
             DeltaBd = b*Delta**(b-1)*Deltad
-
-            fird += n*(Delta**b*(F+delta*Fd)+DeltaBd*delta*F)
+            fird = fird + _dot(n, Delta**b*(F+d_*Fd)+DeltaBd*d_*F)
 
         # Special form from Saul-Wagner Water 58 coefficient equation
-        if "nr5" in coef:
-            if delta < 0.2:
-                factor = 1.6*delta**6*(1-1.2*delta**6)
-            else:
-                factor = exp(-0.4*delta**6)-exp(-2*delta**6)
-
-            nr5 = coef.get("nr5", [])
-            d5 = coef.get("d5", [])
-            t5 = coef.get("t5", [])
-            frd1, frd2 = 0, 0
-            for n, d, t in zip(nr5, d5, t5):
-                frd1 += n*delta**(d+5)*tau**t
-                frd2 += n*d*delta**(d-1)*tau**t
+        if "sw" in cmp:
+            n, d, t = cmp["sw"]
+            d6 = delta**6
+            factor = where(
+                delta < 0.2, 1.6*d6*(1-1.2*d6), exp(-0.4*d6)-exp(-2*d6))
+            taut = t_**t
+            fird = fird + (-2.4*exp(-0.4*d6)+12*exp(-2*d6)) * \
+                (n*d_**(d+5)*taut).sum(axis=-1) + \
+                factor*(n*d*d_**(d-1)*taut).sum(axis=-1)
 
-            fird += (-2.4*exp(-0.4*delta**6)+12*exp(-2*delta**6))*frd1 + \
-                factor*frd2
-
-    return fird
+    return _ungrid(fird, mask)
 
 
 def _Helmholtz_phirt(tau, delta, coef):
@@ -579,87 +932,47 @@ def _Helmholtz_phirt(tau, delta, coef):
 
     Parameters
     ----------
-    tau : float
+    tau : float or array
         Inverse reduced temperature, Tc/T [-]
-    delta : float
+    delta : float or array
         Reduced density, rho/rhoc [-]
     coef : dict
         Parameters of multiparameter equation of state
 
     Returns
     -------
-    firt : float
+    firt : float or array
         :math:`\left.\frac{\partial \phi^r}{\partial \tau}\right|_{\delta}`
     """
-    firt = 0
-
-    if delta:
-        # Polinomial terms
-        nr1 = coef.get("nr1", [])
-        d1 = coef.get("d1", [])
-        t1 = coef.get("t1", [])
-        for n, d, t in zip(nr1, d1, t1):
-            firt += n*t*delta**d*tau**(t-1)
-
-        # Exponential terms
-        nr2 = coef.get("nr2", [])
-        d2 = coef.get("d2", [])
-        g2 = coef.get("gamma2", [])
-        t2 = coef.get("t2", [])
-        c2 = coef.get("c2", [])
-        for n, d, g, t, c in zip(nr2, d2, g2, t2, c2):
-            firt += n*t*delta**d*tau**(t-1)*exp(-g*delta**c)
-
-        # Gaussian terms
-        nr3 = coef.get("nr3", [])
-        d3 = coef.get("d3", [])
-        t3 = coef.get("t3", [])
-        a3 = coef.get("alfa3", [])
-        e3 = coef.get("epsilon3", [])
-        b3 = coef.get("beta3", [])
-        g3 = coef.get("gamma3", [])
-        exp1 = coef.get("exp1", [2]*len(nr3))
-        exp2 = coef.get("exp2", [2]*len(nr3))
-        for n, d, t, a, e, b, g, ex1, ex2 in zip(
-                nr3, d3, t3, a3, e3, b3, g3, exp1, exp2):
-            expr = exp(-a*(delta-e)**ex1-b*(tau-g)**ex2)
-            firt += expr * (n*delta**d*t*tau**(t-1) -
-                            n*b*delta**d*ex2*tau**t*(tau-g)**(ex2-1))
+    cmp = _compileHelmholtz(coef)
+    tau, delta, mask, t_, d_ = _grid(tau, delta)
+
+    with errstate(all="ignore"):
+        # Polinomial, exponential and gaussian terms
+        fi, Tfac, aux = _terms(cmp, t_, d_)
+        firt = _dot(fi, _tterms(cmp, t_, aux, second=False))
 
         # Non analitic terms
-        ni = coef.get("nr4", [])
-        ai = coef.get("a4", [])
-        bi = coef.get("b4", [])
-        Ai = coef.get("A", [])
-        Bi = coef.get("B", [])
-        Ci = coef.get("C", [])
-        Di = coef.get("D", [])
-        b_ = coef.get("beta4", [])
-
-        for n, a, b, A, B, C, D, bt in zip(ni, ai, bi, Ai, Bi, Ci, Di, b_):
-            Tita = (1-tau)+A*((delta-1)**2)**(0.5/bt)
-            F = exp(-C*(delta-1)**2-D*(tau-1)**2)
-            Ft = -2*D*F*(tau-1)
-            Delta = Tita**2+B*((delta-1)**2)**a
+        n, a, b, A, Bi, Ci, Di, bt = cmp["na"]
+        if n.size:
+            d12 = (d_-1)**2
+            Tita = (1-t_)+A*d12**(0.5/bt)
+            F = exp(-Ci*d12-Di*(t_-1)**2)
+            Ft = -2*Di*F*(t_-1)
+            Delta = Tita**2+Bi*d12**a
             DeltaBt = -2*Tita*b*Delta**(b-1)
-            firt += n*delta*(DeltaBt*F+Delta**b*Ft)
+            firt = firt + _dot(n, d_*(DeltaBt*F+Delta**b*Ft))
 
         # Special form from Saul-Wagner Water 58 coefficient equation
-        if "nr5" in coef:
-            if delta < 0.2:
-                factor = 1.6*delta**6*(1-1.2*delta**6)
-            else:
-                factor = exp(-0.4*delta**6)-exp(-2*delta**6)
+        if "sw" in cmp:
+            n, d, t = cmp["sw"]
+            d6 = delta**6
+            factor = where(
+                delta < 0.2, 1.6*d6*(1-1.2*d6), exp(-0.4*d6)-exp(-2*d6))
+            firt = firt + factor*(n*d_**d*t*t_**(t-1)).sum(axis=-1)
 
-            nr5 = coef.get("nr5", [])
-            d5 = coef.get("d5", [])
-            t5 = coef.get("t5", [])
-            frt = 0
-            for n, d, t in zip(nr5, d5, t5):
-                frt += n*delta**d*t*tau**(t-1)
-            firt += factor*frt
+    return _ungrid(firt, mask)
 
-    return firt
 
 
 def _MBWR_phir(T, rho, rhoc, M, coef):
@@ -889,6 +1202,135 @@ def _MBWR_phirt(T, Tc, rho, rhoc, M, coef):
     return (A/T-dAT)/R/tau
 
 
+@contextmanager
+def _lockFile(filename):
+    """Exclusive lock of file between processes, only in systems with fcntl,
+    in other systems the write is only atomic"""
+    if fcntl is None:
+        yield
+        return
+    with open(filename, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _readRefOffsets(filename):
+    """Read the reference state offsets saved in file, with format
+    {"fluid-code": {ref: {"h": h, "s": s}}}"""
+    offsets = {}
+    try:
+        with open(filename, "r") as archivo:
+            dat = json.load(archivo)
+    except (OSError, ValueError):
+        return offsets
+
+    for name, refs in dat.items():
+        fluid, code = name.rsplit("-", 1)
+        for ref, value in refs.items():
+            offsets[(fluid, code, ref)] = (value["h"], value["s"])
+    return offsets
+
+
+def loadRefOffsets():
+    """Load the reference state offsets saved in config folder in
+    :data:`refOffsets`, the file is read only once for process"""
+    global _refOffsetsLoaded
+    for key, value in _readRefOffsets(conf_dir+"MEoSref.json").items():
+        refOffsets.setdefault(key, value)
+    _refOffsetsLoaded = True
+
+
+def saveRefOffsets(offsets):
+    """Save reference state offsets in the config folder, the file is locked
+    and updated with the values saved by other processes meanwhile, and
+    replaced atomically so the readers never see a partial file
+
+    Parameters
+    ----------
+    offsets : dict
+        Offsets to save as (h, s) with (fluid, equation code, reference
+        state) keys
+    """
+    filename = conf_dir+"MEoSref.json"
+    try:
+        with _lockFile(filename+".lock"):
+            dat = _readRefOffsets(filename)
+            dat.update(offsets)
+            data = {}
+            for (fluid, code, ref), (h, s) in sorted(dat.items()):
+                data.setdefault("%s-%s" % (fluid, code), {})[ref] = {
+                    "h": h, "s": s}
+
+            with tempfile.NamedTemporaryFile(
+                    "w", dir=conf_dir, prefix="MEoSref", suffix=".tmp",
+                    delete=False) as archivo:
+                json.dump(data, archivo)
+            os.replace(archivo.name, filename)
+    except OSError:
+        logging.warning("Reference state offsets not saved")
+        return
+
+    for key, value in dat.items():
+        refOffsets.setdefault(key, value)
+
+
+def precomputeRefOffsets(fluids=None, refs=("OTO", "NBP", "IIR", "ASHRAE")):
+    """Calculate the reference state offsets of all equations of fluids and
+    save them in the config folder, so later calculations only read them
+
+    Parameters
+    ----------
+    fluids : list, optional
+        lib.mEoS classes of fluids, default all
+    refs : list, optional
+        Reference states to calculate, the default reference state of each
+        equation is calculated too
+
+    Returns
+    -------
+    offsets : dict
+        Offsets calculated as (h, s), with (fluid, equation code, reference
+        state) keys
+
+    Examples
+    --------
+    >>> from lib.mEoS import R134a
+    >>> offsets = precomputeRefOffsets([R134a])
+    >>> ("R134a", "0", "IIR") in refOffsets
+    True
+    >>> st = R134a(T=273.15, x=0, ref="IIR")
+    >>> "%0.4f %0.4f" % (st.h.kJkg, st.s.kJkgK)
+    '200.0000 1.0000'
+    """
+    if fluids is None:
+        from lib import mEoS
+        fluids = mEoS.__all__
+
+    if not _refOffsetsLoaded:
+        loadRefOffsets()
+    old = set(refOffsets)
+
+    for fluid in fluids:
+        for eq in range(len(fluid.eq)):
+            st = fluid(eq=eq)
+            st._saveRefOffsets = False
+            for ref in (None, ) + tuple(refs):
+                try:
+                    st._ref(ref)
+                except Exception as err:
+                    logging.warning("Reference state %s of %s-%i failed: %s",
+                                    ref, fluid.__name__, eq, err)
+
+    offsets = {key: refOffsets[key] for key in refOffsets
+               if key not in old and key not in _refOffsetsFailed}
+    if offsets:
+        saveRefOffsets(offsets)
+    return offsets
+
+
 class MEoS(ThermoAdvanced):
     r"""General class for implement multiparameter equation of state
     Each child class must define the parameters for the calculations
@@ -968,6 +1410,24 @@ class MEoS(ThermoAdvanced):
 
     _test = []
 
+    # Use the Newton-Raphson solver with analytic jacobian in fsolve
+    _useNewton = True
+    _newtonMaxIter = 25
+    _newtonMaxStarts = 4
+
+    # Save in config folder the reference state offsets calculated in first
+    # use, see _refOffset
+    _saveRefOffsets = True
+
+    # Use the precalculated saturation table for initial values and phase
+    # classification, and number of nodes of table
+    _useSatTable = True
+    _satTableNodes = 60
+
+    # Properties available in batch calculation
+    _batchProps = ("T", "P", "x", "rho", "v", "h", "s", "u", "a", "g", "cv",
+                   "cp", "cp_cv", "w", "Z")
+
     kwargs = {"T": 0.0,
               "P": 0.0,
               "rho": None,
@@ -1310,8 +1770,9 @@ class MEoS(ThermoAdvanced):
 
         return bool(self._mode)
 
-    def calculo(self):
-        """Calculate procedure"""
+    def _solve(self):
+        """Solve the input pair of state, returning the tuple (T, P, rho, x,
+        rhoL, rhoG) or None if the state is out of range of equation"""
 
         # Get input parameters
         T = self.kwargs["T"]
@@ -1327,9 +1788,8 @@ class MEoS(ThermoAdvanced):
         refvalues = self.kwargs["refvalues"]
         self._ref(ref, refvalues)
 
-        propiedades = None
-        vapor = None
-        liquido = None
+        rhoL = None
+        rhoG = None
 
         # Special rhoc for MBWR with gamma defined
         if self._constants["__type__"] == "MBWR" and \
@@ -1366,9 +1826,15 @@ class MEoS(ThermoAdvanced):
             rho = prop["rho"]
 
         elif self._mode == "T-rho":
-            # In this mode only check possible two phases region
-            rhol = self._Liquid_Density(T)
-            rhov = self._Vapor_Density(T)
+            # In this mode only check possible two phases region, with the
+            # saturation table out of its error margin if it's available
+            sat = self._satInterpolate(T)
+            if sat:
+                rhol = sat[1]*(1+self._satMargin("rhoL"))
+                rhov = sat[2]*(1-self._satMargin("rhoG"))
+            else:
+                rhol = self._Liquid_Density(T)
+                rhov = self._Vapor_Density(T)
 
             if T > self.Tc:
                 x = 1
@@ -1986,7 +2452,7 @@ class MEoS(ThermoAdvanced):
                         Jl*(1/rhog-1/rhol)-log(rhol/rhog)-K,
                         lu*(1-x)+vu*x - u)
 
-            prop = self.fsolve(f, f2, **{"h": h, "rho": rho})
+            prop = self.fsolve(f, f2, **{"u": u, "rho": rho})
             T = prop["T"]
             if "rho" in prop:
                 rho = prop["rho"]
@@ -2228,7 +2694,14 @@ class MEoS(ThermoAdvanced):
                 T = float(T)
                 rhol, rhov, Ps = self._saturation(T)
                 return Ps-P
-            T = fsolve(funcion, 0.99*self.Tc)[0]
+
+            # Initial value from saturation table if it's available
+            sat = self._satInterpolate(P=P)
+            if sat:
+                To = sat[0]
+            else:
+                To = 0.99*self.Tc
+            T = fsolve(funcion, To)[0]
             rhoL, rhoG, Ps = self._saturation(T)
             rho = 1/(1/rhoG*x+1/rhoL*(1-x))
             self.status = 1
@@ -2238,7 +2711,13 @@ class MEoS(ThermoAdvanced):
             if T > self.Tc:
                 x = 1
             else:
-                rhol, rhov, Ps = self._saturation(T)
+                # The saturation table avoid the phase equilibrium procedure
+                # when the pressure is far from the vapor pressure
+                sat = self._satInterpolate(T)
+                if sat and abs(P/sat[3]-1) > self._satMargin("P"):
+                    Ps = sat[3]
+                else:
+                    rhol, rhov, Ps = self._saturation(T)
                 if Ps > P:
                     x = 1
                 else:
@@ -2260,6 +2739,19 @@ class MEoS(ThermoAdvanced):
                 "pychemqt", "input out of range")
             return
 
+        return T, P, rho, x, rhoL, rhoG
+
+    def calculo(self):
+        """Calculate procedure"""
+        state = self._solve()
+        if state is None:
+            return
+        T, P, rho, x, rhoL, rhoG = state
+
+        propiedades = None
+        vapor = None
+        liquido = None
+
         if x == 0:
             rhoL = rho
             liquido = self._eq(rhoL, T)
@@ -2371,6 +2863,239 @@ class MEoS(ThermoAdvanced):
         # Phase identification parameter
         # PI = 2-rho*(d2PdrhodT/dPdT-d2pdrho2/dPdrho)
 
+    @classmethod
+    def batch(cls, props=("rho", "h", "s", "cp", "w"), **kwargs):
+        """Calculate properties for a set of state points in a single call
+
+        The input pair is given as arrays, or scalars broadcasted to the
+        shape of the other input, using the same keywords of the class
+        constructor. The others options (eq, ref, ...) are common to all
+        points. Each state is solved point by point but the thermodynamic
+        properties are evaluated over the whole set at once, without the
+        phase objects and unidades instances of a normal instance, so it's
+        the fast way to fill tables or plots.
+
+        Parameters
+        ----------
+        props : list
+            Properties to return, any of :attr:`_batchProps`
+        kwargs : dict
+            Input pair and options as in :class:`MEoS`
+
+        Returns
+        -------
+        prop : dict
+            Dict with the arrays of requested properties in SI units, with
+            the same value as saved internally in unidades, and the
+            `status` array with the state of each point:
+
+                * 0: Undefined input pair
+                * 1: Calculated state
+                * 3: Ideal condition at zero pressure
+                * 5: Input out of range or solution don't converge
+
+            The properties of not calculated points are returned as nan.
+            In two phases region the properties not defined for the overall
+            mixture (cp, cv, w...) are nan too.
+
+        Examples
+        --------
+        >>> from lib.mEoS import H2O
+        >>> prop = H2O.batch(T=[300, 400, 500], P=[1e5, 1e5, 1e6])
+        >>> prop["status"]
+        array([1, 1, 1])
+        >>> st = H2O(T=400, P=1e5)
+        >>> "%0.6f %0.6f" % (st.rho, prop["rho"][1])
+        '0.547605 0.547605'
+        >>> "%0.3f %0.3f" % (st.cp, prop["cp"][1])
+        '2007.758 2007.758'
+
+        >>> prop = H2O.batch(T=373.124, x=[0, 0.5, 1], props=["P", "h"])
+        >>> st = H2O(T=373.124, x=0.5)
+        >>> "%0.1f %0.1f" % (st.h, prop["h"][1])
+        '1547292.7 1547292.7'
+        >>> H2O.batch(T=[300, 3000], P=1e5, props=["rho"])["status"]
+        array([1, 5])
+        """
+        for prop in props:
+            if prop not in cls._batchProps:
+                raise ValueError("Unknown property %s" % prop)
+
+        config = {}
+        for key in ("eq", "visco", "thermal", "ref", "refvalues", "rho0",
+                    "T0"):
+            if key in kwargs:
+                config[key] = kwargs.pop(key)
+        if not kwargs:
+            raise ValueError("Undefined input pair")
+
+        keys = list(kwargs.keys())
+        inputs = broadcast_arrays(
+            *[asarray(kwargs[key], dtype=float) for key in keys])
+        shape = inputs[0].shape
+        inputs = [value.ravel() for value in inputs]
+        size = inputs[0].size
+
+        st = cls(**config)
+        vectorized = st._code != "PR" and \
+            st._constants["__type__"] == "Helmholtz"
+
+        status = zeros(size, dtype=int)
+        T, P, rho, x, rhoL, rhoG = [full(size, nan) for i in range(6)]
+
+        # Phase properties of each point, only for the not vectorized eq
+        phases = [None]*size
+
+        for i in range(size):
+            st.kwargs = MEoS.kwargs.copy()
+            st.kwargs.update(config)
+            st.cleanOldValues(**{k: v[i] for k, v in zip(keys, inputs)})
+            if not st.calculable:
+                continue
+
+            try:
+                state = st._solve()
+                if state is not None and not vectorized:
+                    Ti, Pi, rhoi, xi, rhoLi, rhoGi = state
+                    if 0 < xi < 1:
+                        phases[i] = (st._eq(rhoLi, Ti), st._eq(rhoGi, Ti))
+                    else:
+                        phases[i] = (st._eq(rhoi, Ti), None)
+                    if st._code == "PR" and xi < 1:
+                        phases[i][0]["v"] = st.vtPR()
+            except Exception as e:
+                logging.warning("%s batch point %i fail: %s" % (
+                    cls.__name__, i, e))
+                state = None
+
+            if state is None:
+                status[i] = 5
+                continue
+
+            status[i] = st.status
+            T[i], P[i], rho[i], x[i] = state[:4]
+            if 0 < x[i] < 1:
+                rhoL[i], rhoG[i] = state[4:]
+
+        with errstate(invalid="ignore", divide="ignore"):
+            ok = (status == 1) | (status == 3)
+            two = ok & (0 < x) & (x < 1)
+
+            liquido = st._batchPhase(T, where(two, rhoL, rho), ok, phases, 0)
+            vapor = st._batchPhase(T, rhoG, two, phases, 1)
+
+            # Pressure of states defined without it
+            if "P" not in keys:
+                P = where(two, vapor["P"], where(P == 0, liquido["P"], P))
+
+            liquido = st._batchFill(T, P, liquido)
+            vapor = st._batchFill(T, P, vapor)
+
+            prop = {}
+            for key in liquido:
+                if key in ("v", "h", "s", "u", "a", "g"):
+                    mix = x*vapor[key]+(1-x)*liquido[key]
+                    prop[key] = where(two, mix, liquido[key])
+                else:
+                    prop[key] = where(two, nan, liquido[key])
+            prop["rho"] = 1/prop["v"]
+            prop["T"] = T
+            prop["P"] = P
+            prop["x"] = x
+
+            # Check convergence of input pair like in single state
+            for key, value in zip(keys, inputs):
+                if key == "v":
+                    key, value = "rho", 1/value
+                if key not in ("T", "P", "rho", "h", "s", "u", "x"):
+                    continue
+                if key in ("P", "h", "u", "s"):
+                    maxError = 1e-1
+                else:
+                    maxError = 1e-3
+                status[ok & ~(abs(value-prop[key]) <= maxError)] = 5
+
+        ok = (status == 1) | (status == 3)
+        result = {"status": status.reshape(shape)}
+        for key in props:
+            result[key] = where(ok, prop[key], nan).reshape(shape)
+        return result
+
+    def _batchPhase(self, T, rho, mask, phases, index):
+        """Calculate the dimensionless Helmholtz free energy derivatives of a
+        phase for the points of batch calculation selected by mask"""
+        keys = ("tau", "delta", "fio", "fiot", "fiott", "fir", "firt",
+                "firtt", "fird", "firdd", "firdt", "P", "v")
+        prop = {key: full(T.shape, nan) for key in keys}
+        if not mask.any():
+            return prop
+
+        if phases[mask.nonzero()[0][0]] is not None:
+            # Equation evaluated point by point in batch loop
+            for i in mask.nonzero()[0]:
+                for key in keys:
+                    prop[key][i] = phases[i][index][key]
+            return prop
+
+        T = T[mask]
+        rho = rho[mask]
+        tau = self.Tc/T
+        delta = rho/self.rhoc
+        res = _Helmholtz_derivatives(tau, delta, self._constants)
+        for key in ("fir", "firt", "firtt", "fird", "firdd", "firdt"):
+            prop[key][mask] = res[key]
+
+        # Ideal contribution, cheap but not vectorized
+        fio, fiot, fiott = zeros(T.shape), zeros(T.shape), zeros(T.shape)
+        for i, (t, d) in enumerate(zip(tau, delta)):
+            ideal = self._phi0(self._constants["cp"], t, d)
+            fio[i], fiot[i], fiott[i] = ideal["fio"], ideal["fiot"], \
+                ideal["fiott"]
+
+        prop["tau"][mask] = tau
+        prop["delta"][mask] = delta
+        prop["fio"][mask] = fio
+        prop["fiot"][mask] = fiot
+        prop["fiott"][mask] = fiott
+        prop["P"][mask] = (1+delta*res["fird"])*self.R*T*rho
+        prop["v"][mask] = 1/rho
+        return prop
+
+    def _batchFill(self, T, P, estado):
+        """Vectorized version of :func:`fill` for the properties available
+        in batch calculation, in SI units"""
+        R = float(self.R)
+        tau = estado["tau"]
+        delta = estado["delta"]
+        fio = estado["fio"]
+        fiot = estado["fiot"]
+        fiott = estado["fiott"]
+        fir = estado["fir"]
+        firt = estado["firt"]
+        firtt = estado["firtt"]
+        fird = estado["fird"]
+        firdd = estado["firdd"]
+        firdt = estado["firdt"]
+
+        prop = {}
+        prop["v"] = estado["v"]
+        prop["Z"] = P*prop["v"]/T/R
+        prop["h"] = R*T*(1+tau*(fiot+firt)+delta*fird) + \
+            (self.href-self.hoffset)*1e3
+        prop["s"] = R*(tau*(fiot+firt)-fio-fir) + (self.sref-self.soffset)*1e3
+        prop["u"] = prop["h"]-P*prop["v"]
+        prop["a"] = prop["u"]-T*prop["s"]
+        prop["g"] = prop["h"]-T*prop["s"]
+        prop["cv"] = -R*tau**2*(fiott+firtt)
+        prop["cp"] = R*(
+            -tau**2*(fiott+firtt) +
+            (1+delta*fird-delta*tau*firdt)**2/(1+2*delta*fird+delta**2*firdd))
+        prop["cp_cv"] = prop["cp"]/prop["cv"]
+        prop["w"] = (R*T*(
+            1 + 2*delta*fird+delta**2*firdd -
+            (1+delta*fird-delta*tau*firdt)**2/tau**2/(fiott+firtt)))**0.5
+        return prop
+
     def fsolve(self, f, f2=None, **kwargs):
         """Procedure to iterate to calculate T and rho in input pair without
         some of that unknown
@@ -2394,6 +3119,7 @@ class MEoS(ThermoAdvanced):
                     * rho0 : initial values for density, [kg/m³]
         """
         # Set initial value for iteration
+        ro, to = None, None
         if "T" not in kwargs:
             to = [self._constants["Tmin"], (self.Tt+self.Tc)/2, self.Tc,
                   self._constants["Tmax"]]
@@ -2416,7 +3142,143 @@ class MEoS(ThermoAdvanced):
                 else:
                     ro.insert(0, kwargs["rho0"])
 
+        time0 = time.perf_counter()
+        stats = solverStats.setdefault(self._mode, {
+            "calls": 0, "newton": 0, "iterations": 0, "fallback": 0,
+            "time": 0})
+        stats["calls"] += 1
+
         prop = {}
+        rho, T = 0, 0
+        converge = False
+        twophases = False
+        saturation = False
+
+        # Newton-Raphson with analytic jacobian, the multi-start scipy
+        # fsolve is used only when it fails. The T-P input is a single
+        # variable iteration yet and it's kept with the old procedure, the
+        # reference state of equations are defined with that input
+        if self._useNewton and self._code != "PR" and self._mode != "T-P":
+            if "T" in kwargs:
+                groups = [[(r, kwargs["T"]) for r in ro]]
+            else:
+                if "rho" in kwargs:
+                    groups = [[(kwargs["rho"], t) for t in to]]
+                else:
+                    groups = [list(product(ro, to))]
+
+                # With known pressure or density the ancillary equations
+                # locate the saturation point to choose the phase or try first
+                # the two phases solution
+                sat, Ts = self._newtonBracket(**kwargs)
+                if sat is None:
+                    saturation = True
+                    prop, iterations = self._newtonSaturation(Ts, **kwargs)
+                    stats["iterations"] += iterations
+                    if prop:
+                        groups = []
+                elif sat:
+                    groups.insert(0, sat)
+
+            rho = None
+            for starts in groups:
+                rho, T, iterations, twophases = self._newton(
+                    starts, **kwargs)
+                stats["iterations"] += iterations
+                if rho is not None or twophases:
+                    break
+
+            if twophases and not saturation:
+                prop, iterations = self._newtonSaturation(T, **kwargs)
+                stats["iterations"] += iterations
+
+            if rho is None:
+                rho, T = 0, 0
+            else:
+                converge = True
+
+            if converge or prop:
+                stats["newton"] += 1
+
+        # Solution in two phases region, go directly to saturation procedure
+        if not converge and not prop and not twophases:
+            stats["fallback"] += 1
+            rho, T, converge = self._multistart(f, ro, to, **kwargs)
+
+        if f2 is not None and not converge and not prop:
+
+            for t in ((self.Tc+self.Tt)/2, self.Tt, self.Tc):
+                rLo = self._Liquid_Density(t)
+                rGo = self._Vapor_Density(t)
+                if "rho" in kwargs:
+                    try:
+                        rinput = fsolve(f2, [t, rLo, rGo], full_output=True)
+                        T, rhoL, rhoG = rinput[0]
+                    except:
+                        pass
+                    else:
+                        if sum(abs(rinput[1]["fvec"])) < 1e-5:
+                            prop["T"] = T
+                            prop["rhoL"] = rhoL
+                            prop["rhoG"] = rhoG
+                            break
+                else:
+                    try:
+                        rinput = fsolve(
+                            f2, [t, rLo, rGo, 0.5], full_output=True)
+                        T, rhoL, rhoG, x = rinput[0]
+                    except:
+                        pass
+                    else:
+                        if sum(abs(rinput[1]["fvec"])) < 1e-5:
+                            prop["T"] = T
+                            prop["rhoL"] = rhoL
+                            prop["rhoG"] = rhoG
+                            prop["x"] = x
+                            break
+
+            # The Newton solution in two phases region can be wrong near the
+            # saturation line, ancillary equation aren't exact
+            if not prop and twophases:
+                stats["fallback"] += 1
+                rho, T, converge = self._multistart(f, ro, to, **kwargs)
+
+        if f2 is None or converge:
+            if "T" in kwargs:
+                prop["rho"] = rho
+            elif "rho" in kwargs:
+                prop["T"] = T
+            else:
+                prop["rho"] = rho
+                prop["T"] = T
+
+        stats["time"] += time.perf_counter()-time0
+        return prop
+
+    def _multistart(self, f, ro, to, **kwargs):
+        """Multi-start iteration of single phase region using scipy fsolve,
+        procedure used when the Newton-Raphson solver fails
+
+        Parameters
+        ----------
+        f : callable
+            function to iterate in single phase region
+        ro : list
+            Initial values of density, [kg/m³]
+        to : list
+            Initial values of temperature, [K]
+        kwargs : dict
+            Known values of input pair, see :func:`fsolve`
+
+        Returns
+        -------
+        rho : float
+            Density, [kg/m³]
+        T : float
+            Temperature, [K]
+        converge : boolean
+            Solution found
+        """
         rinput = None
         rho, T = 0, 0
         converge = False
@@ -2475,48 +3337,374 @@ class MEoS(ThermoAdvanced):
                             f1 < 1e-5 and not twophases:
                         converge = True
                         break
+        return rho, T, converge
 
-        if f2 is not None and not converge:
+    def _newton(self, starts, **kwargs):
+        """Damped Newton-Raphson solver for the single phase region using the
+        analytic derivatives of the equation of state for the jacobian
 
-            for to in ((self.Tc+self.Tt)/2, self.Tt, self.Tc):
-                rLo = self._Liquid_Density(to)
-                rGo = self._Vapor_Density(to)
-                if "rho" in kwargs:
-                    try:
-                        rinput = fsolve(f2, [to, rLo, rGo], full_output=True)
-                        T, rhoL, rhoG = rinput[0]
-                    except:
-                        pass
+        The iteration is done over the logarithm of unknown variables,
+        density and temperature, with a backtracking line search to reduce
+        the residual in each step. The solution must be mechanically stable
+        and, if temperature is unknown, in the temperature range of equation
+        and out of the two phases region defined by the ancillary equations
+        of saturated densities. A solution inside that region stop
+        the procedure to let the caller go to the two phases iteration.
+
+        Parameters
+        ----------
+        starts : list
+            Initial values (rho, T) to try in order
+        kwargs : dict
+            Known values of input pair, see :func:`fsolve`
+
+        Returns
+        -------
+        rho : float
+            Density, [kg/m³], None if there is no solution
+        T : float
+            Temperature, [K], the temperature of solution in two phases
+            region if the iteration stop there
+        iterations : int
+            Total number of iterations done
+        twophases : boolean
+            The iteration stop in a solution inside two phases region
+        """
+        unknown = [var for var in ("rho", "T") if var not in kwargs]
+        targets = [var for var in ("P", "h", "s", "u") if var in kwargs]
+
+        # Reference values to get dimensionless residuals, the pressure
+        # residual is scaled with the bulk modulus too, so in the stiff
+        # liquid region it measure the relative error of density and the
+        # line search don't stop the steps of temperature
+        R = float(self.R)
+        scale = {"P": abs(kwargs.get("P", 0))+1,
+                 "h": R*self.Tc,
+                 "s": R,
+                 "u": R*self.Tc}
+        rhomax = self._constants["rhomax"]*self.M
+
+        def residual(var):
+            """Dimensionless residual and jacobian of input pair"""
+            prop = self._newtonProp(var["rho"], var["T"])
+            if "P" in targets:
+                scale["P"] = abs(kwargs["P"])+1 + \
+                    var["rho"]*abs(prop["dPdrho"])
+            F = [(prop[k]-kwargs[k])/scale[k] for k in targets]
+            J = [[prop["d%sd%s" % (k, x)]/scale[k] for x in unknown]
+                 for k in targets]
+            return F, J, sum(r**2 for r in F)**0.5, prop
+
+        # With unknown temperature try first the start nearest to solution,
+        # the initial values with known temperature are chosen by phase
+        points = [({"rho": rho, "T": T}, None) for rho, T in starts]
+        if "T" not in kwargs:
+            points = []
+            for rho, T in starts:
+                var = {"rho": rho, "T": T}
+                try:
+                    with errstate(all="ignore"):
+                        points.append((var, residual(var)))
+                except (ZeroDivisionError, OverflowError, ValueError,
+                        TypeError):
+                    pass
+            points.sort(key=lambda point: point[1][2])
+            points = points[:self._newtonMaxStarts]
+
+        iterations = 0
+        for var, initial in points:
+            try:
+                if initial is None:
+                    with errstate(all="ignore"):
+                        initial = residual(var)
+                F, J, norm, prop = initial
+                for i in range(self._newtonMaxIter):
+                    if norm < 1e-13:
+                        break
+                    iterations += 1
+
+                    # Newton step in logarithmic variables
+                    Jl = [[j*var[x] for j, x in zip(row, unknown)]
+                          for row in J]
+                    if len(unknown) == 1:
+                        step = [-F[0]/Jl[0][0]]
                     else:
-                        if sum(abs(rinput[1]["fvec"])) < 1e-5:
-                            prop["T"] = T
-                            prop["rhoL"] = rhoL
-                            prop["rhoG"] = rhoG
+                        det = Jl[0][0]*Jl[1][1]-Jl[0][1]*Jl[1][0]
+                        step = [(-F[0]*Jl[1][1]+F[1]*Jl[0][1])/det,
+                                (-F[1]*Jl[0][0]+F[0]*Jl[1][0])/det]
+
+                    # Limit the step and backtrack until residual decrease
+                    lamb = min(1, 1/max(abs(dx) for dx in step))
+                    for j in range(8):
+                        new = var.copy()
+                        for x, dx in zip(unknown, step):
+                            new[x] *= exp(lamb*dx)
+                        with errstate(all="ignore"):
+                            Fn, Jn, normn, propn = residual(new)
+                        if normn < norm:
                             break
-                else:
-                    try:
-                        rinput = fsolve(
-                            f2, [to, rLo, rGo, 0.5], full_output=True)
-                        T, rhoL, rhoG, x = rinput[0]
-                    except:
-                        pass
+                        lamb /= 2
                     else:
-                        if sum(abs(rinput[1]["fvec"])) < 1e-5:
-                            prop["T"] = T
-                            prop["rhoL"] = rhoL
-                            prop["rhoG"] = rhoG
-                            prop["x"] = x
-                            break
+                        break
+                    var, F, J, norm, prop = new, Fn, Jn, normn, propn
+            except (ZeroDivisionError, OverflowError, ValueError, TypeError):
+                continue
+
+            if not norm < 1e-8:
+                continue
+
+            rho, T = var["rho"], var["T"]
+            if not 0 < rho < rhomax or prop["dPdrho"] <= 0:
+                continue
+            if "T" not in kwargs:
+                if not self._constants["Tmin"] <= T <= self._constants["Tmax"]:
+                    continue
+                if self._satAvailable() and self.Tt < T < self.Tc:
+                    rhol, rhov, Pv = self._satGuess(T)
+                    if rhov < rho < rhol:
+                        # Stop in the first solution in two phases region
+                        return None, T, iterations, True
+            return rho, T, iterations, False
+
+        return None, None, iterations, False
+
+    def _newtonTsat(self, P):
+        """Saturation temperature from the saturation table or the vapor
+        pressure ancillary equation, None if the pressure is out of the
+        saturation line range"""
+        sat = self._satInterpolate(P=P)
+        if sat:
+            return sat[0]
+        try:
+            Pt = self._Vapor_Pressure(self.Tt)
+            if not Pt < P < self.Pc:
+                return None
+            return brentq(lambda T: self._Vapor_Pressure(T)-P, self.Tt,
+                          self.Tc)
+        except ValueError:
+            return None
 
+    def _newtonSaturation(self, T0, **kwargs):
+        """Newton-Raphson solver for two phases states, iterating the
+        temperature, saturated densities and vapor quality with the analytic
+        jacobian of phase equilibrium conditions, same pressure and gibbs free
+        energy in both phases, and the input pair values of mixture
+
+        Parameters
+        ----------
+        T0 : float
+            Initial value of temperature, [K]
+        kwargs : dict
+            Known values of input pair, see :func:`fsolve`
+
+        Returns
+        -------
+        prop : dict
+            Saturation state with T, rhoL, rhoG and vapor quality x, empty if
+            the procedure fail or the state isn't in two phases region
+        iterations : int
+            Number of iterations done
+        """
+        if not self._satAvailable() or not self.Tt <= T0 < self.Tc:
+            return {}, 0
+
+        targets = [var for var in ("P", "rho", "h", "s", "u") if var in kwargs]
+        R = float(self.R)
+        scale = {"P": abs(kwargs.get("P", 0))+1,
+                 "rho": 1/kwargs.get("rho", 1),
+                 "h": R*self.Tc,
+                 "s": R,
+                 "u": R*self.Tc}
+
+        rhoL, rhoG, Pv = self._satGuess(T0)
+        if "rho" in kwargs:
+            x = (1/kwargs["rho"]-1/rhoL)/(1/rhoG-1/rhoL)
         else:
-            if "T" in kwargs:
-                prop["rho"] = rho
-            elif "rho" in kwargs:
-                prop["T"] = T
+            x = 0.5
+        var = [T0, rhoL, rhoG, x]
+
+        def residual(var):
+            """Dimensionless residual and jacobian, logarithmic variables for
+            temperature and densities"""
+            T, rhoL, rhoG, x = var
+            liq = self._newtonProp(rhoL, T)
+            vap = self._newtonProp(rhoG, T)
+            for st, rho in ((liq, rhoL), (vap, rhoG)):
+                st["g"] = st["h"]-T*st["s"]
+                st["dgdT"] = st["dhdT"]-st["s"]-T*st["dsdT"]
+                st["dgdrho"] = st["dhdrho"]-T*st["dsdrho"]
+                st["rho"] = 1/rho
+                st["drhodT"] = 0
+                st["drhodrho"] = -1/rho**2
+
+            # Phase equilibrium
+            Ps = rhoG*R*T
+            F = [(liq["P"]-vap["P"])/Ps, (liq["g"]-vap["g"])/R/T]
+            J = [[(liq["dPdT"]-vap["dPdT"])*T/Ps, liq["dPdrho"]*rhoL/Ps,
+                  -vap["dPdrho"]*rhoG/Ps, 0],
+                 [(liq["dgdT"]-vap["dgdT"])/R, liq["dgdrho"]*rhoL/R/T,
+                  -vap["dgdrho"]*rhoG/R/T, 0]]
+
+            # Input pair, the specific volume is used as density property
+            for key in targets:
+                if key == "P":
+                    F.append((vap["P"]-kwargs["P"])/scale[key])
+                    J.append([vap["dPdT"]*T/scale[key], 0,
+                              vap["dPdrho"]*rhoG/scale[key], 0])
+                    continue
+                value = kwargs[key]
+                if key == "rho":
+                    value = 1/value
+                F.append((x*vap[key]+(1-x)*liq[key]-value)/scale[key])
+                J.append([
+                    (x*vap["d%sdT" % key]+(1-x)*liq["d%sdT" % key])*T /
+                    scale[key],
+                    (1-x)*liq["d%sdrho" % key]*rhoL/scale[key],
+                    x*vap["d%sdrho" % key]*rhoG/scale[key],
+                    (vap[key]-liq[key])/scale[key]])
+            return F, J, sum(r**2 for r in F)**0.5
+
+        iterations = 0
+        try:
+            with errstate(all="ignore"):
+                F, J, norm = residual(var)
+                for i in range(self._newtonMaxIter):
+                    if norm < 1e-13:
+                        break
+                    iterations += 1
+                    step = solve(J, [-r for r in F])
+                    lamb = min(1, 1/max(abs(step[:3])))
+                    for j in range(8):
+                        new = [v*exp(lamb*dv) for v, dv in zip(var, step)]
+                        new[3] = var[3]+lamb*step[3]
+                        Fn, Jn, normn = residual(new)
+                        if normn < norm:
+                            break
+                        lamb /= 2
+                    else:
+                        break
+                    var, F, J, norm = new, Fn, Jn, normn
+        except (ZeroDivisionError, OverflowError, ValueError, TypeError,
+                LinAlgError):
+            return {}, iterations
+
+        T, rhoL, rhoG, x = var
+        if not norm < 1e-8 or not self.Tt <= T < self.Tc or \
+                not rhoG < rhoL*(1-1e-6) or not 0 <= x <= 1:
+            return {}, iterations
+
+        return {"T": T, "rhoL": rhoL, "rhoG": rhoG, "x": x}, iterations
+
+    def _newtonBracket(self, **kwargs):
+        """Locate the saturation point with the ancillary equations when
+        pressure or density are known, to choose the initial values of
+        Newton-Raphson solver in the phase of state
+
+        Parameters
+        ----------
+        kwargs : dict
+            Known values of input pair, see :func:`fsolve`
+
+        Returns
+        -------
+        starts : list
+            Initial values (rho, T) in saturated liquid or vapor state, None
+            if the state is in two phases region
+        Ts : float
+            Saturation temperature, [K]
+        """
+        if not self._satAvailable():
+            return [], None
+
+        target = [key for key in ("h", "s", "u") if key in kwargs]
+        if "P" in kwargs:
+            Ts = self._newtonTsat(kwargs["P"])
+            if Ts is None:
+                return [], None
+            rhol, rhov, Pv = self._satGuess(Ts)
+            liquid = (rhol, Ts)
+            vapor = (rhov, Ts)
+
+            if "rho" in kwargs:
+                if not vapor[0] < kwargs["rho"] < liquid[0]:
+                    return [(kwargs["rho"], Ts)], Ts
+                return None, Ts
+
+            if not target:
+                return [], Ts
+            with errstate(all="ignore"):
+                propL = self._newtonProp(*liquid)[target[0]]
+                propV = self._newtonProp(*vapor)[target[0]]
+            if kwargs[target[0]] <= propL:
+                return [liquid], Ts
+            elif kwargs[target[0]] >= propV:
+                return [vapor], Ts
+            return None, Ts
+
+        if "rho" in kwargs and target:
+            # Saturation temperature of density, the property increase with
+            # temperature both in single and two phases region
+            rho = kwargs["rho"]
+            if rho > self.rhoc:
+                i = 0
             else:
-                prop["rho"] = rho
-                prop["T"] = T
+                i = 1
+            try:
+                Ts = brentq(lambda T: self._satGuess(T)[i]-rho, self.Tt,
+                            self.Tc)
+            except ValueError:
+                return [], None
+            with errstate(all="ignore"):
+                prop = self._newtonProp(rho, Ts)[target[0]]
+            if kwargs[target[0]] >= prop:
+                return [(rho, Ts)], Ts
+            return None, Ts
+
+        return [], None
+
+    def _newtonProp(self, rho, T):
+        """Calculate the properties used in Newton-Raphson solver and its
+        derivatives with density and temperature
 
+        Parameters
+        ----------
+        rho : float
+            Density, [kg/m³]
+        T : float
+            Temperature, [K]
+
+        Returns
+        -------
+        prop : dict
+            Properties P, h, s, u with its derivatives, in the form dPdrho,
+            [∂P/∂ρ]T, and dPdT, [∂P/∂T]ρ
+        """
+        R = float(self.R)
+        st = self._eq(rho, T)
+        tau = st["tau"]
+        delta = st["delta"]
+        fiot = st["fiot"]+st["firt"]
+        fiott = st["fiott"]+st["firtt"]
+        fiodt = st["fiodt"]+st["firdt"]
+        fird = st["fird"]
+        firdd = st["firdd"]
+
+        prop = {}
+        prop["P"] = st["P"]
+        prop["dPdrho"] = R*T*(1+2*delta*fird+delta**2*firdd)
+        prop["dPdT"] = rho*R*(1+delta*fird-delta*tau*st["firdt"])
+
+        prop["h"] = R*T*(1+tau*fiot+delta*fird)
+        prop["dhdrho"] = R*T/self.rhoc*(tau*fiodt+fird+delta*firdd)
+        prop["dhdT"] = R*(1+delta*fird-delta*tau*st["firdt"]-tau**2*fiott)
+
+        prop["s"] = R*(tau*fiot-st["fio"]-st["fir"])
+        prop["dsdrho"] = R/self.rhoc*(tau*fiodt-st["fiod"]-fird)
+        prop["dsdT"] = -R*tau**2*fiott/T
+
+        prop["u"] = prop["h"]-prop["P"]/rho
+        prop["dudrho"] = prop["dhdrho"]-prop["dPdrho"]/rho+prop["P"]/rho**2
+        prop["dudT"] = prop["dhdT"]-prop["dPdT"]/rho
         return prop
 
     def fill(self, fase, estado):
@@ -2684,6 +3872,218 @@ class MEoS(ThermoAdvanced):
 #            self.derivative("P", "T", "rho", propiedades)))
 #        propiedades["cps"] = propiedades["cv"] Add cps from Argon pag.27
 
+    def _coefficientHash(self):
+        """Hash of the coefficients of the equation in use, included in the
+        key of the tables saved in the config folder"""
+        txt = json.dumps(self._constants, sort_keys=True, default=repr)
+        return hashlib.sha1(txt.encode()).hexdigest()
+
+    def _satTable(self):
+        """Saturation table of fluid with the equation in use, built once from
+        the rigorous phase equilibrium procedure and saved in the config
+        folder, see :func:`_satInterpolate`
+
+        Returns
+        -------
+        table : dict
+            Saturation values in nodes, T, P, rhoL, rhoG, the max relative
+            error of interpolation and the monotone splines, None if the table
+            isn't available for the equation
+        """
+        if not self._useSatTable or self._code == "PR":
+            return None
+
+        name = "%s-%s" % (self.__class__.__name__, self._code)
+        if name in satTables:
+            return satTables[name]
+
+        # Definition values of table, a change in equation coefficients or
+        # nodes number rebuild it
+        key = [float(self.Tt), float(self.Tc), float(self.Pc),
+               float(self.rhoc), self._satTableNodes, self._coefficientHash()]
+
+        filename = conf_dir+"MEoSsat_%s.pkl" % name
+        dat = None
+        if os.path.isfile(filename):
+            try:
+                with open(filename, "rb") as archivo:
+                    dat = pickle.load(archivo)
+            except (OSError, EOFError, AttributeError, ImportError,
+                    IndexError, TypeError, ValueError,
+                    pickle.UnpicklingError):
+                dat = None
+            if not isinstance(dat, dict) or dat.get("key") != key:
+                dat = None
+
+        if dat is None:
+            # Mark the table as unavailable to use the ancillary equations
+            # in the calculation of table
+            satTables[name] = None
+            dat = self._satTableBuild()
+            if dat is None:
+                # Save the failed table too to avoid recalculation
+                dat = {}
+            dat["key"] = key
+            # Written in a temporal file and renamed, so an interrupted or
+            # concurrent save don't leave a truncated file
+            archivo = None
+            try:
+                with tempfile.NamedTemporaryFile(
+                        "wb", dir=conf_dir, prefix="MEoSsat", suffix=".tmp",
+                        delete=False) as archivo:
+                    pickle.dump(dat, archivo)
+                os.replace(archivo.name, filename)
+            except (OSError, pickle.PicklingError):
+                logging.warning("Saturation table of %s not saved", name)
+                if archivo is not None and os.path.isfile(archivo.name):
+                    os.remove(archivo.name)
+
+        table = None
+        if "T" in dat:
+            table = self._satSplines(dat)
+        satTables[name] = table
+        return table
+
+    def _satSplines(self, dat):
+        """Monotone splines of saturation table, the logarithm of pressure is
+        interpolated with the inverse of temperature, the densities with the
+        square root of distance to critical point"""
+        table = dat.copy()
+        Tt, Tc = float(self.Tt), float(self.Tc)
+        tau = -Tc/dat["T"]
+        w = -((Tc-dat["T"])/(Tc-Tt))**0.5
+        lnP = log(dat["P"])
+        table["Tmin"] = dat["T"][0]
+        table["Tmax"] = dat["T"][-1]
+        table["Pmin"] = dat["P"][0]
+        table["Pmax"] = dat["P"][-1]
+        table["lnP"] = PchipInterpolator(tau, lnP)
+        table["tau"] = PchipInterpolator(lnP, tau)
+        table["rhoL"] = PchipInterpolator(w, dat["rhoL"])
+        table["lnrhoG"] = PchipInterpolator(w, log(dat["rhoG"]))
+        return table
+
+    def _satTableBuild(self):
+        """Calculate the saturation table between the triple point and the
+        critical point, the nodes are clustered near the critical point where
+        the saturated densities change quickly. The error bound is the max
+        relative difference of interpolation with the rigorous solution in
+        the middle point between nodes"""
+        N = self._satTableNodes
+        w = linspace(1, 0.03, 2*N-1)
+        Tt, Tc = float(self.Tt), float(self.Tc)
+        Ts = Tc-(Tc-Tt)*w**2
+
+        points = []
+        with errstate(all="ignore"):
+            for T in Ts:
+                T = float(T)
+                try:
+                    rhoL, rhoG, Ps = self._saturation(T)
+                    rhoL, rhoG, Ps = float(rhoL), float(rhoG), float(Ps)
+                except (ZeroDivisionError, OverflowError, ValueError,
+                        TypeError):
+                    points.append(None)
+                    continue
+                if rhoL > rhoG*(1+1e-6) and rhoG > 0 and Ps > 0 and \
+                        rhoL < float("inf"):
+                    points.append((T, Ps, rhoL, rhoG))
+                else:
+                    points.append(None)
+
+        # Longest run of valid and monotone nodes, each with the check point
+        # between it and the previous node
+        runs = [[]]
+        for i in range(0, len(points), 2):
+            node = points[i]
+            check = None
+            if runs[-1]:
+                last = runs[-1][-1][0]
+                check = points[i-1]
+                if node is None or check is None or node[1] <= last[1] or \
+                        node[2] >= last[2] or node[3] <= last[3]:
+                    runs.append([])
+                    check = None
+            if node is not None:
+                runs[-1].append((node, check))
+        run = max(runs, key=len)
+        if len(run) < 4:
+            return None
+
+        dat = {}
+        for i, var in enumerate(("T", "P", "rhoL", "rhoG")):
+            dat[var] = asarray([node[i] for node, check in run])
+
+        error = {"P": 0, "rhoL": 0, "rhoG": 0}
+        dat["error"] = error
+        for node, check in run[1:]:
+            T, Ps, rhoL, rhoG = check
+            sat = self._satInterpolate(T, table=self._satSplines(dat))
+            error["P"] = max(error["P"], abs(sat[3]/Ps-1))
+            error["rhoL"] = max(error["rhoL"], abs(sat[1]/rhoL-1))
+            error["rhoG"] = max(error["rhoG"], abs(sat[2]/rhoG-1))
+        return dat
+
+    def _satMargin(self, prop):
+        """Relative margin to trust the phase classification with the
+        saturation table, ten times the error bound of interpolation"""
+        return max(10*self._satTable()["error"][prop], 1e-6)
+
+    def _satAvailable(self):
+        """Check if the saturation values are available for the iterative
+        procedures, from saturation table or ancillary equations"""
+        return self._satTable() is not None or bool(
+            self._vapor_Pressure and self._liquid_Density and
+            self._vapor_Density)
+
+    def _satGuess(self, T):
+        """Saturated densities and vapor pressure used as initial values,
+        interpolated from saturation table if it's available or calculated
+        with the ancillary equations"""
+        sat = self._satInterpolate(T)
+        if sat:
+            return sat[1:]
+        return self._Liquid_Density(T), self._Vapor_Density(T), \
+            self._Vapor_Pressure(T)
+
+    def _satInterpolate(self, T=None, P=None, table=None):
+        """Saturation state interpolated from saturation table at the input
+        temperature or pressure
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        table : dict
+            Saturation table to use, default the table of fluid
+
+        Returns
+        -------
+        sat : tuple
+            Saturation values (T, rhoL, rhoG, Ps), None if the input is out
+            of the table range or the table isn't available
+        """
+        if table is None:
+            table = self._satTable()
+            if table is None:
+                return None
+
+        if P is not None:
+            if not table["Pmin"] <= P <= table["Pmax"]:
+                return None
+            T = -self.Tc/float(table["tau"](log(P)))
+        elif not table["Tmin"] <= T <= table["Tmax"]:
+            return None
+
+        T = float(T)
+        w = -((self.Tc-T)/(self.Tc-self.Tt))**0.5
+        rhoL = float(table["rhoL"](w))
+        rhoG = float(exp(table["lnrhoG"](w)))
+        Ps = float(exp(table["lnP"](-self.Tc/T)))
+        return T, rhoL, rhoG, Ps
+
     @refDoc(__doi__, [9], tab=8)
     def _saturation(self, T=None):
         """
@@ -2970,11 +4370,12 @@ class MEoS(ThermoAdvanced):
             self._refOffset(False, refvalues)
 
     def _refOffset(self, ref, refvalues):
-        name = "%s-%s" % (self.__class__.__name__, self._code)
+        """Set the enthalpy and entropy offsets of reference state, from
+        :data:`refOffsets` or calculated in first use"""
         if ref == "CUSTOM":
             if refvalues is None:
-                refvalues = [298.15, 101325., 0., 0.]
-            ref = "CUSTOM-%s-%s-%s-%s" % refvalues
+                refvalues = [298.15, 101.325, 0., 0.]
+            ref = "CUSTOM-%s-%s-%s-%s" % tuple(refvalues)
 
         # Skip reference state checking to avoid recursion
         if ref is False:
@@ -2982,57 +4383,47 @@ class MEoS(ThermoAdvanced):
             self.soffset = 0
             return
 
-        filename = conf_dir+"MEoSref.json"
-        if os.path.isfile(filename):
-            with open(filename, "r") as archivo:
-                dat = json.load(archivo)
-        else:
-            dat = {}
+        if not _refOffsetsLoaded:
+            loadRefOffsets()
 
-        if name in dat and ref in dat[name]:
-            self.hoffset = dat[name][ref]["h"]
-            self.soffset = dat[name][ref]["s"]
+        key = (self.__class__.__name__, self._code, ref)
+        if key not in refOffsets:
+            offset = self._refOffsetCalc(ref, refvalues)
+            if offset is None:
+                _refOffsetsFailed.add(key)
+                refOffsets[key] = (0, 0)
+            else:
+                refOffsets[key] = offset
+                if self._saveRefOffsets:
+                    saveRefOffsets({key: offset})
+        self.hoffset, self.soffset = refOffsets[key]
+
+    def _refOffsetCalc(self, ref, refvalues):
+        """Calculate the enthalpy and entropy offsets of reference state, None
+        if the reference state is unavailable"""
+        kw = {"ref": False}
+        kw["eq"] = self.kwargs["eq"]
+        kw["visco"] = self.kwargs["visco"]
+        kw["thermal"] = self.kwargs["thermal"]
+        if ref in ("OTO", "OTH"):
+            st = self.__class__(T=298.15, P=101325, **kw)
+        elif ref == "NBP":
+            st = self.__class__(P=101325, x=0, **kw)
+        elif ref == "IIR":
+            st = self.__class__(T=273.15, x=0, **kw)
+        elif ref == "ASHRAE":
+            st = self.__class__(T=233.15, x=0, **kw)
         else:
-            if name not in dat:
-                dat[name] = {}
-
-            kw = {"ref": False}
-            kw["eq"] = self.kwargs["eq"]
-            kw["visco"] = self.kwargs["visco"]
-            kw["thermal"] = self.kwargs["thermal"]
-            if ref == "OTO":
-                st = self.__class__(T=298.15, P=101325, **kw)
-                self.hoffset = st.h0.kJkg
-                self.soffset = st.s0.kJkgK
-            elif ref == "OTH":
-                st = self.__class__(T=298.15, P=101325, **kw)
-                self.hoffset = st.h.kJkg
-                self.soffset = st.s.kJkgK
-            elif ref == "NBP":
-                st = self.__class__(P=101325, x=0, **kw)
-                self.hoffset = st.h.kJkg
-                self.soffset = st.s.kJkgK
-            elif ref == "IIR":
-                st = self.__class__(T=273.15, x=0, **kw)
-                self.hoffset = st.h.kJkg
-                self.soffset = st.s.kJkgK
-            elif ref == "ASHRAE":
-                st = self.__class__(T=233.15, x=0, **kw)
-                self.hoffset = st.h.kJkg
-                self.soffset = st.s.kJkgK
-            elif ref[:6] == "CUSTOM":
-                # First check if the custum state is in database
-                code = "%s-%s-%s-%s" % refvalues
-                if code not in dat[name]:
-                    T = refvalues[0]
-                    P = refvalues[1]*1e3
-                    st = self.__class__(T=T, P=P, **kw)
-                    self.hoffset = st.h.kJkg
-                    self.soffset = st.s.kJkgK
-
-            dat[name][ref] = {"h": self.hoffset, "s": self.soffset}
-            with open(filename, "w") as archivo:
-                json.dump(dat, archivo)
+            st = self.__class__(T=refvalues[0], P=refvalues[1]*1e3, **kw)
+
+        # Reference state out of range of equation, without offset
+        if st.status not in (1, 3):
+            logging.warning("Reference state %s of %s-%s unavailable", ref,
+                            self.__class__.__name__, self._code)
+            return None
+        if ref == "OTO":
+            return st.h0.kJkg, st.s0.kJkgK
+        return st.h.kJkg, st.s.kJkgK
 
     def _prop0(self, rho, T):
         """Ideal gas properties"""
@@ -3251,11 +4642,14 @@ class MEoS(ThermoAdvanced):
             * beta4: Nonanalytic term exponent in θ expression
 
 
+        All terms are evaluated in a single vectorized pass over the
+        compiled coefficients, see :func:`_Helmholtz_derivatives`
+
         Parameters
         ----------
-        tau : float
+        tau : float or array
             Inverse reduced temperature, Tc/T [-]
-        delta : float
+        delta : float or array
             Reduced density, rho/rhoc [-]
 
         Returns
@@ -3271,270 +4665,7 @@ class MEoS(ThermoAdvanced):
                 * firdd: [∂²fir/∂δ²]τ,x  [-]
         """
 
-        fir = fird = firdd = firt = firtt = firdt = firdtt = 0
-        firddd = firttt = firddt = 0
-        delta_0 = 1e-100
-        B = C = D = 0
-
-        if delta:
-            # Polinomial terms
-            nr1 = self._constants.get("nr1", [])
-            d1 = self._constants.get("d1", [])
-            t1 = self._constants.get("t1", [])
-            for n, d, t in zip(nr1, d1, t1):
-                fir += n*delta**d*tau**t
-                fird += n*d*delta**(d-1)*tau**t
-                firdd += n*d*(d-1)*delta**(d-2)*tau**t
-                firt += n*t*delta**d*tau**(t-1)
-                firtt += n*t*(t-1)*delta**d*tau**(t-2)
-                firdt += n*t*d*delta**(d-1)*tau**(t-1)
-                firdtt += n*t*d*(t-1)*delta**(d-1)*tau**(t-2)
-                # firddd += n*d*(d-1)*(d-2)*delta**(d-3)*tau**t
-                # firddt += n*(d-1)*delta**(d-2)*t*tau**(t-1)
-                # firttt += n*t*(t-1)*(t-2)*delta**d*tau**(t-3)
-                B += n*d*delta_0**(d-1)*tau**t
-                C += n*d*(d-1)*delta_0**(d-2)*tau**t
-                # D += n*d*(d-1)*(d-2)*delta_0**(d-3)*tau**t
-
-            # Exponential terms
-            nr2 = self._constants.get("nr2", [])
-            d2 = self._constants.get("d2", [])
-            g2 = self._constants.get("gamma2", [])
-            t2 = self._constants.get("t2", [])
-            c2 = self._constants.get("c2", [])
-            for n, d, g, t, c in zip(nr2, d2, g2, t2, c2):
-                fir += n*delta**d*tau**t*exp(-g*delta**c)
-                fird += n*exp(-g*delta**c)*delta**(d-1)*tau**t*(d-g*c*delta**c)
-                firdd += n*exp(-g*delta**c)*delta**(d-2)*tau**t * \
-                    ((d-g*c*delta**c)*(d-1-g*c*delta**c)-g**2*c**2*delta**c)
-                # firddd -= n*exp(-g*delta**c)*delta**(d-3)*tau**t * \
-                    # (c**3*delta**(3*c)*g**3 - 3*c**2*d*delta**(2*c)*g**2 -
-                     # 3*c**3*delta**(2*c)*g**2 + 3*c**2*delta**(2*c)*g**2 +
-                     # 3*c*d**2*delta**c*g + 3*c**2*d*delta**c*g -
-                     # 6*c*d*delta**c*g + c**3*delta**c*g - 3*c**2*delta**c*g +
-                     # 2*c*delta**c*g - d**3 + 3*d**2 - 2*d)
-                firt += n*t*delta**d*tau**(t-1)*exp(-g*delta**c)
-                firtt += n*t*(t-1)*delta**d*tau**(t-2)*exp(-g*delta**c)
-                firdt += n*t*delta**(d-1)*tau**(t-1)*(d-g*c*delta**c) * \
-                    exp(-g*delta**c)
-                firdtt += n*t*(t-1)*delta**(d-1)*tau**(t-2) * \
-                    (d-g*c*delta**c) * exp(-g*delta**c)
-                # firddt += n*t*delta**(d-2)*tau**(t-1)*exp(-g*delta**c) * (
-                    # c**2*delta**(2*c)*g**2 - 2*c*d*delta**c*g -
-                    # c**2*delta**c*g + c*delta**c*g + d**2 - d)
-                # firttt += n*t*(t-1)*(t-2)*delta**d*tau**(t-3)*exp(-g*delta**c)
-                B += n*exp(-g*delta_0**c)*delta_0**(d-1)*tau**t * \
-                    (d-g*c*delta_0**c)
-                C += n*exp(-g*delta_0**c) * \
-                    (delta_0**(d-2)*tau**t*((d-g*c*delta_0**c)*(
-                        d-1-g*c*delta_0**c)-g**2*c**2 * delta_0**c))
-                # D -= n*exp(-g*delta_0**c)*delta_0**(d-3)*tau**t * \
-                    # (c**3*delta_0**(3*c)*g**3 - 3*c**2*d*delta_0**(2*c)*g**2 -
-                     # 3*c**3*delta_0**(2*c)*g**2 + 3*c**2*delta_0**(2*c)*g**2 +
-                     # 3*c*d**2*delta_0**c*g + 3*c**2*d*delta_0**c*g -
-                     # 6*c*d*delta_0**c*g + c**3*delta_0**c*g -
-                     # 3*c**2*delta_0**c*g + 2*c*delta_0**c*g - d**3+3*d**2-2*d)
-
-            # Gaussian terms
-            nr3 = self._constants.get("nr3", [])
-            d3 = self._constants.get("d3", [])
-            t3 = self._constants.get("t3", [])
-            a3 = self._constants.get("alfa3", [])
-            e3 = self._constants.get("epsilon3", [])
-            b3 = self._constants.get("beta3", [])
-            g3 = self._constants.get("gamma3", [])
-            exp1 = self._constants.get("exp1", [2]*len(nr3))
-            exp2 = self._constants.get("exp2", [2]*len(nr3))
-            for n, d, t, a, e, b, g, ex1, ex2 in zip(
-                    nr3, d3, t3, a3, e3, b3, g3, exp1, exp2):
-                expr = exp(-a*(delta-e)**ex1-b*(tau-g)**ex2)
-
-                fir += n*delta**d*tau**t * expr
-                fird += expr * (n*d*delta**(d-1)*tau**t -
-                                n*a*delta**d*(delta-e)**(ex1-1)*ex1*tau**t)
-                firdd += expr * (
-                    n*a**2*delta**d*(delta-e)**(2*ex1-2)*ex1**2*tau**t -
-                    n*a*delta**d*(delta-e)**(ex1-2)*(ex1-1)*ex1*tau**t -
-                    2*n*a*d*delta**(d-1)*(delta-e)**(ex1-1)*ex1*tau**t +
-                    n*(d-1)*d*delta**(d-2)*tau**t)
-                firt += expr * (n*delta**d*t*tau**(t-1) -
-                                n*b*delta**d*ex2*tau**t*(tau-g)**(ex2-1))
-                firtt += expr * (
-                    n*b**2*delta**d*ex2**2*tau**t*(tau-g)**(2*ex2-2) -
-                    2*n*b*delta**d*ex2*t*tau**(t-1)*(tau-g)**(ex2-1) -
-                    n*b*delta**d*(ex2-1)*ex2*tau**t*(tau-g)**(ex2-2) +
-                    n*delta**d*(t-1)*t*tau**(t-2))
-                firdt += expr * (
-                    n*a*b*delta**d*(delta-e)**(ex1-1)*ex1*ex2*tau**t *
-                    (tau-g)**(ex2-1) -
-                    n*b*d*delta**(d-1)*ex2*tau**t*(tau-g)**(ex2-1) -
-                    n*a*delta**d*(delta-e)**(ex1-1)*ex1*t*tau**(t-1) +
-                    n*d*delta**(d-1)*t*tau**(t-1))
-                firdtt += expr * (
-                    -n*a*b**2*delta**d*(delta-e)**(ex1-1)*ex1*ex2**2*tau**t *
-                    (tau-g)**(2*ex2-2) +
-                    n*b**2*d*delta**(d-1)*ex2**2*tau**t*(tau-g)**(2*ex2-2) +
-                    2*n*a*b*delta**d*(delta-e)**(ex1-1)*ex1*ex2*t*tau**(t-1) *
-                    (tau-g)**(ex2-1) -
-                    2*n*b*d*delta**(d-1)*ex2*t*tau**(t-1)*(tau-g)**(ex2-1) +
-                    n*a*b*delta**d*(delta-e)**(ex1-1)*ex1*(ex2-1)*ex2*tau**t *
-                    (tau-g)**(ex2-2) -
-                    n*b*d*delta**(d-1)*(ex2-1)*ex2*tau**t*(tau-g)**(ex2-2) -
-                    n*a*delta**d*(delta-e)**(ex1-1)*ex1*(t-1)*t*tau**(t-2) +
-                    n*d*delta**(d-1)*(t-1)*t*tau**(t-2))
-
-                expr_ = exp(-a*(delta_0-e)**ex1-b*(tau-g)**ex2)
-                B += expr_ * (n*d*delta_0**(d-1)*tau**t -
-                              n*a*delta_0**d*(delta_0-e)**(ex1-1)*ex1*tau**t)
-                C += expr_ * (
-                    n*a**2*delta_0**d*(delta_0-e)**(2*ex1-2)*ex1**2*tau**t -
-                    n*a*delta_0**d*(delta_0-e)**(ex1-2)*(ex1-1)*ex1*tau**t -
-                    2*n*a*d*delta_0**(d-1)*(delta_0-e)**(ex1-1)*ex1*tau**t +
-                    n*(d-1)*d*delta_0**(d-2)*tau**t)
-
-            # Non analitic terms
-            # FIXME: Invalid value in critical point with this term
-            ni = self._constants.get("nr4", [])
-            ai = self._constants.get("a4", [])
-            bi = self._constants.get("b4", [])
-            Ai = self._constants.get("A", [])
-            Bi = self._constants.get("B", [])
-            Ci = self._constants.get("C", [])
-            Di = self._constants.get("D", [])
-            b_ = self._constants.get("beta4", [])
-
-            for n, a, b, A, B, C, D, bt in zip(ni, ai, bi, Ai, Bi, Ci, Di, b_):
-                Tita = (1-tau)+A*((delta-1)**2)**(0.5/bt)
-                F = exp(-C*(delta-1)**2-D*(tau-1)**2)
-                Fd = -2*C*F*(delta-1)
-                Fdd = 2*C*F*(2*C*(delta-1)**2-1)
-                Ft = -2*D*F*(tau-1)
-                Ftt = 2*D*F*(2*D*(tau-1)**2-1)
-                Fdt = 4*C*D*F*(delta-1)*(tau-1)
-                Fdtt = 4*C*D*F*(delta-1)*(2*D*(tau-1)**2-1)
-
-                Delta = Tita**2+B*((delta-1)**2)**a
-                Deltad = (delta-1)*(A*Tita*2/bt*((delta-1)**2)**(0.5/bt-1) +
-                                    2*B*a*((delta-1)**2)**(a-1))
-                if delta == 1:
-                    Deltadd = 0
-                else:
-                    Deltadd = Deltad/(delta-1)+(delta-1)**2*(
-                        4*B*a*(a-1)*((delta-1)**2)**(a-2) +
-                        2*A**2/bt**2*(((delta-1)**2)**(0.5/bt-1))**2 +
-                        A*Tita*4/bt*(0.5/bt-1)*((delta-1)**2)**(0.5/bt-2))
-
-                DeltaBd = b*Delta**(b-1)*Deltad
-                DeltaBdd = b*(Delta**(b-1)*Deltadd +
-                              (b-1)*Delta**(b-2)*Deltad**2)
-                DeltaBt = -2*Tita*b*Delta**(b-1)
-                DeltaBtt = 2*b*Delta**(b-1)+4*Tita**2*b*(b-1)*Delta**(b-2)
-                DeltaBdt = -A*b*2/bt*Delta**(b-1)*(delta-1)*((delta-1)**2)**(
-                    0.5/bt-1)-2*Tita*b*(b-1)*Delta**(b-2)*Deltad
-                DeltaBdtt = 2*b*(b-1)*Delta**(b-2) * \
-                    (Deltad*(1+2*Tita**2*(b-2)/Delta)+4*Tita*A *
-                     (delta-1)/bt*((delta-1)**2)**(0.5/bt-1))
-
-                fir += n*Delta**b*delta*F
-                fird += n*(Delta**b*(F+delta*Fd)+DeltaBd*delta*F)
-                firdd += n*(Delta**b*(2*Fd+delta*Fdd)+2*DeltaBd*(F+delta*Fd) +
-                            DeltaBdd*delta*F)
-                firt += n*delta*(DeltaBt*F+Delta**b*Ft)
-                firtt += n*delta*(DeltaBtt*F+2*DeltaBt*Ft+Delta**b*Ftt)
-                firdt += n*(Delta**b*(Ft+delta*Fdt)+delta*DeltaBd*Ft +
-                            DeltaBt*(F+delta*Fd)+DeltaBdt*delta*F)
-                firdtt += n*(
-                    (DeltaBtt*F+2*DeltaBt*Ft+Delta**b*Ftt) +
-                    delta*(DeltaBdtt*F+DeltaBtt*Fd+2*DeltaBdt*Ft +
-                           2*DeltaBt*Fdt + DeltaBt*Ftt+Delta**b*Fdtt))
-
-                Tita_ = (1-tau)+A*((delta_0-1)**2)**(0.5/bt)
-                Delta_ = Tita_**2+B*((delta_0-1)**2)**a
-                Deltad_ = (delta_0-1)*(A*Tita_*2/bt*((delta_0-1)**2)**(
-                    0.5/bt-1)+2*B*a*((delta_0-1)**2)**(a-1))
-                Deltadd_ = Deltad_/(delta_0-1) + (delta_0-1)**2*(
-                    4*B*a*(a-1)*((delta_0-1)**2)**(a-2) +
-                    2*A**2/bt**2*(((delta_0-1)**2)**(0.5/bt-1))**2 +
-                    A*Tita_*4/bt*(0.5/bt-1)*((delta_0-1)**2)**(0.5/bt-2))
-                DeltaBd_ = b*Delta_**(b-1)*Deltad_
-                DeltaBdd_ = b*(Delta_**(b-1)*Deltadd_ +
-                               (b-1)*Delta_**(b-2)*Deltad_**2)
-                F_ = exp(-C*(delta_0-1)**2-D*(tau-1)**2)
-                Fd_ = -2*C*F_*(delta_0-1)
-                Fdd_ = 2*C*F_*(2*C*(delta_0-1)**2-1)
-
-                B += n*(Delta_**b*(F_+delta_0*Fd_)+DeltaBd_*delta_0*F_)
-                C += n*(Delta_**b*(2*Fd_+delta_0*Fdd_)+2*DeltaBd_ *
-                        (F_+delta*Fd_) + DeltaBdd_*delta_0*F_)
-
-            # Special form from Saul-Wagner Water 58 coefficient equation
-            if "nr5" in self._constants:
-                if delta < 0.2:
-                    factor = 1.6*delta**6*(1-1.2*delta**6)
-                else:
-                    factor = exp(-0.4*delta**6)-exp(-2*delta**6)
-
-                nr5 = self._constants.get("nr5", [])
-                d5 = self._constants.get("d5", [])
-                t5 = self._constants.get("t5", [])
-                fr, frt, frtt, frdtt1, frdtt2 = 0, 0, 0, 0, 0
-                frd1, frd2 = 0, 0
-                frdd1, frdd2, frdd3 = 0, 0, 0
-                frdt1, frdt2 = 0, 0
-                Bsum1, Bsum2, Csum1, Csum2, Csum3 = 0, 0, 0, 0, 0
-                for n, d, t in zip(nr5, d5, t5):
-                    fr += n*delta**d*tau**t
-                    frd1 += n*delta**(d+5)*tau**t
-                    frd2 += n*d*delta**(d-1)*tau**t
-                    frdd1 += n*delta**(d+10)*tau**t
-                    frdd2 += n*(2*d+5)*delta**(d+4)*tau**t
-                    frdd3 += n*d*(d-1)*delta**(d-2)*tau**t
-                    frt += n*delta**d*t*tau**(t-1)
-                    frtt += n*delta**d*t*(t-1)*tau**(t-2)
-                    frdt1 += n*delta**(d+5)*t*tau**(t-1)
-                    frdt2 += n*d*delta**(d-1)*t*tau**(t-1)
-                    frdtt1 += n*delta**(d+5)*t*(t-1)*tau**(t-2)
-                    frdtt2 += n*d*delta**(d-1)*t*(t-1)*tau**(t-2)
-                    Bsum1 += n*delta_0**(d+5)*tau**t
-                    Bsum2 += n*d*delta_0**(d-1)*tau**t
-                    Csum1 += n*delta_0**(d+10)*tau**t
-                    Csum2 += n*(2*d+5)*delta_0**(d+4)*tau**t
-                    Csum3 += n*d*(d-1)*delta_0**(d-2)*tau**t
-
-                fir += factor*fr
-                fird += (-2.4*exp(-0.4*delta**6)+12*exp(-2*delta**6))*frd1 + \
-                    factor*frd2
-                firdd += (5.76*exp(-0.4*delta**6)-144*exp(-2*delta**6)) * \
-                    frdd1 + (-2.4*exp(-0.4*delta**6)+12*exp(-2*delta**6)) * \
-                    frdd2 + factor*frdd3
-                firt += factor*frt
-                firtt += factor*frtt
-                firdt += (-2.4*exp(-0.4*delta**6)+12*exp(-2*delta**6)) * \
-                    frdt1 + factor*frdt2
-                firdtt += (-2.4*exp(-0.4*delta**6)+12*exp(-2*delta**6)) * \
-                    frdtt1 + factor*frdtt2
-
-                B += (-2.4*exp(-0.4*delta_0**6)+12*exp(-2*delta_0**6)) * \
-                    Bsum1 + (exp(0.4*delta_0**6)-exp(-2*delta_0**6))*Bsum2
-                C += (5.76*exp(-0.4*delta_0**6)-144*exp(-2*delta_0**6)) * \
-                    Csum1+(-2.4*exp(-0.4*delta_0**6)+12*exp(-2*delta_0**6)) * \
-                    Csum2 + (exp(0.4*delta_0**6)-exp(-2*delta_0**6))*Csum3
-
-        prop = {}
-        prop["fir"] = fir
-        prop["firt"] = firt
-        prop["firtt"] = firtt
-        prop["fird"] = fird
-        prop["firdd"] = firdd
-        prop["firdt"] = firdt
-        prop["firddd"] = firddd
-        prop["firddt"] = firddt
-        prop["firdtt"] = firdtt
-        prop["firttt"] = firttt
-        prop["B"] = B
-        prop["C"] = C
-        prop["D"] = D
-        return prop
+        return _Helmholtz_derivatives(tau, delta, self._constants)
 
     @refDoc(__doi__, [11], tab=8)
     def _MBWR(self, rho, T):
@@ -74,6 +74,7 @@ Mixture mass definition:
 
 from math import pi
 
+from numpy import asarray, eye, outer, tril, where
 from numpy.linalg import solve
 from scipy import log, log10, exp
 
@@ -367,47 +368,30 @@ def Vc_ChuehPrausnitz(xi, Vci, Mi, hydrocarbon=None):
     >>> "%0.2f" % (Vc_ChuehPrausnitz([0.63, 0.37], [Vc1, Vc2], Mi).ft3lb*Mm)
     '4.35'
     """
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+
     # Define default C parameters:
     if hydrocarbon is None:
         hydrocarbon = [True]*len(xi)
+    hydrocarbon = asarray(hydrocarbon, dtype=bool)
 
     # Convert critical volumes to molar base
-    Vci = [Vc*M for Vc, M in zip(Vci, Mi)]
+    Vci = asarray(Vci, dtype=float)*Mi
 
-    Mm = sum([M*x for M, x in zip(Mi, xi)])
+    Mm = xi.dot(Mi)
 
-    Vij = []
-    for Vc_i, C_i in zip(Vci, hydrocarbon):
-        Viji = []
-        for Vc_j, C_j in zip(Vci, hydrocarbon):
-            if C_i and C_j:
-                C = 0
-            else:
-                C = 0.1559
-            mu = abs((Vc_i-Vc_j)/(Vc_i+Vc_j))
-            Viji.append(-1.4684*mu + C)
-        Vij.append(Viji)
-
-    nuij = []
-    for Viji, Vc_i in zip(Vij, Vci):
-        nuiji = []
-        for V, Vc_j in zip(Viji, Vci):
-            nuiji.append(V*(Vc_i+Vc_j)/2)
-        nuij.append(nuiji)
+    C = where(outer(hydrocarbon, hydrocarbon), 0, 0.1559)
+    Vsum = Vci[:, None]+Vci
+    Vij = -1.4684*abs((Vci[:, None]-Vci)/Vsum) + C
+    nuij = Vij*Vsum/2
 
     # Eq 2
-    phii = []
-    for x_j, Vc_j in zip(xi, Vci):
-        suma = sum([x_i*Vc_i**(2/3) for x_i, Vc_i in zip(xi, Vci)])
-        phii.append(x_j*Vc_j**(2/3)/suma)
+    phii = xi*Vci**(2/3)
+    phii /= phii.sum()
 
     # Eq 4 generalized
-    sum1 = sum([phi*Vc for phi, Vc in zip(phii, Vci)])
-    sum2 = 0
-    for phi_i, nuiji in zip(phii, nuij):
-        for phi_j, nu in zip(phii, nuiji):
-            sum2 += phi_i*phi_j*nu
-    Vcm = sum1 + sum2
+    Vcm = phii.dot(Vci) + phii.dot(nuij).dot(phii)
 
     return unidades.SpecificVolume(Vcm/Mm)
 
@@ -441,7 +425,7 @@ def RhoL_RackettMix(T, xi, Tci, Pci, Vci, Zrai, Mi):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -458,7 +442,7 @@ def RhoL_RackettMix(T, xi, Tci, Pci, Vci, Zrai, Mi):
 
     Returns
     -------
-    rho : float
+    rho : float or array
         Bubble point liquid density at T, [kg/m³]
 
     Examples
@@ -491,54 +475,47 @@ def RhoL_RackettMix(T, xi, Tci, Pci, Vci, Zrai, Mi):
     >>> "%0.1f" % (1/RhoL_RackettMix(*args).gcc)
     '120.0'
     """
+    xi = asarray(xi, dtype=float)
+    Tci = asarray(Tci, dtype=float)
+    Pci = asarray(Pci, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+
     # Convert critical volumes to molar base
-    Vci = [Vc*M for Vc, M in zip(Vci, Mi)]
+    Vci = asarray(Vci, dtype=float)*Mi
 
     # Eq 11
-    Zram = 0
-    for x, Zra in zip(xi, Zrai):
-        Zram += x*Zra
+    Zram = xi.dot(Zrai)
 
     # Eq 13
-    suma = 0
-    for x, Vc in zip(xi, Vci):
-        suma += x*Vc
-    phi = []
-    for x, Vc in zip(xi, Vci):
-        phi.append(x*Vc/suma)
+    phi = xi*Vci/xi.dot(Vci)
 
     # Eq 16
-    kij = []
-    for Vc_i in Vci:
-        kiji = []
-        for Vc_j in Vci:
-            kiji.append(1-8*((Vc_i**(1/3)*Vc_j**(1/3))**0.5/(
-                Vc_i**(1/3)+Vc_j**(1/3)))**3)
-        kij.append(kiji)
+    V13 = Vci**(1/3)
+    kij = 1-8*((V13[:, None]*V13)**0.5/(V13[:, None]+V13))**3
 
     # Eq 15
-    Tcij = []
-    for Tc_i, kiji in zip(Tci, kij):
-        Tciji = []
-        for Tc_j, k in zip(Tci, kiji):
-            Tciji.append((Tc_i*Tc_j)**0.5*(1-k))
-        Tcij.append(Tciji)
+    Tcij = (Tci[:, None]*Tci)**0.5*(1-kij)
 
     # Eq 14
-    Tcm = 0
-    for phi_i, Tciji in zip(phi, Tcij):
-        for phi_j, Tc in zip(phi, Tciji):
-            Tcm += phi_i*phi_j*Tc
+    Tcm = phi.dot(Tcij).dot(phi)
 
     # Eq 10
-    suma = 0
-    for x, Tc, Pc in zip(xi, Tci, Pci):
-        suma += x*Tc/Pc*101325
-    Tr = T/Tcm
+    suma = xi.dot(Tci/Pci)*101325
+    Tr = asarray(T, dtype=float)/Tcm
     V = R_atml*suma*Zram**(1+(1-Tr)**(2/7))
 
-    Mm = sum([M*x for M, x in zip(Mi, xi)])
-    return unidades.Density(Mm/V)
+    Mm = xi.dot(Mi)
+    return unidades.Density.array(Mm/V)
+
+
+def _CostaldMix(xi, Tci, Vci):
+    """Mixing rules of Hankinson-Thomson for the characteristic volume and
+    the critical temperature of mixture, used in COSTALD method and its
+    compressed liquid extensions, with the volume in molar base"""
+    Tci = asarray(Tci, dtype=float)
+    Vcm = (xi.dot(Vci)+3*xi.dot(Vci**(2/3))*xi.dot(Vci**(1/3)))/4
+    Tcm = xi.dot((Vci*Tci)**0.5)**2/Vcm
+    return Vcm, Tcm
 
 
 @refDoc(__doi__, [10, 2, 3])
@@ -560,7 +537,7 @@ def RhoL_CostaldMix(T, xi, Tci, wi, Vci, Mi):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature [K]
     xi : list
         Mole fractions of components, [-]
@@ -575,7 +552,7 @@ def RhoL_CostaldMix(T, xi, Tci, wi, Vci, Mi):
 
     Returns
     -------
-    rho : float
+    rho : float or array
         Bubble point liquid density at T, [kg/m³]
 
     Examples
@@ -603,37 +580,24 @@ def RhoL_CostaldMix(T, xi, Tci, wi, Vci, Mi):
     >>> "%0.1f" % (1/RhoL_CostaldMix(*args).gcc)
     '119.5'
     """
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+
     # Convert critical volumes to molar base
-    Vci = [Vc*M for Vc, M in zip(Vci, Mi)]
+    Vci = asarray(Vci, dtype=float)*Mi
 
     # Apply mixing rules
     # Eq 24
-    wm = 0
-    for x, w in zip(xi, wi):
-        wm += x*w
-
-    # Eq 21
-    sum1 = 0
-    sum2 = 0
-    sum3 = 0
-    for x, Vc, Tc in zip(xi, Vci, Tci):
-        sum1 += x*Vc
-        sum2 += x*Vc**(2/3)
-        sum3 += x*Vc**(1/3)
-    Vcm = (sum1+3*sum2*sum3)/4
+    wm = xi.dot(wi)
 
     # Eq 19 & 21
-    Tcm = 0
-    for x_i, Vc_i, Tc_i in zip(xi, Vci, Tci):
-        for x_j, Vc_j, Tc_j in zip(xi, Vci, Tci):
-            Tcm += x_i*x_j*(Vc_i*Tc_i*Vc_j*Tc_j)**0.5
-    Tcm /= Vcm
+    Vcm, Tcm = _CostaldMix(xi, Tci, Vci)
 
-    Mm = sum([M*x for M, x in zip(Mi, xi)])
+    Mm = xi.dot(Mi)
 
     # Apply the pure component procedure with the mixing parameters
-    rho = RhoL_Costald(T, Tcm, wm, Vcm)
-    return unidades.Density(rho*Mm)
+    rho = RhoL_Costald(asarray(T, dtype=float), Tcm, wm, Vcm)
+    return unidades.Density.array(rho*Mm)
 
 
 @refDoc(__doi__, [11, 3])
@@ -657,7 +621,7 @@ def RhoL_AaltoKeskinenMix(T, P, xi, Tci, Pci, Vci, wi, Mi, rhos):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     P : float
         Pressure, [Pa]
@@ -678,7 +642,7 @@ def RhoL_AaltoKeskinenMix(T, P, xi, Tci, Pci, Vci, wi, Mi, rhos):
 
     Returns
     -------
-    rho : float
+    rho : float or array
         High-pressure liquid density, [kg/m³]
 
     Examples
@@ -696,41 +660,27 @@ def RhoL_AaltoKeskinenMix(T, P, xi, Tci, Pci, Vci, wi, Mi, rhos):
     >>> "%0.2f" % (1/RhoL_AaltoKeskinenMix(*args).gcc)
     '99.05'
     """
+    xi = asarray(xi, dtype=float)
+
     # Convert critical volumes to molar base
-    Vci = [Vc*M for Vc, M in zip(Vci, Mi)]
+    Vci = asarray(Vci, dtype=float)*asarray(Mi, dtype=float)
 
     # Apply mixing rules
     # Eq A5
-    wm = 0
-    for x, w in zip(xi, wi):
-        wm += x*w**0.5
-    wm *= wm
+    wm = xi.dot(asarray(wi, dtype=float)**0.5)**2
 
-    # Eq 2
-    sum1 = 0
-    sum2 = 0
-    sum3 = 0
-    for x, Vc, Tc in zip(xi, Vci, Tci):
-        sum1 += x*Vc
-        sum2 += x*Vc**(2/3)
-        sum3 += x*Vc**(1/3)
-    Vcm = (sum1+3*sum2*sum3)/4
-
-    # Eq 1
-    Tcm = 0
-    for x_i, Vc_i, Tc_i in zip(xi, Vci, Tci):
-        for x_j, Vc_j, Tc_j in zip(xi, Vci, Tci):
-            Tcm += x_i*x_j*(Vc_i*Tc_i*Vc_j*Tc_j)**0.5
-    Tcm /= Vcm
+    # Eq 1 & 2
+    Vcm, Tcm = _CostaldMix(xi, Tci, Vci)
 
     # Eq 4
     Pcm = (0.291-0.08*wm)*R*Tcm/Vcm*1000
 
+    T = asarray(T, dtype=float)
     Ps = _Pv(T, Tcm, Pcm, wm)
 
     # Apply the pure component procedure with the mixing parameters
     rho = RhoL_AaltoKeskinen(T, P, Tcm, Pcm, wm, Ps, rhos)
-    return unidades.Density(rho)
+    return unidades.Density.array(rho)
 
 
 @refDoc(__doi__, [12, 2])
@@ -770,7 +720,7 @@ def RhoL_TaitCostaldMix(T, P, xi, Tci, Vci, wi, Mi, rhos):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     P : float
         Pressure, [Pa]
@@ -789,7 +739,7 @@ def RhoL_TaitCostaldMix(T, P, xi, Tci, Vci, wi, Mi, rhos):
 
     Returns
     -------
-    rho : float
+    rho : float or array
         High-pressure liquid density, [kg/m³]
 
     Examples
@@ -813,41 +763,28 @@ def RhoL_TaitCostaldMix(T, P, xi, Tci, Vci, wi, Mi, rhos):
     >>> "%0.3f" % RhoL_TaitCostaldMix(*args).gcc
     '0.698'
     """
+    xi = asarray(xi, dtype=float)
+
     # Convert critical volumes to molar base
-    Vci = [Vc*M for Vc, M in zip(Vci, Mi)]
+    Vci = asarray(Vci, dtype=float)*asarray(Mi, dtype=float)
 
     # Apply mixing rules
     # Eq 16
-    wm = 0
-    for x, w in zip(xi, wi):
-        wm += x*w
-
-    # Eq 15
-    sum1 = 0
-    sum2 = 0
-    sum3 = 0
-    for x, Vc, Tc in zip(xi, Vci, Tci):
-        sum1 += x*Vc
-        sum2 += x*Vc**(2/3)
-        sum3 += x*Vc**(1/3)
-    Vcm = (sum1+3*sum2*sum3)/4
+    wm = xi.dot(wi)
 
-    # Eq 13
-    Tcm = 0
-    for x_i, Vc_i, Tc_i in zip(xi, Vci, Tci):
-        for x_j, Vc_j, Tc_j in zip(xi, Vci, Tci):
-            Tcm += x_i*x_j*(Vc_i*Tc_i*Vc_j*Tc_j)**0.5
-    Tcm /= Vcm
+    # Eq 13 & 15
+    Vcm, Tcm = _CostaldMix(xi, Tci, Vci)
 
     # Eq 17
     Pcm = (0.291-0.08*wm)*R*Tcm/Vcm*1000
 
     # Saturation Pressure
+    T = asarray(T, dtype=float)
     Ps = _Pv(T, Tcm, Pcm, wm)
 
     # Apply the pure component procedure with the mixing parameters
     rho = RhoL_TaitCostald(T, P, Tcm, Pcm, wm, Ps, rhos)
-    return unidades.Density(rho)
+    return unidades.Density.array(rho)
 
 
 @refDoc(__doi__, [13])
@@ -871,7 +808,7 @@ def RhoL_NasrifarMix(T, P, xi, Tci, Vci, wi, Mi, rhos):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     P : float
         Pressure, [Pa]
@@ -890,48 +827,34 @@ def RhoL_NasrifarMix(T, P, xi, Tci, Vci, wi, Mi, rhos):
 
     Returns
     -------
-    rho : float
+    rho : float or array
         High-pressure liquid density, [kg/m³]
     """
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+
     # Convert critical volumes to molar base
-    Vci = [Vc*M for Vc, M in zip(Vci, Mi)]
+    Vci = asarray(Vci, dtype=float)*Mi
 
     # Apply mixing rules
     # Eq 25
-    wm = 0
-    for x, w in zip(xi, wi):
-        wm += x*w
+    wm = xi.dot(wi)
 
-    # Eq 24
-    sum1 = 0
-    sum2 = 0
-    sum3 = 0
-    for x, Vc, Tc in zip(xi, Vci, Tci):
-        sum1 += x*Vc
-        sum2 += x*Vc**(2/3)
-        sum3 += x*Vc**(1/3)
-    Vcm = (sum1+3*sum2*sum3)/4
-
-    # Eq 22
-    Tcm = 0
-    for x_i, Vc_i, Tc_i in zip(xi, Vci, Tci):
-        for x_j, Vc_j, Tc_j in zip(xi, Vci, Tci):
-            Tcm += x_i*x_j*(Vc_i*Tc_i*Vc_j*Tc_j)**0.5
-    Tcm /= Vcm
-
-    Mm = 0
-    for x, M in zip(xi, Mi):
-        Mm += x*M
+    # Eq 22 & 24
+    Vcm, Tcm = _CostaldMix(xi, Tci, Vci)
+
+    Mm = xi.dot(Mi)
 
     # Eq 26
     Pcm = (0.291-0.08*wm)*R*Tcm/Vcm*1000
 
     # Saturation Pressure
+    T = asarray(T, dtype=float)
     Ps = _Pv(T, Tcm, Pcm, wm)
 
     # Apply the pure component procedure with the mixing parameters
     rho = RhoL_Nasrifar(T, P, Tcm, Pcm, wm, Mm, Ps, rhos)
-    return unidades.Density(rho)
+    return unidades.Density.array(rho)
 
 
 @refDoc(__doi__, [14, 2])
@@ -1003,11 +926,9 @@ def RhoL_APIMix(T, P, xi, Tci, Pci, rhos, To=None, Po=None):
         Po = 101325
 
     # Calculate pseudocritical properties
-    Tc = 0
-    Pc = 0
-    for x, Tc_i, Pc_i in zip(xi, Tci, Pci):
-        Tc += x*Tc_i
-        Pc += x*Pc_i
+    xi = asarray(xi, dtype=float)
+    Tc = xi.dot(Tci)
+    Pc = xi.dot(Pci)
 
     def C(Tr, Pr):
         """Polinomial ajust of Lu chart, referenced in [14]"""
@@ -1023,7 +944,7 @@ def RhoL_APIMix(T, P, xi, Tci, Pci, rhos, To=None, Po=None):
 
     # Eq 1
     d2 = rhos*C2/C1
-    return unidades.Density(d2)
+    return unidades.Density.array(d2)
 
 
 @refDoc(__doi__, [11, 12])
@@ -1056,7 +977,7 @@ def _Pv(T, Tcm, Pcm, wm):
     Pr1 = 4.86601*beta+0.03721754*alpha                                # Eq 21
 
     Pbp = Pcm*10**(Pro+wm*Pr1)
-    return unidades.Pressure(Pbp)
+    return unidades.Pressure.array(Pbp)
 
 
 # Liquid viscosity correlations
@@ -1148,6 +1069,20 @@ def MuL_Chemcad(xi, Mi, mui):
 
 
 # Gas viscosity correlations
+def _WilkeSum(xi, propi, phiij):
+    r"""Mixing rule with the form of Wilke method, used too in thermal
+    conductivity correlations, with the interaction parameters of pairs
+    including the unity diagonal
+
+    .. math::
+        \lambda_m = \sum_i \frac{x_i\lambda_i}{\sum_j x_j\phi_{ij}}
+
+    The property of components and the interaction parameters can have
+    additional leading dimensions for several states
+    """
+    return (xi*propi/(phiij*xi).sum(axis=-1)).sum(axis=-1)
+
+
 @refDoc(__doi__, [3])
 def MuG_Reichenberg(T, xi, Tci, Pci, Mi, mui, Di):
     r"""Calculate viscosity of gas mixtures using the Reichenberg method as
@@ -1189,7 +1124,7 @@ def MuG_Reichenberg(T, xi, Tci, Pci, Mi, mui, Di):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -1206,7 +1141,7 @@ def MuG_Reichenberg(T, xi, Tci, Pci, Mi, mui, Di):
 
     Returns
     -------
-    mu : float
+    mu : float or array
         Viscosity of mixture, [Pa·s]
 
     Examples
@@ -1223,78 +1158,49 @@ def MuG_Reichenberg(T, xi, Tci, Pci, Mi, mui, Di):
     >>> "%0.1f" % MuG_Reichenberg(T, x, Tc, Pc, M, mu, D).microP
     '146.2'
     """
+    xi = asarray(xi, dtype=float)
+    Tci = asarray(Tci, dtype=float)
+    Pci = asarray(Pci, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+    Di = asarray(Di, dtype=float)
+    mui = asarray(mui, dtype=float)
+    T = asarray(T, dtype=float)[..., None]
+
     # Calculate reduced temperatures
-    Tri = [T/Tc for Tc in Tci]
-    Trij = []
-    for Tc_i in Tci:
-        Triji = []
-        for Tc_j in Tci:
-            Triji.append(T/(Tc_i*Tc_j)**0.5)
-        Trij.append(Triji)
+    Tri = T/Tci
+    Trij = T[..., None]/(Tci[:, None]*Tci)**0.5
 
     # Calculate reduced viscosity
-    muri = [52.46*D**2*Pc*1e-5/Tc**2 for D, Pc, Tc in zip(Di, Pci, Tci)]
-    murij = []
-    for mur_i in muri:
-        muriji = []
-        for mur_j in muri:
-            muriji.append((mur_i*mur_j)**0.5)
-        murij.append(muriji)
+    muri = 52.46*Di**2*Pci*1e-5/Tci**2
+    murij = (muri[:, None]*muri)**0.5
 
     # Polar correction, Eq 9-5.5
-    Fri = []
-    for Tr, mur in zip(Tri, muri):
-        Fri.append((Tr**3.5+(10*mur)**7)/Tr**3.5/(1+(10*mur)**7))
-    Frij = []
-    for Triji, muriji in zip(Trij, murij):
-        Friji = []
-        for Tr, mur in zip(Triji, muriji):
-            Friji.append((Tr**3.5+(10*mur)**7)/Tr**3.5/(1+(10*mur)**7))
-        Frij.append(Friji)
+    Fri = (Tri**3.5+(10*muri)**7)/Tri**3.5/(1+(10*muri)**7)
+    Frij = (Trij**3.5+(10*murij)**7)/Trij**3.5/(1+(10*murij)**7)
 
     # Eq 9-5.3
-    Ui = []
-    for Tr, Fr in zip(Tri, Fri):
-        Ui.append((1+0.36*Tr*(Tr-1))**(1/6)*Fr/Tr**0.5)
+    Ui = (1+0.36*Tri*(Tri-1))**(1/6)*Fri/Tri**0.5
 
     # Eq 9-5.4
-    Ci = [M**0.25/(mu*U)**0.5 for M, mu, U in zip(Mi, mui, Ui)]
+    Ci = Mi**0.25/(mui*Ui)**0.5
 
-    # Eq 9-5.6
-    Hij = []
-    for M_i, C_i, Triji, Friji in zip(Mi, Ci, Trij, Frij):
-        Hiji = []
-        for M_j, C_j, Tr, Fr in zip(Mi, Ci, Triji, Friji):
-            Hiji.append((M_i*M_j/32/(M_i+M_j)**3)**0.5*(C_i+C_j)**2*(
-                        1+0.36*Tr*(Tr-1))**(1/6)*Fr/Tr**0.5)
-        Hij.append(Hiji)
+    # Eq 9-5.6, only the terms with i≠j are used
+    Hij = (Mi[:, None]*Mi/32/(Mi[:, None]+Mi)**3)**0.5 * \
+        (Ci[..., :, None]+Ci[..., None, :])**2 * \
+        (1+0.36*Trij*(Trij-1))**(1/6)*Frij/Trij**0.5
+    Hij = Hij*(1-eye(len(xi)))
 
     # Eq 9-5.2
-    sumai = []
-    for i, M_i in enumerate(Mi):
-        sumaij = 0
-        for j, M_j in enumerate(Mi):
-            if i != j:
-                sumaij += xi[j]*Hij[i][j]*(3+2*M_j/M_i)
-        sumai.append(sumaij)
-    Ki = [x*mu/(x+mu*suma) for x, mu, suma in zip(xi, mui, sumai)]
+    suma = (Hij*xi*(3+2*Mi/Mi[:, None])).sum(axis=-1)
+    Ki = xi*mui/(xi+mui*suma)
 
     # Eq 9-5.1
-    mu = 0
-    for i, K_i in enumerate(Ki):
-        sum1 = 0
-        for H, K_j in zip(Hij[i], Ki[:i]):
-            sum1 += H*K_j
-
-        sum2 = 0
-        for j, K_j in enumerate(Ki):
-            for k, K_k in enumerate(Ki):
-                if j != i and k != i:
-                    sum2 += Hij[i][j]*Hij[i][k]*K_j*K_k
+    HK = Hij*Ki[..., None, :]
+    sum1 = tril(HK).sum(axis=-1)
+    sum2 = HK.sum(axis=-1)**2
+    mu = (Ki*(1+2*sum1+sum2)).sum(axis=-1)
 
-        mu += K_i*(1+2*sum1+sum2)
-
-    return unidades.Viscosity(mu)
+    return unidades.Viscosity.array(mu)
 
 
 @refDoc(__doi__, [1, 2, 3])
@@ -1358,32 +1264,17 @@ def MuG_Wilke(xi, Mi, mui):
     >>> "%0.2f" % MuG_Wilke([0.697, 0.303], [16.043, 58.123], mui).microP
     '92.25'
     """
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+    mui = asarray(mui, dtype=float)
+
     # Eq 4
-    kij = []
-    for i, mi in enumerate(Mi):
-        kiji = []
-        for j, mj in enumerate(Mi):
-            if i == j:
-                kiji.append(0)
-            else:
-                kiji.append((1+(mui[i]/mui[j])**0.5*(mj/mi)**0.25)**2 /
-                            8**0.5/(1+mi/mj)**0.5)
-        kij.append(kiji)
+    phiij = (1+(mui[..., :, None]/mui[..., None, :])**0.5 *
+             (Mi/Mi[:, None])**0.25)**2/8**0.5/(1+Mi[:, None]/Mi)**0.5
 
     # Eq 13
-    # Precalculate of internal sum
-    suma = []
-    for i, Xi in enumerate(xi):
-        sumai = 0
-        if Xi != 0:
-            for j, Xj in enumerate(xi):
-                sumai += kij[i][j]*Xj/Xi
-        suma.append(sumai)
-
-    mu = 0
-    for mu_i, sumai in zip(mui, suma):
-        mu += mu_i/(1+sumai)
-    return unidades.Viscosity(mu)
+    mu = _WilkeSum(xi, mui, phiij)
+    return unidades.Viscosity.array(mu)
 
 
 @refDoc(__doi__, [3])
@@ -1420,28 +1311,13 @@ def MuG_Herning(xi, Mi, mui):
     >>> "%0.1f" % MuG_Herning([0.697, 0.303], [16.043, 58.123], mui).microP
     '92.8'
     """
-    kij = []
-    for i, mi in enumerate(Mi):
-        kiji = []
-        for j, mj in enumerate(Mi):
-            if i == j:
-                kiji.append(0)
-            else:
-                kiji.append((mj/mi)**0.5)
-        kij.append(kiji)
-
-    suma = []
-    for i, Xi in enumerate(xi):
-        sumai = 0
-        if Xi != 0:
-            for j, Xj in enumerate(xi):
-                sumai += kij[i][j]*Xj/Xi
-        suma.append(sumai)
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+    mui = asarray(mui, dtype=float)
 
-    mu = 0
-    for mu_i, sumai in zip(mui, suma):
-        mu += mu_i/(1+sumai)
-    return unidades.Viscosity(mu)
+    phiij = (Mi/Mi[:, None])**0.5
+    mu = _WilkeSum(xi, mui, phiij)
+    return unidades.Viscosity.array(mu)
 
 
 @refDoc(__doi__, [3])
@@ -1557,7 +1433,7 @@ def MuG_Lucas(T, P, xi, Tci, Pci, Vci, Zci, Mi, Di):
     # Calculate A factor
     Mh = max(Mi)
     Ml = min(Mi)
-    xh = xi[Mi.index(Mh)]
+    xh = xi[list(Mi).index(Mh)]
     if Mh/Ml > 9 and 0.05 < xh < 0.7:
         A = 1 - 0.01*(Mh/Ml)**0.87
     else:
@@ -1594,6 +1470,43 @@ def MuG_Lucas(T, P, xi, Tci, Pci, Vci, Zci, Mi, Di):
     return unidades.Viscosity(mu, "microP")
 
 
+def _ChungMix(xi, Tci, Vci, Mi, wi, Di=None, ki=None):
+    """Mixing rules of Chung method, with the critical volume in molar base,
+    Eq 14-27
+
+    Returns
+    -------
+    sm, ekm, wm, Mm, Dm, km : float
+        Mixture σ, ε/k, ω, M, dipole moment and association factor
+    """
+    Tci = asarray(Tci, dtype=float)
+    wi = asarray(wi, dtype=float)
+    xx = outer(xi, xi)
+
+    sigmai = 0.809*Vci**(1/3)                                           # Eq 4
+    eki = Tci/1.2593                                                    # Eq 5
+    sigmaij = (sigmai[:, None]*sigmai)**0.5                            # Eq 23
+    ekij = (eki[:, None]*eki)**0.5                                     # Eq 24
+    wij = (wi[:, None]+wi)/2                                           # Eq 25
+    Mij = 2*Mi[:, None]*Mi/(Mi[:, None]+Mi)                            # Eq 26
+
+    s3 = xx*sigmaij**3
+    sm3 = s3.sum()                                                     # Eq 14
+    sm = sm3**(1/3)
+    ekm = (s3*ekij).sum()/sm3                                          # Eq 15
+    wm = (s3*wij).sum()/sm3                                            # Eq 18
+    Mm = ((xx*ekij*sigmaij**2*Mij**0.5).sum()/(ekm*sm**2))**2          # Eq 19
+
+    Dm = km = 0
+    if Di is not None:
+        Di = asarray(Di, dtype=float)
+        Dm = ((xx*outer(Di, Di)**2/ekij/sigmaij**3).sum()*ekm*sm3)**0.25
+    if ki is not None:
+        ki = asarray(ki, dtype=float)
+        km = (xx*(ki[:, None]*ki)**0.5).sum()                      # Eq 21, 27
+    return sm, ekm, wm, Mm, Dm, km
+
+
 @refDoc(__doi__, [15, 3])
 def MuG_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki):
     r"""Calculate the viscosity of a gas mixture using the Chung correlation
@@ -1658,7 +1571,7 @@ def MuG_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -1677,7 +1590,7 @@ def MuG_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki):
 
     Returns
     -------
-    mu : float
+    mu : float or array
         Viscosity of gas, [Pa·s]
 
     Notes
@@ -1700,103 +1613,25 @@ def MuG_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki):
     >>> "%0.1f" % MuG_Chung(331, x, Tc, Vc, M, w, mu, k).microP
     '87.6'
     """
-    # Use critical volume in molar base
-    Vci = [Vc*M*1000 for Vc, M in zip(Vci, Mi)]
-
-    sigmai = [0.809*Vc**(1/3) for Vc in Vci]                            # Eq 4
-    eki = [Tc/1.2593 for Tc in Tci]                                     # Eq 5
-
-    # Eq 23
-    sigmaij = []
-    for s_i in sigmai:
-        sigmaiji = []
-        for s_j in sigmai:
-            sigmaiji.append((s_i*s_j)**0.5)
-        sigmaij.append(sigmaiji)
-
-    # Eq 24
-    ekij = []
-    for ek_i in eki:
-        ekiji = []
-        for ek_j in eki:
-            ekiji.append((ek_i*ek_j)**0.5)
-        ekij.append(ekiji)
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
 
-    # Eq 25
-    wij = []
-    for w_i in wi:
-        wiji = []
-        for w_j in wi:
-            wiji.append((w_i+w_j)/2)
-        wij.append(wiji)
-
-    # Eq 26
-    Mij = []
-    for M_i in Mi:
-        Miji = []
-        for M_j in Mi:
-            Miji.append(2*M_i*M_j/(M_i+M_j))
-        Mij.append(Miji)
-
-    # Eq 27
-    kij = []
-    for k_i in ki:
-        kiji = []
-        for k_j in ki:
-            kiji.append((k_i*k_j)**0.5)
-        kij.append(kiji)
-
-    # Eq 14
-    sm = 0
-    for x_i, sigmaiji in zip(xi, sigmaij):
-        for x_j, sij in zip(xi, sigmaiji):
-            sm += x_i*x_j*sij**3
-    sm = sm**(1/3)
+    # Use critical volume in molar base
+    Vci = asarray(Vci, dtype=float)*Mi*1000
 
-    # Eq 15
-    ekm = 0
-    for x_i, sigmaiji, ekiji in zip(xi, sigmaij, ekij):
-        for x_j, sij, ek in zip(xi, sigmaiji, ekiji):
-            ekm += x_i*x_j*ek*sij**3
-    ekm /= sm**3
-
-    # Eq 18
-    wm = 0
-    for x_i, sigmaiji, wiji in zip(xi, sigmaij, wij):
-        for x_j, sij, w in zip(xi, sigmaiji, wiji):
-            wm += x_i*x_j*w*sij**3
-    wm /= sm**3
-
-    # Eq 19
-    Mm = 0
-    for x_i, sigmaiji, ekiji, Miji in zip(xi, sigmaij, ekij, Mij):
-        for x_j, s, ek, M in zip(xi, sigmaiji, ekiji, Miji):
-            Mm += x_i*x_j*ek*s**2*M**0.5
-    Mm = (Mm/(ekm*sm**2))**2
-
-    # Eq 20
-    Dm = 0
-    for x_i, sigmaiji, ekiji, D_i in zip(xi, sigmaij, ekij, Di):
-        for x_j, s, ek, D_j in zip(xi, sigmaiji, ekiji, Di):
-            Dm += x_i*x_j*(D_i*D_j)**2/ek/s**3
-    Dm = (Dm*ekm*sm**3)**0.25
-
-    # Eq 21
-    km = 0
-    for x_i, kiji in zip(xi, kij):
-        for x_j, k in zip(xi, kiji):
-            km += x_i*x_j*k
+    sm, ekm, wm, Mm, Dm, km = _ChungMix(xi, Tci, Vci, Mi, wi, Di, ki)
 
     Vcm = (sm/0.809)**3                                                # Eq 16
     Tcm = 1.2593*ekm                                                   # Eq 17
     murm = 131.3*Dm/(Vcm*Tcm)**0.5                                     # Eq 22
 
+    T = asarray(T, dtype=float)
     T_ = T/ekm
     omega = Collision_Neufeld(T_)
 
     Fcm = 1 - 0.2756*wm + 0.059035*murm**4 + km                         # Eq 7
     mu = 40.785*Fcm*Mm**0.5*T**0.5/Vcm**(2/3)/omega                     # Eq 6
-    return unidades.Viscosity(mu, "microP")
+    return unidades.Viscosity.array(mu, "microP")
 
 
 @refDoc(__doi__, [15, 1])
@@ -1808,7 +1643,7 @@ def MuG_P_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki, rho, muo):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -1831,102 +1666,23 @@ def MuG_P_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki, rho, muo):
 
     Returns
     -------
-    mu : float
+    mu : float or array
         Viscosity of gas mixture, [Pa·s]
     """
-    # Use critical volume in molar base
-    Vci = [Vc*M*1000 for Vc, M in zip(Vci, Mi)]
-
-    sigmai = [0.809*Vc**(1/3) for Vc in Vci]                            # Eq 4
-    eki = [Tc/1.2593 for Tc in Tci]                                     # Eq 5
-
-    # Eq 23
-    sigmaij = []
-    for s_i in sigmai:
-        sigmaiji = []
-        for s_j in sigmai:
-            sigmaiji.append((s_i*s_j)**0.5)
-        sigmaij.append(sigmaiji)
-
-    # Eq 24
-    ekij = []
-    for ek_i in eki:
-        ekiji = []
-        for ek_j in eki:
-            ekiji.append((ek_i*ek_j)**0.5)
-        ekij.append(ekiji)
-
-    # Eq 25
-    wij = []
-    for w_i in wi:
-        wiji = []
-        for w_j in wi:
-            wiji.append((w_i+w_j)/2)
-        wij.append(wiji)
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
 
-    # Eq 26
-    Mij = []
-    for M_i in Mi:
-        Miji = []
-        for M_j in Mi:
-            Miji.append(2*M_i*M_j/(M_i+M_j))
-        Mij.append(Miji)
-
-    # Eq 27
-    kij = []
-    for k_i in ki:
-        kiji = []
-        for k_j in ki:
-            kiji.append((k_i*k_j)**0.5)
-        kij.append(kiji)
+    # Use critical volume in molar base
+    Vci = asarray(Vci, dtype=float)*Mi*1000
 
-    # Eq 14
-    sm = 0
-    for x_i, sigmaiji in zip(xi, sigmaij):
-        for x_j, sij in zip(xi, sigmaiji):
-            sm += x_i*x_j*sij**3
-    sm = sm**(1/3)
+    sm, ekm, wm, Mm, Dm, km = _ChungMix(xi, Tci, Vci, Mi, wi, Di, ki)
 
-    # Eq 15
-    ekm = 0
-    for x_i, sigmaiji, ekiji in zip(xi, sigmaij, ekij):
-        for x_j, sij, ek in zip(xi, sigmaiji, ekiji):
-            ekm += x_i*x_j*ek*sij**3
-    ekm /= sm**3
-
-    # Eq 18
-    wm = 0
-    for x_i, sigmaiji, wiji in zip(xi, sigmaij, wij):
-        for x_j, sij, w in zip(xi, sigmaiji, wiji):
-            wm += x_i*x_j*w*sij**3
-    wm /= sm**3
-
-    # Eq 19
-    Mm = 0
-    for x_i, sigmaiji, ekiji, Miji in zip(xi, sigmaij, ekij, Mij):
-        for x_j, s, ek, M in zip(xi, sigmaiji, ekiji, Miji):
-            Mm += x_i*x_j*ek*s**2*M**0.5
-    Mm = (Mm/(ekm*sm**2))**2
-
-    # Eq 20
-    Dm = 0
-    for x_i, sigmaiji, ekiji, D_i in zip(xi, sigmaij, ekij, Di):
-        for x_j, s, ek, D_j in zip(xi, sigmaiji, ekiji, Di):
-            Dm += x_i*x_j*(D_i*D_j)**2/ek/s**3
-    Dm = (Dm*ekm*sm**3)**0.25
-
-    # Eq 21
-    km = 0
-    for x_i, kiji in zip(xi, kij):
-        for x_j, k in zip(xi, kiji):
-            km += x_i*x_j*k
-
-    rho = rho/Mm/1000
+    rho = asarray(rho, dtype=float)/Mm/1000
     Vcm = (sm/0.809)**3                                                # Eq 16
     Tcm = 1.2593*ekm                                                   # Eq 17
     murm = 131.3*Dm/(Vcm*Tcm)**0.5                                     # Eq 22
 
-    T_ = T/ekm
+    T_ = asarray(T, dtype=float)/ekm
 
     # Table II
     dat = [
@@ -1951,11 +1707,48 @@ def MuG_P_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki, rho, muo):
     G1 = (1-0.5*Y)/(1-Y)**3
     G2 = (A1*((1-exp(-A4*Y))/Y)+A2*G1*exp(A5*Y)+A3*G1)/(A1*A4+A2+A3)
 
-    muk = muo*(1/G2 + A6*Y)
+    muk = asarray(muo, dtype=float)*(1/G2 + A6*Y)
     mup = (36.344e-6*(Mm*Tcm)**0.5/Vcm**(2/3))*A7*Y**2*G2*exp(
         A8+A9/T_+A10/T_**2)
 
-    return unidades.Viscosity(muk+mup, "P")
+    return unidades.Viscosity.array(muk+mup, "P")
+
+
+# Reference fluid properties of TRAPP method, propane
+_TcR = 369.83
+_rhocR = 1/200  # mol/cm³
+_ZcR = 0.276
+_wR = 0.152
+
+
+def _TRAPPShape(T, xi, Tci, Vci, Zci, wi):
+    """Shape factors of TRAPP method, with the critical volume in molar base
+    and the temperature with a last dimension to broadcast with components
+
+    Returns
+    -------
+    hi : array
+        Shape factor h of components
+    fij, hij : array
+        Shape factors of pairs, Eq 9-7.4 and 9-7.5
+    fm, hm : array
+        Shape factors of mixture, Eq 9-7.2 and 9-7.3
+    """
+    Tci = asarray(Tci, dtype=float)
+    wi = asarray(wi, dtype=float)
+    lnTr = log(T/Tci)
+    fi = Tci/_TcR*(1+(wi-_wR)*(0.05203-0.7498*lnTr))
+    hi = _rhocR*Vci*_ZcR/asarray(Zci, dtype=float)*(
+        1-(wi-_wR)*(0.1436-0.2822*lnTr))
+
+    fij = (fi[..., :, None]*fi[..., None, :])**0.5
+    hi3 = hi**(1/3)
+    hij = (hi3[..., :, None]+hi3[..., None, :])**3/8
+
+    xx = outer(xi, xi)
+    hm = (xx*hij).sum(axis=(-2, -1))
+    fm = (xx*fij*hij).sum(axis=(-2, -1))/hm
+    return hi, fij, hij, fm, hm
 
 
 @refDoc(__doi__, [1, 21, 16, 17])
@@ -2037,7 +1830,7 @@ def MuG_TRAPP(T, P, xi, Tci, Vci, Zci, Mi, wi, rho, muo):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -2058,7 +1851,7 @@ def MuG_TRAPP(T, P, xi, Tci, Vci, Zci, Mi, wi, rho, muo):
 
     Returns
     -------
-    mu : float
+    mu : float or array
         Viscosity of gas, [Pa·s]
 
     Examples
@@ -2076,75 +1869,34 @@ def MuG_TRAPP(T, P, xi, Tci, Vci, Zci, Mi, wi, rho, muo):
     >>> "%0.1f" % mu.muPas
     '82.6'
     """
-    # Reference fluid properties, propane
-    TcR = 369.83
-    rhocR = 1/200  # mol/cm³
-    ZcR = 0.276
-    wR = 0.152
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+    T = asarray(T, dtype=float)
 
     # Convert volume to molar base
-    Vci = [Vc*M*1000 for Vc, M in zip(Vci, Mi)]
-    Mm = sum([x*M for x, M in zip(xi, Mi)])
-    rho = rho/Mm
+    Vci = asarray(Vci, dtype=float)*Mi*1000
+    Mm = xi.dot(Mi)
+    rho = asarray(rho, dtype=float)/Mm
 
-    # Calculate shape factor for mixture
-    fi = []
-    hi = []
-    for Tc, Vc, Zc, w in zip(Tci, Vci, Zci, wi):
-        fi.append(Tc/TcR*(1+(w-wR)*(0.05203-0.7498*log(T/Tc))))
-        hi.append(rhocR*Vc*ZcR/Zc*(1-(w-wR)*(0.1436-0.2822*log(T/Tc))))
-
-    # Eq 9-7.5
-    fij = []
-    for f_i in fi:
-        fiji = []
-        for f_j in fi:
-            fiji.append((f_i*f_j)**0.5)
-        fij.append(fiji)
-
-    # Eq 9-7.4
-    hij = []
-    for h_i in hi:
-        hiji = []
-        for h_j in hi:
-            hiji.append((h_i**(1/3)+h_j**(1/3))**3/8)
-        hij.append(hiji)
-
-    # Eq 9-7.2
-    hm = 0
-    for x_i, hiji in zip(xi, hij):
-        for x_j, h in zip(xi, hiji):
-            hm += x_i*x_j*h
-
-    # Eq 9-7.3
-    fm = 0
-    for x_i, hiji, fiji in zip(xi, hij, fij):
-        for x_j, h, f in zip(xi, hiji, fiji):
-            fm += x_i*x_j*f*h/hm
+    # Calculate shape factor for mixture, Eq 9-7.2 to 9-7.5
+    hi, fij, hij, fm, hm = _TRAPPShape(T[..., None], xi, Tci, Vci, Zci, wi)
+    xx = outer(xi, xi)
 
     # Eq 9-7.9
-    Mij = []
-    for M_i in Mi:
-        Miji = []
-        for M_j in Mi:
-            Miji.append(2*M_i*M_j/(M_i+M_j))
-        Mij.append(Miji)
+    Mij = 2*Mi[:, None]*Mi/(Mi[:, None]+Mi)
 
     To = T/fm                                                       # Eq 9-7.6
     rho0 = rho/1000*hm                                              # Eq 9-7.7
 
     # Eq 9-7.8
-    suma = 0
-    for x_i, fiji, Miji, hiji in zip(xi, fij, Mij, hij):
-        for x_j, f, M, h in zip(xi, fiji, Miji, hiji):
-            suma += x_i*x_j*(f*M)**0.5*h**(4/3)
+    suma = (xx*(fij*Mij)**0.5*hij**(4/3)).sum(axis=(-2, -1))
     Fnm = 44.094**-0.5/hm**2*suma
 
     # Calculation of reference residual viscosity
     # Coefficients in [16]_, pag 796
     # Density are in mol/dm³
-    rho0 *= 1000
-    rhocR *= 1000
+    rho0 = rho0*1000
+    rhocR = _rhocR*1000
     G = -14.113294896 + 968.22940153/To
     H = rho0**0.5*(rho0-rhocR)/rhocR
     G2 = 13.686545032 - 12511.628378/To**1.5
@@ -2153,98 +1905,50 @@ def MuG_TRAPP(T, P, xi, Tci, Vci, Zci, Mi, wi, rho, muo):
     muR = exp(F)-exp(G)
 
     # Calculate of Δη
-    sigmai = [4.771*h**(1/3) for h in hi]
-    sigmaij = []
-    for s_i in sigmai:
-        sigmaiji = []
-        for s_j in sigmai:
-            sigmaiji.append((s_i+s_j)/2)
-        sigmaij.append(sigmaiji)
+    sigmai = 4.771*hi**(1/3)
+    sigmaij = (sigmai[..., :, None]+sigmai[..., None, :])/2
 
     # Eq 9-7.16
-    X = 6.023e-4*pi/6*rho*sum([x*s**3 for x, s in zip(xi, sigmai)])
+    sum2 = (xi*sigmai**2).sum(axis=-1)
+    sum3 = (xi*sigmai**3).sum(axis=-1)
+    X = 6.023e-4*pi/6*rho*sum3
 
     # Eq 9-7.15
-    sum2 = sum([x*s**2 for x, s in zip(xi, sigmai)])
-    sum3 = sum([x*s**3 for x, s in zip(xi, sigmai)])
-    titaij = []
-    for s_i, siji in zip(sigmai, sigmaij):
-        titaiji = []
-        for s_j, sij in zip(sigmai, siji):
-            titaiji.append(s_i*s_j/2/sij*sum2/sum3)
-        titaij.append(titaiji)
+    titaij = sigmai[..., :, None]*sigmai[..., None, :]/2/sigmaij * \
+        (sum2/sum3)[..., None, None]
 
     # Eq 9-7.14
-    gij = []
-    for titaiji in titaij:
-        giji = []
-        for tij in titaiji:
-            giji.append(1/(1-X)+3*X/(1-X)**2*tij+2*X**2/(1-X)**3*tij**2)
-        gij.append(giji)
+    Xij = X[..., None, None]
+    gij = 1/(1-Xij)+3*Xij/(1-Xij)**2*titaij+2*Xij**2/(1-Xij)**3*titaij**2
 
     # Eq 9-3.8
-    muij = []
-    for miji, siji in zip(Mij, sigmaij):
-        muiji = []
-        for m, s in zip(miji, siji):
-            muiji.append(2.669*(m*T)**0.5/s**2)
-        muij.append(muiji)
+    muij = 2.669*(Mij*T[..., None, None])**0.5/sigmaij**2
 
     # Eq 9-7.19
-    Bij = []
-    for i, M_i in enumerate(Mi):
-        Biji = []
-        for j, M_j in enumerate(Mi):
-            B = 0
-            for k, M_k in enumerate(Mi):
-                if i == j:
-                    dij = 1
-                else:
-                    dij = 0
-                if j == k:
-                    djk = 1
-                else:
-                    djk = 0
-                B += xi[i]*xi[k]*gij[i][k]/muij[i][k]*(M_k/(M_i+M_k))**2*(
-                    (1+5/3*M_i/M_k)*dij - 2/3*M_i/M_k*djk)
-            B *= 2e-1
-            Biji.append(B)
-        Bij.append(Biji)
+    Qij = xx*gij/muij*(Mi/(Mi[:, None]+Mi))**2
+    MiMj = Mi[:, None]/Mi
+    Bij = 2e-1*(eye(len(xi))*(Qij*(1+5/3*MiMj)).sum(axis=-1)[..., None] -
+                2/3*Qij*MiMj)
 
     # Eq 9-7.17
-    Yi = []
-    for x_i, M_i, siji, giji in zip(xi, Mi, sigmaij, gij):
-        suma = 0
-        for x_j, M_j, s, g in zip(xi, Mi, siji, giji):
-            suma += x_j*M_j/(M_i+M_j)*s**3*g
-        Yi.append(x_i*(1+8*pi/15*6.023e-4*rho*suma))
+    suma = (xi*Mi/(Mi[:, None]+Mi)*sigmaij**3*gij).sum(axis=-1)
+    Yi = xi*(1+8*pi/15*6.023e-4*rho[..., None]*suma)
 
     # Eq 9-7.18
-    betai = solve(Bij, Yi)
+    betai = solve(Bij, Yi[..., None])[..., 0]
 
     # Eq 9-7.11
-    sum1 = sum([b*Y for b, Y in zip(betai, Yi)])
-    sum2 = 0
-    for x_i, siji, muiji, giji in zip(xi, sigmaij, muij, gij):
-        for x_j, s, mu, g in zip(xi, siji, muiji, giji):
-            sum2 += x_i*x_j*s**6*mu*g
+    sum1 = (betai*Yi).sum(axis=-1)
+    sum2 = (xx*sigmaij**6*muij*gij).sum(axis=(-2, -1))
     alfa = 48/25/pi*(2*pi/3*6.023e-4)**2
     eta_m = sum1 + alfa*10*rho**2*sum2
 
     # ηx for pure hypothethical fluid
     # Eq 9-7.20
-    sigmax = 0
-    for x_i, siji in zip(xi, sigmaij):
-        for x_j, s in zip(xi, siji):
-            sigmax += x_i*x_j*s**3
-    sigmax = sigmax**(1/3)
+    sigmax = (xx*sigmaij**3).sum(axis=(-2, -1))**(1/3)
 
     # Eq 9-7.21
-    Mx = 0
-    for x_i, siji, Miji in zip(xi, sigmaij, Mij):
-        for x_j, s, M in zip(xi, siji, Miji):
-            Mx += x_i*x_j*M**0.5*s**4
-    Mx = Mx**2/sigmax**8
+    Mx = (xx*Mij**0.5*sigmaij**4).sum(axis=(-2, -1))**2/sigmax**8
 
     X = 6.023e-4*pi/6*rho*sigmax**3
     gxx = 1/(1-X)+3*X/(1-X)**2*0.5+2*X**2/(1-X)**3*0.25
@@ -2257,7 +1961,8 @@ def MuG_TRAPP(T, P, xi, Tci, Vci, Zci, Mi, wi, rho, muo):
     # Eq 9-7.10
     # The 0.1 factor because this values are im μP, to convert to μPa·s
     Dmu = (eta_m-eta_x)*0.1
-    return unidades.Viscosity(Fnm*muR + Dmu + muo*1e6, "muPas")
+    mu = Fnm*muR + Dmu + asarray(muo, dtype=float)*1e6
+    return unidades.Viscosity.array(mu, "muPas")
 
 
 @refDoc(__doi__, [19, 2])
@@ -2421,32 +2126,23 @@ def ThL_Li(xi, Vi, Mi, ki):
     >>> "%0.5f" % ThL_Li([0.68, 0.32], [V1, V2], [1, 1], [k1, k2]).BtuhftF
     '0.07751'
     """
+    xi = asarray(xi, dtype=float)
+    ki = asarray(ki, dtype=float)
+
     # Use critical volume in molar base
-    Vi = [V*M*1000 for V, M in zip(Vi, Mi)]
+    Vi = asarray(Vi, dtype=float)*asarray(Mi, dtype=float)*1000
 
     # Calculation of binary thermal conductivity pair, Eq 2
-    kij = []
-    for k_i in ki:
-        kiji = []
-        for k_j in ki:
-            kiji.append(2/(1/k_i+1/k_j))
-        kij.append(kiji)
+    kij = 2/(1/ki[..., :, None]+1/ki[..., None, :])
 
     # Calculation of volume fraction, Eq 3
-    suma = 0
-    for x, V in zip(xi, Vi):
-        suma += x*V
-    phi = []
-    for x, V in zip(xi, Vi):
-        phi.append(x*V/suma)
+    phi = xi*Vi
+    phi = phi/phi.sum(axis=-1)[..., None]
 
     # Calculation of misture thermal conductivity, Eq 1
-    k = 0
-    for phi_i, ki in zip(phi, kij):
-        for phi_j, k_ij in zip(phi, ki):
-            k += phi_i*phi_j*k_ij
+    k = (phi[..., :, None]*phi[..., None, :]*kij).sum(axis=(-2, -1))
 
-    return unidades.ThermalConductivity(k)
+    return unidades.ThermalConductivity.array(k)
 
 
 @refDoc(__doi__, [3])
@@ -2501,7 +2197,7 @@ def ThG_LindsayBromley(T, xi, Mi, Tbi, mui, ki):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -2516,7 +2212,7 @@ def ThG_LindsayBromley(T, xi, Mi, Tbi, mui, ki):
 
     Returns
     -------
-    k : float
+    k : float or array
         Thermal conductivities of mixture, [W/m·K]
 
     Examples
@@ -2536,43 +2232,28 @@ def ThG_LindsayBromley(T, xi, Mi, Tbi, mui, ki):
     >>> "%0.5f" % k.BtuhftF
     '0.01197'
     """
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+    mui = asarray(mui, dtype=float)
+    T = asarray(T, dtype=float)[..., None, None]
+
     # Calculation of Sutherland constants, Eq 14
-    S = []
-    for Tb, M in zip(Tbi, Mi):
-        if M == 2.0158 or M == 4.0026:
-            # Hydrogen or helium case
-            S.append(79)
-        else:
-            S.append(1.5*Tb)
+    # Hydrogen or helium case with fixed value
+    S = where((Mi == 2.0158) | (Mi == 4.0026), 79,
+              1.5*asarray(Tbi, dtype=float))
 
     # Geometric mean of collision Sutherland constants, Eq 15
-    Sij = []
-    for Si in S:
-        Siji = []
-        for Sj in S:
-            Siji.append((Si*Sj)**0.5)
-        Sij.append(Siji)
+    Sij = (S[:, None]*S)**0.5
 
     # Eq 12
-    Aij = []
-    for mu_i, M_i, Si, Siji in zip(mui, Mi, S, Sij):
-        Aiji = []
-        for mu_j, M_j, Sj, S_ij in zip(mui, Mi, S, Siji):
-            Aiji.append(0.25*(1+(mu_i/mu_j*(M_j/M_i)**0.75*(1+Si/T)/(
-                1+Sj/T))**0.5)**2 * (1+S_ij/T)/(1+Si/T))
-        Aij.append(Aiji)
+    Si = 1+S[:, None]/T
+    Sj = 1+S/T
+    Aij = 0.25*(1+(mui[..., :, None]/mui[..., None, :]*(Mi/Mi[:, None])**0.75 *
+                   Si/Sj)**0.5)**2 * (1+Sij/T)/Si
 
     # Calculate thermal conductivity, Eq 11
-    sumaj = []
-    for Aiji in Aij:
-        suma = 0
-        for xj, A_ij in zip(xi, Aiji):
-            suma += A_ij*xj
-        sumaj.append(suma)
-    k = 0
-    for x_i, k_i, si in zip(xi, ki, sumaj):
-        k += k_i*x_i/si
-    return unidades.ThermalConductivity(k)
+    k = _WilkeSum(xi, asarray(ki, dtype=float), Aij)
+    return unidades.ThermalConductivity.array(k)
 
 
 @refDoc(__doi__, [6, 3])
@@ -2618,27 +2299,18 @@ def ThG_MasonSaxena(xi, Mi, mui, ki):
     >>> "%0.4f" % ThG_MasonSaxena(xi, Mi, mui, ki)
     '0.0184'
     """
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+    mui = asarray(mui, dtype=float)
+
     # Aij coefficient with ε=1 as explain in [3]_, Eq 21
-    Aij = []
-    for mu_i, M_i in zip(mui, Mi):
-        Aiji = []
-        for mu_j, M_j in zip(mui, Mi):
-            # Monatomic value of thermal conductivity ratio, Eq 22
-            lt_ij = mu_i*M_j/mu_j/M_i
-            Aiji.append((1+lt_ij**0.5*(M_i/M_j)**0.25)**2/(8*(1+M_i/M_j))**0.5)
-        Aij.append(Aiji)
+    # Monatomic value of thermal conductivity ratio, Eq 22
+    lt_ij = mui[..., :, None]*Mi/mui[..., None, :]/Mi[:, None]
+    Aij = (1+lt_ij**0.5*(Mi[:, None]/Mi)**0.25)**2/(8*(1+Mi[:, None]/Mi))**0.5
 
     # Calculate thermal conductivity, Eq 20
-    sumaj = []
-    for Aiji in Aij:
-        suma = 0
-        for xj, A_ij in zip(xi, Aiji):
-            suma += A_ij*xj
-        sumaj.append(suma)
-    k = 0
-    for x_i, k_i, si in zip(xi, ki, sumaj):
-        k += k_i*x_i/si
-    return unidades.ThermalConductivity(k)
+    k = _WilkeSum(xi, asarray(ki, dtype=float), Aij)
+    return unidades.ThermalConductivity.array(k)
 
 
 @refDoc(__doi__, [15, 1])
@@ -2664,7 +2336,7 @@ def ThG_Chung(T, xi, Tci, Vci, Mi, wi, Cvi, mu):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -2683,7 +2355,7 @@ def ThG_Chung(T, xi, Tci, Vci, Mi, wi, Cvi, mu):
 
     Returns
     -------
-    k : float
+    k : float or array
         Thermal conductivity, [W/m/k]
 
     Examples
@@ -2705,76 +2377,18 @@ def ThG_Chung(T, xi, Tci, Vci, Mi, wi, Cvi, mu):
     >>> "%0.4f" % ThG_Chung(T, xi, Tci, Vci, Mi, wi, Cvi, mu)
     '0.0222'
     """
-    # Molar values
-    Vci = [Vc*M*1000 for Vc, M in zip(Vci, Mi)]
-    Cvi = [Cv*M/1000 for Cv, M in zip(Cvi, Mi)]
-    Cvm = sum([x*Cv for x, Cv in zip(xi, Cvi)])
-
-    sigmai = [0.809*Vc**(1/3) for Vc in Vci]                            # Eq 4
-    eki = [Tc/1.2593 for Tc in Tci]                                     # Eq 5
-
-    # Eq 23
-    sigmaij = []
-    for s_i in sigmai:
-        sigmaiji = []
-        for s_j in sigmai:
-            sigmaiji.append((s_i*s_j)**0.5)
-        sigmaij.append(sigmaiji)
-
-    # Eq 24
-    ekij = []
-    for ek_i in eki:
-        ekiji = []
-        for ek_j in eki:
-            ekiji.append((ek_i*ek_j)**0.5)
-        ekij.append(ekiji)
-
-    # Eq 25
-    wij = []
-    for w_i in wi:
-        wiji = []
-        for w_j in wi:
-            wiji.append((w_i+w_j)/2)
-        wij.append(wiji)
-
-    # Eq 26
-    Mij = []
-    for M_i in Mi:
-        Miji = []
-        for M_j in Mi:
-            Miji.append(2*M_i*M_j/(M_i+M_j))
-        Mij.append(Miji)
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
 
-    # Eq 14
-    sm = 0
-    for x_i, sigmaiji in zip(xi, sigmaij):
-        for x_j, sij in zip(xi, sigmaiji):
-            sm += x_i*x_j*sij**3
-    sm = sm**(1/3)
+    # Molar values
+    Vci = asarray(Vci, dtype=float)*Mi*1000
+    Cvi = asarray(Cvi, dtype=float)*Mi/1000
+    Cvm = (xi*Cvi).sum(axis=-1)
 
-    # Eq 15
-    ekm = 0
-    for x_i, sigmaiji, ekiji in zip(xi, sigmaij, ekij):
-        for x_j, sij, ek in zip(xi, sigmaiji, ekiji):
-            ekm += x_i*x_j*ek*sij**3
-    ekm /= sm**3
-
-    # Eq 18
-    wm = 0
-    for x_i, sigmaiji, wiji in zip(xi, sigmaij, wij):
-        for x_j, sij, w in zip(xi, sigmaiji, wiji):
-            wm += x_i*x_j*w*sij**3
-    wm /= sm**3
-
-    # Eq 19
-    Mm = 0
-    for x_i, sigmaiji, ekiji, Miji in zip(xi, sigmaij, ekij, Mij):
-        for x_j, s, ek, M in zip(xi, sigmaiji, ekiji, Miji):
-            Mm += x_i*x_j*ek*s**2*M**0.5
-    Mm = (Mm/(ekm*sm**2))**2
+    sm, ekm, wm, Mm, Dm, km = _ChungMix(xi, Tci, Vci, Mi, wi)
 
     Tcm = 1.2593*ekm
-    Trm = T/Tcm
+    Trm = asarray(T, dtype=float)/Tcm
 
     alpha = Cvm/R - 1.5
     beta = 0.7862 - 0.7109*wm + 1.3168*wm**2
@@ -2783,8 +2397,8 @@ def ThG_Chung(T, xi, Tci, Vci, Mi, wi, Cvi, mu):
         0.6366 + beta*Z + 1.061*alpha*beta))
 
     # Eq 9
-    k = 7.452*mu*10/Mm*phi   # Viscosity in P
-    return unidades.ThermalConductivity(k, "calscmK")
+    k = 7.452*asarray(mu, dtype=float)*10/Mm*phi   # Viscosity in P
+    return unidades.ThermalConductivity.array(k, "calscmK")
 
 
 @refDoc(__doi__, [15, 1])
@@ -2797,7 +2411,7 @@ def ThG_P_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki, rho, ko):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -2820,7 +2434,7 @@ def ThG_P_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki, rho, ko):
 
     Returns
     -------
-    k : float
+    k : float or array
         High-pressure gas thermal conductivity [W/m/k]
 
     Examples
@@ -2839,101 +2453,22 @@ def ThG_P_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki, rho, ko):
     '0.058'
     """
     # Thermal conductivity in procedure in cal/s·cm·K
-    ko = unidades.ThermalConductivity(ko).calscmK
-
-    # Use critical volume in molar base
-    Vci = [Vc*M*1000 for Vc, M in zip(Vci, Mi)]
-
-    sigmai = [0.809*Vc**(1/3) for Vc in Vci]                            # Eq 4
-    eki = [Tc/1.2593 for Tc in Tci]                                     # Eq 5
-
-    # Eq 23
-    sigmaij = []
-    for s_i in sigmai:
-        sigmaiji = []
-        for s_j in sigmai:
-            sigmaiji.append((s_i*s_j)**0.5)
-        sigmaij.append(sigmaiji)
-
-    # Eq 24
-    ekij = []
-    for ek_i in eki:
-        ekiji = []
-        for ek_j in eki:
-            ekiji.append((ek_i*ek_j)**0.5)
-        ekij.append(ekiji)
+    ko = asarray(ko, dtype=float)/unidades.ThermalConductivity.rates["calscmK"]
 
-    # Eq 25
-    wij = []
-    for w_i in wi:
-        wiji = []
-        for w_j in wi:
-            wiji.append((w_i+w_j)/2)
-        wij.append(wiji)
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
 
-    # Eq 26
-    Mij = []
-    for M_i in Mi:
-        Miji = []
-        for M_j in Mi:
-            Miji.append(2*M_i*M_j/(M_i+M_j))
-        Mij.append(Miji)
-
-    # Eq 27
-    kij = []
-    for k_i in ki:
-        kiji = []
-        for k_j in ki:
-            kiji.append((k_i*k_j)**0.5)
-        kij.append(kiji)
+    # Use critical volume in molar base
+    Vci = asarray(Vci, dtype=float)*Mi*1000
 
-    # Eq 14
-    sm = 0
-    for x_i, sigmaiji in zip(xi, sigmaij):
-        for x_j, sij in zip(xi, sigmaiji):
-            sm += x_i*x_j*sij**3
-    sm = sm**(1/3)
+    sm, ekm, wm, Mm, Dm, km = _ChungMix(xi, Tci, Vci, Mi, wi, Di, ki)
 
-    # Eq 15
-    ekm = 0
-    for x_i, sigmaiji, ekiji in zip(xi, sigmaij, ekij):
-        for x_j, sij, ek in zip(xi, sigmaiji, ekiji):
-            ekm += x_i*x_j*ek*sij**3
-    ekm /= sm**3
-
-    # Eq 18
-    wm = 0
-    for x_i, sigmaiji, wiji in zip(xi, sigmaij, wij):
-        for x_j, sij, w in zip(xi, sigmaiji, wiji):
-            wm += x_i*x_j*w*sij**3
-    wm /= sm**3
-
-    # Eq 19
-    Mm = 0
-    for x_i, sigmaiji, ekiji, Miji in zip(xi, sigmaij, ekij, Mij):
-        for x_j, s, ek, M in zip(xi, sigmaiji, ekiji, Miji):
-            Mm += x_i*x_j*ek*s**2*M**0.5
-    Mm = (Mm/(ekm*sm**2))**2
-
-    # Eq 20
-    Dm = 0
-    for x_i, sigmaiji, ekiji, D_i in zip(xi, sigmaij, ekij, Di):
-        for x_j, s, ek, D_j in zip(xi, sigmaiji, ekiji, Di):
-            Dm += x_i*x_j*(D_i*D_j)**2/ek/s**3
-    Dm = (Dm*ekm*sm**3)**0.25
-
-    # Eq 21
-    km = 0
-    for x_i, kiji in zip(xi, kij):
-        for x_j, k in zip(xi, kiji):
-            km += x_i*x_j*k
-
-    rho = rho/Mm/1000
+    rho = asarray(rho, dtype=float)/Mm/1000
     Vcm = (sm/0.809)**3                                                # Eq 16
     Tcm = 1.2593*ekm                                                   # Eq 17
     murm = 131.3*Dm/(Vcm*Tcm)**0.5                                     # Eq 22
 
-    T_ = T/ekm
+    T_ = asarray(T, dtype=float)/ekm
 
     # Table IV
     dat = [
@@ -2959,7 +2494,7 @@ def ThG_P_Chung(T, xi, Tci, Vci, Mi, wi, Di, ki, rho, ko):
     kk = ko*(1/H2 + B6*Y)
     kp = (3.039e-4*(Tcm/Mm)**0.5/Vcm**(2/3))*B7*Y**2*H2*T_**0.5
 
-    return unidades.ThermalConductivity(kk+kp, "calscmK")
+    return unidades.ThermalConductivity.array(kk+kp, "calscmK")
 
 
 @refDoc(__doi__, [7, 3])
@@ -2994,7 +2529,7 @@ def ThG_StielThodosYorizane(T, xi, Tci, Pci, Vci, wi, Mi, V, ko):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -3015,7 +2550,7 @@ def ThG_StielThodosYorizane(T, xi, Tci, Pci, Vci, wi, Mi, V, ko):
 
     Returns
     -------
-    k : float
+    k : float or array
         Thermal conductivities of mixture, [W/m·K]
 
     Examples
@@ -3032,43 +2567,31 @@ def ThG_StielThodosYorizane(T, xi, Tci, Pci, Vci, wi, Mi, V, ko):
     >>> "%0.4f" % ThG_StielThodosYorizane(*args)
     '0.0527'
     """
+    xi = asarray(xi, dtype=float)
+    Tci = asarray(Tci, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+
     # Use critical volume in molar base
-    Vci = [Vc*M*1000 for Vc, M in zip(Vci, Mi)]
+    Vci = asarray(Vci, dtype=float)*Mi*1000
 
     # Eq 8; missing rules for critical properties
-    wm = sum([x*w for x, w in zip(xi, wi)])
-    Mm = sum([x*M for x, M in zip(xi, Mi)])
+    wm = xi.dot(wi)
+    Mm = xi.dot(Mi)
     Zcm = 0.291-0.08*wm
 
-    Vcij = []
-    for Vc_i in Vci:
-        Vciji = []
-        for Vc_j in Vci:
-            Vciji.append((Vc_i**(1/3)+Vc_j**(1/3))**3/8)
-        Vcij.append(Vciji)
-
-    Vcm = 0
-    for x_i, Vciji in zip(xi, Vcij):
-        for x_j, Vc in zip(xi, Vciji):
-            Vcm += x_i*x_j*Vc
-
-    Tcij = []
-    for Tc_i in Tci:
-        Tciji = []
-        for Tc_j in Tci:
-            Tciji.append((Tc_i*Tc_j)**0.5)
-        Tcij.append(Tciji)
-
-    Tcm = 0
-    for x_i, Vciji, Tciji in zip(xi, Vcij, Tcij):
-        for x_j, Vc, Tc in zip(xi, Vciji, Tciji):
-            Tcm += x_i*x_j*Vc*Tc/Vcm
+    xx = outer(xi, xi)
+    V13 = Vci**(1/3)
+    Vcij = (V13[:, None]+V13)**3/8
+    Vcm = (xx*Vcij).sum()
+
+    Tcij = (Tci[:, None]*Tci)**0.5
+    Tcm = (xx*Vcij*Tcij).sum()/Vcm
 
     Pcm = Zcm*R*Tcm/Vcm*1e6
     Vcm = Vcm/Mm/1000
 
     km = ThG_StielThodos(T, Tcm, Pcm, Vcm, Mm, V, ko)
-    return unidades.ThermalConductivity(km)
+    return unidades.ThermalConductivity.array(km)
 
 
 @refDoc(__doi__, [1, 21])
@@ -3114,7 +2637,7 @@ def ThG_TRAPP(T, xi, Tci, Vci, Zci, wi, Mi, rho, ko):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Temperature, [K]
     xi : list
         Mole fractions of components, [-]
@@ -3135,7 +2658,7 @@ def ThG_TRAPP(T, xi, Tci, Vci, Zci, wi, Mi, rho, ko):
 
     Returns
     -------
-    k : float
+    k : float or array
         High-pressure gas thermal conductivity [W/m/k]
 
     Examples
@@ -3152,79 +2675,40 @@ def ThG_TRAPP(T, xi, Tci, Vci, Zci, wi, Mi, rho, ko):
     >>> "%0.4f" % ThG_TRAPP(*args)
     '0.0549'
     """
-    # Reference fluid properties, propane
-    TcR = 369.83
-    rhocR = 1/200  # mol/cm³
-    ZcR = 0.276
-    wR = 0.152
+    xi = asarray(xi, dtype=float)
+    Mi = asarray(Mi, dtype=float)
+    T = asarray(T, dtype=float)
 
     # Convert volume to molar base
-    Vci = [Vc*M*1000 for Vc, M in zip(Vci, Mi)]
-    Mm = sum([x*M for x, M in zip(xi, Mi)])
-    rho = rho/Mm/1000
+    Vci = asarray(Vci, dtype=float)*Mi*1000
+    Mm = xi.dot(Mi)
+    rho = asarray(rho, dtype=float)/Mm/1000
 
     # Calculate shape factor for mixture
-    fi = []
-    hi = []
-    for Tc, Vc, Zc, w in zip(Tci, Vci, Zci, wi):
-        fi.append(Tc/TcR*(1+(w-wR)*(0.05203-0.7498*log(T/Tc))))
-        hi.append(rhocR*Vc*ZcR/Zc*(1-(w-wR)*(0.1436-0.2822*log(T/Tc))))
-
-    fij = []
-    for f_i in fi:
-        fiji = []
-        for f_j in fi:
-            fiji.append((f_i*f_j)**0.5)
-        fij.append(fiji)
-
-    hij = []
-    for h_i in hi:
-        hiji = []
-        for h_j in hi:
-            hiji.append((h_i**(1/3)+h_j**(1/3))**3/8)
-        hij.append(hiji)
-
-    hm = 0
-    for x_i, hiji in zip(xi, hij):
-        for x_j, h in zip(xi, hiji):
-            hm += x_i*x_j*h
-
-    fm = 0
-    for x_i, hiji, fiji in zip(xi, hij, fij):
-        for x_j, h, f in zip(xi, hiji, fiji):
-            fm += x_i*x_j*f*h/hm
+    hi, fij, hij, fm, hm = _TRAPPShape(T[..., None], xi, Tci, Vci, Zci, wi)
+    xx = outer(xi, xi)
 
     To = T/fm
     rho0 = rho*hm
 
-    Mij = []
-    for M_i in Mi:
-        Miji = []
-        for M_j in Mi:
-            Miji.append(1/(1/2/M_i+1/2/M_j))
-        Mij.append(Miji)
-
-    suma = 0
-    for x_i, fiji, Miji, hiji in zip(xi, fij, Mij, hij):
-        for x_j, f, M, h in zip(xi, fiji, Miji, hiji):
-            suma += x_i*x_j*(f/M)**0.5*h**(4/3)
+    Mij = 1/(1/2/Mi[:, None]+1/2/Mi)
+
+    suma = (xx*(fij/Mij)**0.5*hij**(4/3)).sum(axis=(-2, -1))
     Flm = 44.094**0.5/hm**2*suma
 
-    wm = sum([x*w for x, w in zip(xi, wi)])
-    Xlm = (1+2.1866*(wm-wR)/(1-0.505*(wm-wR)))**0.5
+    wm = xi.dot(wi)
+    Xlm = (1+2.1866*(wm-_wR)/(1-0.505*(wm-_wR)))**0.5
 
     # Coefficients in [53]_, pag 796
     # Density are in mol/dm³
-    rho0 *= 1000
-    rhocR *= 1000
-
-    rhorR = rho0/rhocR
-    TrR = To/TcR
+    rhorR = rho0/_rhocR
+    TrR = To/_TcR
     lR = 15.2583985944*rhorR + 5.29917319127*rhorR**3 + \
         (-3.05330414748+0.450477583739/TrR)*rhorR**4 + \
         (1.03144050679-0.185480417707/TrR)*rhorR**5
 
-    return unidades.ThermalConductivity(Flm*Xlm*lR*1e-3 + ko)
+    k = Flm*Xlm*lR*1e-3 + asarray(ko, dtype=float)
+    return unidades.ThermalConductivity.array(k)
 
 
 @refDoc(__doi__, [8, 2])
@@ -3580,17 +3064,24 @@ class Mezcla(config.Entity):
         pass
 
     def _arraylize(self, prop, unit=None):
-        """Get the compounds property prop as list
+        """Get the compounds property prop as array, the constant properties
+        of compounds are cached so the array is only built once
         prop: a string code with the property to return
             f_acent, M, Vc, Tc,...
+        unit: optional unit code of property to return
         """
-        array = []
-        for cmp in self.componente:
-            value = cmp.__getattribute__(prop)
-            if unit:
-                value = value.__getattribute__(unit)
-            array.append(value)
-        return array
+        vectors = self.__dict__.setdefault("_vectors", {})
+        if (prop, unit) not in vectors:
+            array = []
+            for cmp in self.componente:
+                value = cmp.__getattribute__(prop)
+                if unit:
+                    value = value.__getattribute__(unit)
+                array.append(value)
+            array = asarray(array)
+            array.flags.writeable = False
+            vectors[(prop, unit)] = array
+        return vectors[(prop, unit)]
 
     def _Ho(self, T):
         """Ideal gas enthalpy"""
@@ -3625,6 +3116,23 @@ class Mezcla(config.Entity):
             Cp += xi*cmp.Cp_Gas_DIPPR(T)
         return unidades.SpecificHeat(Cp)
 
+    def Cp_Liquido(self, T):
+        """Calculate specific heat from liquid as ideal mixture of
+        components"""
+        Cp = 0
+        for xi, cmp in zip(self.fraccion_masica, self.componente):
+            Cp += xi*cmp.Cp_Liquido_DIPPR(T)
+        return unidades.SpecificHeat(Cp)
+
+    def Hv_DIPPR(self, T):
+        """Calculate the heat of vaporization as ideal mixture of
+        components, the supercritical components don't contribute"""
+        Hv = 0
+        for xi, cmp in zip(self.fraccion_masica, self.componente):
+            if T < cmp.Tc:
+                Hv += xi*cmp.Hv_DIPPR(T)
+        return unidades.Enthalpy(Hv)
+
     def RhoL(self, T, P):
         """Calculate the density of liquid phase using any of available
         correlation"""
@@ -3635,53 +3143,31 @@ class Mezcla(config.Entity):
         if Pcorr is None or method >= len(Mezcla.METHODS_RhoLP):
             Pcorr = self.Config.getint("Transport", "Corr_RhoLMix")
 
+        Tci = self._arraylize("Tc")
+        Pci = self._arraylize("Pc")
+        Vci = self._arraylize("Vc")
+        wi = self._arraylize("f_acent")
+        Mi = self._arraylize("M")
+
         # Calculate of low pressure viscosity
         if method == 0:
-            Tci = self._arraylize("Tc")
-            Pci = self._arraylize("Pc")
-            Vci = self._arraylize("Vc")
             Zrai = self._arraylize("rackett")
-            Mi = self._arraylize("M")
             rhos = RhoL_RackettMix(T, self.fraccion, Tci, Pci, Vci, Zrai, Mi)
         elif method == 1:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            wi = self._arraylize("f_acent")
-            Mi = self._arraylize("M")
             rhos = RhoL_CostaldMix(T, self.fraccion, Tci, wi, Vci, Mi)
 
         # Add correction factor for high pressure
         if P < 1e6:
             rho = rhos
         elif Pcorr == 0:
-            Tci = self._arraylize("Tc")
-            Pci = self._arraylize("Pc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
-            Mi = self._arraylize("M")
             rho = RhoL_AaltoKeskinenMix(
                 T, P, self.fraccion, Tci, Pci, Vci, wi, Mi, rhos)
         elif Pcorr == 1:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
-            Mi = self._arraylize("M")
             rho = RhoL_TaitCostaldMix(
                 T, P, self.fraccion, Tci, Vci, wi, Mi, rhos)
         elif Pcorr == 2:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
-            Mi = self._arraylize("M")
             rho = RhoL_NasrifarMix(T, P, self.fraccion, Tci, Vci, wi, Mi, rhos)
         elif Pcorr == 3:
-            Tci = self._arraylize("Tc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
-            Mi = self._arraylize("M")
             rho = RhoL_APIMix(T, P, self.fraccion, Tci, Pci, rhos)
 
         return rho
@@ -3695,38 +3181,28 @@ class Mezcla(config.Entity):
         if Pcorr is None or method >= len(Mezcla.METHODS_MuGP):
             Pcorr = self.Config.getint("Transport", "Corr_MuGMix")
 
+        Tci = self._arraylize("Tc")
+        Pci = self._arraylize("Pc")
+        Vci = self._arraylize("Vc")
+        Zci = self._arraylize("Zc")
+        wi = self._arraylize("f_acent")
+        Mi = self._arraylize("M")
+        Di = self._arraylize("dipole", "Debye")
+
         # Calculate of low pressure viscosity
         if method == 0:
-            Tci = self._arraylize("Tc")
-            Pci = self._arraylize("Pc")
-            Mi = self._arraylize("M")
-            Mi = self._arraylize("M")
-            Di = self._arraylize("dipole", "Debye")
             mui = [cmp.Mu_Gas(T, 101325, rho) for cmp in self.componente]
             muo = MuG_Reichenberg(T, self.fraccion, Tci, Pci, Mi, mui, Di)
         elif method == 1:
-            Tci = self._arraylize("Tc")
-            Pci = self._arraylize("Pc")
-            Vci = self._arraylize("Vc")
-            Zci = self._arraylize("Zc")
-            Mi = self._arraylize("M")
-            Di = self._arraylize("dipole", "Debye")
             muo = MuG_Lucas(
                 T, 101325, self.fraccion, Tci, Pci, Vci, Zci, Mi, Di)
         elif method == 2:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
-            Di = self._arraylize("dipole", "Debye")
             ki = [cmp._K_Chung() for cmp in self.componente]
             muo = MuG_Chung(T, self.fraccion, Tci, Vci, Mi, wi, Di, ki)
         elif method == 3:
-            Mi = self._arraylize("M")
             mui = [cmp.Mu_Gas(T, 101325, None) for cmp in self.componente]
             muo = MuG_Wilke(self.fraccion, Mi, mui)
         elif method == 4:
-            Mi = self._arraylize("M")
             mui = [cmp.Mu_Gas(T, 101325, None) for cmp in self.componente]
             muo = MuG_Herning(self.fraccion, Mi, mui)
 
@@ -3734,40 +3210,18 @@ class Mezcla(config.Entity):
         if P < 1e6:
             mu = muo
         elif Pcorr == 0:
-            Tci = self._arraylize("Tc")
-            Pci = self._arraylize("Pc")
-            Vci = self._arraylize("Vc")
-            Zci = self._arraylize("Zc")
-            Mi = self._arraylize("M")
-            Di = self._arraylize("dipole", "Debye")
             mu = MuG_Lucas(T, P, self.fraccion, Tci, Pci, Vci, Zci, Mi, Di)
         elif Pcorr == 1:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
-            Di = self._arraylize("dipole", "Debye")
             ki = [cmp._K_Chung() for cmp in self.componente]
             mu = MuG_P_Chung(
                 T, self.fraccion, Tci, Vci, Mi, wi, Di, ki, rho, muo)
         elif Pcorr == 2:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            Zci = self._arraylize("Zc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
             mu = MuG_TRAPP(
                 T, P, self.fraccion, Tci, Vci, Zci, Mi, wi, rho, muo)
         elif Pcorr == 3:
-            Tci = self._arraylize("Tc")
-            Pci = self._arraylize("Pc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
             rhoc = 1/Vc_ChuehPrausnitz(self.fraccion, Vci, Mi)
             mu = MuG_DeanStielMix(self.fraccion, Tci, Pci, Mi, rhoc, rho, muo)
         elif Pcorr == 4:
-            Tci = self._arraylize("Tc")
-            Pci = self._arraylize("Pc")
             mu = MuG_APIMix(T, P, self.fraccion, Tci, Pci, muo)
 
         return mu
@@ -3820,23 +3274,22 @@ class Mezcla(config.Entity):
         if Pcorr is None or method >= len(Mezcla.METHODS_ThGP):
             Pcorr = self.Config.getint("Transport", "Corr_ThCondGMix")
 
+        Tci = self._arraylize("Tc")
+        Vci = self._arraylize("Vc")
+        wi = self._arraylize("f_acent")
+        Mi = self._arraylize("M")
+
         # Calculate of low pressure viscosity
         if method == 0:
-            Mi = self._arraylize("M")
             mui = [cmp.Mu_Gas(T, 101325, rho) for cmp in self.componente]
             ki = [cmp.ThCond_Gas(T, P, rho) for cmp in self.componente]
             ko = ThG_MasonSaxena(self.fraccion, Mi, mui, ki)
         elif method == 1:
-            Mi = self._arraylize("M")
             Tbi = self._arraylize("Tb")
             mui = [cmp.Mu_Gas(T, 101325, rho) for cmp in self.componente]
             ki = [cmp.ThCond_Gas(T, P, rho) for cmp in self.componente]
             ko = ThG_LindsayBromley(T, self.fraccion, Mi, Tbi, mui, ki)
         elif method == 2:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
             Cvi = [cmp.Cv(T) for cmp in self.componente]
             Di = self._arraylize("dipole", "Debye")
             ki = [cmp._K_Chung() for cmp in self.componente]
@@ -3847,25 +3300,13 @@ class Mezcla(config.Entity):
         if P < 1e6:
             k = ko
         elif Pcorr == 0:
-            Tci = self._arraylize("Tc")
             Pci = self._arraylize("Pc")
-            Vci = self._arraylize("Vc")
-            wi = self._arraylize("f_acent")
-            Mi = self._arraylize("M")
             k = ThG_StielThodosYorizane(
                 T, self.fraccion, Tci, Pci, Vci, wi, Mi, 1/rho, ko)
         elif Pcorr == 1:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
             Zci = self._arraylize("Zc")
-            wi = self._arraylize("f_acent")
-            Mi = self._arraylize("M")
             k = ThG_TRAPP(T, self.fraccion, Tci, Vci, Zci, wi, Mi, rho, ko)
         elif Pcorr == 2:
-            Tci = self._arraylize("Tc")
-            Vci = self._arraylize("Vc")
-            Mi = self._arraylize("M")
-            wi = self._arraylize("f_acent")
             Di = self._arraylize("dipole", "Debye")
             ki = [cmp._K_Chung() for cmp in self.componente]
             k = ThG_P_Chung(
@@ -3898,6 +3339,7 @@ class Mezcla(config.Entity):
         state["mezcla"] = mezcla
 
     def readStatefromJSON(self, mezcla):
+        self._vectors = {}
         if mezcla:
             self._bool = True
             self.ids = mezcla["ids"]
@@ -92,7 +92,6 @@ PNA decomposition procedures:
 
 from configparser import ConfigParser
 
-from PyQt5.QtWidgets import QApplication
 from scipy import exp, sqrt, log10, log
 from scipy.interpolate import interp1d
 from scipy.optimize import fsolve, leastsq, newton
@@ -105,6 +104,7 @@ from lib.newComponent import newComponente
 from lib.config import conf_dir
 from lib.compuestos import prop_Edmister
 from lib.utilities import refDoc
+from lib.qt import QApplication
 
 
 __doi__ = {
@@ -31,7 +31,9 @@ Module for implement physics correlation:
 '''
 
 
-from math import exp, pi, cos, acos, sin
+from math import pi, cos, acos
+
+from numpy import exp, sin
 
 from scipy.constants import R, calorie, liter, atm, Btu, lb
 from scipy.special import cbrt
@@ -142,7 +144,7 @@ def Collision_Neufeld(T, l=2, s=2):
 
     Parameters
     ----------
-    T : float
+    T : float or array
         Reduced temperature, [-]
     l: int, optional
         Collision integral first term order, default 2
@@ -151,7 +153,7 @@ def Collision_Neufeld(T, l=2, s=2):
 
     Returns
     -------
-    omega : float
+    omega : float or array
         Transport collision integral, [-]
     """
     # Table I
@@ -0,0 +1,373 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Hydraulic solver of pipe networks with loops and branches.
+
+The network is a graph with the pipes as edges, each one a
+:class:`equipment.pipe.Pipe` with its material of pipe database, length,
+head increase and fittings. The nodes have a fixed pressure or a fixed
+demand, the mass flow leaving the network in the node. The mass flow in each
+pipe and the pressure in each node without fixed pressure are solved
+simultaneously with the gradient method of Todini and Pilati, a global Newton
+method where the sparse linear system is reduced to the node pressures.
+
+    * :class:`Network`: Pipe network solver
+
+The pressure drop in each pipe is the single phase flow of Pipe, the Darcy
+friction factor of :func:`lib.friction.f_friccion` and the fittings loss
+coefficients, plus the hydrostatic head. In the transition region between
+laminar and turbulent flow the friction factor is interpolated like in
+EPANET, to avoid the cycling of flows around the discontinuity. The fluid
+properties are calculated once in each node and used with the mean of both
+ends in each pipe.
+'''
+
+
+import logging
+import time
+
+from numpy import abs as npabs
+from numpy import (arange, array, clip, concatenate, maximum, ones, pi, where,
+                   zeros)
+from numpy.linalg import norm
+from scipy.constants import g
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import spsolve
+
+from equipment.pipe import Pipe
+from lib import unidades
+from lib.friction import f_friccion
+from lib.utilities import refDoc
+
+
+__doi__ = {
+    1:
+        {"autor": "Todini, E., Pilati, S.",
+         "title": "A Gradient Algorithm for the Analysis of Pipe Networks",
+         "ref": "Computer Applications in Water Supply, Vol. 1, 1-20 (1988)",
+         "doi": ""},
+    2:
+        {"autor": "Rossman, L.A.",
+         "title": "EPANET 2 Users Manual",
+         "ref": "U.S. Environmental Protection Agency, Cincinnati (2000)",
+         "doi": ""},
+}
+
+
+@refDoc(__doi__, [1, 2])
+class Network(object):
+    """Pipe network with fixed pressure and fixed demand nodes
+
+    Parameters
+    ----------
+    fluido : Corriente
+        Stream with the fluid of network, its temperature and composition
+        are used in all nodes
+    pipes : list
+        Pipes of network as list of (input node, output node, pipe), with
+        pipe a Pipe instance or a dict with the Pipe kwargs, material, l, h
+        and accesorios. The node names can be any hashable value. The mass
+        flow is positive in the direction from input to output node
+    P : dict
+        Fixed pressure of nodes, [Pa]
+    demand : dict
+        Mass flow leaving the network in nodes without fixed pressure, a
+        negative value for a flow entering the network, [kg/s]
+    tol : float
+        Relative tolerance of pipe mass flows
+    maxiter : int
+        Maximum number of Newton iterations
+    ptol : float
+        Relative pressure change in a node to calculate again its fluid
+        properties, nodes with pressures in this tolerance share a calculation
+
+    Notes
+    -----
+    After :meth:`solve` the results are available as arrays, in the order of
+    :attr:`nodes` for node values and in the order of pipes for pipe values:
+
+        * P: Pressure of nodes
+        * demand: Mass flow leaving the network in nodes, the supply of fixed
+          pressure nodes as negative values
+        * caudal: Mass flow of pipes
+        * V, Re, f: Velocity, Reynolds number and friction factor of pipes
+        * DeltaP: Pressure drop of pipes, input minus output pressure
+        * stats: dict with the Newton iterations, the fluid property
+          calculations, the final residual, the convergence status and the
+          calculation time
+
+    A three pipe loop with water fed at 3 bar and two consumers
+
+    >>> from lib.corriente import Corriente
+    >>> agua = Corriente(T=300, P=3e5, caudalMasico=1, ids=[62],
+    ...                  fraccionMolar=[1], MEoS=True)
+    >>> mat = ["Steel (ANSI)", "Sch.  40", 0.046, '4"', 102.26, 6.02, 114.3,
+    ...        16.07, 0.821, 35.91, 0, 0]
+    >>> pipes = [("A", "B", {"material": mat, "l": 100}),
+    ...          ("B", "C", {"material": mat, "l": 100, "h": 5}),
+    ...          ("A", "C", {"material": mat, "l": 300})]
+    >>> red = Network(agua, pipes, P={"A": 3e5}, demand={"B": 5, "C": 10})
+    >>> red.solve()
+    True
+    >>> print("%0.4f %0.4f %0.4f" % tuple(red.caudal))
+    3.8948 -1.1052 11.1052
+    >>> print("%0.1f %0.1f %0.1f" % tuple(red.P))
+    300000.0 297581.0 248963.0
+    >>> print("%0.4f" % red.demand[0])
+    -15.0000
+    >>> print("%0.0f %0.0f" % (red.DeltaP[0], red.pipe(0).DeltaP))
+    2419 2419
+    """
+
+    def __init__(self, fluido, pipes, P, demand=None, tol=1e-8, maxiter=50,
+                 ptol=1e-3):
+        self.fluido = fluido
+        self.tol = tol
+        self.maxiter = maxiter
+        self.ptol = ptol
+
+        self.nodes = []
+        self.index = {}
+        self.pipes = []
+        inlet = []
+        outlet = []
+        for nodeIn, nodeOut, pipe in pipes:
+            if not isinstance(pipe, Pipe):
+                pipe = Pipe(**pipe)
+            self.pipes.append(pipe)
+            for node in (nodeIn, nodeOut):
+                if node not in self.index:
+                    self.index[node] = len(self.nodes)
+                    self.nodes.append(node)
+            inlet.append(self.index[nodeIn])
+            outlet.append(self.index[nodeOut])
+        self._inlet = array(inlet, dtype=int)
+        self._outlet = array(outlet, dtype=int)
+
+        nn = len(self.nodes)
+        self._P = zeros(nn)
+        self._fixed = zeros(nn, dtype=bool)
+        for node, value in P.items():
+            self._P[self.index[node]] = value
+            self._fixed[self.index[node]] = True
+        self._demand = zeros(nn)
+        if demand:
+            for node, value in demand.items():
+                self._demand[self.index[node]] = value
+
+        # Incidence matrix, -1 in the input node and +1 in the output node
+        npipe = len(self.pipes)
+        rows = concatenate((arange(npipe), arange(npipe)))
+        cols = concatenate((self._inlet, self._outlet))
+        data = concatenate((-ones(npipe), ones(npipe)))
+        self._A = csr_matrix((data, (rows, cols)), shape=(npipe, nn))
+
+        # Geometry of pipes
+        L = []
+        Di = []
+        e = []
+        K = []
+        h = []
+        for pipe in self.pipes:
+            material = pipe.kwargs["material"]
+            L.append(pipe.kwargs["l"])
+            Di.append((material[6]-2*material[5])/1000)
+            e.append(material[2]/1000)
+            K.append(sum(acc[2]*acc[3] for acc in pipe.kwargs["accesorios"]))
+            h.append(pipe.kwargs["h"])
+        self.L = unidades.Length.array(L)
+        self.Di = unidades.Length.array(Di)
+        self.eD = unidades.Dimensionless.array(array(e)/self.Di)
+        self.K = unidades.Dimensionless.array(K)
+        self._h = array(h, dtype=float)
+        self.seccion = unidades.Area.array(pi/4*self.Di**2)
+
+        self.stats = {}
+
+    def _check(self):
+        """Check each connected part of network has a fixed pressure node"""
+        ncomp, labels = connected_components(self._A.T @ self._A,
+                                             directed=False)
+        for comp in range(ncomp):
+            if not self._fixed[labels == comp].any():
+                raise ValueError("Network without fixed pressure node")
+
+    def _properties(self, nodes, P):
+        """Calculate the density and viscosity of fluid in nodes, in order of
+        pressure, reusing the last calculation for pressures in tolerance"""
+        Pref = None
+        for i in nodes[P[nodes].argsort()]:
+            if P[i] <= 0:
+                raise ValueError("Negative pressure in node %s" %
+                                 str(self.nodes[i]))
+            if Pref is None or abs(P[i]-Pref) > self.ptol*Pref:
+                Pref = P[i]
+                stream = self.fluido.clone(P=Pref)
+                rho, mu = Pipe._fluid(stream)
+                self.stats["evaluations"] += 1
+            self._rho[i] = rho
+            self._mu[i] = mu
+            self._Peval[i] = Pref
+
+    def _friction(self, Re):
+        """Darcy friction factor of pipes, in the transition region the
+        friction factor is interpolated between the laminar value and the
+        turbulent value at Re=4000, so it's continuous for the Newton method
+        """
+        x = clip((Re-2100)/1900, 0, 1)
+        f = (1-x)*64/2100 + x*f_friccion(maximum(Re, 4000), self.eD)
+        return where(Re < 2100, 64/Re, f)
+
+    def _residual(self, m, P, rho, mu):
+        """Pressure balance of pipes and its derivative with mass flow"""
+        LD = self.L/self.Di
+        c = 1/(2*rho*self.seccion**2)
+        am = maximum(npabs(m), 1e-12)
+        Re = 4*am/(pi*self.Di*mu)
+        f = self._friction(Re)
+        k = f*LD+self.K
+
+        # Logarithmic derivative of friction factor with Reynolds number
+        eps = 1e-6
+        s = (self._friction(Re*(1+eps))/f-1)/eps
+
+        F = c*k*am*m + self._A @ P + rho*g*self._h
+        D = c*am*(2*k+LD*f*s)
+        D = maximum(D, 1e-12*D.max())
+        return F, D, Re, f
+
+    def _newton(self, m, P, rho, mu):
+        """Gradient method for the pipe flows and the free node pressures
+        with fixed fluid properties"""
+        free = ~self._fixed
+        A1 = self._A[:, free]
+        A1T = A1.T.tocsr()
+        d = self._demand[free]
+
+        F, D, Re, f = self._residual(m, P, rho, mu)
+        G = A1T @ m - d
+        for it in range(1, self.maxiter+1):
+            self.stats["iterations"] += 1
+            # Reduced system of pressure corrections, A1'·D⁻¹·A1·dP = b
+            M = (A1T @ diags(1/D) @ A1).tocsc()
+            dP = spsolve(M, G-A1T @ (F/D))
+            dm = -(F+A1 @ dP)/D
+            m = m+dm
+            P = P.copy()
+            P[free] += dP
+
+            F, D, Re, f = self._residual(m, P, rho, mu)
+            G = A1T @ m - d
+            error = norm(F/D) + norm(G)
+            if npabs(dm).sum() <= self.tol*npabs(m).sum() and \
+                    npabs(G).max() <= self.tol*npabs(m).max():
+                self.stats["residual"] = error
+                return m, P, Re, f, True
+
+        self.stats["residual"] = error
+        return m, P, Re, f, False
+
+    def solve(self):
+        """Calculate the flows and pressures of network
+
+        Returns
+        -------
+        converge : boolean
+            Convergence status of calculation
+        """
+        start = time.perf_counter()
+        self._check()
+        self.stats = {"iterations": 0, "evaluations": 1, "residual": None,
+                      "converge": False, "time": 0}
+
+        # Initial estimation, mean fixed pressure in nodes, a flow velocity
+        # of 1 m/s in pipes and the fluid properties of input stream
+        nn = len(self.nodes)
+        P = self._P.copy()
+        P[~self._fixed] = P[self._fixed].mean()
+        rho, mu = Pipe._fluid(self.fluido)
+        self._rho = rho*ones(nn)
+        self._mu = mu*ones(nn)
+        self._Peval = self.fluido.P*ones(nn)
+        m = rho*self.seccion
+
+        for outer in range(self.maxiter):
+            rho = (self._rho[self._inlet]+self._rho[self._outlet])/2
+            mu = (self._mu[self._inlet]+self._mu[self._outlet])/2
+            m, P, Re, f, converge = self._newton(m, P, rho, mu)
+            if not converge:
+                break
+
+            # Recalculate the fluid properties of nodes with pressure change
+            stale = npabs(P-self._Peval) > self.ptol*self._Peval
+            if not stale.any():
+                break
+            self._properties(stale.nonzero()[0], P)
+        else:
+            converge = False
+
+        self.P = unidades.Pressure.array(P)
+        self.caudal = unidades.MassFlow.array(m)
+        self.demand = unidades.MassFlow.array(self._A.T @ m)
+        self.V = unidades.Speed.array(m/rho/self.seccion)
+        self.Re = unidades.Dimensionless.array(Re)
+        self.f = unidades.Dimensionless.array(f)
+        self.DeltaP = unidades.DeltaP.array(P[self._inlet]-P[self._outlet])
+        self.rho = unidades.Density.array(rho)
+        self.mu = unidades.Viscosity.array(mu)
+
+        self.stats["converge"] = converge
+        self.stats["time"] = time.perf_counter()-start
+        if not converge:
+            logging.warning("Pipe network not converged, residual %g" %
+                            self.stats["residual"])
+        return converge
+
+    def pipe(self, index):
+        """Calculate the pipe with the solved flow, the input stream is the
+        fluid at the pressure of upstream node. The pipe is calculated from
+        its input node, so a pipe with reversed flow has the friction loss
+        with the opposite sign of network
+
+        Parameters
+        ----------
+        index : int
+            Index of pipe
+
+        Returns
+        -------
+        pipe : Pipe
+            Calculated pipe
+        """
+        m = self.caudal[index]
+        if m >= 0:
+            P = self.P[self._inlet[index]]
+        else:
+            P = self.P[self._outlet[index]]
+        entrada = self.fluido.clone(P=P, split=abs(m)/self.fluido.caudalmasico)
+        pipe = self.pipes[index]
+        pipe(entrada=entrada)
+        return pipe
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -32,13 +32,46 @@ from configparser import ConfigParser
 # except:
    # from pygraph.readwrite.markup import write
 
-from lib.config import conf_dir
+from lib.config import conf_dir, setMainWindowConfig
 from lib.corriente import Corriente
+from lib.flowsheet import Scheduler
 from equipment import equipments
 from equipment.flux import Mixer
 
 
 class Project(object):
+    """Project of pychemqt, with the equipments and the streams connecting
+    them. The flowsheet is calculated with :class:`lib.flowsheet.Scheduler`,
+    only the equipments affected by a change are calculated again and the
+    recycle loops are converged iteratively
+
+    Simple recycle loop, the half of mixer output is recycled to its input,
+    the stream 4 is the tear stream and needs an initial estimate:
+
+    >>> from equipment.flux import Divider
+    >>> feed = Corriente(T=300, P=101325, caudalMasico=1, ids=[62],
+    ...                  fraccionMolar=[1], MEoS=True)
+    >>> items = {"i1": feed, "e1": Mixer(), "o1": Corriente(),
+    ...          "e2": Divider(salidas=2, split=[0.5, 0.5])}
+    >>> streams = {1: ("i1", "e1", 0, 0, feed),
+    ...            2: ("e1", "e2", 0, 0, Corriente()),
+    ...            3: ("e2", "o1", 0, 0, Corriente()),
+    ...            4: ("e2", "e1", 1, 1, feed.clone(caudalMasico=0.1))}
+    >>> project = Project(items=items, streams=streams)
+    >>> project.run()
+    >>> recycle = project.scheduler.recycles[0]
+    >>> recycle["tears"], recycle["converged"]
+    ([4], True)
+    >>> "%0.4f %0.4f" % (project.getStream(2).caudalmasico,
+    ...                  project.getOutput(1).caudalmasico)
+    '2.0000 1.0000'
+
+    A new feed only calculates the equipments again
+
+    >>> project.setInput(1, feed.clone(caudalMasico=2))
+    >>> "%0.4f" % project.getOutput(1).caudalmasico
+    '2.0000'
+    """
     MAGIC_NUMBER = 0x3051E
     FILE_VERSION = 10
 
@@ -54,6 +87,7 @@ class Project(object):
             config.read(conf_dir+"pychemqtrc")
         self.config = config
         self.streams = streams
+        self.scheduler = Scheduler(self)
         # self.graph = self.calGraph()
 
         self.downToStream = {}
@@ -150,7 +184,7 @@ class Project(object):
     def getDownToStream(self, id):
         up, down, ind_up, ind_down, obj = self.streams[id]
         if down[0] == "e":
-            return self.getItem(int(down[1]))
+            return self.getItem(int(down[1:]))
         else:
             return obj
 
@@ -161,38 +195,11 @@ class Project(object):
                 lista.append((key, value))
         return lista
 
-    def run(self, name):
-        """Ejecuta el projecto de forma recursiva hasta que encuentra un equipo no resuelto"""
-        tipo = name[0]
-        ind = int(name[1])
-
-        if tipo == "i":
-            obj = self.getInput(ind)
-            if obj.status:
-                key, (up, down, ind_up, ind_down, oldobj) = self.getDownToEquip(name)[0]
-                self.setStream(key, obj)
-                self.run("s%i" % key)
-
-        elif tipo == "e":
-            obj = self.getItem(ind)
-            if obj.status:
-                for key, (up, down, ind_up, ind_down, oldobj) in self.getDownToEquip(name):
-                    self.setStream(key, obj.salida[ind_up])
-                    self.run("s%i" % key)
-
-        elif tipo == "s":
-            up, down, ind_up, ind_down, stream = self.streams[ind]
-            if stream.status:
-                if down[0] == "e":
-                    equip = self.items[down]
-                    if isinstance(equip, Mixer):
-                        kwargs = {"entrada": stream, "id_entrada": ind_down}
-                    else:
-                        kwargs = {equip.kwargsInput[ind_down]: stream}
-                    equip(**kwargs)
-                    self.run(down)
-                elif down[0] == "o":
-                    self.setOutput(int(down[1]), stream)
+    def run(self, name=None):
+        """Calculate the project after a change in item or stream name,
+        only the affected equipments are calculated, None to calculate all
+        the project, see :class:`lib.flowsheet.Scheduler`"""
+        self.scheduler.run(name)
 
     def writeToJSON(self, data):
         """Write the project to a dictionary to save to file in json format"""
@@ -235,9 +242,12 @@ class Project(object):
         # write external dependences necessaries for the project
         data["external_dependences"] = dependences
 
-    def readFromJSON(self, data, huella=True):
+    def readFromJSON(self, data, huella=True, temporal=True):
         """Read project from stream
-        huella: boolean to save project file to pychemqt_temporal"""
+        huella: boolean to save project file to pychemqt_temporal
+        temporal: boolean to save the project config to pychemqtrc_temporal,
+        if False the config is only set in memory as current config, without
+        change any file, used in headless runs"""
         # read configuration
         config = ConfigParser()
         for section, options in data["config"].items():
@@ -246,9 +256,13 @@ class Project(object):
                 config.set(section, option, value)
 
         self.setConfig(config)
-        if not huella:
+        if not temporal:
+            setMainWindowConfig(config)
+        elif not huella:
             os.rename(conf_dir+"pychemqtrc_temporal", conf_dir+"pychemqtrc_temporal_bak")
-        config.write(open(conf_dir+"pychemqtrc_temporal", "w"))
+            config.write(open(conf_dir+"pychemqtrc_temporal", "w"))
+        else:
+            config.write(open(conf_dir+"pychemqtrc_temporal", "w"))
 
         # read equipments
         items = {}
@@ -290,7 +304,7 @@ class Project(object):
                     equip.salida[ind_up] = obj
         self.setStreams(streams)
 
-        if not huella:
+        if not huella and temporal:
             os.rename(conf_dir+"pychemqtrc_temporal_bak", conf_dir+"pychemqtrc_temporal")
 
     # def printer(self):
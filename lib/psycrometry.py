@@ -50,7 +50,6 @@ from configparser import ConfigParser
 import logging
 import os
 
-from PyQt5.QtWidgets import QApplication
 from scipy.optimize import fsolve
 from scipy import log, exp, arange, concatenate, linspace
 
@@ -63,6 +62,7 @@ from lib.config import conf_dir
 from lib.unidades import (Temperature, Pressure, Dimensionless, SpecificVolume,
                           Density, Enthalpy, Length)
 from lib.utilities import refDoc
+from lib.qt import QApplication
 
 
 __doi__ = {
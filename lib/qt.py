@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Optional Qt integration of the calculation libraries, so lib and the
+equipment calculation modules can be imported and used without PyQt5, in
+scripts, batch calculation or worker processes.
+
+The Qt functionality is used only when PyQt5 has been imported previously by
+the graphical interface, this module never import PyQt5 itself.
+
+  * :func:`loaded`: Return the PyQt5 module if it's in use
+  * :class:`QApplication`: Replacement of the QApplication functionality
+    used in the calculation libraries
+  * :func:`systemLocale`: Name of system locale
+
+>>> QApplication.translate("pychemqt", "Temperature")
+'Temperature'
+'''
+
+
+import locale
+import sys
+
+
+def loaded(module="QtWidgets"):
+    """Return the PyQt5 module if it's already imported by the graphical
+    interface, None in other case"""
+    return sys.modules.get("PyQt5." + module)
+
+
+class QApplication(object):
+    """Replacement of QApplication with the functionality used in the
+    calculation libraries, translation and event processing, the calls are
+    delegated to Qt when the graphical interface is running"""
+
+    @staticmethod
+    def translate(context, sourceText, disambiguation=None, n=-1):
+        """Translate text with the Qt translators installed, without Qt
+        return the source text"""
+        QtWidgets = loaded()
+        if QtWidgets is None:
+            return sourceText
+        return QtWidgets.QApplication.translate(
+            context, sourceText, disambiguation, n)
+
+    @staticmethod
+    def processEvents():
+        """Let the graphical interface process the pending events in long
+        calculations"""
+        QtWidgets = loaded()
+        if QtWidgets is not None:
+            QtWidgets.QApplication.processEvents()
+
+
+def systemLocale():
+    """Return the name of system locale, en_US format"""
+    QtCore = loaded("QtCore")
+    if QtCore is not None:
+        return QtCore.QLocale.system().name()
+    name = locale.getlocale()[0]
+    if not name or name == "C":
+        name = "en_US"
+    return name
@@ -30,10 +30,10 @@ import sqlite3
 
 from numpy import polyval
 from scipy.optimize import fsolve
-from PyQt5.QtWidgets import QApplication
 
 from lib import unidades
 from lib.sql import databank_name
+from lib.qt import QApplication
 
 
 class Reaction(object):
@@ -39,14 +39,14 @@ from lib.mezcla import mix_unitmassflow, mix_unitmolarflow
 from lib.thermo import ThermoRefProp
 
 
-# Automatic loading of refprop name from meos subclass _refPropName property
+# Automatic loading of refprop name of fluids from the lib.mEoS registry
 __all__ = {}
 noIds = []
-for cmp in mEoS.__all__:
-    if cmp.id and cmp._refPropName:
-        __all__[cmp.id] = cmp._refPropName
-    elif cmp._refPropName:
-        noIds.append(cmp._refPropName)
+for cmp in mEoS.registry.values():
+    if cmp.id and cmp.refPropName:
+        __all__[cmp.id] = cmp.refPropName
+    elif cmp.refPropName:
+        noIds.append(cmp.refPropName)
 
 
 class RefProp(ThermoRefProp):
@@ -27,11 +27,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 from scipy import log, exp, r_
 from scipy.optimize import leastsq
 from scipy.special import erf
-from PyQt5.QtWidgets import QApplication
 
 from lib.compuestos import Componente
 from lib.config import Entity, getMainWindowConfig
 from lib.unidades import Density, MassFlow, Length, Temperature
+from lib.qt import QApplication
 
 
 class Solid(Entity):
@@ -26,10 +26,14 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 #   -deleteElement: Delete Element with indice from custom Database
 #   -getElement: Get element from database
 #   -copyElement: Create a copy of element of indice in custom Database
+#   -getConnection: Pooled read-only connection to a databank
+#   -invalidate: Drop the cached data of custom databank after a change
+#   -addInvalidateHook: Register a callback to call in invalidate
 ###############################################################################
 
 
 import os
+import pathlib
 import sqlite3
 
 
@@ -47,6 +51,11 @@ if os.path.isfile(databank_Custom_name):
 else:
     N_comp_Custom = 0
 
+# Process-wide pool of read-only connections, one for each databank file, and
+# callbacks to call when the custom databank is changed
+_connections = {}
+_invalidateHooks = []
+
 
 def transformElement(elemento):
     vals = []
@@ -183,6 +192,8 @@ def inserElementsFromArray(name, lista):
         curs.execute(query+str(tuple(vals)))
     conn.commit()
     conn.close()
+    if name == databank_Custom_name:
+        invalidate()
 
 
 def updateElement(elemento, indice):
@@ -247,6 +258,7 @@ def updateElement(elemento, indice):
                          % (variable, valor, indice))
     conn.commit()
     conn.close()
+    invalidate(indice)
 
 
 def deleteElement(indice):
@@ -256,19 +268,47 @@ def deleteElement(indice):
     curs.execute("DELETE FROM compuestos WHERE id=%i" % indice)
     conn.commit()
     conn.close()
+    invalidate(indice)
+
+
+def getConnection(name):
+    """Get the pooled read-only connection to the databank file name, the
+    connection is opened in the first call and reused in the next ones"""
+    conn = _connections.get(name)
+    if conn is None:
+        uri = pathlib.Path(name).as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        _connections[name] = conn
+    return conn
+
+
+def invalidate(indice=None):
+    """Drop the cached data of custom databank after a change
+    indice: index of changed element, None for the whole databank"""
+    conn = _connections.pop(databank_Custom_name, None)
+    if conn is not None:
+        conn.close()
+    for hook in _invalidateHooks:
+        hook(indice)
+
+
+def addInvalidateHook(func):
+    """Register a callback to call in invalidate, with the changed indice as
+    only argument, used by the modules with cached databank data"""
+    if func not in _invalidateHooks:
+        _invalidateHooks.append(func)
 
 
 def getElement(indice):
     """Get element from database
     indice: index in databank of element"""
     if indice > 1000:
-        db_Custom = sqlite3.connect(databank_Custom_name).cursor()
-        db_Custom.execute("select * from compuestos where id==%i" % indice)
-        componente = db_Custom.fetchone()
+        db = getConnection(databank_Custom_name).cursor()
     else:
-        db = sqlite3.connect(databank_name).cursor()
-        db.execute("select * from compuestos where id==%i" % indice)
-        componente = db.fetchone()
+        db = getConnection(databank_name).cursor()
+    db.execute("select * from compuestos where id==%i" % indice)
+    componente = db.fetchone()
+    db.close()
     return componente
 
 
@@ -282,3 +322,4 @@ def copyElement(indice):
                  str((1001+N_comp_Custom, ) + vals))
     conn.commit()
     conn.close()
+    invalidate()
@@ -0,0 +1,959 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Tabulated interpolation of the multiparameter equation of state of lib.mEoS
+fluids, a fast alternative to the rigorous calculation for stream with a
+controlled error.
+
+The single phase properties are tabulated in a regular grid of temperature
+and logarithm of pressure, with bicubic interpolation in each cell, similar
+to the TTSE method used in CoolProp. The saturation line is tabulated apart
+so the phase boundary and the two phases states are calculated without the
+smearing of interpolation across the discontinuity.
+
+Each cell of grid and each interval of saturation line is validated at its
+middle point against the rigorous MEoS calculation, the cells with an error
+greater than tolerance and the input out of table domain use the rigorous
+calculation as fallback.
+
+    * :class:`Table`: Tabulated values of a fluid
+    * :func:`getTable`: Table of fluid, loaded from disk or calculated
+    * :func:`precomputeTables`: Calculate and save the tables of fluids
+
+The calculation of a table with the default domain take some minutes, so the
+first stream of a fluid is slow if its table isn't saved yet, the tables can
+be calculated before with :func:`precomputeTables`.
+    * :class:`Tabulated`: Thermo class to use in stream calculation
+
+>>> from lib.mEoS import H2O
+>>> table = Table(H2O, Tmin=400, Tmax=500, Pmin=1e5, Pmax=1e6, nodes=(11, 9))
+>>> st = Tabulated(fluid=H2O, T=480, P=2e5, table=table)
+>>> ref = H2O(T=480, P=2e5)
+>>> st.fallback
+False
+>>> "%0.5f %0.5f" % (st.rho, ref.rho)
+'0.91174 0.91174'
+>>> "%0.2f %0.2f" % (st.h.kJkg, ref.h.kJkg)
+'2884.51 2884.51'
+>>> st2 = Tabulated(fluid=H2O, P=2e5, h=st.h, table=table)
+>>> "%0.4f" % st2.T
+'480.0000'
+>>> st3 = Tabulated(fluid=H2O, T=460, x=0.5, table=table)
+>>> "%0.1f %0.3f" % (st3.P.kPa, st3.x)
+'1170.9 0.500'
+>>> Tabulated(fluid=H2O, T=900, P=5e5, table=table).fallback
+True
+"""
+
+
+import logging
+import os
+import pickle
+import tempfile
+
+from numpy import (arange, array, clip, einsum, exp, floor, isfinite,
+                   linspace, log, moveaxis, nan, ndindex, ones, searchsorted,
+                   zeros)
+from numpy import gradient as npgradient
+from scipy.interpolate import CubicSpline
+
+from lib import unidades
+from lib.config import conf_dir
+from lib.thermo import ThermoAdvanced
+
+
+# Properties tabulated in each node, density, transport properties and
+# fugacity coefficient are tabulated in logarithmic form
+_props = ("lnrho", "h", "s", "cp", "cv", "w", "lnmu", "lnk", "lnfi", "h0",
+          "s0", "cp0", "cv0")
+
+# Saturation properties needed to define the phase boundary
+_boundary = ("P", "sigma", "lnrho", "h", "s")
+
+# Reference scale of error for properties with an arbitrary zero, enthalpy
+# and entropy, in R*Tc and R units
+_scale = {"h": "RT", "s": "R", "h0": "RT", "s0": "R"}
+
+# Bicubic interpolation matrix
+_A = array([[1., 0., 0., 0.],
+            [0., 0., 1., 0.],
+            [-3., 3., -2., -1.],
+            [2., -2., 1., 1.]])
+
+# Tables calculated in session, indexed by fluid, equation and domain
+_tables = {}
+
+# Version of table format, a change rebuild the tables saved in disk
+_version = 1
+
+
+def _float(value):
+    """Float value of property, nan for undefined values"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return nan
+    return value
+
+
+def _state(fluid, eq, **kwargs):
+    """Rigorous state, None if the calculation fails"""
+    try:
+        st = fluid(eq=eq, **kwargs)
+    except Exception:
+        return None
+    if st.status != 1:
+        return None
+    return st
+
+
+def _gradient(f, phase, axis):
+    """Derivative of grid values along an axis in index units, calculated
+    with a cubic spline over each run of consecutive nodes with the same
+    phase, so the saturation line isn't crossed. The short runs use finite
+    differences"""
+    f = moveaxis(f, axis, 0)
+    phase = moveaxis(phase, axis, 0)
+    df = zeros(f.shape)*nan
+    n = f.shape[0]
+    for line in ndindex(*phase.shape[1:]):
+        ph = phase[(slice(None),)+line]
+        start = 0
+        while start < n:
+            end = start+1
+            while end < n and ph[end] == ph[start]:
+                end += 1
+            if ph[start] == ph[start]:
+                run = (slice(start, end),)+line
+                y = f[run]
+                if end-start >= 2:
+                    df[run] = npgradient(y, axis=0)
+                defined = isfinite(y).all(axis=0)
+                if end-start >= 4 and defined.any():
+                    x = arange(end-start)
+                    spline = CubicSpline(x, y[:, defined])
+                    df[run+(defined,)] = spline(x, 1)
+            start = end
+    return moveaxis(df, 0, axis)
+
+
+def _values(st, fase):
+    """Tabulated values and analytic derivatives of a single phase state
+
+    Returns
+    -------
+    values : list
+        Properties in _props order
+    dT : dict
+        Temperature derivatives at constant pressure of properties with
+        analytic expression
+    dlnP : dict
+        Logarithm of pressure derivatives at constant temperature of
+        properties with analytic expression
+    """
+    rho = _float(fase.rho)
+    values = [log(rho), _float(fase.h), _float(fase.s), _float(fase.cp),
+              _float(fase.cv), _float(fase.w), log(_float(fase.mu)),
+              log(_float(fase.k)), log(_float(fase.fi[0])), _float(st.h0),
+              _float(st.s0), _float(st.cp0), _float(st.cv0)]
+
+    P = _float(st.P)
+    alfav = _float(fase.alfav)
+    kappa = _float(fase.kappa)
+    dT = {"lnrho": -alfav, "h": values[3], "s": values[3]/_float(st.T)}
+    dlnP = {"lnrho": P*kappa, "h": P/rho*(1-_float(st.T)*alfav),
+            "s": -P/rho*alfav}
+    return values, dT, dlnP
+
+
+class Table(object):
+    """Tabulated properties of a fluid in a temperature and pressure domain
+
+    Parameters
+    ----------
+    fluid : class
+        lib.mEoS fluid class
+    eq : int or str
+        Equation of state to use, default first
+    Tmin : float
+        Lower temperature of table, default triple point, [K]
+    Tmax : float
+        Upper temperature of table, default the lower of max temperature of
+        equation or three times the critical temperature, [K]
+    Pmin : float
+        Lower pressure of table, default 1 kPa, [Pa]
+    Pmax : float
+        Upper pressure of table, default the lower of max pressure of
+        equation or ten times the critical pressure, [Pa]
+    nodes : tuple
+        Number of nodes of grid in temperature and pressure
+    satNodes : int
+        Number of nodes of saturation line
+    tol : float
+        Max relative error of interpolation accepted in a cell
+
+    Attributes
+    ----------
+    valid : array
+        Boolean array with the cells of grid with an error lower than
+        tolerance
+    error : dict
+        Max error of each property in the validated cells and saturation
+        intervals
+    """
+
+    def __init__(self, fluid, eq=0, Tmin=None, Tmax=None, Pmin=None,
+                 Pmax=None, nodes=(100, 60), satNodes=100, tol=1e-5):
+        self.fluid = fluid
+        self.eq = eq
+        ref = fluid(eq=eq)
+        self.M = ref.M
+        self.R = _float(ref.R)
+        self.Tc = _float(ref.Tc)
+        self.Pc = _float(ref.Pc)
+        self.Tt = _float(ref.Tt)
+        self.doi = ref._constants["__doi__"]
+
+        if Tmin is None:
+            Tmin = max(self.Tt, ref._constants["Tmin"])
+        if Tmax is None:
+            Tmax = min(ref._constants["Tmax"], 3*self.Tc)
+        if Pmin is None:
+            Pmin = 1e3
+        if Pmax is None:
+            Pmax = min(ref._constants["Pmax"]*1e3, 10*self.Pc)
+        self.tol = tol
+        self.nodes = nodes
+        self.satNodes = satNodes
+
+        self.T = linspace(Tmin, Tmax, nodes[0])
+        self.lnP = linspace(log(Pmin), log(Pmax), nodes[1])
+        self.dT = self.T[1]-self.T[0]
+        self.dlnP = self.lnP[1]-self.lnP[0]
+
+        self.error = {}
+        self._saturationTable()
+        self._singlePhaseTable()
+
+    def _errors(self, values, st, fase):
+        """Error of interpolated values against a rigorous state"""
+        ref = _values(st, fase)[0]
+        scale = {"RT": self.R*_float(st.T), "R": self.R}
+        errors = {}
+        for prop, x, y in zip(_props, values, ref):
+            if not isfinite(y):
+                continue
+            if prop[:2] == "ln":
+                errors[prop] = abs(x-y)
+            elif prop in _scale:
+                errors[prop] = abs(x-y)/max(abs(y), scale[_scale[prop]])
+            else:
+                errors[prop] = abs(x-y)/abs(y)
+        return errors
+
+    def _saturationTable(self):
+        """Saturation line from triple point to near critical point, with
+        cubic splines in the square root of distance to critical point of
+        logarithm of pressure, surface tension and properties of both
+        saturated phases"""
+        self.sat = None
+        N = self.satNodes
+        w = linspace(1, 0.02, 2*N-1)
+        Ts = self.Tc-(self.Tc-self.Tt)*w**2
+
+        points = []
+        for T in Ts:
+            st = _state(self.fluid, self.eq, T=T, x=0.5)
+            if st is None:
+                points.append(None)
+                continue
+            points.append([log(_float(st.P)), _float(st.sigma)] +
+                          _values(st, st.Liquido)[0] +
+                          _values(st, st.Gas)[0])
+
+        nodes = [i for i in range(0, 2*N-1, 2) if points[i] is not None]
+        if len(nodes) < 4:
+            return
+        x = -w[nodes]
+        data = array([points[i] for i in nodes])
+        sat = {"w": x, "spline": CubicSpline(x, data),
+               "valid": ones(len(nodes)-1, dtype=bool),
+               "boundary": ones(len(nodes)-1, dtype=bool)}
+        self.sat = sat
+
+        # Validate each interval with the rigorous state at middle point, the
+        # interval can be used to locate the phase boundary with accurate
+        # pressure, surface tension, density, enthalpy and entropy, although
+        # some other property isn't accurate
+        nprop = len(_props)
+        error = {}
+        for k, (i, j) in enumerate(zip(nodes[:-1], nodes[1:])):
+            mid = (i+j)//2
+            if j-i != 2 or points[mid] is None:
+                sat["valid"][k] = False
+                sat["boundary"][k] = False
+                continue
+            st = _state(self.fluid, self.eq, T=Ts[mid], x=0.5)
+            values = sat["spline"](-w[mid])
+            err = {"P": abs(exp(values[0]-points[mid][0])-1)}
+            if isfinite(points[mid][1]):
+                err["sigma"] = abs(values[1]/points[mid][1]-1)
+            err.update(self._errors(values[2:2+nprop], st, st.Liquido))
+            for prop, e in self._errors(values[2+nprop:], st,
+                                        st.Gas).items():
+                err[prop] = max(err.get(prop, 0), e)
+            boundary = [err.get(prop, 0) for prop in _boundary]
+            if max(boundary) > self.tol:
+                sat["boundary"][k] = False
+            if max(err.values()) > self.tol:
+                sat["valid"][k] = False
+                continue
+            for prop, e in err.items():
+                error[prop] = max(error.get(prop, 0), e)
+
+        sat["Tmax"] = self.Tc+(self.Tc-self.Tt)*-x[-1]**2
+        sat["lnPmin"] = data[0, 0]
+        sat["lnPmax"] = data[-1, 0]
+        sat["wlnP"] = CubicSpline(data[:, 0], x)
+        self.error["saturation"] = error
+
+    def _singlePhaseTable(self):
+        """Grid of single phase properties with the bicubic coefficients of
+        each cell"""
+        nT, nP = self.nodes
+        nprop = len(_props)
+        f = zeros((nT, nP, nprop))*nan
+        fx = zeros((nT, nP, nprop))*nan
+        fy = zeros((nT, nP, nprop))*nan
+        phase = zeros((nT, nP))*nan
+        for i, T in enumerate(self.T):
+            for j, lnP in enumerate(self.lnP):
+                st = _state(self.fluid, self.eq, T=T, P=exp(lnP))
+                if st is None or 0 < st.x < 1:
+                    continue
+                values, dT, dlnP = _values(st, st)
+                f[i, j] = values
+                phase[i, j] = st.x
+                for k, prop in enumerate(_props):
+                    if prop in dT:
+                        fx[i, j, k] = dT[prop]*self.dT
+                        fy[i, j, k] = dlnP[prop]*self.dlnP
+
+        # Derivatives in grid index units, finite differences for properties
+        # without analytic expression and for the cross derivative
+        fdx = _gradient(f, phase, 0)
+        fdy = _gradient(f, phase, 1)
+        analytic = [prop in ("lnrho", "h", "s") for prop in _props]
+        for k, exact in enumerate(analytic):
+            if not exact:
+                fx[:, :, k] = fdx[:, :, k]
+                fy[:, :, k] = fdy[:, :, k]
+        fxy = (_gradient(fx, phase, 1)+_gradient(fy, phase, 0))/2
+
+        # Bicubic coefficients of cells
+        F = zeros((nT-1, nP-1, nprop, 4, 4))
+        F[..., 0, 0] = f[:-1, :-1]
+        F[..., 0, 1] = f[:-1, 1:]
+        F[..., 1, 0] = f[1:, :-1]
+        F[..., 1, 1] = f[1:, 1:]
+        F[..., 0, 2] = fy[:-1, :-1]
+        F[..., 0, 3] = fy[:-1, 1:]
+        F[..., 1, 2] = fy[1:, :-1]
+        F[..., 1, 3] = fy[1:, 1:]
+        F[..., 2, 0] = fx[:-1, :-1]
+        F[..., 2, 1] = fx[:-1, 1:]
+        F[..., 3, 0] = fx[1:, :-1]
+        F[..., 3, 1] = fx[1:, 1:]
+        F[..., 2, 2] = fxy[:-1, :-1]
+        F[..., 2, 3] = fxy[:-1, 1:]
+        F[..., 3, 2] = fxy[1:, :-1]
+        F[..., 3, 3] = fxy[1:, 1:]
+        self.coef = einsum("ab,...bc,dc->...ad", _A, F, _A)
+
+        # The properties without data in fluid, transport properties in
+        # some fluids, don't invalidate the cells
+        defined = isfinite(f).any(axis=(0, 1))
+        finite = isfinite(self.coef[..., defined, :, :]).all(axis=(2, 3, 4))
+        self.defined = defined
+
+        # Validation in the middle point of cells
+        valid = zeros((nT-1, nP-1), dtype=bool)
+        error = {}
+        for i in range(nT-1):
+            for j in range(nP-1):
+                # Cells crossed by the saturation line aren't used
+                if not finite[i, j] or \
+                        len(set(phase[i:i+2, j:j+2].flat)) != 1:
+                    continue
+                T = self.T[i]+self.dT/2
+                P = exp(self.lnP[j]+self.dlnP/2)
+                st = _state(self.fluid, self.eq, T=T, P=P)
+                if st is None or 0 < st.x < 1:
+                    continue
+                values = self._cell(i, j, 0.5, 0.5)[0]
+                err = self._errors(values, st, st)
+                if max(err.values()) > self.tol:
+                    continue
+                valid[i, j] = True
+                for prop, e in err.items():
+                    error[prop] = max(error.get(prop, 0), e)
+        self.valid = valid
+        self.error["single"] = error
+
+    def _cell(self, i, j, u, v):
+        """Bicubic interpolation in cell
+
+        Parameters
+        ----------
+        i, j : int
+            Index of cell in temperature and pressure
+        u, v : float
+            Relative position in cell, [0-1]
+
+        Returns
+        -------
+        values : array
+            Interpolated properties
+        dT : array
+            Temperature derivative of properties at constant pressure
+        dlnP : array
+            Logarithm of pressure derivative of properties at constant
+            temperature
+        """
+        a = self.coef[i, j]
+        U = array([1, u, u**2, u**3])
+        V = array([1, v, v**2, v**3])
+        dU = array([0, 1, 2*u, 3*u**2])
+        dV = array([0, 1, 2*v, 3*v**2])
+        aV = a.dot(V)
+        values = aV.dot(U)
+        dT = aV.dot(dU)/self.dT
+        dlnP = a.dot(dV).dot(U)/self.dlnP
+        return values, dT, dlnP
+
+    def _locate(self, T, P):
+        """Cell and relative position of a state, None if it's out of table
+        or in a cell not validated"""
+        x = (T-self.T[0])/self.dT
+        y = (log(P)-self.lnP[0])/self.dlnP
+        if not 0 <= x <= self.nodes[0]-1 or not 0 <= y <= self.nodes[1]-1:
+            return None
+        i = min(int(floor(x)), self.nodes[0]-2)
+        j = min(int(floor(y)), self.nodes[1]-2)
+        if not self.valid[i, j]:
+            return None
+        return i, j, x-i, y-j
+
+    def single(self, T, P):
+        """Single phase properties at T, P, None if the state isn't covered
+        by table"""
+        cell = self._locate(T, P)
+        if cell is None:
+            return None
+        return self._cell(*cell)
+
+    def saturation(self, T=None, P=None, boundary=False):
+        """Saturation state at temperature or pressure
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        boundary : bool
+            Accept the intervals validated only for the properties of phase
+            boundary, the others properties can be inaccurate
+
+        Returns
+        -------
+        sat : tuple
+            T, P, sigma and values of saturated liquid and vapor, None if
+            the input is out of saturation table or in a interval not
+            validated
+        """
+        sat = self.sat
+        if sat is None:
+            return None
+        if P is not None:
+            lnP = log(P)
+            if not sat["lnPmin"] <= lnP <= sat["lnPmax"]:
+                return None
+            # Inverse spline with Newton refinement
+            x = float(sat["wlnP"](lnP))
+            for i in range(3):
+                x -= (sat["spline"](x)[0]-lnP)/sat["spline"](x, 1)[0]
+            x = float(clip(x, sat["w"][0], sat["w"][-1]))
+            T = self.Tc-(self.Tc-self.Tt)*x**2
+        else:
+            if not self.Tt <= T <= sat["Tmax"]:
+                return None
+            x = -((self.Tc-T)/(self.Tc-self.Tt))**0.5
+
+        k = min(max(int(searchsorted(sat["w"], x, "right"))-1, 0),
+                len(sat["valid"])-1)
+        if boundary:
+            valid = sat["boundary"][k]
+        else:
+            valid = sat["valid"][k]
+        if not valid:
+            return None
+        values = sat["spline"](x)
+        nprop = len(_props)
+        return T, exp(values[0]), values[1], values[2:2+nprop], \
+            values[2+nprop:]
+
+    def temperature(self, P, h, prop="h"):
+        """Single phase temperature at pressure and enthalpy, or entropy with
+        prop="s", solved with the interpolation of table, None if the state
+        isn't in table"""
+        y = (log(P)-self.lnP[0])/self.dlnP
+        if not 0 <= y <= self.nodes[1]-1:
+            return None
+        j = min(int(floor(y)), self.nodes[1]-2)
+        v = y-j
+
+        # Enthalpy in nodes along the isobar, the enthalpy and the entropy
+        # increase with temperature in single phase and with the phase change
+        k = _props.index(prop)
+        a = self.coef[:, j, k]
+        hnode = a[:, 0, :].dot([1, v, v**2, v**3])
+        hlast = a[-1].dot([1, v, v**2, v**3]).sum()
+        hnode = list(hnode)+[hlast]
+        if not hnode[0] <= h <= hnode[-1]:
+            return None
+        i = 0
+        while i < len(hnode)-2 and hnode[i+1] < h:
+            i += 1
+        if not self.valid[i, j]:
+            return None
+
+        u = 0.5
+        for it in range(20):
+            values, dT, dlnP = self._cell(i, j, u, v)
+            du = (values[k]-h)/dT[k]/self.dT
+            u -= du
+            if abs(du) < 1e-12:
+                break
+        if not -1e-9 <= u <= 1+1e-9:
+            return None
+        return self.T[i]+u*self.dT
+
+
+def getTable(fluid, eq=0, **kwargs):
+    """Table of fluid, calculated in first use and saved in the config
+    folder to use in later sessions
+
+    Parameters
+    ----------
+    fluid : class
+        lib.mEoS fluid class
+    eq : int or str
+        Equation of state to use, default first
+    kwargs : dict
+        Domain and nodes of table, see :class:`Table`
+
+    Returns
+    -------
+    table : Table
+        Tabulated values of fluid
+    """
+    key = [_version, fluid.__name__, eq]
+    for par in ("Tmin", "Tmax", "Pmin", "Pmax", "nodes", "satNodes", "tol"):
+        key.append(kwargs.get(par, None))
+    name = "%s-%s" % (fluid.__name__, eq)
+    code = str(key)
+    if code in _tables:
+        return _tables[code]
+
+    # The table saved is rebuilt with a change of equation coefficients
+    key.append(fluid(eq=eq)._coefficientHash())
+
+    filename = conf_dir+"MEoStable_%s.pkl" % name
+    table = None
+    if os.path.isfile(filename):
+        try:
+            with open(filename, "rb") as archivo:
+                dat = pickle.load(archivo)
+            if dat["key"] == key:
+                table = dat["table"]
+        except (OSError, EOFError, KeyError, AttributeError, ImportError,
+                IndexError, TypeError, ValueError, pickle.UnpicklingError):
+            table = None
+
+    if table is None:
+        logging.warning("Calculating property table of %s, it can take "
+                        "some minutes, see precomputeTables", name)
+        table = Table(fluid, eq, **kwargs)
+        # Written in a temporal file and renamed, so an interrupted or
+        # concurrent save don't leave a truncated file
+        archivo = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                    "wb", dir=conf_dir, prefix="MEoStable", suffix=".tmp",
+                    delete=False) as archivo:
+                pickle.dump({"key": key, "table": table}, archivo)
+            os.replace(archivo.name, filename)
+        except (OSError, pickle.PicklingError):
+            logging.warning("Property table of %s not saved", name)
+            if archivo is not None and os.path.isfile(archivo.name):
+                os.remove(archivo.name)
+
+    _tables[code] = table
+    return table
+
+
+def precomputeTables(fluids=None, eq=0):
+    """Calculate the tables of fluids with the default domain and save them
+    in the config folder, so later streams only read them. The tables
+    already saved with the same definition aren't recalculated
+
+    Parameters
+    ----------
+    fluids : list, optional
+        lib.mEoS classes of fluids, default all
+    eq : int or str
+        Equation of state to use, default first
+
+    Returns
+    -------
+    tables : dict
+        Tables of fluids, with the fluid name as key
+    """
+    if fluids is None:
+        from lib import mEoS
+        fluids = mEoS.__all__
+
+    tables = {}
+    for fluid in fluids:
+        tables[fluid.__name__] = getTable(fluid, eq)
+    return tables
+
+
+class Tabulated(ThermoAdvanced):
+    """Stream class using the tabulated interpolation of a lib.mEoS fluid,
+    the states out of table use the rigorous MEoS calculation
+
+    Parameters needed to define it are:
+
+        -fluid: lib.mEoS class of fluid
+        -eq: equation of state of fluid to use, default first
+
+        -T: Temperature, Kelvin
+        -P: Pressure, Pa
+        -h: Enthalpy, J/kg
+        -s: Entropy, J/kgK
+        -x: Quality, -
+
+    Optional:
+        -table: Table instance to use, default calculated with
+            :func:`getTable`
+    """
+    kwargs = {"fluid": None,
+              "eq": 0,
+              "table": None,
+
+              "T": 0.0,
+              "P": 0.0,
+              "h": None,
+              "s": None,
+              "x": None}
+
+    fallback = False
+
+    @property
+    def calculable(self):
+        self._mode = ""
+        if not self.kwargs["fluid"]:
+            return False
+        if self.kwargs["T"] and self.kwargs["P"]:
+            self._mode = "T-P"
+        elif self.kwargs["P"] and self.kwargs["h"] is not None:
+            self._mode = "P-h"
+        elif self.kwargs["P"] and self.kwargs["s"] is not None:
+            self._mode = "P-s"
+        elif self.kwargs["T"] and self.kwargs["x"] is not None:
+            self._mode = "T-x"
+        elif self.kwargs["P"] and self.kwargs["x"] is not None:
+            self._mode = "P-x"
+        return bool(self._mode)
+
+    def calculo(self):
+        fluid = self.kwargs["fluid"]
+        table = self.kwargs["table"]
+        if table is None:
+            table = getTable(fluid, self.kwargs["eq"])
+        self.table = table
+
+        self.name = fluid.name
+        self.synonim = fluid.synonym
+        self.CAS = fluid.CASNumber
+        self.M = unidades.Dimensionless(table.M)
+        self.Tc = unidades.Temperature(table.Tc)
+        self.Pc = unidades.Pressure(table.Pc)
+        self.R = table.R
+        self.__doi__ = [table.doi]
+
+        self.fallback = not self._interpolate(table)
+        if self.fallback:
+            kw = {var: self.kwargs[var] for var in self._mode.split("-")}
+            st = fluid(eq=self.kwargs["eq"], **kw)
+            self.status = st.status
+            self.msg = st.msg
+            for prop in self.propertiesKey()+["Liquido", "Gas", "rhoM",
+                                               "hM", "sM", "uM", "aM", "gM",
+                                               "cvM", "cpM"]:
+                if prop in st.__dict__:
+                    self.__setattr__(prop, st.__getattribute__(prop))
+
+    def _interpolate(self, table):
+        """Calculate the state with the table, return False if it isn't
+        possible"""
+        T = self.kwargs["T"]
+        P = self.kwargs["P"]
+        x = self.kwargs["x"]
+
+        sat = None
+        if self._mode in ("T-x", "P-x"):
+            if self._mode == "T-x":
+                sat = table.saturation(T=T)
+            else:
+                sat = table.saturation(P=P)
+            if sat is None:
+                return False
+            T, P = sat[:2]
+
+        elif self._mode in ("P-h", "P-s"):
+            prop = self._mode[-1]
+            h = self.kwargs[prop]
+            if P < table.Pc:
+                sat = table.saturation(P=P, boundary=True)
+                if sat is None:
+                    return False
+                k = _props.index(prop)
+                hl = sat[3][k]
+                hv = sat[4][k]
+                if hl <= h <= hv:
+                    sat = table.saturation(P=P)
+                    if sat is None:
+                        return False
+                    T = sat[0]
+                    x = (h-hl)/(hv-hl)
+                else:
+                    sat = None
+            if sat is None:
+                T = table.temperature(P, h, prop)
+                if T is None:
+                    return False
+
+        # Single phase states, phase defined by the saturation line
+        if sat is None:
+            sigma = None
+            if T < table.Tc:
+                saturation = table.saturation(T=T, boundary=True)
+                if saturation is None:
+                    return False
+                if P >= saturation[1]:
+                    x = 0
+                    sigma = saturation[2]
+                else:
+                    x = 1
+            else:
+                x = 1
+            single = table.single(T, P)
+            if single is None:
+                return False
+
+        self.T = unidades.Temperature(T)
+        self.Tr = unidades.Dimensionless(T/table.Tc)
+        self.P = unidades.Pressure(P)
+        self.Pr = unidades.Dimensionless(P/table.Pc)
+        self.x = unidades.Dimensionless(x)
+
+        self.Liquido = ThermoAdvanced()
+        self.Gas = ThermoAdvanced()
+        if sat is None:
+            values, dT, dlnP = single
+            self._ideal(values, self.R*T/P)
+            if x == 0:
+                fase = self.Liquido
+                self.fillNone(self.Gas)
+            else:
+                fase = self.Gas
+                self.fillNone(self.Liquido)
+            self.fill(fase, values, dT, dlnP)
+
+            # The global state is the phase state, share the instances
+            # instead of calculate them twice
+            for key in self.propertiesPhase()+["fraccion", "fraccion_masica"]:
+                if key in fase.__dict__:
+                    self.__setattr__(key, fase.__dict__[key])
+            self.sigma = unidades.Tension(sigma)
+            self.Hvap = unidades.Enthalpy(None)
+            self.Svap = unidades.SpecificHeat(None)
+
+        else:
+            T, P, sigma, liquid, vapor = sat
+            self.fill(self.Liquido, liquid)
+            self.fill(self.Gas, vapor)
+            self.fillNone(self)
+
+            self.v = unidades.SpecificVolume(
+                x*self.Gas.v+(1-x)*self.Liquido.v)
+            self.rho = unidades.Density(1/self.v)
+            for prop in ("h", "s", "u", "a", "g"):
+                value = x*self.Gas.__getattribute__(prop) + \
+                    (1-x)*self.Liquido.__getattribute__(prop)
+                self.__setattr__(prop, self.Gas.__getattribute__(
+                    prop).__class__(value))
+            self.rhoM = unidades.MolarDensity(self.rho/self.M)
+            self.hM = unidades.MolarEnthalpy(self.h*self.M)
+            self.sM = unidades.MolarSpecificHeat(self.s*self.M)
+            self.uM = unidades.MolarEnthalpy(self.u*self.M)
+            self.aM = unidades.MolarEnthalpy(self.a*self.M)
+            self.gM = unidades.MolarEnthalpy(self.g*self.M)
+
+            # Ideal gas properties at the global density, the entropy
+            # change with density
+            ideal = vapor.copy()
+            ideal[_props.index("s0")] -= self.R*log(self.rho/self.Gas.rho)
+            self._ideal(ideal, self.R*T/P)
+
+            self.sigma = unidades.Tension(sigma)
+            self.Hvap = unidades.Enthalpy(self.Gas.h-self.Liquido.h)
+            self.Svap = unidades.SpecificHeat(self.Gas.s-self.Liquido.s)
+
+        self.invT = unidades.InvTemperature(-1/self.T)
+        return True
+
+    def _ideal(self, values, v0):
+        """Set the ideal gas properties"""
+        cp0 = {}
+        for prop in ("h0", "s0", "cp0", "cv0"):
+            cp0[prop[:-1]] = values[_props.index(prop)]
+        cp0["v"] = v0
+        cp0["w"] = None
+        self._cp0(cp0)
+
+    def fill(self, fase, values, dT=None, dlnP=None):
+        """Fill phase properties from the tabulated values, the derivatives
+        of density are necessary for the derived properties, not available
+        in saturated phases"""
+        prop = dict(zip(_props, values))
+        T = self.T
+        P = self.P
+
+        fase._bool = True
+        fase.M = self.M
+        fase.rho = unidades.Density(exp(prop["lnrho"]))
+        fase.v = unidades.SpecificVolume(1/fase.rho)
+        fase.Z = unidades.Dimensionless(P*fase.v/self.R/T)
+
+        fase.h = unidades.Enthalpy(prop["h"])
+        fase.s = unidades.SpecificHeat(prop["s"])
+        fase.u = unidades.Enthalpy(fase.h-P*fase.v)
+        fase.a = unidades.Enthalpy(fase.u-T*fase.s)
+        fase.g = unidades.Enthalpy(fase.h-T*fase.s)
+        fase.fi = [unidades.Dimensionless(exp(prop["lnfi"]))]
+        fase.f = [unidades.Pressure(f*P) for f in fase.fi]
+
+        fase.cv = unidades.SpecificHeat(prop["cv"])
+        fase.cp = unidades.SpecificHeat(prop["cp"])
+        fase.cp_cv = unidades.Dimensionless(fase.cp/fase.cv)
+        fase.w = unidades.Speed(prop["w"])
+
+        fase.rhoM = unidades.MolarDensity(fase.rho/self.M)
+        fase.hM = unidades.MolarEnthalpy(fase.h*self.M)
+        fase.sM = unidades.MolarSpecificHeat(fase.s*self.M)
+        fase.uM = unidades.MolarEnthalpy(fase.u*self.M)
+        fase.aM = unidades.MolarEnthalpy(fase.a*self.M)
+        fase.gM = unidades.MolarEnthalpy(fase.g*self.M)
+        fase.cvM = unidades.MolarSpecificHeat(fase.cv*self.M)
+        fase.cpM = unidades.MolarSpecificHeat(fase.cp*self.M)
+
+        if isfinite(prop["lnmu"]):
+            fase.mu = unidades.Viscosity(exp(prop["lnmu"]))
+            fase.nu = unidades.Diffusivity(fase.mu/fase.rho)
+        else:
+            fase.mu = unidades.Viscosity(None)
+            fase.nu = unidades.Diffusivity(None)
+        if isfinite(prop["lnk"]):
+            fase.k = unidades.ThermalConductivity(exp(prop["lnk"]))
+            fase.alfa = unidades.Diffusivity(fase.k/fase.rho/fase.cp)
+        else:
+            fase.k = unidades.ThermalConductivity(None)
+            fase.alfa = unidades.Diffusivity(None)
+        if fase.mu and fase.k:
+            fase.Prandt = unidades.Dimensionless(fase.mu*fase.cp/fase.k)
+        else:
+            fase.Prandt = unidades.Dimensionless(None)
+
+        if dT is not None:
+            k = _props.index("lnrho")
+            alfav = -dT[k]
+            kappa = dlnP[k]/P
+            kappas = kappa*fase.cv/fase.cp
+            dPdT = alfav/kappa
+
+            fase.alfav = unidades.InvTemperature(alfav)
+            fase.kappa = unidades.InvPressure(kappa)
+            fase.kappas = unidades.InvPressure(kappas)
+            fase.alfap = unidades.InvTemperature(dPdT/P)
+            fase.betap = unidades.Density(fase.rho/P/kappa)
+            fase.gamma = unidades.Dimensionless(1/P/kappas)
+            fase.joule = unidades.TemperaturePressure(
+                (T*alfav-1)*fase.v/fase.cp)
+            fase.deltat = unidades.EnthalpyPressure(fase.v*(1-T*alfav))
+            fase.betas = unidades.TemperaturePressure(
+                T*fase.v*alfav/fase.cp)
+            fase.Gruneisen = unidades.Dimensionless(
+                fase.v*dPdT/fase.cv)
+            fase.kt = unidades.Dimensionless(1/P/kappa)
+            fase.ks = unidades.Dimensionless(1/P/kappas)
+            fase.Kt = unidades.Pressure(1/kappa)
+            fase.Ks = unidades.Pressure(1/kappas)
+            fase.dpdT_rho = unidades.PressureTemperature(dPdT)
+            fase.dpdrho_T = unidades.PressureDensity(1/fase.rho/kappa)
+            fase.drhodP_T = unidades.DensityPressure(fase.rho*kappa)
+            fase.drhodT_P = unidades.DensityTemperature(-fase.rho*alfav)
+            fase.dhdT_P = fase.cp
+            fase.dhdP_T = fase.deltat
+            fase.dhdT_rho = unidades.SpecificHeat(
+                fase.cv+fase.v*dPdT)
+            fase.dhdP_rho = unidades.EnthalpyPressure(fase.dhdT_rho/dPdT)
+            fase.dhdrho_T = unidades.EnthalpyDensity(
+                fase.deltat*fase.dpdrho_T)
+            fase.IntP = unidades.Pressure(T*dPdT-P)
+            fase.hInput = unidades.Enthalpy(fase.cp/alfav)
+        else:
+            for key in ("alfav", "kappa", "kappas", "alfap", "betap",
+                        "gamma", "joule", "deltat", "betas", "Gruneisen",
+                        "kt", "ks", "Kt", "Ks", "dpdT_rho", "dpdrho_T",
+                        "drhodP_T", "drhodT_P", "dhdT_P", "dhdP_T",
+                        "dhdT_rho", "dhdP_rho", "dhdrho_T", "IntP",
+                        "hInput"):
+                fase.__setattr__(key, unidades.Dimensionless(None))
+
+        fase.virialB = unidades.SpecificVolume(None)
+        fase.virialC = unidades.SpecificVolume_square(None)
+        fase.invT = unidades.InvTemperature(-1/T)
+        fase.epsilon = unidades.Dimensionless(None)
+        fase.fraccion = [1]
+        fase.fraccion_masica = [1]
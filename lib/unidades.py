@@ -94,19 +94,15 @@ The list of supported unit are:
 '''
 
 
-from configparser import ConfigParser
 import json
-import logging
 import os
 import time
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5 import QtCore
+from numpy import asarray
 import scipy.constants as k
 
-from lib.config import conf_dir, getMainWindowConfig
-from lib.utilities import representacion
-from tools.firstrun import getrates
+from lib.config import conf_dir, getNumericFormat, getUnits
+from lib.qt import QApplication, systemLocale
 
 # Defining conversion factor not available in scipy
 k.tonUS = 2000 * k.lb
@@ -175,7 +171,36 @@ def K2Re(K):
     return (K - 273.15) / 1.25
 
 
-class unidad(float):
+class _Unit(object):
+    """Descriptor of a unit attribute of magnitudes, the value is calculated
+    on demand from the value in base unit"""
+    __slots__ = ("name", )
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        try:
+            return instance._fromBase(self.name)
+        except KeyError:
+            raise AttributeError(self.name)
+
+
+class _unidadMeta(type):
+    """Metaclass of magnitudes, define the instance layout with __slots__ and
+    add the descriptors for the unit attributes"""
+    def __new__(mcs, name, bases, namespace):
+        namespace.setdefault("__slots__", ())
+        cls = type.__new__(mcs, name, bases, namespace)
+        for unit in list(cls.rates)+list(cls.__units__):
+            if unit not in namespace:
+                setattr(cls, unit, _Unit(unit))
+        return cls
+
+
+class unidad(float, metaclass=_unidadMeta):
     """
     Generic class to model units.
 
@@ -197,6 +222,7 @@ class unidad(float):
     __tooltip__ = []
     _magnitudes = []
     __units_set__ = []
+    __slots__ = ("magnitud", "code", "_data")
 
     def __init__(self, data, unit="", magnitud=""):
         """Constructor
@@ -213,7 +239,10 @@ class unidad(float):
         Notes
         -----
         Non proportional magnitudes (Temperature, Pressure) must rewrite this
-        method
+        method and :func:`_fromBase`
+
+        The value in each unit is not saved in instance, it's calculated when
+        the unit attribute is accessed
         """
         if not magnitud:
             magnitud = self.__class__.__name__
@@ -227,15 +256,10 @@ class unidad(float):
             self.code = ""
 
         if unit == "conf":
-            Config = getMainWindowConfig()
-            unit = self.__units__[Config.getint('Units', magnitud)]
+            unit = self.__units__[getUnits()[magnitud]]
         elif not unit:
             unit = self.__units__[0]
         self._data = self._getBaseValue(data, unit, magnitud)
-        for key in self.__class__.rates:
-            self.__setattr__(key, self._data / self.__class__.rates[key])
-
-        logging.debug("%s, %f" % (self.__class__.__name__, self._data))
 
     def __new__(cls, data, unit="", magnitud=""):
         """Constructor to let multiple paramter input in float"""
@@ -257,8 +281,7 @@ class unidad(float):
             data = float(data)
 
         if unit == "conf":
-            Config = getMainWindowConfig()
-            unit = cls.__units__[Config.getint('Units', magnitud)]
+            unit = cls.__units__[getUnits()[magnitud]]
         elif not unit:
             unit = cls.__units__[0]
 
@@ -271,6 +294,26 @@ class unidad(float):
         data *= conversion
         return data
 
+    @classmethod
+    def array(cls, data, unit=""):
+        """Return the instance for scalar data, for array data the numpy array
+        in base unit, to let the vectorized correlations return both
+
+        Only valid for units with proportional conversion rates
+        """
+        data = asarray(data, dtype=float)
+        if data.ndim == 0:
+            if unit:
+                return cls(float(data), unit)
+            return cls(float(data))
+        if unit:
+            data = data*cls.rates[unit]
+        return data
+
+    def _fromBase(self, unit):
+        """Convert the value in base unit to the unit"""
+        return self._data/self.__class__.rates[unit]
+
     def __add__(self, other):
         """Support for += operation"""
         return self.__class__(self._data+other)
@@ -283,8 +326,7 @@ class unidad(float):
         """Using config file return the value in the configurated unit"""
         if not magnitud:
             magnitud = self.__class__.__name__
-        Config = getMainWindowConfig()
-        value = Config.getint('Units', magnitud)
+        value = getUnits()[magnitud]
         return self.__getattribute__(self.__units__[value])
 
     @classmethod
@@ -292,16 +334,14 @@ class unidad(float):
         """Using config file return the configurated unit text"""
         if not magnitud:
             magnitud = cls.__name__
-        Config = getMainWindowConfig()
-        return cls.__text__[Config.getint("Units", magnitud)]
+        return cls.__text__[getUnits()[magnitud]]
 
     @classmethod
     def func(cls, magnitud=""):
         """Return the configurated unit name for getattribute call"""
         if not magnitud:
             magnitud = cls.__name__
-        Config = getMainWindowConfig()
-        return cls.__units__[Config.getint("Units", magnitud)]
+        return cls.__units__[getUnits()[magnitud]]
 
     @classmethod
     def magnitudes(cls):
@@ -318,11 +358,8 @@ class unidad(float):
             magnitud = self.__class__.__name__
         if not unit:
             unit = self.func(magnitud)
-        Preferences = ConfigParser()
-        Preferences.read(conf_dir+"pychemqtrc")
-        kwargs = eval(Preferences.get("NumericFormat", magnitud))
         value = self.__getattribute__(unit)
-        return representacion(value, **kwargs)
+        return getNumericFormat(magnitud)(value)
 
     def get_str(self, conf=None):
         """Return a string representation of class"""
@@ -345,6 +382,7 @@ with support for class unidad operations: txt, config. func."""
     __title__ = QApplication.translate("pychemqt", "Dimensionless")
     __text__ = []
     _magnitudes = []
+    __slots__ = ("txt", "code", "_data")
 
     def __init__(self, data, txt=""):
 
@@ -356,7 +394,6 @@ with support for class unidad operations: txt, config. func."""
         else:
             self._data = data
             self.code = ""
-        logging.debug("%s, %f" % (self.__class__.__name__, self._data))
 
     def __new__(cls, data, txt=""):
         """Discard superfluous parameters for this class"""
@@ -372,15 +409,21 @@ with support for class unidad operations: txt, config. func."""
     def func(cls):
         return ""
 
+    @classmethod
+    def array(cls, data, txt=""):
+        """Return the instance for scalar data, the numpy array for array
+        data, see :func:`unidad.array`"""
+        data = asarray(data, dtype=float)
+        if data.ndim == 0:
+            return cls(float(data), txt)
+        return data
+
     def config(self):
         return self
 
     def format(self, unit):
         """Using config file return the unit value in desired numeric format"""
-        Preferences = ConfigParser()
-        Preferences.read(conf_dir+"pychemqtrc")
-        kwargs = eval(Preferences.get("NumericFormat", "Dimensionless"))
-        return representacion(self, **kwargs)
+        return getNumericFormat("Dimensionless")(self)
 
     @property
     def str(self):
@@ -414,8 +457,7 @@ class Temperature(unidad):
             self.code = ""
 
         if unit == "conf":
-            Config = getMainWindowConfig()
-            unit = self.__units__[Config.getint('Units', magnitud)]
+            unit = self.__units__[getUnits()[magnitud]]
 
         if unit == "K":
             self._data = data
@@ -431,12 +473,18 @@ class Temperature(unidad):
             raise ValueError(
                 QApplication.translate("pychemqt", "Wrong input code"))
 
-        self.K = self._data
-        self.C = K2C(self._data)
-        self.F = K2F(self._data)
-        self.R = K2R(self._data)
-        self.Re = K2Re(self._data)
-        logging.debug("%s, %f" % (self.__class__.__name__, self._data))
+    def _fromBase(self, unit):
+        if unit == "K":
+            return self._data
+        elif unit == "C":
+            return K2C(self._data)
+        elif unit == "F":
+            return K2F(self._data)
+        elif unit == "R":
+            return K2R(self._data)
+        elif unit == "Re":
+            return K2Re(self._data)
+        raise KeyError(unit)
 
     @classmethod
     def _getBaseValue(cls, data, unit, magnitud):
@@ -446,8 +494,7 @@ class Temperature(unidad):
             magnitud = cls.__name__
 
         if unit == "conf":
-            Config = getMainWindowConfig()
-            unit = cls.__units__[Config.getint('Units', magnitud)]
+            unit = cls.__units__[getUnits()[magnitud]]
         elif not unit:
             unit = "K"
 
@@ -1040,8 +1087,7 @@ class Pressure(unidad):
         self.magnitud = magnitud
 
         if unit == "conf":
-            Config = getMainWindowConfig()
-            unit = self.__units__[Config.getint('Units', magnitud)]
+            unit = self.__units__[getUnits()[magnitud]]
 
         if unit == "barg":
             self._data = data*k.bar+k.atm
@@ -1052,13 +1098,14 @@ class Pressure(unidad):
         else:
             self._data = data * self.__class__.rates[unit]
 
-        for key in self.__class__.rates:
-            self.__setattr__(key, self._data/self.__class__.rates[key])
-
-        self.barg = (self.Pa-k.atm)/k.bar
-        self.psig = (self.Pa-k.atm)/k.psi
-        self.kgcm2g = (self.Pa-k.atm)*k.centi**2/k.g
-        logging.debug("%s, %f" % (self.__class__.__name__, self._data))
+    def _fromBase(self, unit):
+        if unit == "barg":
+            return (self._data-k.atm)/k.bar
+        elif unit == "psig":
+            return (self._data-k.atm)/k.psi
+        elif unit == "kgcm2g":
+            return (self._data-k.atm)*k.centi**2/k.g
+        return self._data/self.__class__.rates[unit]
 
     @classmethod
     def _getBaseValue(cls, data, unit, magnitud):
@@ -1068,8 +1115,7 @@ class Pressure(unidad):
             magnitud = cls.__name__
 
         if unit == "conf":
-            Config = getMainWindowConfig()
-            unit = cls.__units__[Config.getint('Units', magnitud)]
+            unit = cls.__units__[getUnits()[magnitud]]
         elif not unit:
             unit = "Pa"
 
@@ -2015,6 +2061,7 @@ class Currency(unidad):
         archivo = open(filename, "r")
         rates = json.load(archivo)
     except (FileNotFoundError, TypeError):  # noqa
+        from tools.firstrun import getrates
         getrates(filename)
         archivo = open(filename, "r")
         rates = json.load(archivo)
@@ -2233,7 +2280,7 @@ class Currency(unidad):
 
 if os.environ["icu"] == "True":
     import icu
-    locale = QtCore.QLocale.system().name()
+    locale = systemLocale()
 
     subclasses = unidad.__subclasses__()
     names = [unit.__title__ for unit in subclasses]
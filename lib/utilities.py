@@ -22,17 +22,20 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 # Module with utilities:
 #   - format2txt: Function to convert dict format config in a string value
 #   - representacion: Function for string representation of float values
+#   - compileFormat: Precompiled version of representacion
 #   - colors: Function to generate colors
 #   - exportTable; Save data to a file
 #   - formatLine: Return a matplotlib line formatting kw
 ###############################################################################
 
 
+from functools import lru_cache
 import os
 import random
 
 from scipy import exp
-from PyQt5.QtWidgets import QApplication
+
+from lib.qt import QApplication
 
 
 def format2txt(formato):
@@ -69,7 +72,20 @@ def representacion(float, format=0, total=0, decimales=4, exp=False, tol=5,
     """
     if type(float) is str:
         return float
+    return compileFormat(format, total, decimales, exp, tol, signo,
+                         thousand)(float)
+
 
+@lru_cache(maxsize=None)
+def compileFormat(format=0, total=0, decimales=4, exp=False, tol=5,
+                  signo=False, thousand=False):
+    """Return a function for string representation of float values with the
+    format strings of :func:`representacion` precompiled, useful to format
+    many values with the same options
+
+    >>> compileFormat(decimales=2, exp=True, tol=3)(1e5)
+    ' 1.00e+05'
+    """
     if signo:
         start = "{:+"
     else:
@@ -80,20 +96,33 @@ def representacion(float, format=0, total=0, decimales=4, exp=False, tol=5,
     else:
         coma = "."
 
-    if exp and (-10**tol > float or (-10**-tol < float < 10**(-tol+1) and
-                                     float != 0) or float > 10**tol):
-        format = 2
-    if float == 0:
-        decimales = 1
-
-    if format == 1:
-        string = start+"{}{:d}g".format(coma, decimales)+"}"
-    elif format == 2:
-        string = start+"{:d}{}{:d}e".format(total, coma, decimales)+"}"
-    else:
-        string = start+"{:d}{}{:d}f".format(total, coma, decimales)+"}"
-
-    return string.format(float)
+    def template(format, decimales):
+        if format == 1:
+            string = start+"{}{:d}g".format(coma, decimales)+"}"
+        elif format == 2:
+            string = start+"{:d}{}{:d}e".format(total, coma, decimales)+"}"
+        else:
+            string = start+"{:d}{}{:d}f".format(total, coma, decimales)+"}"
+        return string.format
+
+    fixed = template(format, decimales)
+    zero = template(format, 1)
+    engineering = template(2, decimales)
+    high = 10**tol
+    low = 10**-tol
+    low1 = 10**(-tol+1)
+
+    def func(value):
+        if type(value) is str:
+            return value
+        if exp and (-high > value or (-low < value < low1 and value != 0) or
+                    value > high):
+            return engineering(value)
+        if value == 0:
+            return zero(value)
+        return fixed(value)
+
+    return func
 
 
 def colors(number, mix="", scale=False):
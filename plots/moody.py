@@ -65,11 +65,11 @@ def calculate(config):
     # turbulent
     turb = {}
     for e in eD:
-        turb[e] = [F(Rei, e)/x for Rei in Re_turbulent]
+        turb[e] = (F(Re_turbulent, e)/x).tolist()
         dat["turbulent"] = turb
 
     # Line to define the fully desarrolled turbulent flux
-    dat["fully"] = [(1/(1.14-2*log10(3500/R)))**2/x for R in Re_fully]
+    dat["fully"] = ((1/(1.14-2*log10(3500/Re_fully)))**2/x).tolist()
 
     # Save to file
     with open(conf_dir+"moody.dat", "w") as file:
@@ -0,0 +1,360 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2017, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Headless batch runner of pychemqt project files, load the project without
+the graphical interface, apply the overrides of input values, solve the
+flowsheet and export the properties of streams and equipments::
+
+    python -m pychemqt.run project.pcq --set e1.rendimiento=0.8 \
+--out results.csv
+
+The overrides use the project item names: ``eN.kwarg`` for equipments and
+``sN.kwarg`` or ``iN.kwarg`` for streams, the value is evaluated as a python
+literal or used as text. The output format is selected by the extension of
+the output file, .csv, .json or .parquet (this need pyarrow), without output
+file the results are written to stdout in csv format.
+
+The results are in long format, one row for each property with columns:
+
+    * project: Project file name
+    * id: Item name, eN for equipment, sN for streams
+    * type: Class name of item
+    * property: Attribute name of property
+    * title: Title of property
+    * index: Index of element for list properties, component for streams,
+      the nested lists are flattened
+    * value: Value of property in the internal units of pychemqt, SI
+    * text: Text of value in the units of project configuration
+    * unit: Unit of value
+
+The global configuration files of pychemqt are only read, the project
+configuration is used in memory for the calculation.
+"""
+
+
+import argparse
+import ast
+import csv
+import importlib.util
+import json
+import os
+import sys
+
+
+# Add pychemqt folder to python path
+path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(path)
+
+# Define pychemqt environment
+os.environ["pychemqt"] = path + os.sep
+conf_dir = os.path.expanduser("~") + os.sep + ".pychemqt" + os.sep
+
+
+COLUMNS = ("project", "id", "type", "property", "title", "index", "value",
+           "text", "unit")
+
+
+# Optional modules of tools.dependences, without its translated texts so the
+# runner don't need PyQt5
+OPTIONAL_MODULES = ("freesteam", "CoolProp", "refprop", "pybel", "ezodf",
+                    "openpyxl", "xlwt", "icu", "reportlab", "PyQt5.Qsci")
+
+
+def checkEnvironment():
+    """Check the availability of optional modules without change the
+    environment defined previously, and the configuration of pychemqt"""
+    for module in OPTIONAL_MODULES:
+        if module in os.environ:
+            continue
+        try:
+            found = importlib.util.find_spec(module) is not None
+        except (ImportError, ValueError):
+            # The parent package of a submodule isn't available
+            found = False
+        os.environ[module] = "True" if found else ""
+
+    if not os.path.isfile(conf_dir + "pychemqtrc"):
+        raise RuntimeError(
+            "pychemqt configuration not found in %s, run pychemqt once to "
+            "create it" % conf_dir)
+
+
+def loadProject(fname):
+    """Load the project saved in fname without graphical interface, the
+    project configuration is set as current configuration without write it
+    to file"""
+    from lib.project import Project
+
+    with open(fname, "r") as file:
+        data = json.load(file)
+
+    for dep in data.get("external_dependences", []):
+        if os.environ.get(dep) != "True":
+            raise RuntimeError(
+                "%s need %s external module to load" % (fname, dep))
+
+    project = Project()
+    project.readFromJSON(data, temporal=False)
+    return project
+
+
+def parseValue(txt):
+    """Value of override, a python literal or text"""
+    try:
+        return ast.literal_eval(txt)
+    except (ValueError, SyntaxError):
+        return txt
+
+
+def setValue(project, key, value):
+    """Change an input value of project, key with format item.kwarg, item
+    can be an equipment (eN), a stream (sN) or an input stream (iN)"""
+    if "." not in key:
+        raise ValueError("Wrong override key %s, use item.kwarg" % key)
+    name, kwarg = key.split(".", 1)
+
+    if name[0] == "e":
+        equip = project.items.get(name)
+        if equip is None:
+            raise ValueError("Equipment %s not found in project" % name)
+        if kwarg not in equip.kwargs:
+            raise ValueError("%s hasn't %s input" % (name, kwarg))
+        equip.cleanOldValues(**{kwarg: value})
+
+    elif name[0] in "si":
+        if name[0] == "s":
+            ids = [int(name[1:])]
+        else:
+            ids = [id for id, stream in project.streams.items()
+                   if stream[0] == name]
+        if not ids or ids[0] not in project.streams:
+            raise ValueError("Stream %s not found in project" % name)
+        for id in ids:
+            stream = project.streams[id]
+            if kwarg not in stream[4].kwargs:
+                raise ValueError("%s hasn't %s input" % (name, kwarg))
+            obj = stream[4].clone(**{kwarg: value})
+            project.streams[id] = stream[0:4]+(obj, )
+            if name[0] == "i" and project.items.get(name) is not None:
+                project.items[name] = obj
+
+    else:
+        raise ValueError("Wrong item %s, use eN, sN or iN" % name)
+
+
+def _flatten(value):
+    """Iterate over the elements of a list property, with the nested lists
+    flattened"""
+    for item in value:
+        if isinstance(item, list):
+            yield from _flatten(item)
+        else:
+            yield item
+
+
+def _rows(value, **kwargs):
+    """Rows of a value of property"""
+    if isinstance(value, list):
+        for i, item in enumerate(_flatten(value)):
+            yield from _rows(item, **dict(kwargs, index=i))
+        return
+
+    row = dict(kwargs)
+    row.setdefault("index", None)
+    row["unit"] = ""
+    if isinstance(value, str):
+        row["value"] = None
+        row["text"] = value
+    elif isinstance(value, (int, float)) and not hasattr(value, "str"):
+        row["value"] = float(value)
+        row["text"] = repr(value)
+    elif hasattr(value, "str"):
+        row["value"] = float(value)
+        row["text"] = value.str.strip()
+        if value.__text__:
+            row["unit"] = value.__text__[0]
+    else:
+        row["value"] = None
+        row["text"] = str(value)
+    yield {col: row[col] for col in COLUMNS}
+
+
+def results(project, name=""):
+    """Iterate over the properties of streams and equipments of project as
+    dict with COLUMNS keys"""
+    objects = []
+    for id, stream in sorted(project.streams.items()):
+        objects.append(("s%i" % id, stream[4]))
+    for id, item in sorted(project.items.items()):
+        if id[0] == "e":
+            objects.append((id, item))
+
+    for id, obj in objects:
+        if not obj or not obj.status:
+            continue
+        for title, attr, unit in obj.propertiesNames():
+            try:
+                value = obj._prop(attr)
+            except (AttributeError, KeyError, IndexError, TypeError,
+                    UnboundLocalError):
+                continue
+            if isinstance(attr, tuple):
+                attr = attr[0]
+            yield from _rows(value, project=name, id=id,
+                             type=obj.__class__.__name__, property=attr,
+                             title=title)
+
+
+class CSVWriter(object):
+    """Write results as csv"""
+    def __init__(self, file):
+        self.file = file
+        self.writer = csv.DictWriter(file, COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+
+    def close(self):
+        pass
+
+
+class JSONWriter(object):
+    """Write results as a json array, row by row"""
+    def __init__(self, file):
+        self.file = file
+        self.count = 0
+        file.write("[")
+
+    def write(self, row):
+        if self.count:
+            self.file.write(",")
+        self.file.write(os.linesep + json.dumps(row, ensure_ascii=False))
+        self.count += 1
+
+    def close(self):
+        self.file.write(os.linesep + "]" + os.linesep)
+
+
+class ParquetWriter(object):
+    """Write results as parquet file in row groups"""
+    size = 10000
+
+    def __init__(self, fname):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("parquet output need pyarrow")
+
+        self.pa = pyarrow
+        self.schema = pyarrow.schema([
+            (col, pyarrow.float64() if col == "value" else
+             pyarrow.int64() if col == "index" else pyarrow.string())
+            for col in COLUMNS])
+        self.writer = pyarrow.parquet.ParquetWriter(fname, self.schema)
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            table = self.pa.Table.from_pylist(self.rows, schema=self.schema)
+            self.writer.write_table(table)
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def main(argv=None):
+    desc = "Calculate pychemqt project files without graphical interface"
+    parser = argparse.ArgumentParser(prog="pychemqt.run", description=desc)
+    parser.add_argument("projectFile", nargs="+",
+                        help="pychemqt project files to calculate")
+    parser.add_argument("-s", "--set", action="append", default=[],
+                        metavar="ITEM.KWARG=VALUE",
+                        help="Change an input value of projects before "
+                        "calculate, e1.rendimiento=0.8, s1.T=300")
+    parser.add_argument("-o", "--out",
+                        help="Output file, .csv, .json or .parquet, by "
+                        "default write csv to stdout")
+    parser.add_argument("-w", "--workers", type=int, default=0,
+                        help="Worker processes to calculate independent "
+                        "equipments")
+    args = parser.parse_args(argv)
+
+    overrides = []
+    for txt in args.set:
+        if "=" not in txt:
+            parser.error("Wrong override %s, use item.kwarg=value" % txt)
+        key, value = txt.split("=", 1)
+        overrides.append((key.strip(), parseValue(value.strip())))
+
+    try:
+        checkEnvironment()
+    except RuntimeError as err:
+        parser.error(err)
+
+    ext = os.path.splitext(args.out)[1].lower() if args.out else ".csv"
+    if ext not in (".csv", ".json", ".parquet"):
+        parser.error("Unsupported output format %s" % ext)
+
+    file = None
+    if ext == ".parquet":
+        try:
+            writer = ParquetWriter(args.out)
+        except RuntimeError as err:
+            parser.error(err)
+    else:
+        if args.out:
+            file = open(args.out, "w", newline="", encoding="utf-8")
+        else:
+            file = sys.stdout
+        if ext == ".json":
+            writer = JSONWriter(file)
+        else:
+            writer = CSVWriter(file)
+
+    try:
+        for fname in args.projectFile:
+            try:
+                project = loadProject(fname)
+                for key, value in overrides:
+                    setValue(project, key, value)
+            except (RuntimeError, ValueError) as err:
+                parser.error("%s: %s" % (fname, err))
+
+            project.scheduler.workers = args.workers
+            project.run()
+            for row in results(project, os.path.basename(fname)):
+                writer.write(row)
+    finally:
+        writer.close()
+        if file is not None and file is not sys.stdout:
+            file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -27,11 +27,13 @@ seterr("ignore")
 import warnings
 warnings.simplefilter("ignore")
 
-from unittest import TextTestRunner, TestSuite
+from unittest import TestLoader, TextTestRunner, TestSuite
 from test_lib import TestLib
+from test_run import TestRun
 
 suite = TestSuite()
 suite.addTest(TestLib)
+suite.addTest(TestLoader().loadTestsFromTestCase(TestRun))
 
 runner = TextTestRunner(failfast=True)
 results = runner.run(suite)
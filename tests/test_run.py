@@ -0,0 +1,59 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+import run
+
+
+# Run the export with PyQt5 unavailable and the optional modules unchecked
+NOQT = """
+import os, sys
+sys.modules["PyQt5"] = None
+sys.path.insert(0, os.path.abspath("."))
+import run
+for module in run.OPTIONAL_MODULES:
+    os.environ.pop(module, None)
+run.main([os.path.join("Samples", "pipe.pcq"), "--out", sys.argv[1]])
+"""
+
+
+class TestRun(TestCase):
+    """Export of sample projects with the headless batch runner"""
+
+    def test_pipe(self):
+        """Project with a list property of lists, the pipe fittings"""
+        with tempfile.TemporaryDirectory() as folder:
+            out = os.path.join(folder, "pipe.csv")
+            run.main([os.path.join("Samples", "pipe.pcq"), "--out", out])
+            with open(out, newline="", encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+
+        fittings = [row for row in rows if row["id"] == "e1" and
+                    row["property"] == "accesorios"]
+        self.assertEqual([row["index"] for row in fittings],
+                         [str(i) for i in range(len(fittings))])
+        self.assertEqual(fittings[-1]["text"], "Return bend")
+
+        deltaP = [row for row in rows if row["id"] == "e1" and
+                  row["property"] == "DeltaP"]
+        self.assertEqual(len(deltaP), 1)
+        self.assertGreater(float(deltaP[0]["value"]), 0)
+
+    def test_withoutQt(self):
+        """The runner don't need PyQt5"""
+        with tempfile.TemporaryDirectory() as folder:
+            out = os.path.join(folder, "pipe.csv")
+            proc = subprocess.run([sys.executable, "-c", NOQT, out],
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE)
+            self.assertEqual(proc.returncode, 0, proc.stderr.decode())
+            with open(out, newline="", encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+        self.assertTrue([row for row in rows if row["id"] == "e1"])
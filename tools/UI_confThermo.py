@@ -93,20 +93,24 @@ class UI_confThermo_widget(QtWidgets.QWidget):
             "pychemqt", "Use external library refprop (fastest)"))
         self.refprop.setEnabled(False)
         layout.addWidget(self.refprop, 9, 1, 1, 3)
+        self.tabulated = QtWidgets.QCheckBox(QtWidgets.QApplication.translate(
+            "pychemqt", "Use tabulated interpolation of MEoS (faster)"))
+        self.tabulated.setEnabled(False)
+        layout.addWidget(self.tabulated, 10, 1, 1, 3)
 
         self.iapws = QtWidgets.QCheckBox(QtWidgets.QApplication.translate(
             "pychemqt", "Use IAPWS97 for water"))
-        layout.addWidget(self.iapws, 10, 0, 1, 4)
+        layout.addWidget(self.iapws, 11, 0, 1, 4)
         self.freesteam = QtWidgets.QCheckBox(QtWidgets.QApplication.translate(
             "pychemqt", "Use freesteam library (faster)"))
         self.freesteam.setEnabled(False)
-        layout.addWidget(self.freesteam, 11, 1, 1, 3)
+        layout.addWidget(self.freesteam, 12, 1, 1, 3)
         self.GERG = QtWidgets.QCheckBox(QtWidgets.QApplication.translate(
             "pychemqt", "Use GERG EoS for mix if it's posible"))
-        layout.addWidget(self.GERG, 12, 0, 1, 4)
+        layout.addWidget(self.GERG, 13, 0, 1, 4)
         layout.addItem(QtWidgets.QSpacerItem(
             10, 10, QtWidgets.QSizePolicy.Expanding,
-            QtWidgets.QSizePolicy.Expanding), 13, 0, 1, 5)
+            QtWidgets.QSizePolicy.Expanding), 14, 0, 1, 5)
 
         if os.environ["freesteam"] == "True":
             self.iapws.toggled.connect(self.freesteam.setEnabled)
@@ -114,6 +118,7 @@ class UI_confThermo_widget(QtWidgets.QWidget):
             self.MEoS.toggled.connect(self.coolProp.setEnabled)
         if os.environ["refprop"] == "True":
             self.MEoS.toggled.connect(self.refprop.setEnabled)
+        self.MEoS.toggled.connect(self.tabulated.setEnabled)
 
         if config:
             self.setConfig(config)
@@ -132,12 +137,15 @@ class UI_confThermo_widget(QtWidgets.QWidget):
             self.freesteam.setChecked(config.getboolean("Thermo", "freesteam"))
             self.coolProp.setChecked(config.getboolean("Thermo", "coolProp"))
             self.refprop.setChecked(config.getboolean("Thermo", "refprop"))
+            if config.has_option("Thermo", "tabulated"):
+                self.tabulated.setChecked(
+                    config.getboolean("Thermo", "tabulated"))
 
     def setKwargs(self, kwarg):
         config = getMainWindowConfig()
         self.setConfig(config)
         for key in ["MEoS", "iapws", "GERG", "freesteam", "coolProp",
-                    "refprop"]:
+                    "refprop", "tabulated"]:
             if kwarg[key] != Corriente.kwargs[key]:
                 self.__getattribute__(key).setChecked(kwarg[key])
 
@@ -173,6 +181,7 @@ class UI_confThermo_widget(QtWidgets.QWidget):
         kw["freesteam"] = self.freesteam.isChecked()
         kw["coolProp"] = self.coolProp.isChecked()
         kw["refprop"] = self.refprop.isChecked()
+        kw["tabulated"] = self.tabulated.isChecked()
         return kw
 
     def value(self, config):
@@ -190,6 +199,7 @@ class UI_confThermo_widget(QtWidgets.QWidget):
         config.set("Thermo", "freesteam", str(self.freesteam.isChecked()))
         config.set("Thermo", "coolProp", str(self.coolProp.isChecked()))
         config.set("Thermo", "refprop", str(self.refprop.isChecked()))
+        config.set("Thermo", "tabulated", str(self.tabulated.isChecked()))
         return config
 
     @classmethod
@@ -206,6 +216,7 @@ class UI_confThermo_widget(QtWidgets.QWidget):
         config.set("Thermo", "freesteam", "False")
         config.set("Thermo", "coolProp", "False")
         config.set("Thermo", "refprop", "False")
+        config.set("Thermo", "tabulated", "False")
         return config
 
     def updateBIP(self, index):
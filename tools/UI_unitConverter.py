@@ -32,8 +32,9 @@ import os
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-from lib.unidades import Currency, getrates, _all
+from lib.unidades import Currency, _all
 from lib.config import conf_dir
+from tools.firstrun import getrates
 from UI.delegate import CellEditor
 
 